@@ -10,7 +10,11 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Optional, List, Union, Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, List, Union, Dict, Set, Tuple
+import json
+import multiprocessing
 import numpy as np
 import itertools
 from tqdm import tqdm
@@ -34,6 +38,7 @@ from syne_tune.optimizer.schedulers.transfer_learning import (
 )
 from syne_tune.stopping_criterion import StoppingCriterion
 from syne_tune.tuner import Tuner
+from syne_tune.util import experiment_path
 
 
 BenchmarkDefinitions = Union[
@@ -41,6 +46,10 @@ BenchmarkDefinitions = Union[
     Dict[str, Dict[str, SurrogateBenchmarkDefinition]],
 ]
 
+# Written to the tuner path once an experiment has finished, so that it can be
+# skipped when a sweep is resumed
+COMPLETED_FILENAME = "experiment_completed"
+
 
 def is_dict_of_dict(benchmark_definitions: BenchmarkDefinitions) -> bool:
     assert isinstance(benchmark_definitions, dict) and len(benchmark_definitions) > 0
@@ -48,6 +57,13 @@ def is_dict_of_dict(benchmark_definitions: BenchmarkDefinitions) -> bool:
     return isinstance(val, dict)
 
 
+@lru_cache(maxsize=None)
+def _load_blackbox(blackbox_name: str):
+    # Objectives are memory-mapped, so that their pages are shared by all
+    # processes of a sweep, and each process loads a blackbox only once
+    return load_blackbox(blackbox_name, mmap_mode="r")
+
+
 def get_transfer_learning_evaluations(
     blackbox_name: str,
     test_task: str,
@@ -62,7 +78,7 @@ def get_transfer_learning_evaluations(
     :param n_evals: maximum number of evaluations to be returned
     :return:
     """
-    task_to_evaluations = load_blackbox(blackbox_name)
+    task_to_evaluations = _load_blackbox(blackbox_name)
 
     # todo retrieve right metric
     metric_index = 0
@@ -143,6 +159,19 @@ def parse_args(
                 default="none",
                 help="Ordinal encoding for fcnet categorical HPs",
             ),
+            dict(
+                name="num_processes",
+                type=int,
+                default=1,
+                help="Number of experiments to run in parallel",
+            ),
+            dict(
+                name="skip_completed",
+                type=int,
+                default=0,
+                help="If 1, experiments which have already been completed "
+                "with the same experiment_tag are skipped",
+            ),
         ]
     )
     if nested_dict:
@@ -156,6 +185,7 @@ def parse_args(
     args, method_names, seeds = _parse_args(methods, extra_args)
     args.verbose = bool(args.verbose)
     args.support_checkpointing = bool(args.support_checkpointing)
+    args.skip_completed = bool(args.skip_completed)
     if args.benchmark is not None:
         benchmark_names = [args.benchmark]
     else:
@@ -176,6 +206,155 @@ def parse_args(
     return args, method_names, benchmark_names, seeds
 
 
+def completed_experiments(experiment_tag: str) -> Set[Tuple[str, int, str]]:
+    """
+    :param experiment_tag: Tag of experiments
+    :return: Set of `(method, seed, benchmark_name)` for experiments with tag
+        `experiment_tag` which have been completed
+    """
+    result = set()
+    for metadata_path in experiment_path().glob(f"{experiment_tag}-*/metadata.json"):
+        if (metadata_path.parent / COMPLETED_FILENAME).exists():
+            with open(metadata_path, "r") as f:
+                metadata = json.load(f)
+            if metadata.get("tag") == experiment_tag:
+                result.add(
+                    (metadata["algorithm"], metadata["seed"], metadata["benchmark"])
+                )
+    return result
+
+
+def run_experiment(
+    method: str,
+    seed: int,
+    benchmark_name: str,
+    methods: dict,
+    benchmark_definitions: Dict[str, SurrogateBenchmarkDefinition],
+    args,
+    extra_args: Optional[dict] = None,
+    use_transfer_learning: bool = False,
+) -> Path:
+    """
+    Runs a single simulated experiment
+
+    :param method: Name of method, key of `methods`
+    :param seed: Random seed
+    :param benchmark_name: Name of benchmark, key of `benchmark_definitions`
+    :param methods: Maps method names to scheduler factories
+    :param benchmark_definitions: Maps benchmark names to definitions
+    :param args: Command line arguments, see :func:`parse_args`
+    :param extra_args: Additional arguments passed to the scheduler factory,
+        as returned by `map_extra_args`
+    :param use_transfer_learning: Pass transfer learning evaluations to
+        scheduler factory?
+    :return: Path where results of the experiment are written
+    """
+    experiment_tag = args.experiment_tag
+    np.random.seed(seed)
+    benchmark = benchmark_definitions[benchmark_name]
+    print(f"Starting experiment ({method}/{benchmark_name}/{seed}) of {experiment_tag}")
+
+    max_resource_attr = benchmark.max_resource_attr
+    backend = BlackboxRepositoryBackend(
+        elapsed_time_attr=benchmark.elapsed_time_attr,
+        max_resource_attr=max_resource_attr,
+        blackbox_name=benchmark.blackbox_name,
+        dataset=benchmark.dataset_name,
+        surrogate=benchmark.surrogate,
+        surrogate_kwargs=benchmark.surrogate_kwargs,
+        support_checkpointing=args.support_checkpointing,
+        mmap_mode="r",
+    )
+
+    resource_attr = next(iter(backend.blackbox.fidelity_space.keys()))
+    max_resource_level = int(max(backend.blackbox.fidelity_values))
+    if max_resource_attr is not None:
+        config_space = dict(
+            backend.blackbox.configuration_space,
+            **{max_resource_attr: max_resource_level},
+        )
+        method_kwargs = {"max_resource_attr": max_resource_attr}
+    else:
+        config_space = backend.blackbox.configuration_space
+        method_kwargs = {"max_t": max_resource_level}
+    if extra_args is not None:
+        method_kwargs.update(extra_args)
+    if use_transfer_learning:
+        method_kwargs["transfer_learning_evaluations"] = (
+            get_transfer_learning_evaluations(
+                blackbox_name=benchmark.blackbox_name,
+                test_task=benchmark.dataset_name,
+                datasets=benchmark.datasets,
+            ),
+        )
+    scheduler = methods[method](
+        MethodArguments(
+            config_space=config_space,
+            metric=benchmark.metric,
+            mode=benchmark.mode,
+            random_seed=seed,
+            resource_attr=resource_attr,
+            verbose=args.verbose,
+            fcnet_ordinal=args.fcnet_ordinal,
+            transfer_learning_evaluations=get_transfer_learning_evaluations(
+                blackbox_name=benchmark.blackbox_name,
+                test_task=benchmark.dataset_name,
+                datasets=benchmark.datasets,
+            ),
+            use_surrogates="lcbench" in benchmark_name,
+            **method_kwargs,
+        )
+    )
+
+    stop_criterion = StoppingCriterion(
+        max_wallclock_time=benchmark.max_wallclock_time,
+        max_num_evaluations=benchmark.max_num_evaluations,
+    )
+    metadata = get_metadata(
+        seed, method, experiment_tag, benchmark_name, extra_args=extra_args
+    )
+    metadata["fcnet_ordinal"] = args.fcnet_ordinal
+    tuner = Tuner(
+        trial_backend=backend,
+        scheduler=scheduler,
+        stop_criterion=stop_criterion,
+        n_workers=benchmark.n_workers,
+        sleep_time=0,
+        callbacks=[SimulatorCallback()],
+        results_update_interval=600,
+        print_update_interval=600,
+        tuner_name=experiment_tag,
+        metadata=metadata,
+        save_tuner=args.save_tuner,
+    )
+    tuner.run()
+    (tuner.tuner_path / COMPLETED_FILENAME).touch()
+    return tuner.tuner_path
+
+
+# Arguments of `run_experiment` shared by all experiments of a sweep. Worker
+# processes are forked, so they inherit these without pickling (`methods`
+# typically contains lambdas)
+_run_experiment_kwargs = None
+
+
+def _init_worker(kwargs: dict):
+    global _run_experiment_kwargs
+    _run_experiment_kwargs = kwargs
+
+
+def _run_experiment_in_worker(combination: Tuple[str, int, str]) -> str:
+    method, seed, benchmark_name = combination
+    return str(
+        run_experiment(
+            method=method,
+            seed=seed,
+            benchmark_name=benchmark_name,
+            **_run_experiment_kwargs,
+        )
+    )
+
+
 def main(
     methods: dict,
     benchmark_definitions: BenchmarkDefinitions,
@@ -193,88 +372,42 @@ def main(
         ), "Use --benchmark_key if benchmark_definitions is a nested dictionary"
         benchmark_definitions = benchmark_definitions[args.benchmark_key]
     set_logging_level(args)
+    if extra_args is not None:
+        assert map_extra_args is not None
+        extra_args = map_extra_args(args)
 
     combinations = list(itertools.product(method_names, seeds, benchmark_names))
+    if args.skip_completed:
+        completed = completed_experiments(experiment_tag)
+        num_all = len(combinations)
+        combinations = [x for x in combinations if x not in completed]
+        print(f"Skipping {num_all - len(combinations)} completed experiments")
     print(combinations)
-    for method, seed, benchmark_name in tqdm(combinations):
-        np.random.seed(seed)
-        benchmark = benchmark_definitions[benchmark_name]
-        print(
-            f"Starting experiment ({method}/{benchmark_name}/{seed}) of {experiment_tag}"
-        )
-
-        max_resource_attr = benchmark.max_resource_attr
-        backend = BlackboxRepositoryBackend(
-            elapsed_time_attr=benchmark.elapsed_time_attr,
-            max_resource_attr=max_resource_attr,
-            blackbox_name=benchmark.blackbox_name,
-            dataset=benchmark.dataset_name,
-            surrogate=benchmark.surrogate,
-            surrogate_kwargs=benchmark.surrogate_kwargs,
-            support_checkpointing=args.support_checkpointing,
-        )
-
-        resource_attr = next(iter(backend.blackbox.fidelity_space.keys()))
-        max_resource_level = int(max(backend.blackbox.fidelity_values))
-        if max_resource_attr is not None:
-            config_space = dict(
-                backend.blackbox.configuration_space,
-                **{max_resource_attr: max_resource_level},
-            )
-            method_kwargs = {"max_resource_attr": max_resource_attr}
-        else:
-            config_space = backend.blackbox.configuration_space
-            method_kwargs = {"max_t": max_resource_level}
-        if extra_args is not None:
-            assert map_extra_args is not None
-            extra_args = map_extra_args(args)
-            method_kwargs.update(extra_args)
-        if use_transfer_learning:
-            method_kwargs["transfer_learning_evaluations"] = (
-                get_transfer_learning_evaluations(
-                    blackbox_name=benchmark.blackbox_name,
-                    test_task=benchmark.dataset_name,
-                    datasets=benchmark.datasets,
-                ),
-            )
-        scheduler = methods[method](
-            MethodArguments(
-                config_space=config_space,
-                metric=benchmark.metric,
-                mode=benchmark.mode,
-                random_seed=seed,
-                resource_attr=resource_attr,
-                verbose=args.verbose,
-                fcnet_ordinal=args.fcnet_ordinal,
-                transfer_learning_evaluations=get_transfer_learning_evaluations(
-                    blackbox_name=benchmark.blackbox_name,
-                    test_task=benchmark.dataset_name,
-                    datasets=benchmark.datasets,
-                ),
-                use_surrogates="lcbench" in benchmark_name,
-                **method_kwargs,
+    run_experiment_kwargs = dict(
+        methods=methods,
+        benchmark_definitions=benchmark_definitions,
+        args=args,
+        extra_args=extra_args,
+        use_transfer_learning=use_transfer_learning,
+    )
+    num_processes = min(args.num_processes, len(combinations))
+    if num_processes <= 1:
+        for method, seed, benchmark_name in tqdm(combinations):
+            run_experiment(
+                method=method,
+                seed=seed,
+                benchmark_name=benchmark_name,
+                **run_experiment_kwargs,
             )
-        )
-
-        stop_criterion = StoppingCriterion(
-            max_wallclock_time=benchmark.max_wallclock_time,
-            max_num_evaluations=benchmark.max_num_evaluations,
-        )
-        metadata = get_metadata(
-            seed, method, experiment_tag, benchmark_name, extra_args=extra_args
-        )
-        metadata["fcnet_ordinal"] = args.fcnet_ordinal
-        tuner = Tuner(
-            trial_backend=backend,
-            scheduler=scheduler,
-            stop_criterion=stop_criterion,
-            n_workers=benchmark.n_workers,
-            sleep_time=0,
-            callbacks=[SimulatorCallback()],
-            results_update_interval=600,
-            print_update_interval=600,
-            tuner_name=experiment_tag,
-            metadata=metadata,
-            save_tuner=args.save_tuner,
-        )
-        tuner.run()
+    else:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(
+            processes=num_processes,
+            initializer=_init_worker,
+            initargs=(run_experiment_kwargs,),
+        ) as pool:
+            for _ in tqdm(
+                pool.imap_unordered(_run_experiment_in_worker, combinations),
+                total=len(combinations),
+            ):
+                pass
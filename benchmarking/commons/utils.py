@@ -64,7 +64,8 @@ def message_sync_from_s3(experiment_tag: str) -> str:
         "command to sync result files from S3:\n"
         f"$ aws s3 sync {s3_experiment_path(experiment_name=experiment_tag)} "
         f'~/syne-tune/{experiment_tag}/ --exclude "*" '
-        '--include "*metadata.json" --include "*results.csv.zip"'
+        '--include "*metadata.json" --include "*results.csv.zip" '
+        '--include "*results.jsonl"'
     )
 
 
@@ -0,0 +1,133 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of querying a `BlackboxTabular` for many configurations:
+the former pandas MultiIndex lookup (`.loc`) per configuration, the hash
+index behind `objective_function` per configuration, and a single call of
+`objective_function_batch`.
+
+Tables are synthetic, with the number of configurations, hyperparameters,
+seeds and fidelities of nasbench201 and fcnet. Use `--blackbox` to run on a
+blackbox from the repository instead.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import syne_tune.config_space as sp
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+
+
+# (num_configs, num_hps, num_seeds, num_fidelities)
+TABLE_SIZES = {
+    "nasbench201": (15625, 6, 3, 200),
+    "fcnet": (62208, 9, 4, 100),
+}
+
+
+def _synthetic_blackbox(
+    num_configs: int, num_hps: int, num_seeds: int, num_fidelities: int
+) -> BlackboxTabular:
+    # Mixed-radix digits of the row number make all configurations distinct
+    radix = int(np.ceil(num_configs ** (1 / num_hps)))
+    rows = np.arange(num_configs)
+    columns = {f"hp_{i}": (rows // radix**i) % radix * 0.1 for i in range(num_hps)}
+    hyperparameters = pd.DataFrame(columns)
+    objectives_evaluations = np.random.rand(
+        num_configs, num_seeds, num_fidelities, 2
+    ).astype(np.float32)
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={
+            name: sp.choice(sorted(set(values))) for name, values in columns.items()
+        },
+        fidelity_space={"epoch": sp.randint(1, num_fidelities)},
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["metric_error", "metric_time"],
+    )
+
+
+def _loc_lookup(blackbox: BlackboxTabular, index_df: pd.DataFrame, config: dict):
+    # Lookup as done by `BlackboxTabular` before the hash index
+    key = tuple(config[name] for name in blackbox.hyperparameters.columns)
+    matching_index = index_df.loc[key].values
+    index = blackbox.hyperparameters.loc[matching_index].index.values[0]
+    return blackbox.objectives_evaluations[index, 0, :, :]
+
+
+def run(name: str, blackbox: BlackboxTabular, num_queries: int, num_loc: int):
+    hyperparameters = blackbox.hyperparameters
+    rows = np.random.randint(0, len(hyperparameters), size=num_queries)
+    queries = hyperparameters.iloc[rows].reset_index(drop=True)
+    configs = queries.to_dict(orient="records")
+
+    index_df = hyperparameters.copy()
+    index_df["index"] = hyperparameters.index
+    index_df.set_index(list(hyperparameters.columns), inplace=True)
+    num_loc = min(num_loc, num_queries)
+    start = time.perf_counter()
+    for config in configs[:num_loc]:
+        _loc_lookup(blackbox, index_df, config)
+    time_loc = (time.perf_counter() - start) / num_loc
+
+    start = time.perf_counter()
+    for config in configs:
+        blackbox.objective_function(config, seed=0)
+    time_single = (time.perf_counter() - start) / num_queries
+
+    start = time.perf_counter()
+    values = blackbox.objective_function_batch(queries, seeds=0)
+    time_batch = (time.perf_counter() - start) / num_queries
+    assert values.shape == (num_queries,) + blackbox.objectives_evaluations.shape[2:]
+
+    print(
+        f"{name:12s}  {len(hyperparameters):7d}  {1e6 * time_loc:16.1f}  "
+        f"{1e6 * time_single:17.2f}  {1e6 * time_batch:18.3f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_queries", type=int, default=100000)
+    parser.add_argument(
+        "--num_loc_queries",
+        type=int,
+        default=2000,
+        help="Number of queries timed for the (slow) pandas lookup",
+    )
+    parser.add_argument(
+        "--blackbox",
+        type=str,
+        help="Name of a tabular blackbox in the repository (first task is used)",
+    )
+    args = parser.parse_args()
+
+    np.random.seed(0)
+    print(
+        "table         configs  loc_us_per_query  hash_us_per_query  batch_us_per_query"
+    )
+    if args.blackbox is not None:
+        from syne_tune.blackbox_repository import load_blackbox
+
+        blackbox = next(iter(load_blackbox(args.blackbox).values()))
+        run(args.blackbox, blackbox, args.num_queries, args.num_loc_queries)
+    else:
+        for name, sizes in TABLE_SIZES.items():
+            run(
+                name,
+                _synthetic_blackbox(*sizes),
+                args.num_queries,
+                args.num_loc_queries,
+            )
@@ -0,0 +1,118 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares load time and memory of a tabular blackbox with many tasks, loaded
+into memory (default) or memory-mapped (`mmap_mode="r"`).
+
+A synthetic blackbox is serialized to a temporary directory. Several
+processes are started at the same time, each of which loads the blackbox,
+queries all configurations of a single task, and reports load time, RSS and
+PSS (proportional set size, where shared pages are divided between the
+processes sharing them) while all processes are alive. RSS and PSS are read
+from `/proc`, so this benchmark requires Linux.
+"""
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import syne_tune.config_space as sp
+from syne_tune.blackbox_repository.blackbox_tabular import (
+    BlackboxTabular,
+    serialize,
+    deserialize,
+)
+
+
+def _memory_mb():
+    result = dict()
+    with open("/proc/self/smaps_rollup", "r") as f:
+        for line in f:
+            fields = line.split()
+            if fields[0] in ("Rss:", "Pss:"):
+                result[fields[0][:-1].lower()] = int(fields[1]) / 1024
+    return result
+
+
+def _make_blackboxes(args) -> dict:
+    num_hps = 4
+    radix = int(np.ceil(args.num_configs ** (1 / num_hps)))
+    rows = np.arange(args.num_configs)
+    columns = {f"hp_{i}": (rows // radix**i) % radix for i in range(num_hps)}
+    hyperparameters = pd.DataFrame(columns)
+    configuration_space = {
+        name: sp.choice(sorted(set(values.tolist())))
+        for name, values in columns.items()
+    }
+    fidelity_space = {"epoch": sp.randint(1, args.num_fidelities)}
+    shape = (args.num_configs, 1, args.num_fidelities, args.num_objectives)
+    return {
+        f"task_{i}": BlackboxTabular(
+            hyperparameters=hyperparameters,
+            configuration_space=configuration_space,
+            fidelity_space=fidelity_space,
+            objectives_evaluations=np.random.rand(*shape).astype(np.float32),
+        )
+        for i in range(args.num_tasks)
+    }
+
+
+def _child(path, mmap_mode, barrier, queue):
+    start = time.perf_counter()
+    bb_dict = deserialize(path, mmap_mode=mmap_mode)
+    blackbox = bb_dict["task_0"]
+    time_load = time.perf_counter() - start
+    blackbox.objective_function_batch(blackbox.hyperparameters, seeds=0)
+    barrier.wait()
+    memory = _memory_mb()
+    barrier.wait()
+    queue.put((time_load, memory["rss"], memory["pss"]))
+
+
+def run(path: str, mmap_mode, num_processes: int):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(num_processes)
+    queue = ctx.Queue()
+    processes = [
+        ctx.Process(target=_child, args=(path, mmap_mode, barrier, queue))
+        for _ in range(num_processes)
+    ]
+    for process in processes:
+        process.start()
+    results = np.array([queue.get() for _ in processes])
+    for process in processes:
+        process.join()
+    time_load, rss, pss = results.mean(axis=0)
+    print(
+        f"{str(mmap_mode):9s}  {num_processes:9d}  {time_load:11.3f}  "
+        f"{rss:6.0f}  {pss:6.0f}  {pss * num_processes:12.0f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_tasks", type=int, default=30)
+    parser.add_argument("--num_configs", type=int, default=10000)
+    parser.add_argument("--num_fidelities", type=int, default=50)
+    parser.add_argument("--num_objectives", type=int, default=4)
+    parser.add_argument("--num_processes", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        serialize(_make_blackboxes(args), tmpdir)
+        print("mmap_mode  processes  load_time_s  rss_mb  pss_mb  total_pss_mb")
+        for mmap_mode in [None, "r"]:
+            run(tmpdir, mmap_mode, args.num_processes)
@@ -0,0 +1,144 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures the latency of `BayesianOptimizationAlgorithm.next_candidates` of
+the GP searcher as a function of the number of hyperparameters, for many
+initial candidates. Local optimization is switched off by default, so that
+the time is spent in sampling and scoring initial candidates. We compare:
+
+* `configs`: Candidates sampled as configs, then encoded and scored
+* `matrix`: Candidates sampled column by column directly into the encoded
+  matrix, which is scored, and only the chosen candidate is decoded
+"""
+import argparse
+import time
+
+import numpy as np
+
+from syne_tune.config_space import uniform, loguniform, randint, choice
+from syne_tune.optimizer.schedulers.searchers import GPFIFOSearcher
+from syne_tune.optimizer.schedulers.searchers.gp_fifo_searcher import (
+    create_initial_candidates_scorer,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.base_classes import (
+    CandidateGenerator,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm import (
+    BayesianOptimizationAlgorithm,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components import (
+    LBFGSOptimizeAcquisition,
+    NoOptimization,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.common import (
+    RandomStatefulCandidateGenerator,
+    ExclusionList,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.utils.duplicate_detector import (
+    DuplicateDetectorIdentical,
+)
+
+
+class ConfigsCandidateGenerator(RandomStatefulCandidateGenerator):
+    """
+    Does not support encoded candidates, so that candidates are sampled and
+    scored as configs.
+    """
+
+    generate_candidates_matrix = CandidateGenerator.generate_candidates_matrix
+
+
+def _config_space(num_dims: int) -> dict:
+    config_space = dict()
+    for pos in range(num_dims):
+        if pos % 4 == 1:
+            config_space[f"x{pos}"] = loguniform(1e-4, 1.0)
+        elif pos % 4 == 2:
+            config_space[f"x{pos}"] = randint(1, 256)
+        elif pos % 4 == 3:
+            config_space[f"x{pos}"] = choice(["a", "b", "c", "d"])
+        else:
+            config_space[f"x{pos}"] = uniform(0.0, 1.0)
+    return config_space
+
+
+def _time_per_call(fun, num_calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fun()
+    return (time.perf_counter() - start) / num_calls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_dims", type=int, nargs="+", default=[2, 8, 32, 64])
+    parser.add_argument("--num_initial_candidates", type=int, default=2000)
+    parser.add_argument("--num_observations", type=int, default=50)
+    parser.add_argument("--num_calls", type=int, default=5)
+    parser.add_argument("--local_optimization", type=int, default=0)
+    args = parser.parse_args()
+
+    local_optimizer_class = (
+        LBFGSOptimizeAcquisition if args.local_optimization else NoOptimization
+    )
+    print("num_dims  configs_ms  matrix_ms  speedup")
+    for num_dims in args.num_dims:
+        config_space = _config_space(num_dims)
+        searcher = GPFIFOSearcher(
+            config_space,
+            metric="loss",
+            mode="min",
+            points_to_evaluate=[],
+            random_seed=0,
+            debug_log=False,
+        )
+        random_state = np.random.RandomState(0)
+        for trial_id in range(args.num_observations):
+            config = {
+                k: v.sample(random_state=random_state) for k, v in config_space.items()
+            }
+            searcher._update(str(trial_id), config, {"loss": random_state.rand()})
+        model = searcher.state_transformer.model()
+        hp_ranges = searcher.hp_ranges
+        times = []
+        for generator_class in [
+            ConfigsCandidateGenerator,
+            RandomStatefulCandidateGenerator,
+        ]:
+            bo_algorithm = BayesianOptimizationAlgorithm(
+                initial_candidates_generator=generator_class(
+                    hp_ranges, random_state=np.random.RandomState(1)
+                ),
+                initial_candidates_scorer=create_initial_candidates_scorer(
+                    initial_scoring="acq_func",
+                    model=model,
+                    acquisition_class=searcher.acquisition_class,
+                    random_state=random_state,
+                ),
+                num_initial_candidates=args.num_initial_candidates,
+                local_optimizer=local_optimizer_class(
+                    hp_ranges=hp_ranges,
+                    model=model,
+                    acquisition_class=searcher.acquisition_class,
+                ),
+                pending_candidate_state_transformer=None,
+                exclusion_candidates=ExclusionList(searcher.state_transformer.state),
+                num_requested_candidates=1,
+                greedy_batch_selection=False,
+                duplicate_detector=DuplicateDetectorIdentical(),
+            )
+            times.append(_time_per_call(bo_algorithm.next_candidates, args.num_calls))
+        print(
+            f"{num_dims:8d}  {1e3 * times[0]:10.1f}  {1e3 * times[1]:9.1f}  "
+            f"{times[0] / times[1]:7.1f}"
+        )
@@ -0,0 +1,186 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the overhead of `BotorchSearcher`, as a function of the number of
+trials with results:
+
+* `features`: Assembling the features of observed and pending configs, by
+  encoding all trial configs (`legacy`) versus indexing the incrementally
+  grown feature tensor
+* `fit`: Fitting the GP from default hyperparameters (`cold`) versus from
+  those of the previous fit (`warm`). The previous fit is done on data with
+  one observation less
+* `screen`: `_sample_and_pick_acq_best`, sampling and encoding config
+  dictionaries (`legacy`) versus sampling and scoring in encoded form
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import torch
+from botorch.fit import fit_gpytorch_model
+from botorch.utils import standardize
+from gpytorch.mlls import ExactMarginalLogLikelihood
+
+from syne_tune.config_space import choice, loguniform, randint, uniform
+from syne_tune.optimizer.schedulers.botorch.botorch_searcher import BotorchSearcher
+
+
+config_space = {
+    "lr": loguniform(1e-5, 1e-1),
+    "dropout": uniform(0.0, 0.5),
+    "num_layers": randint(1, 8),
+    "width": randint(16, 512),
+    "activation": choice(["relu", "tanh", "elu"]),
+    "epochs": 50,
+}
+
+
+def _objective(config) -> float:
+    return (
+        (np.log10(config["lr"]) + 3) ** 2
+        + config["dropout"]
+        + 0.1 * abs(config["num_layers"] - 4)
+        + 0.3 * (config["activation"] == "tanh")
+    )
+
+
+def _legacy_features(searcher: BotorchSearcher):
+    configs_with_results = [
+        config
+        for trial, config in searcher.trial_configs.items()
+        if trial not in searcher.pending_trials
+    ]
+    configs_pending = [
+        config
+        for trial, config in searcher.trial_configs.items()
+        if trial in searcher.pending_trials
+    ]
+    X = np.array(
+        torch.stack(
+            [searcher._config_to_feature_matrix([c])[0] for c in configs_with_results]
+        )
+    )
+    X_pending = torch.stack(
+        [searcher._config_to_feature_matrix([c])[0] for c in configs_pending]
+    )
+    return X, X_pending
+
+
+def _features(searcher: BotorchSearcher):
+    X = searcher._features[searcher._observed_rows]
+    X_pending = searcher._features[
+        sorted(searcher._trial_row[trial] for trial in searcher.pending_trials)
+    ]
+    return X, X_pending
+
+
+def _legacy_sample_and_pick_acq_best(searcher: BotorchSearcher, acq, num_samples):
+    configs_candidates = [searcher._sample_random() for _ in range(num_samples)]
+    configs_candidates = [
+        x for x in configs_candidates if not searcher._is_config_already_seen(x)
+    ]
+    X_tensor = torch.stack(
+        [searcher._config_to_feature_matrix([c])[0] for c in configs_candidates]
+    )
+    ei = acq(X_tensor.unsqueeze(dim=-2))
+    return configs_candidates[ei.argmax()]
+
+
+def _fit(searcher: BotorchSearcher, num_data: int, warm: bool) -> float:
+    X = searcher._features[searcher._observed_rows[:num_data]]
+    Y = standardize(torch.Tensor(searcher.objectives()[:num_data]).reshape(-1, 1))
+    gp = searcher._make_gp(X_tensor=X, Y_tensor=Y)
+    if warm:
+        searcher._warm_start_gp(gp)
+    mll = ExactMarginalLogLikelihood(gp.likelihood, gp)
+    start = time.perf_counter()
+    fit_gpytorch_model(mll, max_retries=1)
+    fit_time = time.perf_counter() - start
+    searcher._gp_hyperparameters = {
+        name: param.detach().clone() for name, param in gp.named_parameters()
+    }
+    return fit_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trials", type=int, nargs="+", default=[50, 200, 2000])
+    parser.add_argument("--num_pending", type=int, default=4)
+    parser.add_argument("--num_samples", type=int, default=100)
+    parser.add_argument("--num_calls", type=int, default=5)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    print(
+        "num_trials  features_legacy_ms  features_ms  fit_cold_ms  fit_warm_ms  "
+        "screen_legacy_ms  screen_ms"
+    )
+    for num_trials in args.num_trials:
+        searcher = BotorchSearcher(
+            config_space, metric="metric", mode="min", random_seed=31415927
+        )
+        for trial_id in range(num_trials + args.num_pending):
+            config = searcher._sample_random()
+            # Register the config as suggested, without running BO
+            searcher.pending_trials.add(trial_id)
+            searcher.trial_configs[trial_id] = config
+            searcher.config_seen.add(searcher._config_key(config))
+            searcher._append_features(trial_id, config)
+            if trial_id < num_trials:
+                searcher.on_trial_result(
+                    str(trial_id), config, {"metric": _objective(config)}, update=True
+                )
+        timings = dict()
+        for name, func in (
+            ("features_legacy", _legacy_features),
+            ("features", _features),
+        ):
+            start = time.perf_counter()
+            for _ in range(args.num_calls):
+                func(searcher)
+            timings[name] = (time.perf_counter() - start) / args.num_calls
+        # GP fitting is limited to `max_num_observations` points
+        num_data = min(num_trials, searcher.max_num_observations)
+        timings["fit_cold"] = np.mean(
+            [_fit(searcher, num_data, warm=False) for _ in range(args.num_calls)]
+        )
+        fit_warm = []
+        for _ in range(args.num_calls):
+            _fit(searcher, num_data - 1, warm=False)
+            fit_warm.append(_fit(searcher, num_data, warm=True))
+        timings["fit_warm"] = np.mean(fit_warm)
+
+        def acq(X):
+            return -torch.sum((X[..., 0, :] - 0.3) ** 2, dim=-1)
+
+        for name, func in (
+            (
+                "screen_legacy",
+                lambda: _legacy_sample_and_pick_acq_best(
+                    searcher, acq, args.num_samples
+                ),
+            ),
+            ("screen", lambda: searcher._sample_and_pick_acq_best(acq)),
+        ):
+            start = time.perf_counter()
+            for _ in range(args.num_calls):
+                func()
+            timings[name] = (time.perf_counter() - start) / args.num_calls
+        print(
+            f"{num_trials:10d}  {timings['features_legacy'] * 1000:18.2f}  "
+            f"{timings['features'] * 1000:11.2f}  {timings['fit_cold'] * 1000:11.1f}  "
+            f"{timings['fit_warm'] * 1000:11.1f}  "
+            f"{timings['screen_legacy'] * 1000:16.2f}  {timings['screen'] * 1000:9.2f}"
+        )
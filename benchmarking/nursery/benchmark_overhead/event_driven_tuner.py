@@ -0,0 +1,96 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures worker utilization of `Tuner` with `LocalBackend` running many
+sub-second trials, comparing polling (sleeping for `sleep_time` whenever all
+workers are busy) against the event-driven mode (`event_driven=True`).
+
+Utilization is the time spent inside training scripts summed over all trials,
+divided by `n_workers` times the wallclock time of the experiment. Time lost
+between the end of a trial and the start of the next one on the same worker
+lowers utilization.
+"""
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend import LocalBackend
+from syne_tune.config_space import uniform
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.tuner_callback import StoreResultsCallback
+
+
+TRAINING_SCRIPT = """
+import time
+
+start_time = time.time()
+
+import argparse
+
+from syne_tune import Reporter
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--x", type=float)
+    parser.add_argument("--trial_time", type=float)
+    args, _ = parser.parse_known_args()
+    time.sleep(args.trial_time)
+    Reporter()(y=args.x ** 2, start_time=start_time, end_time=time.time())
+"""
+
+
+def run_experiment(entry_point: Path, event_driven: bool, args) -> (float, int, float):
+    config_space = {"x": uniform(-1, 1), "trial_time": args.trial_time}
+    callback = StoreResultsCallback()
+    tuner = Tuner(
+        trial_backend=LocalBackend(entry_point=str(entry_point)),
+        scheduler=RandomSearch(config_space, metric="y", mode="min"),
+        stop_criterion=StoppingCriterion(max_wallclock_time=args.max_wallclock_time),
+        n_workers=args.n_workers,
+        sleep_time=args.sleep_time,
+        event_driven=event_driven,
+        callbacks=[callback],
+        save_tuner=False,
+    )
+    start_time = time.time()
+    tuner.run()
+    total_time = time.time() - start_time
+    df = callback.dataframe()
+    busy_time = (df["end_time"] - df["start_time"]).sum()
+    utilization = busy_time / (args.n_workers * total_time)
+    return utilization, len(df), total_time
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_workers", type=int, default=4)
+    parser.add_argument("--trial_time", type=float, default=0.5)
+    parser.add_argument("--sleep_time", type=float, default=1.0)
+    parser.add_argument("--max_wallclock_time", type=float, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        entry_point = Path(tmpdir) / "train_sleep.py"
+        with open(entry_point, "w") as f:
+            f.write(TRAINING_SCRIPT)
+        print("mode          utilization  num_trials")
+        for event_driven in [False, True]:
+            utilization, num_trials, _ = run_experiment(
+                entry_point, event_driven=event_driven, args=args
+            )
+            name = "event-driven" if event_driven else "polling"
+            print(f"{name:12s}  {utilization:11.3f}  {num_trials:10d}")
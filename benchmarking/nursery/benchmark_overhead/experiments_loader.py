@@ -0,0 +1,91 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares ways of loading many experiments with `load_experiments_df`.
+Synthetic experiments are written to a temporary directory. We compare:
+
+* `sequential`: All experiments are loaded one after the other
+* `columns`: Only a few columns of the results are loaded (`columns`)
+* `parallel`: Experiments are loaded by a process pool (`num_workers`)
+* `index_cold`: As `sequential`, but the consolidated index is created
+  (`index_file`)
+* `index_warm`: Index exists and is up to date
+* `index_refresh`: Index exists, but some experiments have changed
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from syne_tune.constants import (
+    ST_TUNER_CREATION_TIMESTAMP,
+    ST_RESULTS_DATAFRAME_FILENAME,
+)
+from syne_tune.experiments import load_experiments_df
+
+
+def _write_experiment(path: Path, num_results: int, num_columns: int):
+    path.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        ST_TUNER_CREATION_TIMESTAMP: time.time(),
+        "metric_names": ["loss"],
+        "metric_mode": "min",
+        "scheduler_name": "FIFOScheduler",
+        "entrypoint": "train",
+    }
+    with open(path / "metadata.json", "w") as f:
+        json.dump(metadata, f)
+    data = {f"column{i}": np.random.rand(num_results) for i in range(num_columns)}
+    data["trial_id"] = np.arange(num_results) // 10
+    data["loss"] = np.random.rand(num_results)
+    pd.DataFrame(data).to_csv(path / ST_RESULTS_DATAFRAME_FILENAME, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_experiments", type=int, default=2000)
+    parser.add_argument("--num_results", type=int, default=200)
+    parser.add_argument("--num_columns", type=int, default=20)
+    parser.add_argument("--num_workers", type=int, default=os.cpu_count())
+    parser.add_argument("--num_changed", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "experiments"
+        for i in range(args.num_experiments):
+            _write_experiment(root / f"tuner-{i}", args.num_results, args.num_columns)
+        index_file = str(Path(tmpdir) / "index.pkl")
+        variants = [
+            ("sequential", dict()),
+            ("columns", dict(columns=["trial_id", "loss"])),
+            ("parallel", dict(num_workers=args.num_workers)),
+            ("index_cold", dict(index_file=index_file)),
+            ("index_warm", dict(index_file=index_file)),
+            ("index_refresh", dict(index_file=index_file)),
+        ]
+        print("variant        time_s  num_rows")
+        for variant, kwargs in variants:
+            if variant == "index_refresh":
+                for i in range(args.num_changed):
+                    _write_experiment(
+                        root / f"tuner-{i}", args.num_results, args.num_columns
+                    )
+            start_time = time.perf_counter()
+            df = load_experiments_df(root=root, **kwargs)
+            elapsed_time = time.perf_counter() - start_time
+            print(f"{variant:>13}  {elapsed_time:6.2f}  {len(df):8d}")
@@ -0,0 +1,117 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures the time for fitting the hyperparameters of a GP surrogate model
+(maximizing the marginal likelihood) as the dataset grows by one observation
+at a time. We compare:
+
+* `reset`: Parameters are reset before each fit, and `n_starts` L-BFGS runs
+  are done one after the other (default)
+* `parallel`: As `reset`, but restarts are run in parallel by a thread pool
+  (`OptimizationConfig.n_workers`)
+* `warmstart`: Each fit starts from the previous optimum, and random
+  restarts are done only every `restart_period` fits
+  (`OptimizationConfig.restart_period`)
+
+Times are recorded with :class:`SimpleProfiler`. We also report the negative
+log marginal likelihood after the final fit (smaller is better).
+"""
+import argparse
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
+    OptimizationConfig,
+    DEFAULT_OPTIMIZATION_CONFIG,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression import (
+    GaussianProcessRegression,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import Matern52
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.optimization_utils import (
+    add_regularizer_to_criterion,
+)
+from syne_tune.optimizer.schedulers.utils.simple_profiler import SimpleProfiler
+
+
+def _create_model(
+    num_dims: int, n_starts: int, n_workers: int, restart_period: int, warmstart: bool
+) -> GaussianProcessRegression:
+    optimization_config = OptimizationConfig(
+        lbfgs_tol=DEFAULT_OPTIMIZATION_CONFIG.lbfgs_tol,
+        lbfgs_maxiter=DEFAULT_OPTIMIZATION_CONFIG.lbfgs_maxiter,
+        verbose=False,
+        n_starts=n_starts,
+        n_workers=n_workers,
+        restart_period=restart_period,
+    )
+    return GaussianProcessRegression(
+        kernel=Matern52(dimension=num_dims, ARD=True),
+        optimization_config=optimization_config,
+        random_seed=0,
+        fit_reset_params=not warmstart,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_dims", type=int, default=6)
+    parser.add_argument("--num_data_min", type=int, default=20)
+    parser.add_argument("--num_data_max", type=int, default=200)
+    parser.add_argument("--report_every", type=int, default=20)
+    parser.add_argument("--n_starts", type=int, default=5)
+    parser.add_argument("--n_workers", type=int, default=4)
+    parser.add_argument("--restart_period", type=int, default=10)
+    args = parser.parse_args()
+
+    random_state = np.random.RandomState(0)
+    features = random_state.uniform(size=(args.num_data_max, args.num_dims))
+    targets = np.sin(3 * features[:, 0]) + features[:, 1] ** 2
+    targets += 0.1 * random_state.normal(size=args.num_data_max)
+    targets = ((targets - np.mean(targets)) / np.std(targets)).reshape((-1, 1))
+
+    variants = {
+        "reset": dict(n_workers=1, restart_period=1, warmstart=False),
+        "parallel": dict(n_workers=args.n_workers, restart_period=1, warmstart=False),
+        "warmstart": dict(
+            n_workers=1, restart_period=args.restart_period, warmstart=True
+        ),
+    }
+    times = dict()
+    criterion_values = dict()
+    num_data_values = list(range(args.num_data_min, args.num_data_max + 1))
+    for name, kwargs in variants.items():
+        model = _create_model(args.num_dims, args.n_starts, **kwargs)
+        profiler = SimpleProfiler()
+        for num_data in num_data_values:
+            data = {"features": features[:num_data], "targets": targets[:num_data]}
+            profiler.begin_block({"num_data": num_data})
+            profiler.start("all")
+            model.fit(data, profiler=profiler)
+            profiler.stop("all")
+        times[name] = profiler.records_as_dict()["all_sum"]
+        criterion_values[name] = add_regularizer_to_criterion(
+            model.likelihood, [data]
+        ).item()
+
+    print("num_data  " + "  ".join(f"{name + '_ms':>12}" for name in variants))
+    for pos, num_data in enumerate(num_data_values):
+        if (num_data - args.num_data_min) % args.report_every == 0:
+            print(
+                f"{num_data:8d}  "
+                + "  ".join(f"{1e3 * times[name][pos]:12.1f}" for name in variants)
+            )
+    print("total_s   " + "  ".join(f"{sum(times[name]):12.2f}" for name in variants))
+    print(
+        "crit      " + "  ".join(f"{criterion_values[name]:12.3f}" for name in variants)
+    )
@@ -0,0 +1,127 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the exact GP surrogate model with its subset-of-data variant
+(`max_size_data_for_model` of GP searchers) as the number of observations n
+grows. For each n, the time for fitting hyperparameters and computing the
+posterior (`model_factory.model`) is measured, and the quality of predictions
+on held-out points is reported as RMSE of the predictive mean and average
+negative log predictive density (NLPD). We compare:
+
+* `exact`: GP fit to all observations. Its cost grows cubically with n, so it
+  is run only for n up to `--max_exact`
+* `subset`: GP fit to at most `--max_size` observations, made up of the best
+  ones and others sampled at random
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy.stats import norm
+
+from syne_tune.config_space import uniform
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
+    dictionarize_objective,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
+    OptimizationConfig,
+    DEFAULT_OPTIMIZATION_CONFIG,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression import (
+    GaussianProcessRegression,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import Matern52
+from syne_tune.optimizer.schedulers.searchers.bayesopt.models.gp_model import (
+    GaussProcEmpiricalBayesModelFactory,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.utils.test_objects import (
+    create_tuning_job_state,
+)
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
+    make_hyperparameter_ranges,
+)
+
+
+def _objective(x: np.ndarray) -> np.ndarray:
+    return np.sin(3 * x[:, 0]) + x[:, 1] ** 2 + 0.5 * np.cos(5 * x[:, 2] * x[:, 3])
+
+
+def _model_factory(
+    num_dims: int, max_size: int, opt_nstarts: int, opt_maxiter: int
+) -> GaussProcEmpiricalBayesModelFactory:
+    gpmodel = GaussianProcessRegression(
+        kernel=Matern52(dimension=num_dims, ARD=True),
+        optimization_config=OptimizationConfig(
+            lbfgs_tol=DEFAULT_OPTIMIZATION_CONFIG.lbfgs_tol,
+            lbfgs_maxiter=opt_maxiter,
+            verbose=False,
+            n_starts=opt_nstarts,
+        ),
+        random_seed=0,
+    )
+    return GaussProcEmpiricalBayesModelFactory(
+        gpmodel=gpmodel,
+        num_fantasy_samples=20,
+        max_size_data_for_model=max_size,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_data", type=int, nargs="+", default=[100, 500, 2000, 5000, 20000]
+    )
+    parser.add_argument("--num_dims", type=int, default=4)
+    parser.add_argument("--max_size", type=int, default=500)
+    parser.add_argument("--max_exact", type=int, default=2000)
+    parser.add_argument("--num_test", type=int, default=1000)
+    parser.add_argument("--noise_std", type=float, default=0.1)
+    parser.add_argument("--opt_nstarts", type=int, default=2)
+    parser.add_argument("--opt_maxiter", type=int, default=50)
+    args = parser.parse_args()
+
+    config_space = {f"x{i}": uniform(0.0, 1.0) for i in range(args.num_dims)}
+    hp_ranges = make_hyperparameter_ranges(config_space)
+    random_state = np.random.RandomState(0)
+    test_features = random_state.uniform(size=(args.num_test, args.num_dims))
+    test_targets = _objective(test_features) + args.noise_std * random_state.normal(
+        size=args.num_test
+    )
+    print("num_data  variant  time_s    rmse    nlpd")
+    for num_data in args.num_data:
+        features = random_state.uniform(size=(num_data, args.num_dims))
+        targets = _objective(features) + args.noise_std * random_state.normal(
+            size=num_data
+        )
+        state = create_tuning_job_state(
+            hp_ranges=hp_ranges,
+            cand_tuples=[tuple(x) for x in features],
+            metrics=[dictionarize_objective(y) for y in targets],
+        )
+        for variant, max_size in (("exact", None), ("subset", args.max_size)):
+            if max_size is None and num_data > args.max_exact:
+                continue
+            model_factory = _model_factory(
+                args.num_dims, max_size, args.opt_nstarts, args.opt_maxiter
+            )
+            start_time = time.perf_counter()
+            model = model_factory.model(state, fit_params=True)
+            elapsed_time = time.perf_counter() - start_time
+            prediction = model.predict(test_features)[0]
+            means, stds = prediction["mean"], prediction["std"]
+            rmse = np.sqrt(np.mean((means - test_targets) ** 2))
+            nlpd = -np.mean(norm.logpdf(test_targets, loc=means, scale=stds))
+            print(
+                f"{num_data:8d}  {variant:>7}  {elapsed_time:6.2f}  {rmse:6.4f}  "
+                f"{nlpd:6.3f}"
+            )
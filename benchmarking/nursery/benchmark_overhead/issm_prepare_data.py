@@ -0,0 +1,115 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures the time spent in `prepare_data` of the learning curve surrogate
+models (GP-ISSM, GP-expdecay) when it is called once per new observation, as
+happens in `GaussProcAdditiveModelFactory`. Starting from `--num_trials`
+trials with one observation each, observations at the next resource level are
+appended to random trials, and data is prepared after every
+`--num_new` additions. We compare:
+
+* `rebuild`: Configurations are encoded and observations sorted from scratch
+  in every call
+* `cached`: `PreparedDataCache` keeps encoded features and sorted observations
+  per trial, and only appends the new entries
+
+The time of `issm_likelihood_precomputations` for the final data is reported
+as well.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from syne_tune.config_space import randint, uniform
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.config_ext import (
+    ExtendedConfiguration,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.tuning_job_state import (
+    TuningJobState,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.learncurve.issm import (
+    PreparedDataCache,
+    issm_likelihood_precomputations,
+    prepare_data,
+)
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
+    make_hyperparameter_ranges,
+)
+
+
+METRIC = "metric"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trials", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--num_dims", type=int, default=8)
+    parser.add_argument("--max_resource", type=int, default=81)
+    parser.add_argument("--num_updates", type=int, default=100)
+    parser.add_argument("--num_new", type=int, default=5)
+    args = parser.parse_args()
+
+    config_space = {f"x{i}": uniform(0.0, 1.0) for i in range(args.num_dims - 1)}
+    config_space["n"] = randint(1, 64)
+    hp_ranges = make_hyperparameter_ranges(config_space)
+    config_space_ext = ExtendedConfiguration(
+        hp_ranges,
+        resource_attr_key="epoch",
+        resource_attr_range=(1, args.max_resource),
+    )
+    print("num_trials  num_obs  variant  time_s  precomp_s")
+    for num_trials in args.num_trials:
+        for variant in ("rebuild", "cached"):
+            random_state = np.random.RandomState(0)
+            state = TuningJobState(
+                hp_ranges=hp_ranges, config_for_trial=dict(), trials_evaluations=[]
+            )
+            for trial_id in range(num_trials):
+                metrics = state.metrics_for_trial(
+                    str(trial_id), config=hp_ranges.random_config(random_state)
+                )
+                metrics[METRIC] = {"1": random_state.randn()}
+            data_cache = PreparedDataCache(hp_ranges) if variant == "cached" else None
+            num_obs = num_trials
+            elapsed_time = 0
+            for _ in range(args.num_updates):
+                for _ in range(args.num_new):
+                    trial_id = str(random_state.randint(num_trials))
+                    metric_vals = state.metrics_for_trial(trial_id)[METRIC]
+                    resource = len(metric_vals) + 1
+                    if resource <= args.max_resource:
+                        new_labels = {str(resource): random_state.randn()}
+                        metric_vals.update(new_labels)
+                        num_obs += 1
+                        # As done by :class:`ModelStateTransformer`
+                        if data_cache is not None:
+                            data_cache.append_observations(
+                                trial_id, {METRIC: new_labels}
+                            )
+                start_time = time.perf_counter()
+                data = prepare_data(
+                    state=state,
+                    config_space_ext=config_space_ext,
+                    active_metric=METRIC,
+                    normalize_targets=True,
+                    data_cache=data_cache,
+                )
+                elapsed_time += time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            issm_likelihood_precomputations(data["targets"], r_min=1)
+            precomp_time = time.perf_counter() - start_time
+            print(
+                f"{num_trials:10d}  {num_obs:7d}  {variant:>7}  {elapsed_time:6.3f}  "
+                f"{precomp_time:9.5f}"
+            )
@@ -0,0 +1,129 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures the latency of `get_config` of `KernelDensityEstimator` (the
+searcher used by BOHB) as a function of the number of observations and the
+number of hyperparameters. We compare:
+
+* `loop`: Refit both KDEs on every call, sample candidates one by one and
+  evaluate the densities one point at a time (as done before)
+* `batch`: Cached KDEs, all candidates sampled as one array, densities
+  evaluated over the whole candidate matrix at once
+"""
+import argparse
+import time
+
+import numpy as np
+import scipy.stats as sps
+
+from syne_tune.config_space import uniform, randint, choice
+from syne_tune.optimizer.schedulers.searchers.kde.kde_searcher import (
+    KernelDensityEstimator,
+)
+
+
+def _config_space(num_dims: int) -> dict:
+    config_space = dict()
+    for pos in range(num_dims):
+        if pos % 4 == 2:
+            config_space[f"x{pos}"] = randint(1, 32)
+        elif pos % 4 == 3:
+            config_space[f"x{pos}"] = choice(["a", "b", "c", "d"])
+        else:
+            config_space[f"x{pos}"] = uniform(0.0, 1.0)
+    return config_space
+
+
+def _legacy_get_config(searcher: KernelDensityEstimator) -> dict:
+    models = searcher.train_kde(np.array(searcher.X), np.array(searcher.y))
+    bad_kde, good_kde = models
+    random_state = searcher.random_state
+    current_best = None
+    val_current_best = None
+    for _ in range(searcher.num_candidates):
+        mean = good_kde.data[random_state.randint(0, len(good_kde.data))]
+        candidate = []
+        for m, bw, (vartype, domain) in zip(mean, good_kde.bw, searcher.vartypes):
+            bw = max(bw, searcher.min_bandwidth)
+            if vartype == "c":
+                bw = searcher.bandwidth_factor * bw
+                candidate.append(
+                    sps.truncnorm.rvs(
+                        -m / bw,
+                        (1 - m) / bw,
+                        loc=m,
+                        scale=bw,
+                        random_state=random_state,
+                    )
+                )
+            elif random_state.rand() < (1 - bw):
+                candidate.append(m)
+            elif vartype == "o":
+                sample = random_state.randint(domain[0], domain[1])
+                candidate.append((sample - domain[0]) / (domain[1] - domain[0]))
+            else:
+                candidate.append(random_state.randint(domain) / domain)
+        val = max(1e-32, bad_kde.pdf(candidate)) / max(good_kde.pdf(candidate), 1e-32)
+        if val_current_best is None or val_current_best > val:
+            current_best = candidate
+            val_current_best = val
+    return searcher.from_feature(feature_vector=current_best)
+
+
+def _time_per_call(fun, num_calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fun()
+    return (time.perf_counter() - start) / num_calls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_observations", type=int, nargs="+", default=[200, 1000, 3000]
+    )
+    parser.add_argument("--num_dims", type=int, nargs="+", default=[5, 20])
+    parser.add_argument("--num_candidates", type=int, default=64)
+    parser.add_argument("--num_calls", type=int, default=5)
+    args = parser.parse_args()
+
+    print("num_dims  num_observations  loop_ms  batch_ms  speedup")
+    for num_dims in args.num_dims:
+        config_space = _config_space(num_dims)
+        for num_observations in args.num_observations:
+            searcher = KernelDensityEstimator(
+                config_space,
+                metric="loss",
+                points_to_evaluate=[],
+                num_candidates=args.num_candidates,
+                random_fraction=0.0,
+                random_seed=0,
+                debug_log=False,
+            )
+            random_state = np.random.RandomState(0)
+            for trial_id in range(num_observations):
+                config = {
+                    k: v.sample(random_state=random_state)
+                    for k, v in config_space.items()
+                }
+                searcher._update(str(trial_id), config, {"loss": random_state.rand()})
+            # First call fits the KDEs, which are then cached
+            searcher.get_config()
+            time_loop = _time_per_call(
+                lambda: _legacy_get_config(searcher), args.num_calls
+            )
+            time_batch = _time_per_call(searcher.get_config, args.num_calls)
+            print(
+                f"{num_dims:8d}  {num_observations:16d}  {1e3 * time_loop:7.1f}  "
+                f"{1e3 * time_batch:8.2f}  {time_loop / time_batch:7.1f}"
+            )
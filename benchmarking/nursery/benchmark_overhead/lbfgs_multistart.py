@@ -0,0 +1,111 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares local optimization of the acquisition function of the GP searcher
+from several starting points, as a function of the number of starts. We
+compare (as in Bayesian optimization, starts are the top-ranked among many
+random candidates):
+
+* `sequential`: `LBFGSOptimizeAcquisition.optimize` is called for each start,
+  so every L-BFGS iteration calls the model for a single point
+* `batch`: `LBFGSOptimizeAcquisition.optimize_batch` advances all starts
+  jointly, computing acquisition values and gradients for all of them with a
+  single model call, and dropping starts once they have converged
+
+Apart from the time per call, we report the best acquisition value found
+(smaller is better), which should be about the same for both variants.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from syne_tune.config_space import uniform, loguniform, randint
+from syne_tune.optimizer.schedulers.searchers import GPFIFOSearcher
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.base_classes import (
+    unwrap_acquisition_class_and_kwargs,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components import (
+    LBFGSOptimizeAcquisition,
+)
+
+
+def _config_space(num_dims: int) -> dict:
+    config_space = dict()
+    for pos in range(num_dims):
+        if pos % 3 == 1:
+            config_space[f"x{pos}"] = loguniform(1e-4, 1.0)
+        elif pos % 3 == 2:
+            config_space[f"x{pos}"] = randint(1, 256)
+        else:
+            config_space[f"x{pos}"] = uniform(0.0, 1.0)
+    return config_space
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_starts", type=int, nargs="+", default=[2, 5, 10, 20])
+    parser.add_argument("--num_dims", type=int, default=8)
+    parser.add_argument("--num_observations", type=int, default=100)
+    parser.add_argument("--num_initial_candidates", type=int, default=2000)
+    args = parser.parse_args()
+
+    config_space = _config_space(args.num_dims)
+    searcher = GPFIFOSearcher(
+        config_space,
+        metric="loss",
+        mode="min",
+        points_to_evaluate=[],
+        random_seed=0,
+        debug_log=False,
+    )
+    random_state = np.random.RandomState(0)
+    for trial_id in range(args.num_observations):
+        config = {
+            k: v.sample(random_state=random_state) for k, v in config_space.items()
+        }
+        loss = sum((v - 0.3) ** 2 for v in config.values() if isinstance(v, float))
+        searcher._update(str(trial_id), config, {"loss": loss})
+    model = searcher.state_transformer.model()
+    hp_ranges = searcher.hp_ranges
+    local_optimizer = LBFGSOptimizeAcquisition(
+        hp_ranges=hp_ranges, model=model, acquisition_class=searcher.acquisition_class
+    )
+    acquisition_class, acquisition_kwargs = unwrap_acquisition_class_and_kwargs(
+        searcher.acquisition_class
+    )
+    acquisition_function = acquisition_class(model, **acquisition_kwargs)
+
+    def best_value(configs) -> float:
+        return np.min(
+            acquisition_function.compute_acq(hp_ranges.to_ndarray_matrix(configs))
+        )
+
+    print("num_starts  sequential_ms  batch_ms  speedup  sequential_acq  batch_acq")
+    for num_starts in args.num_starts:
+        inputs = hp_ranges.random_ndarray_matrix(
+            random_state, args.num_initial_candidates
+        )
+        order = np.argsort(acquisition_function.compute_acq(inputs).reshape((-1,)))
+        starts = [hp_ranges.from_ndarray(x) for x in inputs[order[:num_starts]]]
+        start_time = time.perf_counter()
+        sequential = [local_optimizer.optimize(config) for config in starts]
+        time_sequential = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        batch = [config for _, config in local_optimizer.optimize_batch(starts)]
+        time_batch = time.perf_counter() - start_time
+        print(
+            f"{num_starts:10d}  {1e3 * time_sequential:13.1f}  "
+            f"{1e3 * time_batch:8.1f}  {time_sequential / time_batch:7.1f}  "
+            f"{best_value(sequential):14.5f}  {best_value(batch):9.5f}"
+        )
@@ -0,0 +1,81 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the per-poll cost of retrieving metrics from a growing `std.out` of
+a trial: parsing the full log at every poll (as done with `retrieve`) against
+tailing it with `IncrementalMetricsRetriever`.
+
+The log is grown in chunks of chatty training output interleaved with
+`[tune-metric]` lines, and both approaches poll after each chunk. Cost of
+the former grows linearly with the log size, the latter should stay flat.
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from syne_tune.report import retrieve, IncrementalMetricsRetriever
+
+
+def _write_chunk(f, num_lines: int, step: int, metric_every: int):
+    noise = "INFO some chatty training log line with a bit of payload " * 2
+    for i in range(num_lines):
+        if i % metric_every == 0:
+            f.write(f"[tune-metric]: {json.dumps({'step': step, 'loss': 0.1})}\n")
+            step += 1
+        else:
+            f.write(noise + "\n")
+    return step
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max_size_mb", type=int, default=200)
+    parser.add_argument("--lines_per_poll", type=int, default=20000)
+    parser.add_argument("--metric_every", type=int, default=100)
+    parser.add_argument(
+        "--skip_full",
+        action="store_true",
+        help="Do not time full re-parsing (which becomes slow for large logs)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "std.out"
+        retriever = IncrementalMetricsRetriever(path)
+        step = 0
+        size_mb = 0
+        print("size_mb  num_metrics  full_parse_ms  incremental_ms")
+        while size_mb < args.max_size_mb:
+            with open(path, "a") as f:
+                step = _write_chunk(
+                    f, args.lines_per_poll, step=step, metric_every=args.metric_every
+                )
+            size_mb = path.stat().st_size / 2**20
+            start = time.perf_counter()
+            retriever.read_new()
+            time_incremental = time.perf_counter() - start
+            assert len(retriever.metrics) == step
+            if args.skip_full:
+                time_full = float("nan")
+            else:
+                start = time.perf_counter()
+                with open(path, "r") as f:
+                    metrics = retrieve(log_lines=f.readlines())
+                time_full = time.perf_counter() - start
+                assert len(metrics) == step
+            print(
+                f"{size_mb:7.1f}  {step:11d}  {1000 * time_full:13.1f}  "
+                f"{1000 * time_incremental:14.2f}"
+            )
@@ -0,0 +1,89 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of ranking a new result at a rung level of MOASHA with
+non-dominated sorting, as a function of the number of trials which reached
+the rung:
+
+* `full`: Non-dominated sort of all results at the rung for every new
+  result (`MORungData` with `NonDominatedPriority`)
+* `incremental`: Pareto fronts of the rung are maintained under insertion,
+  and only the epsilon-net of the front of the new result is computed
+  (`NonDominatedRungData`)
+
+Objectives are drawn at random, either independently or anti-correlated
+(first two objectives), in which case fronts are large.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.multiobjective.multiobjective_priority import (
+    NonDominatedPriority,
+)
+
+
+def _sample_objectives(
+    random_state, num_samples: int, num_objectives: int, anti_correlated: bool
+) -> np.ndarray:
+    X = random_state.rand(num_samples, num_objectives)
+    if anti_correlated:
+        X[:, 1] = 1 - X[:, 0] + 0.05 * X[:, 1]
+    return X
+
+
+def _metrics(x: np.ndarray) -> dict:
+    return {f"metric-{i}": v for i, v in enumerate(x)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_trials", type=int, nargs="+", default=[100, 1000, 3000, 10000]
+    )
+    parser.add_argument("--num_objectives", type=int, default=3)
+    parser.add_argument("--num_calls", type=int, default=20)
+    args = parser.parse_args()
+
+    print("objectives       num_trials  fill_incremental_s  full_ms  incremental_ms")
+    for anti_correlated in (False, True):
+        name = "anti-correlated" if anti_correlated else "independent"
+        for num_trials in args.num_trials:
+            random_state = np.random.RandomState(0)
+            X = _sample_objectives(
+                random_state,
+                num_trials + args.num_calls,
+                args.num_objectives,
+                anti_correlated,
+            )
+            priority = NonDominatedPriority(dim=0)
+            rung_data = priority.rung_data()
+            start = time.perf_counter()
+            for trial_id in range(num_trials):
+                rung_data.add(trial_id, _metrics(X[trial_id]))
+            fill_time = time.perf_counter() - start
+            # Full: priorities of all entries are recomputed for a new one
+            start = time.perf_counter()
+            for i in range(args.num_calls):
+                priority(X[: (num_trials + i + 1)])
+            full_time = (time.perf_counter() - start) / args.num_calls
+            start = time.perf_counter()
+            for i in range(args.num_calls):
+                trial_id = num_trials + i
+                rung_data.add(trial_id, _metrics(X[trial_id]))
+            incremental_time = (time.perf_counter() - start) / args.num_calls
+            print(
+                f"{name:>15}  {num_trials:11d}  {fill_time:18.2f}  "
+                f"{full_time * 1000:7.1f}  {incremental_time * 1000:14.2f}"
+            )
@@ -0,0 +1,121 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the latency of the two hot paths of NeuralBand, as a function of the
+number of observations:
+
+* `train`: Training the budget-aware network, with per-sample Adam steps (at
+  most 500, `legacy`) versus mini-batches drawn from contiguous tensors
+  (`Exploitation.train`)
+* `screen`: Scoring `max_while_loop + 2` candidate configurations, with one
+  forward pass per candidate (`legacy`) versus a single forward pass for all
+  of them (`Exploitation.predict_batch`)
+"""
+import argparse
+import time
+
+import numpy as np
+import torch
+import torch.optim as optim
+
+from syne_tune.optimizer.schedulers.neuralbands.networks import (
+    Exploitation,
+    device,
+)
+
+
+def _legacy_train(net: Exploitation) -> float:
+    # Per-sample training loop which `Exploitation.train` used before
+    optimizer = optim.Adam(net.func.parameters(), lr=net.lr)
+    x1_list = list(net.x1_data)
+    b_list = list(net.b_data.reshape((-1,)))
+    reward_list = net.reward_data.reshape((-1,)).tolist()
+    length = len(reward_list)
+    index = np.arange(length)
+    np.random.shuffle(index)
+    cnt = 0
+    tot_loss = 0
+    while True:
+        batch_loss = 0
+        for idx in index:
+            x1 = x1_list[idx].to(device)
+            b = b_list[idx].to(device)
+            r = reward_list[idx]
+            optimizer.zero_grad()
+            loss = (net.func(x1, b) - r) ** 2
+            loss.backward()
+            optimizer.step()
+            batch_loss += loss.item()
+            tot_loss += loss.item()
+            cnt += 1
+            if cnt >= 500:
+                return tot_loss / cnt
+        if batch_loss / length <= 1e-4:
+            return batch_loss / length
+
+
+def _mse(net: Exploitation) -> float:
+    with torch.no_grad():
+        pred = net.func(net.x1_data, net.b_data)
+        return torch.mean((pred - net.reward_data) ** 2).item()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_data", type=int, nargs="+", default=[30, 300, 3000])
+    parser.add_argument("--dim", type=int, default=6)
+    parser.add_argument("--max_while_loop", type=int, default=50)
+    parser.add_argument("--num_calls", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        "num_data  train_legacy_ms  train_ms  mse_legacy  mse  "
+        "screen_legacy_ms  screen_ms"
+    )
+    num_candidates = args.max_while_loop + 2
+    for num_data in args.num_data:
+        random_state = np.random.RandomState(0)
+        x1 = random_state.rand(num_data, args.dim)
+        budgets = random_state.randint(1, 10, size=num_data) / 9
+        rewards = np.sin(3 * x1).mean(axis=1) * (1.5 - budgets)
+        results = dict()
+        for name, train in (
+            ("legacy", _legacy_train),
+            ("batched", Exploitation.train),
+        ):
+            torch.manual_seed(0)
+            net = Exploitation(dim=args.dim)
+            for x, b, r in zip(x1, budgets, rewards):
+                net.add_data((x, b), r)
+            start = time.perf_counter()
+            for _ in range(args.num_calls):
+                train(net)
+            results[name] = (
+                (time.perf_counter() - start) / args.num_calls,
+                _mse(net),
+            )
+        candidates = random_state.rand(num_candidates, args.dim)
+        start = time.perf_counter()
+        for _ in range(args.num_calls):
+            scores = [net.predict((x, 1.0)).item() for x in candidates]
+        screen_legacy_time = (time.perf_counter() - start) / args.num_calls
+        start = time.perf_counter()
+        for _ in range(args.num_calls):
+            scores = net.predict_batch(candidates, 1.0)
+        screen_time = (time.perf_counter() - start) / args.num_calls
+        print(
+            f"{num_data:8d}  {results['legacy'][0] * 1000:15.1f}  "
+            f"{results['batched'][0] * 1000:8.1f}  {results['legacy'][1]:10.4f}  "
+            f"{results['batched'][1]:3.4f}  {screen_legacy_time * 1000:16.2f}  "
+            f"{screen_time * 1000:9.2f}"
+        )
@@ -0,0 +1,69 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the time `PythonBackend` needs to run a number of cheap trials
+(one after the other, on a single worker) when starting a new interpreter per
+trial, against running them on a pool of long-lived workers
+(`use_worker_pool=True`).
+"""
+import argparse
+import logging
+import tempfile
+import time
+
+from syne_tune.backend import PythonBackend
+from syne_tune.backend.trial_status import Status
+from syne_tune.config_space import uniform
+
+
+def cheap_function(x):
+    from syne_tune import Reporter
+
+    reporter = Reporter()
+    reporter(y=x**2)
+
+
+def time_trials(use_worker_pool: bool, num_trials: int) -> float:
+    with tempfile.TemporaryDirectory() as local_path:
+        backend = PythonBackend(
+            cheap_function,
+            config_space={"x": uniform(-1, 1)},
+            use_worker_pool=use_worker_pool,
+        )
+        backend.set_path(str(local_path))
+        start_time = time.perf_counter()
+        for i in range(num_trials):
+            trial_id = backend.start_trial({"x": i / num_trials}).trial_id
+            while True:
+                trials, _ = backend.fetch_status_results([trial_id])
+                status = trials[trial_id][1]
+                if status != Status.in_progress:
+                    break
+                backend.wait_for_events([trial_id], timeout=1)
+            assert status == Status.completed
+        total_time = time.perf_counter() - start_time
+        backend.stop_all()
+    return total_time
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trials", type=int, default=20)
+    args = parser.parse_args()
+
+    print("mode         seconds_per_trial")
+    for use_worker_pool in [False, True]:
+        total_time = time_trials(use_worker_pool, args.num_trials)
+        name = "worker-pool" if use_worker_pool else "subprocess"
+        print(f"{name:11s}  {total_time / args.num_trials:17.3f}")
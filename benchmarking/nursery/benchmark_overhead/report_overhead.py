@@ -0,0 +1,75 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the per-report overhead of `Reporter` writing to stdout against
+writing to the metrics channel (see `use_metrics_channel` in `LocalBackend`),
+as well as the cost of retrieving the reports on the back-end side. stdout is
+redirected to a file, as done by `LocalBackend`.
+"""
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from syne_tune.constants import ST_METRICS_CHANNEL_ENV
+from syne_tune.report import (
+    Reporter,
+    IncrementalMetricsRetriever,
+    MetricsChannelReader,
+)
+
+
+def _time_reports(num_reports: int, num_log_lines: int) -> float:
+    reporter = Reporter()
+    start = time.perf_counter()
+    for step in range(num_reports):
+        for _ in range(num_log_lines):
+            print("INFO some chatty training log line")
+        reporter(step=step, loss=1.0 / (step + 1), accuracy=0.5)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_reports", type=int, default=100000)
+    parser.add_argument("--num_log_lines", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stdout_path = Path(tmpdir) / "std.out"
+        channel_path = Path(tmpdir) / "metrics.bin"
+        timings = dict()
+        for name in ["stdout", "channel"]:
+            if name == "channel":
+                os.environ[ST_METRICS_CHANNEL_ENV] = str(channel_path)
+            with open(stdout_path, "w") as f, contextlib.redirect_stdout(f):
+                time_report = _time_reports(args.num_reports, args.num_log_lines)
+            if name == "channel":
+                del os.environ[ST_METRICS_CHANNEL_ENV]
+                retriever = MetricsChannelReader(channel_path)
+            else:
+                retriever = IncrementalMetricsRetriever(stdout_path)
+            start = time.perf_counter()
+            retriever.read_new(flush=True)
+            time_retrieve = time.perf_counter() - start
+            assert len(retriever.metrics) == args.num_reports
+            timings[name] = (time_report, time_retrieve)
+
+    print("channel  report_us  retrieve_us  (per report)")
+    for name, (time_report, time_retrieve) in timings.items():
+        print(
+            f"{name:7s}  {1e6 * time_report / args.num_reports:9.2f}  "
+            f"{1e6 * time_retrieve / args.num_reports:11.2f}"
+        )
@@ -0,0 +1,82 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of storing tuning results periodically, as done by
+:class:`StoreResultsCallback` every `results_update_interval` seconds. Results
+are reported with a given number of metrics, and stored after every
+`--store_every` results. We compare:
+
+* `rewrite`: All results so far are converted to a dataframe, which is written
+  to `results.csv.zip` (previous behaviour)
+* `journal`: Only new results are appended to `results.jsonl` (current
+  behaviour). The zipped CSV file is written once at the end
+
+We report the total time spent storing results, the maximum time of a
+single periodic store, which is how long the tuner loop is stalled, and the
+time for writing the zipped CSV file at the end.
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from syne_tune.tuner_callback import append_results_to_journal
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_results", type=int, nargs="+", default=[1000, 10000, 50000]
+    )
+    parser.add_argument("--store_every", type=int, default=100)
+    parser.add_argument("--num_metrics", type=int, default=10)
+    args = parser.parse_args()
+
+    random_state = np.random.RandomState(0)
+    print("num_results  variant  total_s  max_store_s  final_s")
+    for num_results in args.num_results:
+        results = [
+            dict(
+                {f"metric{j}": random_state.rand() for j in range(args.num_metrics)},
+                trial_id=i // 100,
+                epoch=i % 100 + 1,
+                st_decision="continue",
+            )
+            for i in range(num_results)
+        ]
+        for variant in ("rewrite", "journal"):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                csv_file = Path(tmpdir) / "results.csv.zip"
+                journal_file = Path(tmpdir) / "results.jsonl"
+                store_times = []
+                for start in range(0, num_results, args.store_every):
+                    end = start + args.store_every
+                    start_time = time.perf_counter()
+                    if variant == "rewrite":
+                        pd.DataFrame(results[:end]).to_csv(csv_file, index=False)
+                    else:
+                        append_results_to_journal(results[start:end], journal_file)
+                    store_times.append(time.perf_counter() - start_time)
+                final_time = 0
+                if variant == "journal":
+                    start_time = time.perf_counter()
+                    pd.DataFrame(results).to_csv(csv_file, index=False)
+                    final_time = time.perf_counter() - start_time
+                total_time = sum(store_times) + final_time
+                print(
+                    f"{num_results:11d}  {variant:>7}  {total_time:7.2f}  "
+                    f"{max(store_times):11.4f}  {final_time:7.2f}"
+                )
@@ -0,0 +1,105 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of decisions at a rung level of asynchronous Hyperband
+(ASHA), as a function of the number of trials which reached the rung:
+
+* `stopping`: Quantile cutoff on every report (`StoppingRungSystem`)
+* `promotion`: Cutoff plus best paused trial on every scheduling decision
+  (`PromotionRungSystem`)
+
+Each decision is computed from a plain dict by sorting or scanning all
+values (as done before `RungData`), and from `RungData`, which maintains
+the values in sorted order.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.hyperband_stopping import RungData
+
+
+def _legacy_stopping(recorded: dict, prom_quant: float) -> float:
+    return np.quantile(list(recorded.values()), prom_quant)
+
+
+def _legacy_promotion(recorded: dict, prom_quant: float):
+    cutoff = np.quantile([x[0] for x in recorded.values()], prom_quant)
+    trial_id, val = min(
+        ((k, v[0]) for k, v in recorded.items() if not v[1]),
+        key=lambda x: x[1],
+        default=(None, 0.0),
+    )
+    return trial_id if trial_id is not None and val <= cutoff else None
+
+
+def _promotion(recorded: RungData, prom_quant: float):
+    cutoff = recorded.quantile(prom_quant)
+    for trial_id, val in recorded.not_promoted_best_first():
+        return trial_id if val <= cutoff else None
+    return None
+
+
+def _time_per_call(fun, recorded, prom_quant: float, num_calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fun(recorded, prom_quant)
+    return (time.perf_counter() - start) / num_calls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_trials", type=int, nargs="+", default=[100, 1000, 10000, 50000]
+    )
+    parser.add_argument("--num_calls", type=int, default=200)
+    parser.add_argument("--prom_quant", type=float, default=1 / 3)
+    args = parser.parse_args()
+
+    random_state = np.random.RandomState(0)
+    print(
+        "num_trials  insert_us  stopping_dict_us  stopping_sorted_us  "
+        "promotion_dict_us  promotion_sorted_us"
+    )
+    for num_trials in args.num_trials:
+        values = random_state.rand(num_trials)
+        promoted = random_state.rand(num_trials) < 0.5
+        stopping_dict = dict()
+        promotion_dict = dict()
+        stopping_sorted = RungData("min")
+        promotion_sorted = RungData("min")
+        start = time.perf_counter()
+        for trial_id, (value, flag) in enumerate(zip(values, promoted)):
+            promotion_sorted[trial_id] = (value, flag)
+        time_insert = (time.perf_counter() - start) / num_trials
+        for trial_id, (value, flag) in enumerate(zip(values, promoted)):
+            stopping_dict[trial_id] = value
+            stopping_sorted[trial_id] = value
+            promotion_dict[trial_id] = (value, flag)
+        assert _legacy_promotion(promotion_dict, args.prom_quant) == _promotion(
+            promotion_sorted, args.prom_quant
+        )
+        times = [
+            _time_per_call(fun, recorded, args.prom_quant, args.num_calls)
+            for fun, recorded in [
+                (_legacy_stopping, stopping_dict),
+                (lambda r, q: r.quantile(q), stopping_sorted),
+                (_legacy_promotion, promotion_dict),
+                (_promotion, promotion_sorted),
+            ]
+        ]
+        print(
+            f"{num_trials:10d}  {1e6 * time_insert:9.2f}  {1e6 * times[0]:16.1f}  "
+            f"{1e6 * times[1]:18.2f}  {1e6 * times[2]:17.1f}  {1e6 * times[3]:19.2f}"
+        )
@@ -0,0 +1,156 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures simulation throughput (simulated results per wall-clock second) of
+a blackbox-backed simulation with ASHA, which stops most trials. Events of a
+stopped trial are removed from the event heap of the simulator back-end. We
+compare:
+
+* `eager`: All events of a trial are pushed onto the heap when it starts,
+  and the heap is rebuilt without the events of the trial on every removal
+  (previous behaviour)
+* `lazy`: Events of a trial are queued, and only the earliest is on the
+  heap. Removed events are skipped once they reach the top of the heap, and
+  the heap is compacted only once most of its entries are removed
+  (:class:`SimulatorState`)
+
+The blackbox is synthetic, with one result per epoch. The time spent in
+:class:`SimulatorState` is measured with `cProfile`.
+"""
+import argparse
+import cProfile
+import heapq
+import io
+import logging
+import pstats
+import time
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import syne_tune.config_space as sp
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.simulator_backend.events import SimulatorState, Event
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.optimizer.baselines import ASHA
+
+
+class EagerSimulatorState(SimulatorState):
+    def push_events(self, events: List[Tuple[Event, float]]):
+        for event, event_time in events:
+            self.push(event, event_time)
+
+    def remove_events(self, trial_id: int):
+        self.event_heap = [
+            elem for elem in self.event_heap if elem[2].trial_id != trial_id
+        ]
+        heapq.heapify(self.event_heap)
+        self._num_pending_events.pop(trial_id, None)
+
+
+def _synthetic_blackbox(num_configs: int, num_epochs: int) -> BlackboxTabular:
+    random_state = np.random.RandomState(0)
+    hyperparameters = pd.DataFrame(
+        {"x": np.arange(num_configs) % 100, "y": np.arange(num_configs) // 100}
+    )
+    final_error = random_state.rand(num_configs, 1, 1)
+    epochs = np.arange(1, num_epochs + 1).reshape(1, 1, -1)
+    error = final_error + 1.0 / epochs
+    time_per_epoch = random_state.uniform(1, 10, size=(num_configs, 1, 1))
+    elapsed_time = time_per_epoch * epochs
+    objectives_evaluations = np.stack([error, elapsed_time], axis=-1)
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={
+            "x": sp.choice(list(range(100))),
+            "y": sp.choice(list(range(num_configs // 100))),
+        },
+        fidelity_space={"epoch": sp.randint(1, num_epochs)},
+        objectives_evaluations=objectives_evaluations.astype(np.float32),
+        objectives_names=["metric_error", "metric_elapsed_time"],
+    )
+
+
+def run(variant: str, blackbox: BlackboxTabular, args) -> dict:
+    trial_backend = UserBlackboxBackend(
+        blackbox=blackbox, elapsed_time_attr="metric_elapsed_time", seed=0
+    )
+    if variant == "eager":
+        trial_backend._simulator_state = EagerSimulatorState()
+    scheduler = ASHA(
+        blackbox.configuration_space,
+        metric="metric_error",
+        mode="min",
+        resource_attr="epoch",
+        max_t=args.num_epochs,
+        random_seed=0,
+    )
+    callback = SimulatorCallback()
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        stop_criterion=StoppingCriterion(max_num_trials_started=args.num_trials),
+        n_workers=args.n_workers,
+        sleep_time=0,
+        callbacks=[callback],
+        results_update_interval=3600,
+        print_update_interval=3600,
+        save_tuner=False,
+    )
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    with redirect_stdout(io.StringIO()):  # final status is printed
+        profiler.runcall(tuner.run)
+    elapsed_time = time.perf_counter() - start_time
+    stats = pstats.Stats(profiler).stats
+    heap_time = sum(
+        stats[func][2]  # total time, excluding subcalls
+        for func in stats
+        if func[0].endswith("simulator_backend/events.py")
+        or (func[0] == "~" and "heap" in func[2])
+    )
+    num_results = len(callback.results)
+    return dict(
+        elapsed_time=elapsed_time,
+        heap_time=heap_time,
+        num_results=num_results,
+        throughput=num_results / elapsed_time,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trials", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--num_epochs", type=int, default=100)
+    parser.add_argument("--n_workers", type=int, default=32)
+    parser.add_argument("--num_configs", type=int, default=20000)
+    args = parser.parse_args()
+    logging.getLogger("syne_tune").setLevel(logging.WARNING)
+
+    blackbox = _synthetic_blackbox(args.num_configs, args.num_epochs)
+    print("num_trials  variant  num_results  total_s  heap_s  results_per_s")
+    for num_trials in args.num_trials:
+        args.num_trials = num_trials
+        for variant in ("eager", "lazy"):
+            result = run(variant, blackbox, args)
+            print(
+                f"{num_trials:10d}  {variant:>7}  {result['num_results']:11d}  "
+                f"{result['elapsed_time']:7.1f}  {result['heap_time']:6.2f}  "
+                f"{result['throughput']:13.1f}"
+            )
@@ -0,0 +1,104 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Runs a blackbox-backed simulation with ASHA (see `simulator_event_heap.py`)
+with and without `TunerProfilingCallback`, and reports:
+
+* Simulation throughput (simulated results per wall-clock second) of both
+  runs, which shows the overhead of profiling the tuner loop
+* Summary of the profiled run: how the time of the tuner loop is split
+  between back-end, scheduler, callbacks, bookkeeping and sleeping
+"""
+import argparse
+import io
+import logging
+import time
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.optimizer.baselines import ASHA
+from syne_tune.tuner_callback import TunerProfilingCallback
+
+from simulator_event_heap import _synthetic_blackbox
+
+
+def run(profile: bool, blackbox, args) -> dict:
+    trial_backend = UserBlackboxBackend(
+        blackbox=blackbox, elapsed_time_attr="metric_elapsed_time", seed=0
+    )
+    scheduler = ASHA(
+        blackbox.configuration_space,
+        metric="metric_error",
+        mode="min",
+        resource_attr="epoch",
+        max_t=args.num_epochs,
+        random_seed=0,
+    )
+    callback = SimulatorCallback()
+    callbacks = [callback]
+    profiler = None
+    if profile:
+        profiler = TunerProfilingCallback(flush_interval=1000, log_summary=False)
+        callbacks.append(profiler)
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        stop_criterion=StoppingCriterion(max_num_trials_started=args.num_trials),
+        n_workers=args.n_workers,
+        sleep_time=0,
+        callbacks=callbacks,
+        results_update_interval=3600,
+        print_update_interval=3600,
+        save_tuner=False,
+    )
+    start_time = time.perf_counter()
+    with redirect_stdout(io.StringIO()):  # final status is printed
+        tuner.run()
+    elapsed_time = time.perf_counter() - start_time
+    num_results = len(callback.results)
+    return dict(
+        elapsed_time=elapsed_time,
+        num_results=num_results,
+        throughput=num_results / elapsed_time,
+        summary=profiler.summary() if profiler is not None else None,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trials", type=int, default=2000)
+    parser.add_argument("--num_epochs", type=int, default=100)
+    parser.add_argument("--n_workers", type=int, default=32)
+    parser.add_argument("--num_configs", type=int, default=20000)
+    args = parser.parse_args()
+    logging.getLogger("syne_tune").setLevel(logging.WARNING)
+
+    blackbox = _synthetic_blackbox(args.num_configs, args.num_epochs)
+    print("profile  num_results  total_s  results_per_s")
+    summary = None
+    for profile in (False, True):
+        result = run(profile, blackbox, args)
+        print(
+            f"{str(profile):>7}  {result['num_results']:11d}  "
+            f"{result['elapsed_time']:7.1f}  {result['throughput']:13.1f}"
+        )
+        if profile:
+            summary = result["summary"]
+    with pd.option_context("display.float_format", "{:.2e}".format):
+        print(summary.to_string(index=False))
@@ -0,0 +1,88 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of checkpointing the tuner state after a new result, when
+a GP-based searcher holds n observations. We compare:
+
+* `snapshot`: The scheduler (the dominating part of :class:`Tuner`) is
+  serialized and written to file (`Tuner.save`, done every
+  `results_update_interval` seconds by default)
+* `journal`: The event for the new result is appended to the tuner journal
+  (:class:`TunerJournal`, used if `snapshot_interval` is given). Snapshots
+  are then taken only every `snapshot_interval` seconds
+
+We report times per checkpoint and the size of the snapshot.
+"""
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import dill
+import numpy as np
+
+from syne_tune.backend.trial_status import Trial, Status
+from syne_tune.config_space import uniform
+from syne_tune.optimizer.schedulers.fifo import FIFOScheduler
+from syne_tune.tuner_journal import TunerJournal
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_observations", type=int, nargs="+", default=[100, 1000, 10000]
+    )
+    parser.add_argument("--num_dims", type=int, default=10)
+    parser.add_argument("--num_repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    config_space = {f"x{i}": uniform(0.0, 1.0) for i in range(args.num_dims)}
+    random_state = np.random.RandomState(0)
+    print("num_obs  snapshot_s  snapshot_mb  journal_s")
+    for num_observations in args.num_observations:
+        scheduler = FIFOScheduler(
+            config_space,
+            searcher="bayesopt",
+            metric="loss",
+            mode="min",
+            random_seed=0,
+        )
+        for trial_id in range(num_observations):
+            config = {k: random_state.rand() for k in config_space.keys()}
+            trial = Trial(
+                trial_id=trial_id, config=config, creation_time=datetime.now()
+            )
+            scheduler.on_trial_complete(trial, {"loss": random_state.rand()})
+        event = dict(
+            kind="results",
+            trial_status_dict={trial_id: (trial, Status.completed)},
+            new_results=[(trial_id, {"loss": 0.5, "epoch": 1})],
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot_file = Path(tmpdir) / "tuner.dill"
+            start_time = time.perf_counter()
+            for _ in range(args.num_repeats):
+                with open(snapshot_file, "wb") as f:
+                    f.write(dill.dumps(scheduler))
+            snapshot_time = (time.perf_counter() - start_time) / args.num_repeats
+            snapshot_size = snapshot_file.stat().st_size / 2**20
+            journal = TunerJournal(Path(tmpdir))
+            start_time = time.perf_counter()
+            for _ in range(args.num_repeats):
+                journal.append(event)
+            journal_time = (time.perf_counter() - start_time) / args.num_repeats
+        print(
+            f"{num_observations:7d}  {snapshot_time:10.4f}  {snapshot_size:11.2f}  "
+            f"{journal_time:9.6f}"
+        )
@@ -0,0 +1,162 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures the bookkeeping cost of `TuningJobState` in a multi-fidelity
+setting: `--num_trials` trials are run for `--num_epochs` epochs each, with
+`--num_workers` of them running at any time. For every result reported by a
+running trial, the pending evaluation is removed, the observation is
+appended, a new pending evaluation is registered, and the number of observed
+cases is queried. Every `--fit_every` results, the encoded data for the
+surrogate model is obtained. We compare:
+
+* `scan`: Lookups by linear scans over `trials_evaluations` and
+  `pending_evaluations`, number of cases summed over all trials, and data
+  encoded from the list returned by `observed_data_for_metric` (this is what
+  `TuningJobState` did before it maintained indexes)
+* `indexed`: `TuningJobState` with hash indexes, running counts, and
+  `observed_features_for_metric`
+"""
+import argparse
+import time
+
+import numpy as np
+
+from syne_tune.config_space import randint, uniform
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
+    INTERNAL_METRIC_NAME,
+    PendingEvaluation,
+    TrialEvaluations,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.config_ext import (
+    ExtendedConfiguration,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.tuning_job_state import (
+    TuningJobState,
+)
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
+    make_hyperparameter_ranges,
+)
+
+
+class ScanTuningJobState(TuningJobState):
+    def _find_labeled(self, trial_id: str) -> int:
+        for pos, ev in enumerate(self.trials_evaluations):
+            if ev.trial_id == trial_id:
+                return pos
+        return -1
+
+    def _find_pending(self, trial_id: str, resource=None) -> int:
+        for pos, ev in enumerate(self.pending_evaluations):
+            if ev.trial_id == trial_id and ev.resource == resource:
+                return pos
+        return -1
+
+    def metrics_for_trial(self, trial_id: str, config=None):
+        self._register_config_for_trial(trial_id, config)
+        pos = self._find_labeled(trial_id)
+        if pos != -1:
+            return self.trials_evaluations[pos].metrics
+        metrics = dict()
+        self.trials_evaluations.append(
+            TrialEvaluations(trial_id=trial_id, metrics=metrics)
+        )
+        return metrics
+
+    def append_pending(self, trial_id: str, config=None, resource=None):
+        self._register_config_for_trial(trial_id, config)
+        assert not self.is_pending(trial_id, resource)
+        self.pending_evaluations.append(
+            PendingEvaluation(trial_id=trial_id, resource=resource)
+        )
+
+    def remove_pending(self, trial_id: str, resource=None) -> bool:
+        pos = self._find_pending(trial_id, resource)
+        if pos != -1:
+            self.pending_evaluations.pop(pos)
+            return True
+        return False
+
+    def num_observed_cases(self, metric_name: str = INTERNAL_METRIC_NAME) -> int:
+        return sum(ev.num_cases(metric_name) for ev in self.trials_evaluations)
+
+    def observed_features_for_metric(
+        self, metric_name: str = INTERNAL_METRIC_NAME, resource_attr_name=None
+    ):
+        configs, values = self.observed_data_for_metric(metric_name, resource_attr_name)
+        return self.hp_ranges.to_ndarray_matrix(configs), np.vstack(values)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trials", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--num_workers", type=int, default=8)
+    parser.add_argument("--num_epochs", type=int, default=10)
+    parser.add_argument("--num_dims", type=int, default=8)
+    parser.add_argument("--fit_every", type=int, default=50)
+    args = parser.parse_args()
+
+    config_space = {f"x{i}": uniform(0.0, 1.0) for i in range(args.num_dims - 1)}
+    config_space["n"] = randint(1, 64)
+    config_space_ext = ExtendedConfiguration(
+        make_hyperparameter_ranges(config_space),
+        resource_attr_key="epoch",
+        resource_attr_range=(1, args.num_epochs),
+    )
+    hp_ranges = config_space_ext.hp_ranges_ext
+    print("num_trials  num_obs  variant  time_s")
+    for num_trials in args.num_trials:
+        for variant, state_class in (
+            ("scan", ScanTuningJobState),
+            ("indexed", TuningJobState),
+        ):
+            random_state = np.random.RandomState(0)
+            state = state_class(
+                hp_ranges=hp_ranges, config_for_trial=dict(), trials_evaluations=[]
+            )
+            configs = [
+                config_space_ext.hp_ranges.random_config(random_state)
+                for _ in range(num_trials)
+            ]
+            running_trials = []
+            next_trial_id = 0
+            num_obs = 0
+            start_time = time.perf_counter()
+            while running_trials or next_trial_id < num_trials:
+                while (
+                    len(running_trials) < args.num_workers
+                    and next_trial_id < num_trials
+                ):
+                    state.append_pending(
+                        str(next_trial_id), config=configs[next_trial_id], resource=1
+                    )
+                    running_trials.append([str(next_trial_id), 0])
+                    next_trial_id += 1
+                pos = random_state.randint(len(running_trials))
+                trial_id, resource = running_trials[pos]
+                resource += 1
+                running_trials[pos][1] = resource
+                state.remove_pending(trial_id, resource)
+                metrics = state.metrics_for_trial(trial_id)
+                metrics.setdefault(INTERNAL_METRIC_NAME, dict())[
+                    str(resource)
+                ] = random_state.randn()
+                if resource < args.num_epochs:
+                    state.append_pending(trial_id, resource=resource + 1)
+                else:
+                    running_trials.pop(pos)
+                state.num_observed_cases()
+                num_obs += 1
+                if num_obs % args.fit_every == 0:
+                    state.observed_features_for_metric()
+            elapsed_time = time.perf_counter() - start_time
+            print(f"{num_trials:10d}  {num_obs:7d}  {variant:>7}  {elapsed_time:6.3f}")
@@ -0,0 +1,147 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of status bookkeeping in the tuner loop as a function of
+the number of trials which have been started. Every iteration of the
+simulated loop updates the status with the running trials and a new result,
+evaluates a `StoppingCriterion` and a `PlateauStopper`, and the status is
+printed every `--print_every` iterations:
+
+* `legacy`: Statuses are counted by scanning all trials, user time and cost
+  are summed over all trials, rows of all reported trials are recomputed,
+  every print renders all rows, and `PlateauStopper` recomputes its
+  trajectory over all rows (as done before running aggregates were maintained
+  in `TuningStatus`)
+* `incremental`: `TuningStatus` with running aggregates, printing the most
+  recently started trials only, and `PlateauStopper` updating its trajectory
+  from the rows which changed
+"""
+import argparse
+import time
+
+import numpy as np
+
+from syne_tune.backend.trial_status import Status, Trial
+from syne_tune.constants import ST_WORKER_TIME
+from syne_tune.stopping_criterion import StoppingCriterion, PlateauStopper
+from syne_tune.tuning_status import TuningStatus
+
+
+class LegacyTuningStatus(TuningStatus):
+    def __init__(self, metric_names):
+        super().__init__(metric_names, max_rows_to_print=None)
+
+    def update(self, trial_status_dict, new_results):
+        self.last_trial_status_seen.update(
+            {k: v[1] for k, v in trial_status_dict.items()}
+        )
+        for trial_id, new_result in new_results:
+            self.overall_metric_statistics.add(new_result)
+            self.trial_metric_statistics[trial_id].add(new_result)
+        for trial_id, (trial, status) in trial_status_dict.items():
+            self.trial_rows[trial_id] = self._trial_row(trial_id, trial, status)
+        # No log of row updates, so that `PlateauStopper` recomputes the whole
+        # trajectory
+        self.rows_version += 1
+        self._row_updates_offset = self.rows_version
+
+    def _num_trials(self, status: str):
+        return sum(
+            trial_status == status
+            for trial_status in self.last_trial_status_seen.values()
+        )
+
+    @property
+    def user_time(self):
+        return sum(
+            metric.max_metrics.get(ST_WORKER_TIME, 0)
+            for metric in self.trial_metric_statistics.values()
+        )
+
+    @property
+    def cost(self):
+        return 0.0
+
+
+def _run_loop(
+    status: TuningStatus,
+    num_trials: int,
+    n_workers: int,
+    num_iterations: int,
+    print_every: int,
+) -> float:
+    stop_criterion = StoppingCriterion(max_num_trials_finished=10 * num_trials)
+    plateau_stopper = PlateauStopper(metric="loss", num_trials=10)
+    random_state = np.random.RandomState(0)
+    # Warm up with trials which have finished already
+    trials = [
+        Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        for trial_id in range(num_trials)
+    ]
+    status.update(
+        trial_status_dict={
+            trial.trial_id: (trial, Status.completed) for trial in trials
+        },
+        new_results=[
+            (trial.trial_id, {"loss": loss, ST_WORKER_TIME: 1.0})
+            for trial, loss in zip(trials, random_state.rand(num_trials))
+        ],
+    )
+    running = [
+        Trial(trial_id=num_trials + i, config={"x": -i}, creation_time=None)
+        for i in range(n_workers)
+    ]
+    start = time.perf_counter()
+    for iteration in range(num_iterations):
+        trial = running[iteration % n_workers]
+        status.update(
+            trial_status_dict={t.trial_id: (t, Status.in_progress) for t in running},
+            new_results=[
+                (
+                    trial.trial_id,
+                    {"loss": random_state.rand(), ST_WORKER_TIME: float(iteration)},
+                )
+            ],
+        )
+        stop_criterion(status)
+        plateau_stopper(status)
+        status.user_time
+        if (iteration + 1) % print_every == 0:
+            str(status)
+    return (time.perf_counter() - start) / num_iterations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--num_trials", type=int, nargs="+", default=[100, 1000, 10000, 50000]
+    )
+    parser.add_argument("--n_workers", type=int, default=4)
+    parser.add_argument("--num_iterations", type=int, default=500)
+    parser.add_argument("--print_every", type=int, default=100)
+    args = parser.parse_args()
+
+    print("num_trials  legacy_us  incremental_us  speedup")
+    for num_trials in args.num_trials:
+        kwargs = dict(
+            num_trials=num_trials,
+            n_workers=args.n_workers,
+            num_iterations=args.num_iterations,
+            print_every=args.print_every,
+        )
+        legacy = _run_loop(LegacyTuningStatus(["loss"]), **kwargs)
+        incremental = _run_loop(TuningStatus(["loss"]), **kwargs)
+        print(
+            f"{num_trials:10d}  {legacy * 1e6:9.1f}  {incremental * 1e6:14.1f}  "
+            f"{legacy / incremental:7.1f}"
+        )
@@ -0,0 +1,136 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Helpers to block until files in a set of directories are written to, or one
+of a set of subprocesses terminates. On Linux, this is done without polling,
+using inotify (via `ctypes`) for the directories and `os.pidfd_open` for the
+processes, both waited on with `select`. If either is not available, we fall
+back to polling `has_news` at a short interval.
+"""
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# See `man inotify`
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+DEFAULT_POLL_INTERVAL = 0.02
+
+_libc = None
+
+
+def _get_libc():
+    global _libc
+    if _libc is None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            libc.inotify_init1  # Raises AttributeError if not on Linux
+            _libc = libc
+        except (OSError, AttributeError, TypeError):
+            _libc = False
+    return _libc
+
+
+def _inotify_fd(directories: List[Path]) -> Optional[int]:
+    """
+    :return: inotify file descriptor watching `directories`, or None if
+        inotify is not available
+    """
+    libc = _get_libc()
+    if not libc:
+        return None
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    for directory in directories:
+        # Directories which do not exist (yet) are skipped, `has_news` has to
+        # cover this case
+        libc.inotify_add_watch(fd, str(directory).encode(), _WATCH_MASK)
+    return fd
+
+
+def _pid_fds(processes: List[subprocess.Popen]) -> Optional[List[int]]:
+    """
+    :return: List of file descriptors which become readable once the process
+        terminates, or None if `os.pidfd_open` is not available
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    fds = []
+    for process in processes:
+        try:
+            fds.append(os.pidfd_open(process.pid))
+        except ProcessLookupError:
+            pass  # Process has terminated already, `has_news` covers this
+        except OSError:
+            for fd in fds:
+                os.close(fd)
+            return None
+    return fds
+
+
+def wait_for_events(
+    directories: List[Path],
+    processes: List[subprocess.Popen],
+    has_news: Callable[[], bool],
+    timeout: float,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> float:
+    """
+    Blocks until `has_news()` is True, a file in one of `directories` is
+    created or written to, one of `processes` terminates, or `timeout` seconds
+    have passed. `has_news` must return True if there have been changes before
+    this function is called, which would otherwise be missed.
+
+    :param directories: Directories to be watched
+    :param processes: Processes to be watched
+    :param has_news: See above
+    :param timeout: Maximum time to wait
+    :param poll_interval: Used if we need to fall back to polling
+    :return: Time waited (in seconds)
+    """
+    start = time.perf_counter()
+    inotify_fd = _inotify_fd(directories)
+    pid_fds = _pid_fds(processes) if inotify_fd is not None else None
+    try:
+        # Check after watches are set up, so that no change is missed
+        if has_news():
+            return time.perf_counter() - start
+        if pid_fds is not None:
+            select.select([inotify_fd] + pid_fds, [], [], timeout)
+        else:
+            remaining = timeout
+            while remaining > 0:
+                time.sleep(min(poll_interval, remaining))
+                if has_news():
+                    break
+                remaining = timeout - (time.perf_counter() - start)
+    finally:
+        if inotify_fd is not None:
+            os.close(inotify_fd)
+        if pid_fds is not None:
+            for fd in pid_fds:
+                os.close(fd)
+    return time.perf_counter() - start
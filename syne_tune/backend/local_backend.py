@@ -23,10 +23,11 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from syne_tune.backend.trial_backend import TrialBackend
+from syne_tune.backend.event_waiter import wait_for_events
 from syne_tune.num_gpu import get_num_gpus
-from syne_tune.report import retrieve
+from syne_tune.report import IncrementalMetricsRetriever, MetricsChannelReader
 from syne_tune.backend.trial_status import TrialResult, Status
-from syne_tune.constants import ST_CHECKPOINT_DIR
+from syne_tune.constants import ST_CHECKPOINT_DIR, ST_METRICS_CHANNEL_ENV
 from syne_tune.util import experiment_path, random_string
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,7 @@ class LocalBackend(TrialBackend):
         entry_point: str,
         rotate_gpus: bool = True,
         delete_checkpoints: bool = False,
+        use_metrics_channel: bool = False,
     ):
         """
         A backend running locally by spawning sub-process concurrently.
@@ -60,6 +62,13 @@ class LocalBackend(TrialBackend):
             time for all trials.
         :param delete_checkpoints: If True, checkpoints of stopped or completed
             trials are deleted
+        :param use_metrics_channel: If True, `Reporter` in the training script
+            writes results to a dedicated binary file in the trial directory
+            (passed via the `SYNETUNE_METRICS_CHANNEL` environment variable),
+            instead of printing them to stdout. This reduces the overhead of
+            frequent reports, and makes metric collection independent of the
+            size of the training log. Metrics printed to stdout are ignored
+            in this case
 
         """
         super(LocalBackend, self).__init__(delete_checkpoints)
@@ -68,8 +77,12 @@ class LocalBackend(TrialBackend):
             entry_point
         ).exists(), f"the script provided to tune does not exist ({entry_point})"
         self.entry_point = entry_point
+        self.use_metrics_channel = use_metrics_channel
 
         self.trial_subprocess = {}
+        # Maps trial_id to `IncrementalMetricsRetriever` tailing its `std.out`,
+        # or to `MetricsChannelReader` if `use_metrics_channel` is set
+        self._metrics_retriever = dict()
 
         # GPU rotation
         # Note that the initialization is delayed until first used, so we can
@@ -85,6 +98,9 @@ class LocalBackend(TrialBackend):
     def trial_path(self, trial_id: int) -> Path:
         return self.local_path / str(trial_id)
 
+    def _metrics_channel_path(self, trial_id: int) -> Path:
+        return self.trial_path(trial_id) / "metrics.bin"
+
     def _checkpoint_trial_path(self, trial_id: int):
         return self.trial_path(trial_id) / "checkpoints"
 
@@ -160,19 +176,12 @@ class LocalBackend(TrialBackend):
                 config_str = " ".join(
                     [f"--{key} {value}" for key, value in config_copy.items()]
                 )
-
-                def np_encoder(object):
-                    if isinstance(object, np.generic):
-                        return object.item()
-
-                with open(trial_path / "config.json", "w") as f:
-                    # the encoder fixes json error "TypeError: Object of type 'int64' is not JSON serializable"
-                    json.dump(config, f, default=np_encoder)
+                self._write_config(trial_id, config)
 
                 cmd = f"{sys.executable} {self.entry_point} {config_str}"
 
                 env = dict(os.environ)
-                self._allocate_gpu(trial_id, env)
+                env.update(self._trial_env(trial_id))
 
                 logging.info(f"running subprocess with command: {cmd}")
 
@@ -180,6 +189,26 @@ class LocalBackend(TrialBackend):
                     cmd.split(" "), stdout=stdout, stderr=stderr, env=env
                 )
 
+    def _write_config(self, trial_id: int, config: Dict):
+        def np_encoder(object):
+            if isinstance(object, np.generic):
+                return object.item()
+
+        with open(self.trial_path(trial_id) / "config.json", "w") as f:
+            # the encoder fixes json error "TypeError: Object of type 'int64' is not JSON serializable"
+            json.dump(config, f, default=np_encoder)
+
+    def _trial_env(self, trial_id: int) -> Dict[str, str]:
+        """
+        :return: Environment variables to be set for the trial, on top of
+            those of the current process
+        """
+        env = dict()
+        self._allocate_gpu(trial_id, env)
+        if self.use_metrics_channel:
+            env[ST_METRICS_CHANNEL_ENV] = str(self._metrics_channel_path(trial_id))
+        return env
+
     def _allocate_gpu(self, trial_id: int, env: dict):
         if self.rotate_gpus:
             gpu = self._gpu_for_new_trial()
@@ -220,15 +249,59 @@ class LocalBackend(TrialBackend):
                 if self._is_process_done(trial_id=trial_id):
                     self._write_time_stamp(trial_id=trial_id, name="end")
 
-            metrics = retrieve(log_lines=self.stdout(trial_id=trial_id))
+            # Only the part written since the last call is parsed
+            retriever = self._metrics_retriever.get(trial_id)
+            if retriever is None:
+                if self.use_metrics_channel:
+                    retriever = MetricsChannelReader(
+                        self._metrics_channel_path(trial_id)
+                    )
+                else:
+                    retriever = IncrementalMetricsRetriever(
+                        self.trial_path(trial_id=trial_id) / "std.out"
+                    )
+                self._metrics_retriever[trial_id] = retriever
+            retriever.read_new(flush=status != Status.in_progress)
             trial_results = self._trial_dict[trial_id].add_results(
-                metrics=metrics,
+                metrics=retriever.metrics,
                 status=status,
                 training_end_time=training_end_time,
             )
             res.append(trial_results)
         return res
 
+    def wait_for_events(self, trial_ids: List[int], timeout: float) -> float:
+        """
+        Blocks until one of the trials writes to its directory (e.g., reports
+        a result) or its process terminates. Note that if
+        `use_metrics_channel` is False, writing any line to stdout counts as
+        an event.
+
+        """
+        trial_ids = [
+            trial_id
+            for trial_id in trial_ids
+            if self._trial_process(trial_id) is not None
+        ]
+
+        def has_news() -> bool:
+            for trial_id in trial_ids:
+                retriever = self._metrics_retriever.get(trial_id)
+                if (
+                    retriever is None
+                    or retriever.has_new_data()
+                    or self._is_process_done(trial_id)
+                ):
+                    return True
+            return False
+
+        return wait_for_events(
+            directories=[self.trial_path(trial_id) for trial_id in trial_ids],
+            processes=[self._trial_process(trial_id) for trial_id in trial_ids],
+            has_news=has_news,
+            timeout=timeout,
+        )
+
     def _pause_trial(self, trial_id: int, result: Optional[dict]):
         self._file_path(trial_id=trial_id, filename="pause").touch()
         self._kill_process(trial_id)
@@ -248,7 +321,9 @@ class LocalBackend(TrialBackend):
 
     def _kill_process(self, trial_id: int):
         # send a kill process to the process
-        process = self.trial_subprocess[trial_id]
+        process = self._trial_process(trial_id)
+        if process is None:
+            return
         try:
             process.kill()
         except ProcessLookupError as e:
@@ -267,8 +342,27 @@ class LocalBackend(TrialBackend):
         with open(time_stamp_path, "r") as f:
             return datetime.fromtimestamp(float(f.readline()))
 
+    def _trial_process(self, trial_id: int) -> Optional[subprocess.Popen]:
+        """
+        :return: Process running the trial, or None if not started
+        """
+        return self.trial_subprocess.get(trial_id)
+
+    def _trial_exit_code(self, trial_id: int) -> Optional[int]:
+        """
+        :return: Exit code of the trial, or None if it is still running
+        """
+        process = self._trial_process(trial_id)
+        if process is None:
+            # Trial registered when replaying the journal of a tuner (see
+            # `Tuner.load`), whose process was started by an earlier tuner.
+            # As for processes of a tuner loaded from a snapshot, which are no
+            # children of this process, this is reported as exit code 0
+            return 0
+        return process.poll()
+
     def _is_process_done(self, trial_id: int) -> bool:
-        return self.trial_subprocess[trial_id].poll() is not None
+        return self._trial_exit_code(trial_id) is not None
 
     def _read_status(self, trial_id: int):
         if self._file_path(trial_id=trial_id, filename="stop").exists():
@@ -276,7 +370,7 @@ class LocalBackend(TrialBackend):
         elif self._file_path(trial_id=trial_id, filename="pause").exists():
             return Status.paused
         else:
-            code = self.trial_subprocess[trial_id].poll()
+            code = self._trial_exit_code(trial_id)
             if code is None:
                 return Status.in_progress
             else:
@@ -13,14 +13,17 @@
 import hashlib
 import json
 import logging
+import os
+import subprocess
 import types
 from pathlib import Path
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, Optional, Tuple
 
 import dill
 
 from syne_tune.backend import LocalBackend
-from syne_tune.config_space import to_dict, Domain
+from syne_tune.backend.python_backend.worker_pool import PythonWorkerPool
+from syne_tune.config_space import to_dict, Domain, from_dict
 
 
 def file_md5(filename: str) -> str:
@@ -31,6 +34,35 @@ def file_md5(filename: str) -> str:
     return hash_md5.hexdigest()
 
 
+def load_tune_function(
+    tune_function_root: str, tune_function_hash: str
+) -> Tuple[Callable, Dict[str, object]]:
+    """
+    Loads function and configuration space serialized by `PythonBackend`,
+    after checking that the md5 hash of the serialized function matches.
+
+    :param tune_function_root: Directory with the serialized function
+    :param tune_function_hash: md5 hash of the serialized function
+    :return: (function, config_space)
+    """
+    assert tune_function_root
+    assert tune_function_hash
+    root = Path(tune_function_root)
+    assert (
+        file_md5(root / "tune_function.dill") == tune_function_hash
+    ), "The hash of the tuned function should match the hash obtained when serializing in Syne Tune."
+    with open(root / "tune_function.dill", "rb") as file:
+        tuned_function = dill.load(file)
+
+    with open(root / "configspace.json", "r") as file:
+        config_space = json.load(file)
+        config_space = {
+            k: from_dict(v) if isinstance(v, Dict) else v
+            for k, v in config_space.items()
+        }
+    return tuned_function, config_space
+
+
 class PythonBackend(LocalBackend):
     def __init__(
         self,
@@ -38,6 +70,8 @@ class PythonBackend(LocalBackend):
         config_space: Dict[str, object],
         rotate_gpus: bool = True,
         delete_checkpoints: bool = False,
+        use_metrics_channel: bool = False,
+        use_worker_pool: bool = False,
     ):
         """
         A backend that supports the tuning of Python functions (if you rather want to tune an endpoint script such as
@@ -77,16 +111,33 @@ class PythonBackend(LocalBackend):
             time for all trials.
         :param delete_checkpoints: If True, checkpoints of stopped or completed
             trials are deleted
+        :param use_metrics_channel: If True, results are passed from
+            `Reporter` to the back-end via a dedicated binary file instead of
+            stdout. See :class:`LocalBackend`
+        :param use_worker_pool: If True, trials are run in a pool of
+            long-lived worker processes, each of which loads the function once
+            and then runs one trial after the other. This avoids the cost of
+            starting an interpreter, importing dependencies and loading the
+            function for every trial, which matters if evaluations are cheap.
+            Trials are stopped or paused by interrupting the function in the
+            worker, and a worker which crashes is replaced. Note that
+            `rotate_gpus` only has an effect if the function initializes CUDA
+            itself, and that trials share global state of the worker process
+            (e.g., imported modules)
         """
         super(PythonBackend, self).__init__(
             entry_point=str(Path(__file__).parent / "python_entrypoint.py"),
             rotate_gpus=rotate_gpus,
             delete_checkpoints=delete_checkpoints,
+            use_metrics_channel=use_metrics_channel,
         )
         self.config_space = config_space
         # save function without reference to global variables or modules
         self.tune_function = types.FunctionType(tune_function.__code__, {})
         self.tune_function_path = self.local_path / "tune_function"
+        self._tune_function_hash = None
+        self.use_worker_pool = use_worker_pool
+        self._worker_pool = None
 
     def set_path(
         self, results_root: Optional[str] = None, tuner_name: Optional[str] = None
@@ -99,18 +150,65 @@ class PythonBackend(LocalBackend):
                 f"path {self.local_path} already exists, make sure you have a unique tuner name."
             )
         self.tune_function_path = self.local_path / "tune_function"
+        self._tune_function_hash = None
 
     def _schedule(self, trial_id: int, config: Dict):
         if not (self.tune_function_path / "tune_function.dill").exists():
             self.save_tune_function(self.tune_function)
-        config = config.copy()
-        config["tune_function_root"] = str(self.tune_function_path)
-        # to detect if the serialized function is the same as the one passed by the user, we pass the md5 to the
-        # endpoint script. The hash is checked before executing the function.
-        config["tune_function_hash"] = file_md5(
-            self.tune_function_path / "tune_function.dill"
+        if self._tune_function_hash is None:
+            # to detect if the serialized function is the same as the one passed by the user, we pass the md5 to the
+            # endpoint script. The hash is checked before executing the function.
+            self._tune_function_hash = file_md5(
+                self.tune_function_path / "tune_function.dill"
+            )
+        if self.use_worker_pool:
+            self._schedule_on_worker_pool(trial_id=trial_id, config=config)
+        else:
+            config = config.copy()
+            config["tune_function_root"] = str(self.tune_function_path)
+            config["tune_function_hash"] = self._tune_function_hash
+            super(PythonBackend, self)._schedule(trial_id=trial_id, config=config)
+
+    def _schedule_on_worker_pool(self, trial_id: int, config: Dict):
+        if self._worker_pool is None:
+            self._worker_pool = PythonWorkerPool(
+                tune_function_root=str(self.tune_function_path),
+                tune_function_hash=self._tune_function_hash,
+            )
+        self._prepare_for_schedule()
+        trial_path = self.trial_path(trial_id)
+        os.makedirs(trial_path, exist_ok=True)
+        self._write_config(trial_id, config)
+        logging.debug(f"scheduling {trial_id} on worker pool, {config}")
+        self._worker_pool.start_trial(
+            trial_id,
+            config=config,
+            trial_path=trial_path,
+            env=self._trial_env(trial_id),
         )
-        super(PythonBackend, self)._schedule(trial_id=trial_id, config=config)
+
+    def _trial_process(self, trial_id: int) -> Optional[subprocess.Popen]:
+        if self._worker_pool is None:
+            return super(PythonBackend, self)._trial_process(trial_id)
+        else:
+            return self._worker_pool.process(trial_id)
+
+    def _trial_exit_code(self, trial_id: int) -> Optional[int]:
+        if self._worker_pool is None:
+            return super(PythonBackend, self)._trial_exit_code(trial_id)
+        else:
+            return self._worker_pool.exit_code(trial_id)
+
+    def _kill_process(self, trial_id: int):
+        if self._worker_pool is None:
+            super(PythonBackend, self)._kill_process(trial_id)
+        else:
+            self._worker_pool.interrupt(trial_id)
+
+    def stop_all(self):
+        super(PythonBackend, self).stop_all()
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
 
     def save_tune_function(self, tune_function):
         self.tune_function_path.mkdir(parents=True, exist_ok=True)
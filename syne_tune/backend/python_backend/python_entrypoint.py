@@ -14,16 +14,11 @@
 An entry point that loads a serialized function from `PythonBackend` and executes it with the provided hyperparameter.
 The md5 hash of the file is first checked before executing the deserialized function.
 """
-import json
 import logging
 from argparse import ArgumentParser
-from pathlib import Path
-from typing import Dict
 
-import dill
-
-from syne_tune.backend.python_backend.python_backend import file_md5
-from syne_tune.config_space import add_to_argparse, from_dict
+from syne_tune.backend.python_backend.python_backend import load_tune_function
+from syne_tune.config_space import add_to_argparse
 
 if __name__ == "__main__":
     root = logging.getLogger()
@@ -37,21 +32,10 @@ if __name__ == "__main__":
     # first parse args to get where the function and config space were saved and
     # check the md5 of the serialized function is the same
     # then parse args again with parameters defined in the config space
-    assert args.tune_function_root
-    assert args.tune_function_hash
-    root = Path(args.tune_function_root)
-    assert (
-        file_md5(root / "tune_function.dill") == args.tune_function_hash
-    ), "The hash of the tuned function should match the hash obtained when serializing in Syne Tune."
-    with open(root / "tune_function.dill", "rb") as file:
-        tuned_function = dill.load(file)
-
-    with open(root / "configspace.json", "r") as file:
-        config_space = json.load(file)
-        config_space = {
-            k: from_dict(v) if isinstance(v, Dict) else v
-            for k, v in config_space.items()
-        }
+    tuned_function, config_space = load_tune_function(
+        tune_function_root=args.tune_function_root,
+        tune_function_hash=args.tune_function_hash,
+    )
 
     add_to_argparse(parser, config_space)
 
@@ -0,0 +1,106 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Long-lived worker process used by `PythonBackend` with `use_worker_pool=True`.
+The serialized function is loaded (and its md5 checked) once at start. Then,
+the worker reads jobs from stdin, one JSON line per trial, and runs the
+function for each of them. stdout and stderr are redirected to the log files
+of the trial, and the exit code is written to a file in the trial directory
+once the function returns. Sending SIGUSR1 interrupts the trial currently
+running, after which the worker waits for the next job.
+"""
+import json
+import logging
+import os
+import signal
+import sys
+import traceback
+from argparse import ArgumentParser
+from pathlib import Path
+
+from syne_tune.backend.python_backend.python_backend import load_tune_function
+from syne_tune.backend.python_backend.worker_pool import (
+    write_exit_code,
+    INTERRUPTED_EXIT_CODE,
+)
+
+_trial_running = False
+
+
+class TrialInterrupted(BaseException):
+    pass
+
+
+def _handle_interrupt(signum, frame):
+    if _trial_running:
+        raise TrialInterrupted()
+
+
+def _redirect(path: str, fd: int):
+    with open(path, "a") as f:
+        os.dup2(f.fileno(), fd)
+
+
+def _run_job(tuned_function, config_space: dict, job: dict) -> int:
+    global _trial_running
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    _redirect(job["stdout"], 1)
+    _redirect(job["stderr"], 2)
+    # Environment variables of the job must not leak into the next one
+    environ = os.environ.copy()
+    os.environ.update(job["env"])
+    hps = {k: v for k, v in job["config"].items() if k in config_space}
+    try:
+        _trial_running = True
+        try:
+            tuned_function(**hps)
+        finally:
+            _trial_running = False
+        exit_code = 0
+    except TrialInterrupted:
+        exit_code = INTERRUPTED_EXIT_CODE
+    except SystemExit as ex:
+        exit_code = ex.code if isinstance(ex.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.environ.clear()
+    os.environ.update(environ)
+    return exit_code
+
+
+if __name__ == "__main__":
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+
+    parser = ArgumentParser()
+    parser.add_argument(f"--tune_function_root", type=str)
+    parser.add_argument(f"--tune_function_hash", type=str)
+    args, _ = parser.parse_known_args()
+    tuned_function, config_space = load_tune_function(
+        tune_function_root=args.tune_function_root,
+        tune_function_hash=args.tune_function_hash,
+    )
+    signal.signal(signal.SIGUSR1, _handle_interrupt)
+
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break  # stdin closed by back-end
+        job = json.loads(line)
+        exit_code = _run_job(tuned_function, config_space, job)
+        write_exit_code(Path(job["exit_code_path"]), exit_code)
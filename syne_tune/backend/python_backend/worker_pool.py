@@ -0,0 +1,285 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EXIT_CODE_FILENAME = "worker_exit_code"
+
+# Exit code written for a trial which has been interrupted
+INTERRUPTED_EXIT_CODE = -1
+
+# Time after which a worker which has been interrupted, but is still busy,
+# is killed
+DEFAULT_INTERRUPT_TIMEOUT = 5.0
+
+
+def write_exit_code(path: Path, exit_code: int):
+    # Written atomically, so that a partial file is never read
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(str(exit_code))
+    os.replace(tmp_path, path)
+
+
+def _np_encoder(object):
+    if isinstance(object, np.generic):
+        return object.item()
+
+
+class PythonWorker:
+    """
+    Handle of a long-lived process running `python_worker.py`, which runs
+    trials one after the other.
+
+    :param tune_function_root: Directory with the serialized function
+    :param tune_function_hash: md5 hash of the serialized function
+    """
+
+    def __init__(self, tune_function_root: str, tune_function_hash: str):
+        cmd = [
+            sys.executable,
+            str(Path(__file__).parent / "python_worker.py"),
+            "--tune_function_root",
+            tune_function_root,
+            "--tune_function_hash",
+            tune_function_hash,
+        ]
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self.trial_id = None
+        self.exit_code_path = None
+        self.interrupt_time = None
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def trial_done(self) -> bool:
+        """
+        :return: Has the trial assigned last to this worker finished?
+        """
+        return self.trial_id is None or self.exit_code_path.exists()
+
+    def start_trial(
+        self,
+        trial_id: int,
+        config: dict,
+        trial_path: Path,
+        env: Dict[str, str],
+        exit_code_path: Path,
+    ):
+        self.trial_id = trial_id
+        self.exit_code_path = exit_code_path
+        self.interrupt_time = None
+        try:
+            self.exit_code_path.unlink()
+        except FileNotFoundError:
+            pass
+        job = {
+            "config": config,
+            "stdout": str(trial_path / "std.out"),
+            "stderr": str(trial_path / "std.err"),
+            "env": env,
+            "exit_code_path": str(self.exit_code_path),
+        }
+        line = json.dumps(job, default=_np_encoder) + "\n"
+        self.process.stdin.write(line.encode("utf-8"))
+        self.process.stdin.flush()
+
+    def interrupt(self):
+        if self.interrupt_time is None and not self.trial_done():
+            self.interrupt_time = time.time()
+            try:
+                os.kill(self.process.pid, signal.SIGUSR1)
+            except ProcessLookupError:
+                pass
+
+    def kill(self):
+        try:
+            self.process.kill()
+        except ProcessLookupError:
+            pass
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+
+class PythonWorkerPool:
+    """
+    Pool of long-lived worker processes for :class:`PythonBackend`. A new
+    trial is assigned to a worker which is idle, a new worker is started only
+    if there is none. Hence, the pool grows to the maximum number of trials
+    running concurrently.
+
+    Trials are stopped or paused by interrupting the function in the worker,
+    which remains alive. If a worker dies (e.g., the function crashes the
+    interpreter), its trial is marked as failed and the worker is replaced
+    next time a trial is started. A worker which does not react to an
+    interrupt within `interrupt_timeout` seconds is killed.
+
+    Each run of a trial writes its exit code to a file of its own. If a
+    paused trial is resumed on another worker while the old one is still
+    busy, the old run can therefore not change the status of the new one.
+
+    Worker processes are not serialized with the back-end.
+
+    :param tune_function_root: Directory with the serialized function
+    :param tune_function_hash: md5 hash of the serialized function
+    :param interrupt_timeout: See above
+    """
+
+    def __init__(
+        self,
+        tune_function_root: str,
+        tune_function_hash: str,
+        interrupt_timeout: float = DEFAULT_INTERRUPT_TIMEOUT,
+    ):
+        self.tune_function_root = tune_function_root
+        self.tune_function_hash = tune_function_hash
+        self.interrupt_timeout = interrupt_timeout
+        self._workers = []
+        self._trial_worker = dict()
+        # Exit code file of the most recent run of each trial
+        self._exit_code_path = dict()
+        self._num_jobs = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_workers"] = []
+        state["_trial_worker"] = dict()
+        return state
+
+    @property
+    def workers(self) -> List[PythonWorker]:
+        return self._workers
+
+    def _mark_if_crashed(self, worker: PythonWorker):
+        # If a worker dies while running a trial, we write the exit code on its
+        # behalf
+        if not worker.trial_done() and not worker.is_alive():
+            exit_code = worker.process.returncode
+            write_exit_code(worker.exit_code_path, exit_code if exit_code else 1)
+
+    def _idle_worker(self) -> PythonWorker:
+        now = time.time()
+        idle_worker = None
+        remaining_workers = []
+        for worker in self._workers:
+            self._mark_if_crashed(worker)
+            if not worker.is_alive():
+                logger.info(f"Worker process {worker.process.pid} died, removing it")
+                continue
+            if (
+                worker.interrupt_time is not None
+                and not worker.trial_done()
+                and now - worker.interrupt_time > self.interrupt_timeout
+            ):
+                logger.warning(
+                    f"Worker process {worker.process.pid} does not react to "
+                    f"interrupt of trial_id {worker.trial_id}, killing it"
+                )
+                worker.kill()
+                write_exit_code(worker.exit_code_path, INTERRUPTED_EXIT_CODE)
+                continue
+            remaining_workers.append(worker)
+            if idle_worker is None and worker.trial_done():
+                idle_worker = worker
+        self._workers = remaining_workers
+        if idle_worker is None:
+            idle_worker = PythonWorker(
+                tune_function_root=self.tune_function_root,
+                tune_function_hash=self.tune_function_hash,
+            )
+            self._workers.append(idle_worker)
+            logger.info(
+                f"Started worker process {idle_worker.process.pid} "
+                f"({len(self._workers)} in the pool)"
+            )
+        return idle_worker
+
+    def start_trial(
+        self, trial_id: int, config: dict, trial_path: Path, env: Dict[str, str]
+    ):
+        exit_code_path = trial_path / f"{EXIT_CODE_FILENAME}_{self._num_jobs}"
+        self._num_jobs += 1
+        kwargs = dict(
+            config=config, trial_path=trial_path, env=env, exit_code_path=exit_code_path
+        )
+        worker = self._idle_worker()
+        try:
+            worker.start_trial(trial_id, **kwargs)
+        except BrokenPipeError:
+            # Worker died just before the job could be sent
+            self._workers.remove(worker)
+            worker = self._idle_worker()
+            worker.start_trial(trial_id, **kwargs)
+        self._trial_worker[trial_id] = worker
+        self._exit_code_path[trial_id] = exit_code_path
+
+    def exit_code(self, trial_id: int) -> Optional[int]:
+        """
+        :return: Exit code of the most recent run of the trial, or None if it
+            is still running
+        """
+        worker = self._trial_worker.get(trial_id)
+        exit_code_path = self._exit_code_path.get(trial_id)
+        if worker is not None and worker.exit_code_path == exit_code_path:
+            self._mark_if_crashed(worker)
+        if exit_code_path is not None and exit_code_path.exists():
+            with open(exit_code_path, "r") as f:
+                return int(f.read())
+        elif worker is None:
+            # Worker is lost (e.g., the back-end has been deserialized)
+            return 1
+        else:
+            return None
+
+    def process(self, trial_id: int) -> Optional[subprocess.Popen]:
+        worker = self._trial_worker.get(trial_id)
+        return None if worker is None else worker.process
+
+    def interrupt(self, trial_id: int):
+        worker = self._trial_worker.get(trial_id)
+        if worker is not None and worker.exit_code_path == self._exit_code_path.get(
+            trial_id
+        ):
+            worker.interrupt()
+
+    def shutdown(self):
+        """
+        Stops all workers. Idle workers exit once their stdin is closed.
+        """
+        for worker in self._workers:
+            if worker.trial_done():
+                worker.close()
+            else:
+                worker.kill()
+        self._workers = []
+        self._trial_worker = dict()
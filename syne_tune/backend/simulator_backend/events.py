@@ -10,6 +10,7 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+from collections import Counter, deque
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 import heapq
@@ -78,6 +79,18 @@ class SimulatorState:
     break ties. When an event is added, the `cnt` value is taken from
     `events_added`. This means that ties are broken first_in_first_out.
 
+    Events are removed lazily. `remove_events` records that all events of
+    `trial_id` pushed so far are deleted (tombstones), and these are skipped
+    once they come to the top of the heap. The number of pending events per
+    trial is maintained, so that the heap can be compacted once more than
+    half of its entries are deleted.
+
+    Events pushed together by `push_events` are queued per trial, and only
+    the earliest one is on the heap at any time. Since each event keeps the
+    `cnt` value it got when pushed, events are returned in the same order as
+    if all of them had been on the heap, but events removed before they are
+    due never enter the heap.
+
     """
 
     def __init__(
@@ -87,6 +100,23 @@ class SimulatorState:
             event_heap = []
         self.event_heap = event_heap
         self.events_added = events_added
+        # Events of `trial_id` with `cnt < _removed_before[trial_id]` are
+        # deleted
+        self._removed_before = dict()
+        self._num_pending_events = Counter(elem[2].trial_id for elem in event_heap)
+        self._num_removed_events = 0
+        # Events queued by `push_events` (except for the one on the heap),
+        # and `cnt` of the event on the heap
+        self._queued_events = dict()
+        self._queue_head = dict()
+
+    def _is_removed(self, elem: Tuple[float, int, Event]) -> bool:
+        return elem[1] < self._removed_before.get(elem[2].trial_id, 0)
+
+    def _pop_removed_events(self):
+        while self.event_heap and self._is_removed(self.event_heap[0]):
+            heapq.heappop(self.event_heap)
+            self._num_removed_events -= 1
 
     def push(self, event: Event, event_time: float):
         """
@@ -97,6 +127,35 @@ class SimulatorState:
         """
         heapq.heappush(self.event_heap, (event_time, self.events_added, event))
         self.events_added += 1
+        self._num_pending_events[event.trial_id] += 1
+
+    def push_events(self, events: List[Tuple[Event, float]]):
+        """
+        Push several events of the same trial. This is equivalent to calling
+        `push` for each of them, in this order, but events are moved onto the
+        heap only when the previous ones of the trial have been popped.
+
+        :param events: List of `(event, event_time)` tuples, all for the same
+            trial
+        """
+        if not events:
+            return
+        trial_id = events[0][0].trial_id
+        if trial_id in self._queued_events:
+            for event, event_time in events:
+                self.push(event, event_time)
+            return
+        entries = sorted(
+            (event_time, self.events_added + pos, event)
+            for pos, (event, event_time) in enumerate(events)
+        )
+        self.events_added += len(entries)
+        self._num_pending_events[trial_id] += len(entries)
+        head = entries[0]
+        heapq.heappush(self.event_heap, head)
+        if len(entries) > 1:
+            self._queued_events[trial_id] = deque(entries[1:])
+            self._queue_head[trial_id] = head[1]
 
     def remove_events(self, trial_id: int):
         """
@@ -104,10 +163,38 @@ class SimulatorState:
 
         :param trial_id:
         """
-        self.event_heap = [
-            elem for elem in self.event_heap if elem[2].trial_id != trial_id
-        ]
-        heapq.heapify(self.event_heap)
+        num_removed = self._num_pending_events.pop(trial_id, 0)
+        queued_events = self._queued_events.pop(trial_id, None)
+        if queued_events is not None:
+            del self._queue_head[trial_id]
+            num_removed -= len(queued_events)
+        if num_removed > 0:
+            self._removed_before[trial_id] = self.events_added
+            self._num_removed_events += num_removed
+            if 2 * self._num_removed_events > len(self.event_heap):
+                self.event_heap = [
+                    elem for elem in self.event_heap if not self._is_removed(elem)
+                ]
+                heapq.heapify(self.event_heap)
+                self._num_removed_events = 0
+                self._removed_before = dict()
+
+    def num_pending_events(self, trial_id: int) -> int:
+        """
+        :param trial_id:
+        :return: Number of events for `trial_id` which have not been popped
+        """
+        return self._num_pending_events.get(trial_id, 0)
+
+    def next_event_time(self) -> Optional[float]:
+        """
+        :return: Time of event on top of heap, or None if the heap is empty
+        """
+        self._pop_removed_events()
+        if self.event_heap:
+            return self.event_heap[0][0]
+        else:
+            return None
 
     def next_until(self, time_until: float) -> Optional[Tuple[float, Event]]:
         """
@@ -118,9 +205,23 @@ class SimulatorState:
         :return:
         """
         result = None
+        self._pop_removed_events()
         if self.event_heap:
-            top_time, _, top_event = self.event_heap[0]
+            top_time, top_cnt, top_event = self.event_heap[0]
             if top_time <= time_until:
                 heapq.heappop(self.event_heap)
+                trial_id = top_event.trial_id
+                if self._queue_head.get(trial_id) == top_cnt:
+                    queued_events = self._queued_events[trial_id]
+                    next_entry = queued_events.popleft()
+                    heapq.heappush(self.event_heap, next_entry)
+                    if queued_events:
+                        self._queue_head[trial_id] = next_entry[1]
+                    else:
+                        del self._queued_events[trial_id]
+                        del self._queue_head[trial_id]
+                self._num_pending_events[trial_id] -= 1
+                if self._num_pending_events[trial_id] == 0:
+                    del self._num_pending_events[trial_id]
                 result = (top_time, top_event)
         return result
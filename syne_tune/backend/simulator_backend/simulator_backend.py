@@ -147,6 +147,8 @@ class SimulatorBackend(LocalBackend):
     def _debug_message(
         event_name: str, time: float, trial_id: int, pushed: bool = False, **kwargs
     ):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         msg_part = "push " if pushed else ""
         msg = f"[{msg_part}{event_name}:"
         parts = [f"time = {time:.2f}", f"trial_id = {trial_id}"] + [
@@ -255,6 +257,9 @@ class SimulatorBackend(LocalBackend):
         # Run training script and record results
         status, results = self._run_job_and_collect_results(trial_id, config=config)
         time_final_result = time_event
+        # Events are pushed together, so that those still queued when the
+        # trial is stopped or paused are cheap to remove
+        events = []
         deb_it = 0  # DEBUG
         for i, result in enumerate(results):
             elapsed_time = result.get(self.elapsed_time_attr)
@@ -266,9 +271,8 @@ class SimulatorBackend(LocalBackend):
             )
             _time_result = time_event + float(elapsed_time)
             time_result = _time_result + self.simulator_config.delay_on_trial_result
-            self._simulator_state.push(
-                OnTrialResultEvent(trial_id=trial_id, result=result),
-                event_time=time_result,
+            events.append(
+                (OnTrialResultEvent(trial_id=trial_id, result=result), time_result)
             )
             time_final_result = max(time_final_result, _time_result)
             # DEBUG:
@@ -289,9 +293,8 @@ class SimulatorBackend(LocalBackend):
         time_complete = (
             time_final_result + self.simulator_config.delay_complete_after_final_report
         )
-        self._simulator_state.push(
-            CompleteEvent(trial_id=trial_id, status=status), event_time=time_complete
-        )
+        events.append((CompleteEvent(trial_id=trial_id, status=status), time_complete))
+        self._simulator_state.push_events(events)
         self._debug_message(
             "CompleteEvent", time=time_complete, trial_id=trial_id, pushed=True
         )
@@ -377,6 +380,25 @@ class SimulatorBackend(LocalBackend):
         logger.debug(f"Simulated time since start: {_time_start:.2f} secs")
         self._time_keeper.mark_exit()
 
+    def wait_for_events(self, trial_ids: List[int], timeout: float) -> float:
+        """
+        Does not block, but returns the simulated time until the next event
+        in the queue, capped at `tuner_sleep_time` (note that `timeout` is
+        ignored, since the real sleep time of the tuner is 0). Used together
+        with :class:`SimulatorCallback`, which advances the time keeper by
+        this amount.
+
+        """
+        self._advance_by_outside_time()
+        time_wait = self.tuner_sleep_time
+        time_next_event = self._simulator_state.next_event_time()
+        if time_next_event is not None:
+            time_wait = min(
+                max(time_next_event - self._time_keeper.time(), 0), time_wait
+            )
+        self._time_keeper.mark_exit()
+        return time_wait
+
     def _all_trial_results(self, trial_ids: List[int]) -> List[TrialResult]:
         """
         Note: Since this is not used anymore in `fetch_results`, it can
@@ -30,6 +30,9 @@ class SimulatorCallback(StoreResultsCallback):
     This is doing two things. First, `on_tuning_sleep` is advancing the
     `time_keeper` of the simulator back-end by `tuner_sleep_time` (also
     defined in the back-end). The real sleep time in `Tuner` must be 0.
+    If the tuner is `event_driven`, the time keeper is advanced to the next
+    event instead (but at most by `tuner_sleep_time`), as determined by
+    `SimulatorBackend.wait_for_events`.
 
     Second, we need to make sure that results written out are annotated by
     simulated time, not real time. This is already catered for by
@@ -53,6 +56,7 @@ class SimulatorCallback(StoreResultsCallback):
         # the simulator back-end, so the default is larger
         super().__init__(add_wallclock_time=True)
         self._tuner_sleep_time = None
+        self._event_driven = False
         self._time_keeper = None
         self._tuner = None
         self._backup_stop_criterion = None
@@ -113,12 +117,16 @@ class SimulatorCallback(StoreResultsCallback):
             scheduler.set_time_keeper(self._time_keeper)
         self._time_keeper.start_of_time()
         self._tuner_sleep_time = backend.tuner_sleep_time
+        self._event_driven = tuner.event_driven
         # Modify `tuner.stop_criterion` in case it depends on wallclock time
         self._modify_stop_criterion(tuner)
         self._tuner = tuner
 
     def on_tuning_sleep(self, sleep_time: float):
-        self._time_keeper.advance(self._tuner_sleep_time)
+        if self._event_driven:
+            self._time_keeper.advance(sleep_time)
+        else:
+            self._time_keeper.advance(self._tuner_sleep_time)
 
     def on_tuning_end(self):
         super().on_tuning_end()
@@ -11,6 +11,7 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 from collections import defaultdict
+import time
 
 from datetime import datetime
 from pathlib import Path
@@ -216,6 +217,21 @@ class TrialBackend:
         results = sorted(results, key=lambda result: result[1][ST_WORKER_TIMESTAMP])
         return trial_status_dict, results
 
+    def wait_for_events(self, trial_ids: List[int], timeout: float) -> float:
+        """
+        Blocks until there may be new results or status changes for any of
+        the trials in `trial_ids`, or until `timeout` seconds have passed.
+        This is used by :class:`Tuner` if `event_driven` is True. Back-ends
+        which can be notified of such events should override this method,
+        the default implementation just sleeps for `timeout` seconds.
+
+        :param trial_ids: Trials currently running
+        :param timeout: Maximum time to wait
+        :return: Time waited (in seconds)
+        """
+        time.sleep(timeout)
+        return timeout
+
     def stdout(self, trial_id: int) -> List[str]:
         """
         :param trial_id:
@@ -273,3 +289,47 @@ class TrialBackend:
         Called by :class:`Tuner` at the end of `save`
         """
         pass
+
+    def on_tuner_replay_start_trial(self, trial: Trial):
+        """
+        Called by :class:`Tuner` when replaying its journal (see `Tuner.load`),
+        for a trial started after the last snapshot. The trial is registered,
+        but not started.
+
+        :param trial: trial which had been started
+        """
+        assert trial.trial_id == self.new_trial_id(), (
+            f"Replayed trial_id = {trial.trial_id}, but expected "
+            f"{self.new_trial_id()}"
+        )
+        self.trial_ids.append(trial.trial_id)
+        self._trial_dict[trial.trial_id] = TrialResult(
+            trial_id=trial.trial_id,
+            config=trial.config,
+            creation_time=trial.creation_time,
+            status=Status.in_progress,
+            metrics=[],
+        )
+
+    def on_tuner_replay_resume_trial(
+        self, trial_id: int, new_config: Optional[dict] = None
+    ):
+        """
+        Called by :class:`Tuner` when replaying its journal (see `Tuner.load`),
+        for a trial resumed after the last snapshot.
+
+        :param trial_id: ID of trial which had been resumed
+        :param new_config: If given, the config the trial had been resumed with
+        """
+        if new_config is not None:
+            self._trial_dict[trial_id].config = new_config
+
+    def on_tuner_replay_new_results(self, new_results: List[Tuple[int, dict]]):
+        """
+        Called by :class:`Tuner` when replaying its journal (see `Tuner.load`),
+        for results fetched after the last snapshot.
+
+        :param new_results: results returned by `fetch_status_results`
+        """
+        for trial_id, _ in new_results:
+            self._last_metric_seen_index[trial_id] += 1
@@ -16,6 +16,7 @@ import pandas as pd
 import numpy as np
 
 from syne_tune.blackbox_repository.blackbox import Blackbox
+from syne_tune.blackbox_repository.utils import LazyBlackboxDict
 from syne_tune.blackbox_repository.serialize import (
     serialize_configspace,
     deserialize_configspace,
@@ -77,14 +78,16 @@ class BlackboxTabular(Blackbox):
         }
         self.hyperparameters = hyperparameters
 
-        # builds a dataframe to retrieve in O(1) index given a hyperparameter, we could have use a dict but chose a
-        # dataframe instead as 1) it is easier since the hyperparameters are itself given in a dataframe (otherwise
-        # we would need to have hashable type from the dataframe value) 2) we can support in the future querying
-        # multiple results at once efficiently
+        # builds a hash index to retrieve in O(1) the row of a given hyperparameter, keys are tuples of
+        # hyperparameter values in the order of `self._hp_cols`. This is much faster than a pandas MultiIndex
+        # lookup and allows to query many configurations at once, see `objective_function_batch`
         self._hp_cols = list(hyperparameters.columns.values)
-        self.hyperparameters_index = hyperparameters.copy()
-        self.hyperparameters_index["index"] = hyperparameters.index
-        self.hyperparameters_index.set_index(self._hp_cols, inplace=True)
+        self._hp_index = {
+            key: position
+            for position, key in enumerate(
+                zip(*(hyperparameters[col].tolist() for col in self._hp_cols))
+            )
+        }
 
         self.objectives_evaluations = objectives_evaluations
         if objectives_names is None:
@@ -117,18 +120,9 @@ class BlackboxTabular(Blackbox):
         if not isinstance(configuration, dict):
             objectives_values = self.objectives_evaluations[configuration, seed, :, :]
             return objectives_values
-        try:
-            key = tuple(configuration[key] for key in self._hp_cols)
-            matching_index = self.hyperparameters_index.loc[key].values
-        except KeyError:
-            raise ValueError(
-                f"the hyperparameter {configuration} is not present in available evaluations. Use `add_surrogate(blackbox)` if"
-                f" you want to add interpolation or a surrogate model that support querying any configuration."
-            )
-
-        df_found = self.hyperparameters.loc[matching_index]
-        assert len(df_found) == 1
-        index = df_found.index.values[0]
+        index = self._hp_index.get(tuple(configuration[key] for key in self._hp_cols))
+        if index is None:
+            self._raise_missing_configuration(configuration)
 
         if fidelity is None:
             # returns all fidelities
@@ -141,6 +135,75 @@ class BlackboxTabular(Blackbox):
             ]
             return dict(zip(self.objectives_names, objectives_values))
 
+    def objective_function_batch(
+        self,
+        configurations: Union[pd.DataFrame, np.ndarray, List[dict]],
+        fidelities: Optional[np.ndarray] = None,
+        seeds: Optional[Union[int, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized version of `objective_function`, which evaluates many
+        configurations in one call.
+
+        :param configurations: configurations to be evaluated, either a
+            dataframe with (at least) the hyperparameter columns, an array of
+            shape (n, num_hps) with columns ordered as `hyperparameters`, or a
+            list of configuration dicts
+        :param fidelities: array of n fidelity values. If not given, all
+            fidelities are returned
+        :param seeds: seed or array of n seeds. If not given, seeds are drawn
+            at random for every configuration
+        :return: objective values of shape (n, num_fidelities, num_objectives)
+            if `fidelities` is not given, and (n, num_objectives) otherwise
+        """
+        if isinstance(configurations, pd.DataFrame):
+            columns = [configurations[col].tolist() for col in self._hp_cols]
+        elif isinstance(configurations, np.ndarray):
+            assert configurations.ndim == 2 and configurations.shape[1] == len(
+                self._hp_cols
+            ), f"configurations must have shape (n, {len(self._hp_cols)})"
+            columns = [configurations[:, i].tolist() for i in range(len(self._hp_cols))]
+        else:
+            columns = [
+                [config[col] for config in configurations] for col in self._hp_cols
+            ]
+        num_configs = len(columns[0]) if columns else 0
+        hp_index = self._hp_index
+        indices = [hp_index.get(key) for key in zip(*columns)]
+        if None in indices:
+            missing = indices.index(None)
+            self._raise_missing_configuration(
+                {col: values[missing] for col, values in zip(self._hp_cols, columns)}
+            )
+        indices = np.array(indices, dtype=np.int64)
+
+        if seeds is None:
+            seeds = np.random.randint(0, self.num_seeds, size=num_configs)
+        else:
+            seeds = np.broadcast_to(np.asarray(seeds, dtype=np.int64), (num_configs,))
+            assert np.all((0 <= seeds) & (seeds < self.num_seeds))
+
+        if fidelities is None:
+            return self.objectives_evaluations[indices, seeds, :, :]
+        else:
+            fidelity_map = self.fidelity_map
+            fidelity_indices = np.array(
+                [
+                    fidelity_map[fidelity]
+                    for fidelity in np.asarray(fidelities).tolist()
+                ],
+                dtype=np.int64,
+            )
+            assert len(fidelity_indices) == num_configs
+            return self.objectives_evaluations[indices, seeds, fidelity_indices, :]
+
+    @staticmethod
+    def _raise_missing_configuration(configuration: dict):
+        raise ValueError(
+            f"the hyperparameter {configuration} is not present in available evaluations. Use `add_surrogate(blackbox)` if"
+            f" you want to add interpolation or a surrogate model that support querying any configuration."
+        )
+
     @property
     def fidelity_values(self) -> np.array:
         return self._fidelity_values
@@ -307,12 +370,17 @@ def serialize(
     )
 
 
-def deserialize(path: str) -> Dict[str, BlackboxTabular]:
+def deserialize(
+    path: str, mmap_mode: Optional[str] = None
+) -> Union[Dict[str, BlackboxTabular], LazyBlackboxDict]:
     """
     Deserialize blackboxes contained in a path that were saved with `serialize` above.
     TODO: the API is currently dissonant with `serialize`, `deserialize` for BlackboxOffline as `serialize` is there a member.
     A possible way to unify is to have serialize also be a free function for BlackboxOffline.
     :param path: a path that contains blackboxes that were saved with `serialize`
+    :param mmap_mode: if given, objectives are memory-mapped with this mode (see `numpy.load`, "r" is
+    recommended) instead of being loaded into memory, and blackboxes are only created once their task is
+    accessed. This saves memory and loading time, and processes on the same host share the page cache.
     :return: a dictionary from task name to blackbox
     """
     path = Path(path)
@@ -329,18 +397,22 @@ def deserialize(path: str) -> Dict[str, BlackboxTabular]:
     with open(path / "fidelities_values.npy", "rb") as f:
         fidelity_values = np.load(f)
 
-    # possibly we could use memmap to avoid memory use or speed-up loading times
-    with open(path / "objectives_evaluations.npy", "rb") as f:
-        objectives_evaluations = np.load(f)
+    # (num_tasks, num_hps, num_seeds, num_fidelities, num_objectives)
+    objectives_evaluations = np.load(
+        path / "objectives_evaluations.npy", mmap_mode=mmap_mode
+    )
 
-    return {
-        task: BlackboxTabular(
+    def make_blackbox(task: str) -> BlackboxTabular:
+        return BlackboxTabular(
             hyperparameters=hyperparameters,
             configuration_space=configuration_space,
             fidelity_space=fidelity_space,
-            objectives_evaluations=objectives_evaluations[i],
+            objectives_evaluations=objectives_evaluations[task_names.index(task)],
             fidelity_values=fidelity_values,
             objectives_names=objectives_names,
         )
-        for i, task in enumerate(task_names)
-    }
+
+    if mmap_mode is not None:
+        return LazyBlackboxDict(task_names, make_blackbox)
+    else:
+        return {task: make_blackbox(task) for task in task_names}
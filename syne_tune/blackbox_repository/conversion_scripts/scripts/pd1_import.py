@@ -15,7 +15,7 @@ import json
 import logging
 import tarfile
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -40,6 +40,7 @@ from syne_tune.blackbox_repository.serialize import (
     serialize_configspace,
     serialize_metadata,
 )
+from syne_tune.blackbox_repository.utils import LazyBlackboxDict
 from syne_tune.config_space import loguniform, randint, uniform
 from syne_tune.util import catchtime
 
@@ -293,12 +294,16 @@ def serialize(
     )
 
 
-def deserialize(path: str) -> Dict[str, BlackboxTabular]:
+def deserialize(
+    path: str, mmap_mode: Optional[str] = None
+) -> Union[Dict[str, BlackboxTabular], LazyBlackboxDict]:
     """
     Deserialize blackboxes contained in a path that were saved with `serialize` above.
     TODO: the API is currently dissonant with `serialize`, `deserialize` for BlackboxOffline as `serialize` is there a member.
     A possible way to unify is to have serialize also be a free function for BlackboxOffline.
     :param path: a path that contains blackboxes that were saved with `serialize`
+    :param mmap_mode: if given, objectives are memory-mapped with this mode and blackboxes are only
+    created once their task is accessed, see `blackbox_tabular.deserialize`
     :return: a dictionary from task name to blackbox
     """
     path = Path(path)
@@ -307,8 +312,7 @@ def deserialize(path: str) -> Dict[str, BlackboxTabular]:
     objectives_names = metadata["objectives_names"]
     task_names = metadata["task_names"]
 
-    bb_dict = {}
-    for task in task_names:
+    def make_blackbox(task: str) -> BlackboxTabular:
         hyperparameters = pd.read_parquet(
             Path(path) / f"{task}-hyperparameters.parquet", engine="fastparquet"
         )
@@ -320,10 +324,11 @@ def deserialize(path: str) -> Dict[str, BlackboxTabular]:
         with open(path / f"{task}-fidelity_values.npy", "rb") as f:
             fidelity_values = np.load(f)
 
-        with open(path / f"{task}-objectives_evaluations.npy", "rb") as f:
-            objectives_evaluations = np.load(f)
+        objectives_evaluations = np.load(
+            path / f"{task}-objectives_evaluations.npy", mmap_mode=mmap_mode
+        )
 
-        bb_dict[task] = BlackboxTabular(
+        return BlackboxTabular(
             hyperparameters=hyperparameters,
             configuration_space=configuration_space,
             fidelity_space=fidelity_space,
@@ -331,7 +336,11 @@ def deserialize(path: str) -> Dict[str, BlackboxTabular]:
             fidelity_values=fidelity_values,
             objectives_names=objectives_names,
         )
-    return bb_dict
+
+    if mmap_mode is not None:
+        return LazyBlackboxDict(task_names, make_blackbox)
+    else:
+        return {task: make_blackbox(task) for task in task_names}
 
 
 if __name__ == "__main__":
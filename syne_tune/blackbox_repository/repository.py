@@ -63,6 +63,7 @@ def load_blackbox(
     s3_root: Optional[str] = None,
     generate_if_not_found: bool = True,
     yahpo_kwargs: Optional[dict] = None,
+    mmap_mode: Optional[str] = None,
 ) -> Union[Dict[str, Blackbox], Blackbox]:
     """
     :param name: name of a blackbox present in the repository, see blackbox_list() to get list of available blackboxes.
@@ -92,6 +93,12 @@ def load_blackbox(
         or on S3, should it be generated using its conversion script?
     :param yahpo_kwargs: For a YAHPO blackbox (`name == "yahpo-*"`), these are
         additional arguments to `instantiate_yahpo`
+    :param mmap_mode: For tabular blackboxes, objectives are memory-mapped with
+        this mode (see `numpy.load`, "r" is recommended) and tasks are only
+        materialized when accessed. The dictionary returned is then a
+        :class:`LazyBlackboxDict`. This saves memory and loading time, and
+        processes on the same host share the page cache. Ignored for other
+        blackboxes
     :return: blackbox with the given name, download it if not present.
     """
     if name.startswith("yahpo-"):
@@ -135,9 +142,9 @@ def load_blackbox(
             generate_blackbox_recipes[name].generate(s3_root=s3_root)
 
     if name.startswith("pd1"):
-        return deserialize_pd1(tgt_folder)
+        return deserialize_pd1(tgt_folder, mmap_mode=mmap_mode)
     elif (tgt_folder / "hyperparameters.parquet").exists():
-        return deserialize_tabular(tgt_folder)
+        return deserialize_tabular(tgt_folder, mmap_mode=mmap_mode)
     else:
         return deserialize_offline(tgt_folder)
 
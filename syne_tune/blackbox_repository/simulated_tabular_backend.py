@@ -10,6 +10,7 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+from collections.abc import Mapping
 from pathlib import Path
 from typing import List, Optional
 import logging
@@ -240,6 +241,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         surrogate: Optional[str] = None,
         surrogate_kwargs: Optional[dict] = None,
         config_space_surrogate: Optional[dict] = None,
+        mmap_mode: Optional[str] = None,
         **simulatorbackend_kwargs,
     ):
         """
@@ -265,6 +267,10 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
             space of the original blackbox is used. However, if this is a tabular
             blackbox, its numerical parameters have categorical domains, which is
             usually not what we want for a surrogate.
+        :param mmap_mode: Passed to `load_blackbox`. If given (e.g., "r"),
+            the objectives of tabular blackboxes are memory-mapped, and only
+            the task `dataset` is materialized. This saves memory and allows
+            many simulations on the same host to share the page cache
         """
         assert (
             config_space_surrogate is None or surrogate is not None
@@ -277,6 +283,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         )
         self.blackbox_name = blackbox_name
         self.dataset = dataset
+        self._mmap_mode = mmap_mode
         self._blackbox = None
         if surrogate is not None:
             # makes sure the surrogate can be constructed
@@ -296,14 +303,18 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
     def blackbox(self) -> Blackbox:
         if self._blackbox is None:
             if self.dataset is None:
-                self._blackbox = load_blackbox(self.blackbox_name)
+                self._blackbox = load_blackbox(
+                    self.blackbox_name, mmap_mode=self._mmap_mode
+                )
                 # TODO: This could fail earlier
-                assert not isinstance(self._blackbox, dict), (
+                assert not isinstance(self._blackbox, Mapping), (
                     f"blackbox_name = '{self.blackbox_name}' maps to a dict, "
                     + "dataset argument must be given"
                 )
             else:
-                self._blackbox = load_blackbox(self.blackbox_name)[self.dataset]
+                self._blackbox = load_blackbox(
+                    self.blackbox_name, mmap_mode=self._mmap_mode
+                )[self.dataset]
             if self._surrogate is not None:
                 surrogate = make_surrogate(
                     surrogate=self._surrogate, surrogate_kwargs=self._surrogate_kwargs
@@ -329,6 +340,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
             "dataset": self.dataset,
             "surrogate": self._surrogate,
             "surrogate_kwargs": self._surrogate_kwargs,
+            "mmap_mode": self._mmap_mode,
         }
         if self._config_space_surrogate is not None:
             state["config_space_surrogate"] = {
@@ -348,6 +360,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         self.dataset = state["dataset"]
         self._surrogate = state["surrogate"]
         self._surrogate_kwargs = state["surrogate_kwargs"]
+        self._mmap_mode = state.get("mmap_mode")
         self._blackbox = None
         if "config_space_surrogate" in state:
             self._config_space_surrogate = {
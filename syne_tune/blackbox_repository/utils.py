@@ -10,7 +10,8 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import List, Optional, Tuple
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Optional, Tuple
 
 from syne_tune.blackbox_repository.blackbox import Blackbox
 
@@ -52,3 +53,38 @@ def metrics_for_configuration(
             res_dict[resource_attr] = value
             res.append(res_dict)
     return res
+
+
+class LazyBlackboxDict(Mapping):
+    """
+    Read-only dictionary from task name to blackbox, where each blackbox is
+    created by `make_blackbox(task)` when it is accessed for the first time.
+    This is returned by deserializers in memory-mapped mode, so that loading a
+    blackbox with many tasks does not materialize the tasks which are not used.
+
+    :param task_names: Names of tasks
+    :param make_blackbox: Creates blackbox for a task name
+    """
+
+    def __init__(self, task_names: List[str], make_blackbox: Callable[[str], Blackbox]):
+        self._task_names = list(task_names)
+        self._make_blackbox = make_blackbox
+        self._blackboxes: Dict[str, Blackbox] = dict()
+
+    def __getitem__(self, task: str) -> Blackbox:
+        blackbox = self._blackboxes.get(task)
+        if blackbox is None:
+            if task not in self._task_names:
+                raise KeyError(task)
+            blackbox = self._make_blackbox(task)
+            self._blackboxes[task] = blackbox
+        return blackbox
+
+    def __iter__(self):
+        return iter(self._task_names)
+
+    def __len__(self) -> int:
+        return len(self._task_names)
+
+    def __repr__(self) -> str:
+        return f"LazyBlackboxDict({self._task_names})"
@@ -29,6 +29,10 @@ ST_WORKER_COST = "st_worker_cost"
 ST_INSTANCE_TYPE = "st_instance_type"
 ST_INSTANCE_COUNT = "st_instance_count"
 
+# environment variable set by the back-end, pointing to the file of the metrics
+# channel `report` writes to. If not set, metrics are written to stdout
+ST_METRICS_CHANNEL_ENV = "SYNETUNE_METRICS_CHANNEL"
+
 # constants for tuner results
 ST_TRIAL_ID = "trial_id"
 ST_TUNER_TIMESTAMP = "st_tuner_timestamp"
@@ -36,6 +40,16 @@ ST_TUNER_TIME = "st_tuner_time"
 ST_DECISION = "st_decision"
 ST_STATUS = "st_status"
 
+# files written by `StoreResultsCallback`: results are appended to the journal
+# while tuning, and exported as zipped CSV at the end
+ST_RESULTS_JOURNAL_FILENAME = "results.jsonl"
+ST_RESULTS_DATAFRAME_FILENAME = "results.csv.zip"
+
+# files written by `TunerProfilingCallback`: durations of the phases of every
+# iteration of the tuner loop, and their summary at the end
+ST_TUNER_PROFILE_FILENAME = "tuner_profile.jsonl"
+ST_TUNER_PROFILE_SUMMARY_FILENAME = "tuner_profile_summary.csv"
+
 # constant for the hyperparameter name that contains the checkpoint directory
 ST_CHECKPOINT_DIR = "st_checkpoint_dir"
 
@@ -12,14 +12,25 @@
 # permissions and limitations under the License.
 import json
 import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from json.decoder import JSONDecodeError
-from typing import List, Dict, Callable, Optional
+from pathlib import Path
+from typing import List, Dict, Callable, Optional, Tuple
 import pandas as pd
 from dataclasses import dataclass
 
-from syne_tune.constants import ST_TUNER_TIME, ST_TUNER_CREATION_TIMESTAMP
+from syne_tune.constants import (
+    ST_TUNER_TIME,
+    ST_TUNER_CREATION_TIMESTAMP,
+    ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_JOURNAL_FILENAME,
+)
 from syne_tune import Tuner
+from syne_tune.tuner_callback import read_results_journal
 from syne_tune.util import experiment_path, s3_experiment_path
 from syne_tune.try_import import try_import_aws_message
 
@@ -123,7 +134,12 @@ def download_single_experiment(
     parts_path = s3_path.replace("s3://", "").split("/")
     s3_bucket = parts_path[0]
     s3_key = "/".join(parts_path[1:])
-    for file in ["metadata.json", "results.csv.zip", "tuner.dill"]:
+    for file in [
+        "metadata.json",
+        ST_RESULTS_DATAFRAME_FILENAME,
+        ST_RESULTS_JOURNAL_FILENAME,
+        "tuner.dill",
+    ]:
         try:
             logging.info(f"downloading {file} on {s3_path}")
             s3.download_file(s3_bucket, f"{s3_key}/{file}", str(tgt_dir / file))
@@ -155,18 +171,48 @@ def load_experiment(
         download_single_experiment(
             tuner_name=tuner_name, experiment_name=experiment_name
         )
+    metadata, results = _load_metadata_and_results(path)
+    return _experiment_result(path, metadata, results, load_tuner)
+
+
+def _load_metadata_and_results(
+    path: Path, columns: Optional[List[str]] = None
+) -> Tuple[Optional[Dict], Optional[pd.DataFrame]]:
+    """
+    :param path: path of experiment
+    :param columns: If given, only these columns of the results are read
+    :return: `(metadata, results)`, each None if it cannot be read
+    """
     try:
-        with open(metadata_path, "r") as f:
+        with open(path / "metadata.json", "r") as f:
             metadata = json.load(f)
     except FileNotFoundError:
         metadata = None
+    usecols = None if columns is None else lambda name: name in columns
     try:
-        if (path / "results.csv.zip").exists():
-            results = pd.read_csv(path / "results.csv.zip")
+        if (path / ST_RESULTS_JOURNAL_FILENAME).exists():
+            # The journal is appended to while tuning, so it is more recent
+            # than the CSV file written at the end
+            results = pd.DataFrame(
+                read_results_journal(path / ST_RESULTS_JOURNAL_FILENAME)
+            )
+            if columns is not None:
+                results = results[[name for name in results.columns if usecols(name)]]
+        elif (path / ST_RESULTS_DATAFRAME_FILENAME).exists():
+            results = pd.read_csv(path / ST_RESULTS_DATAFRAME_FILENAME, usecols=usecols)
         else:
-            results = pd.read_csv(path / "results.csv")
+            results = pd.read_csv(path / "results.csv", usecols=usecols)
     except Exception:
         results = None
+    return metadata, results
+
+
+def _experiment_result(
+    path: Path,
+    metadata: Optional[Dict],
+    results: Optional[pd.DataFrame],
+    load_tuner: bool,
+) -> ExperimentResult:
     if load_tuner:
         try:
             tuner = Tuner.load(path)
@@ -213,20 +259,206 @@ def get_metadata(
     return res
 
 
+def _experiment_mtime(path: Path) -> float:
+    """
+    :return: Latest modification time of metadata and results files
+    """
+    mtime = 0
+    for name in (
+        "metadata.json",
+        ST_RESULTS_JOURNAL_FILENAME,
+        ST_RESULTS_DATAFRAME_FILENAME,
+        "results.csv",
+    ):
+        try:
+            mtime = max(mtime, (path / name).stat().st_mtime)
+        except FileNotFoundError:
+            pass
+    return mtime
+
+
+def _load_many_metadata_and_results(
+    paths: List[Path], columns: Optional[List[str]], num_workers: int
+) -> List[Tuple[Optional[Dict], Optional[pd.DataFrame]]]:
+    load_function = partial(_load_metadata_and_results, columns=columns)
+    if num_workers > 1 and len(paths) > 1:
+        chunksize = max(len(paths) // (4 * num_workers), 1)
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(load_function, paths, chunksize=chunksize))
+    else:
+        return [load_function(path) for path in paths]
+
+
+def _read_index(index_file: Path) -> Tuple[Dict[str, Dict], int, int]:
+    """
+    The index file is a sequence of pickled records, each either an entry
+    `dict(path, mtime, metadata, results)` or a removal `dict(path)`. Later
+    records override earlier ones for the same path. A record truncated by a
+    crash while it was appended ends the sequence.
+
+    :return: `(index, num_records, size)`, where `size` is the byte offset
+        after the last complete record
+    """
+    index = dict()
+    num_records = 0
+    size = 0
+    if index_file.exists():
+        with open(index_file, "rb") as f:
+            while True:
+                try:
+                    record = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception:
+                    logging.warning(
+                        f"Ignoring truncated record at the end of index {index_file}"
+                    )
+                    break
+                path = record.pop("path")
+                if record:
+                    index[path] = record
+                else:
+                    index.pop(path, None)
+                num_records += 1
+                size = f.tell()
+    return index, num_records, size
+
+
+def _load_from_index(
+    paths: List[Path], index_file: Path, num_workers: int
+) -> List[Tuple[Optional[Dict], Optional[pd.DataFrame]]]:
+    """
+    Returns metadata and results for experiments in `paths`, using the index
+    stored in `index_file`. The index maps the path of an experiment to
+    modification time, metadata and results (all columns). Only experiments
+    which are new or have changed since the index was written are loaded,
+    and records for them are appended to the index. Once most records are
+    outdated, the index is compacted by writing it to a temporary file, which
+    then replaces `index_file`.
+    """
+    index, num_records, size = _read_index(index_file)
+    mtimes = [_experiment_mtime(path) for path in paths]
+    paths_to_load = [
+        path
+        for path, mtime in zip(paths, mtimes)
+        if index.get(str(path), {}).get("mtime") != mtime
+    ]
+    records = []
+    if paths_to_load:
+        logging.info(
+            f"Updating index {index_file} with {len(paths_to_load)} experiments"
+        )
+        loaded = _load_many_metadata_and_results(
+            paths_to_load, columns=None, num_workers=num_workers
+        )
+        for path, (metadata, results) in zip(paths_to_load, loaded):
+            record = dict(
+                mtime=_experiment_mtime(path), metadata=metadata, results=results
+            )
+            index[str(path)] = record
+            records.append(dict(record, path=str(path)))
+    removed_paths = [key for key in index.keys() if not Path(key).exists()]
+    for key in removed_paths:
+        del index[key]
+        records.append(dict(path=key))
+    if records:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        num_records += len(records)
+        if num_records > 2 * len(index):
+            tmp_file = index_file.with_name(index_file.name + ".tmp")
+            with open(tmp_file, "wb") as f:
+                for path, record in index.items():
+                    pickle.dump(dict(record, path=path), f)
+            os.replace(tmp_file, index_file)
+        else:
+            with open(index_file, "ab") as f:
+                # Drops a record truncated by an earlier crash
+                f.truncate(size)
+                for record in records:
+                    pickle.dump(record, f)
+    return [
+        (index[str(path)]["metadata"], index[str(path)]["results"]) for path in paths
+    ]
+
+
+def _experiment_paths(
+    root: Path,
+    tuner_names: Optional[List[str]],
+    path_filter: Optional[Callable[[str], bool]],
+) -> List[Path]:
+    """
+    Experiments in `tuner_names` are looked up as `root / name` first. Only
+    names not found there require a walk over all of `root`.
+    """
+    metadata_paths = []
+    if tuner_names is not None:
+        remaining_names = set()
+        for name in tuner_names:
+            metadata_path = root / name / "metadata.json"
+            if metadata_path.exists():
+                metadata_paths.append(metadata_path)
+            else:
+                remaining_names.add(name)
+        if remaining_names:
+            metadata_paths.extend(
+                metadata_path
+                for metadata_path in root.glob("**/metadata.json")
+                if metadata_path.parent.name in remaining_names
+            )
+    else:
+        metadata_paths = list(root.glob("**/metadata.json"))
+    return [
+        metadata_path.parent
+        for metadata_path in metadata_paths
+        if path_filter is None or path_filter(metadata_path)
+    ]
+
+
 def list_experiments(
     path_filter: Callable[[str], bool] = None,
     experiment_filter: Callable[[ExperimentResult], bool] = None,
     load_tuner: bool = False,
+    tuner_names: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+    num_workers: int = 1,
+    index_file: Optional[str] = None,
+    root: Optional[Path] = None,
 ) -> List[ExperimentResult]:
+    """
+    :param path_filter: if passed, only experiments whose `metadata.json` path
+        matches the filter are loaded
+    :param experiment_filter: only experiments where the filter is True are
+        kept, default to None and returns everything
+    :param load_tuner: whether to load the tuners in addition to metadata and
+        results
+    :param tuner_names: if passed, only experiments with these tuner names are
+        loaded
+    :param columns: if passed, only these columns of the results are loaded
+    :param num_workers: if larger than 1, experiments are loaded in parallel
+        by a process pool of this size
+    :param index_file: if passed, metadata and results of experiments are
+        cached in this file, and only experiments which are new or have
+        changed since the last call are loaded
+    :param root: root directory of experiments, defaults to `experiment_path()`
+    :return: list of experiments, the most recent first
+    """
+    if root is None:
+        root = experiment_path()
+    paths = _experiment_paths(root, tuner_names, path_filter)
+    if index_file is not None:
+        metadata_and_results = _load_from_index(paths, Path(index_file), num_workers)
+    else:
+        metadata_and_results = _load_many_metadata_and_results(
+            paths, columns=columns, num_workers=num_workers
+        )
     res = []
-    for metadata_path in experiment_path().glob("**/metadata.json"):
-        path = metadata_path.parent
-        tuner_name = path.name
-        if path_filter is None or path_filter(metadata_path):
-            exp = load_experiment(tuner_name, load_tuner, local_path=path.parent)
-            if experiment_filter is None or experiment_filter(exp):
-                if exp.results is not None and exp.metadata is not None:
-                    res.append(exp)
+    for path, (metadata, results) in zip(paths, metadata_and_results):
+        if results is not None and columns is not None:
+            results = results[[name for name in results.columns if name in columns]]
+        exp = _experiment_result(path, metadata, results, load_tuner)
+        if experiment_filter is None or experiment_filter(exp):
+            if exp.results is not None and exp.metadata is not None:
+                res.append(exp)
     return sorted(
         res,
         key=lambda exp: exp.metadata.get(ST_TUNER_CREATION_TIMESTAMP, 0),
@@ -238,10 +470,23 @@ def load_experiments_df(
     path_filter: Callable[[str], bool] = None,
     experiment_filter: Callable[[ExperimentResult], bool] = None,
     load_tuner: bool = False,
+    tuner_names: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+    num_workers: int = 1,
+    index_file: Optional[str] = None,
+    root: Optional[Path] = None,
 ) -> pd.DataFrame:
     """
     :param: name_filter: if specified, only experiment whose path name matches the filter will be kept.
     :param experiment_filter: only experiment where the filter is True are kept, default to None and returns everything.
+    :param load_tuner: whether to load the tuners in addition to metadata and results
+    :param tuner_names: if passed, only experiments with these tuner names are loaded
+    :param columns: if passed, only these columns of the results are loaded, and only metadata entries with these
+        names are added. The `tuner_name` column is always added
+    :param num_workers: if larger than 1, experiments are loaded in parallel by a process pool of this size
+    :param index_file: if passed, metadata and results of experiments are cached in this file, and only
+        experiments which are new or have changed since the last call are loaded
+    :param root: root directory of experiments, defaults to `experiment_path()`
     :return: a dataframe that contains all evaluations reported by tuners according to the filter given.
     The columns contains trial-id, hyperparameter evaluated, metrics observed by `report`:
      metrics collected automatically by syne-tune:
@@ -254,27 +499,43 @@ def load_experiments_df(
      `entry_point_name`/`entry_point_path` name and path of the entry point that was tuned
     """
     dfs = []
+    metadata_rows = []
     for experiment in list_experiments(
         path_filter=path_filter,
         experiment_filter=experiment_filter,
         load_tuner=load_tuner,
+        tuner_names=tuner_names,
+        columns=columns,
+        num_workers=num_workers,
+        index_file=index_file,
+        root=root,
     ):
         assert experiment.results is not None
         assert experiment.metadata is not None
 
-        df = experiment.results
-        df["tuner_name"] = experiment.name
+        row = {"tuner_name": experiment.name}
         for k, v in experiment.metadata.items():
+            if columns is not None and k not in columns:
+                continue
             if isinstance(v, List):
                 if len(v) > 1:
                     for i, x in enumerate(v):
-                        df[f"{k}-{i}"] = x
+                        row[f"{k}-{i}"] = x
                 else:
-                    df[k] = v[0]
+                    row[k] = v[0]
             else:
-                df[k] = v
-        dfs.append(df)
-    return pd.concat(dfs, ignore_index=True)
+                row[k] = v
+        dfs.append(experiment.results)
+        metadata_rows.append(row)
+    # Metadata is broadcast to all rows of an experiment at the end, which is
+    # much faster than adding columns to each dataframe
+    df = pd.concat(dfs, ignore_index=True)
+    metadata_df = pd.DataFrame(metadata_rows)
+    metadata_df = metadata_df.loc[
+        metadata_df.index.repeat([len(results) for results in dfs])
+    ].reset_index(drop=True)
+    df = df.drop(columns=[name for name in metadata_df.columns if name in df.columns])
+    return pd.concat([df, metadata_df], axis=1)
 
 
 if __name__ == "__main__":
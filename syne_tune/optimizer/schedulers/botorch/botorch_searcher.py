@@ -84,9 +84,34 @@ class BotorchSearcher(SearcherWithRandomSeed):
         self.trial_configs = {}
         self.pending_trials = set()
         self.trial_observations = {}
+        # Normalized features of all suggested configs, in the first
+        # `_num_features` rows of `_features`, which grows geometrically.
+        # `_trial_row` maps trial_id to its row, `_observed_rows` lists the rows
+        # of trials with results, in the order of `trial_observations`
+        self._features = torch.zeros((16, self.hp_ranges.ndarray_size))
+        self._num_features = 0
+        self._trial_row = dict()
+        self._observed_rows = []
+        # Hyperparameters of the most recently fitted GP, used to warm-start
+        # the next fit
+        self._gp_hyperparameters = None
+
+    def _append_features(self, trial_id: int, config: Dict):
+        if self._num_features == self._features.shape[0]:
+            features = torch.zeros((2 * self._num_features, self._features.shape[1]))
+            features[: self._num_features] = self._features
+            self._features = features
+        row = self._num_features
+        self._features[row] = self._config_to_feature_matrix([config])[0]
+        self._trial_row[trial_id] = row
+        self._num_features += 1
 
     def _update(self, trial_id: str, config: Dict, result: Dict):
         trial_id = int(trial_id)
+        if trial_id not in self._trial_row:
+            self._append_features(trial_id, config)
+        if trial_id not in self.trial_observations:
+            self._observed_rows.append(self._trial_row[trial_id])
         self.trial_observations[trial_id] = result[self.metric_name]
         self.pending_trials.remove(trial_id)
 
@@ -117,7 +142,8 @@ class BotorchSearcher(SearcherWithRandomSeed):
 
         self.pending_trials.add(trial_id)
         self.trial_configs[trial_id] = config_suggested
-        self.config_seen.add(tuple(config_suggested.values()))
+        self.config_seen.add(self._config_key(config_suggested))
+        self._append_features(trial_id, config_suggested)
 
         return config_suggested
 
@@ -127,7 +153,7 @@ class BotorchSearcher(SearcherWithRandomSeed):
         if this fails because of numerical difficulties with non PSD matrices, then the candidate is sampled at random.
         """
         try:
-            X = np.array(self._config_to_feature_matrix(self._configs_with_results()))
+            X = self._features[self._observed_rows]
             y = self.objectives()
             if self.mode == "min":
                 # qExpectedImprovement only supports maximization
@@ -140,20 +166,26 @@ class BotorchSearcher(SearcherWithRandomSeed):
                 perm = self.random_state.permutation(len(X))[
                     : self.max_num_observations
                 ]
-                X = X[perm]
+                X = X[torch.from_numpy(perm)]
                 y = y[perm]
                 subsample = True
             else:
                 subsample = False
 
-            X_tensor = torch.Tensor(X)
             Y_tensor = standardize(torch.Tensor(y).reshape(-1, 1))
-            gp = self._make_gp(X_tensor=X_tensor, Y_tensor=Y_tensor)
+            gp = self._make_gp(X_tensor=X, Y_tensor=Y_tensor)
+            self._warm_start_gp(gp)
             mll = ExactMarginalLogLikelihood(gp.likelihood, gp)
-            fit_gpytorch_model(mll, max_retries=0)
+            # A single attempt, starting from the current hyperparameters
+            fit_gpytorch_model(mll, max_retries=1)
+            self._gp_hyperparameters = {
+                name: param.detach().clone() for name, param in gp.named_parameters()
+            }
 
             if self.pending_trials and self.fantasising and not subsample:
-                X_pending = self._config_to_feature_matrix(self._configs_pending())
+                X_pending = self._features[
+                    sorted(self._trial_row[trial] for trial in self.pending_trials)
+                ]
             else:
                 X_pending = None
 
@@ -172,7 +204,7 @@ class BotorchSearcher(SearcherWithRandomSeed):
             )
 
             candidate = candidate.detach().numpy()[0]
-            config = self.hp_ranges.from_ndarray(candidate)
+            config = self._config_from_ndarray(candidate)
             if not self._is_config_already_seen(config):
                 return config
             else:
@@ -182,8 +214,22 @@ class BotorchSearcher(SearcherWithRandomSeed):
                 return self._sample_and_pick_acq_best(acq)
         except NotPSDError as _:
             logging.warning("Chlolesky inversion failed, sampling randomly.")
+            # Do not warm-start from hyperparameters which led to the failure
+            self._gp_hyperparameters = None
             return self._sample_random()
 
+    def _warm_start_gp(self, gp: SingleTaskGP):
+        """
+        Initializes the hyperparameters of `gp` with those of the most recently
+        fitted GP, so that fitting starts close to the optimum.
+        """
+        if self._gp_hyperparameters is not None:
+            with torch.no_grad():
+                for name, param in gp.named_parameters():
+                    value = self._gp_hyperparameters.get(name)
+                    if value is not None and value.shape == param.shape:
+                        param.copy_(value)
+
     def _make_gp(self, X_tensor: torch.Tensor, Y_tensor: torch.Tensor) -> SingleTaskGP:
         double_precision = False
         if double_precision:
@@ -200,9 +246,11 @@ class BotorchSearcher(SearcherWithRandomSeed):
         return SingleTaskGP(X_tensor, Y_tensor, input_transform=warp_tf)
 
     def _config_to_feature_matrix(self, configs: List[Dict]) -> torch.Tensor:
+        return self._normalize(self.hp_ranges.to_ndarray_matrix(configs))
+
+    def _normalize(self, X: np.ndarray) -> torch.Tensor:
         bounds = torch.Tensor(self.hp_ranges.get_ndarray_bounds()).T
-        X = torch.Tensor([self.hp_ranges.to_ndarray(config) for config in configs])
-        return normalize(X, bounds)
+        return normalize(torch.Tensor(X), bounds)
 
     def objectives(self):
         return np.array(list(self.trial_observations.values()))
@@ -214,20 +262,29 @@ class BotorchSearcher(SearcherWithRandomSeed):
         :return: Samples `num_samples` candidates and return the one maximizing the acquisitition function `acq` that
         was not seen earlier, if all samples were seen, return a random sample instead.
         """
-        configs_candidates = [self._sample_random() for _ in range(num_samples)]
-        configs_candidates = [
-            x for x in configs_candidates if not self._is_config_already_seen(x)
-        ]
-        logger.debug(f"Sampling among {len(configs_candidates)} unseen configs")
-        if configs_candidates:
-            X_tensor = self._config_to_feature_matrix(configs_candidates)
-            ei = acq(X_tensor.unsqueeze(dim=-2))
-            return configs_candidates[ei.argmax()]
-        else:
-            return self._sample_random()
+        # Candidates are sampled and scored in encoded form. Only those with
+        # the highest scores are decoded, until one has not been seen before
+        X = self.hp_ranges.random_ndarray_matrix(self.random_state, num_samples)
+        with torch.no_grad():
+            ei = acq(self._normalize(X).unsqueeze(dim=-2))
+        for pos in torch.argsort(ei, descending=True).tolist():
+            config = self._config_from_ndarray(X[pos])
+            if not self._is_config_already_seen(config):
+                return config
+        return self._sample_random()
+
+    def _config_from_ndarray(self, x: np.ndarray) -> Dict:
+        config = {
+            k: v for k, v in self.config_space.items() if not isinstance(v, cs.Domain)
+        }
+        config.update(self.hp_ranges.from_ndarray(x))
+        return config
+
+    def _config_key(self, config: Dict) -> tuple:
+        return self.hp_ranges.config_to_tuple(config)
 
     def _is_config_already_seen(self, config) -> bool:
-        return tuple(config.values()) in self.config_seen
+        return self._config_key(config) in self.config_seen
 
     def _sample_random(self) -> Dict:
         return {
@@ -237,20 +294,6 @@ class BotorchSearcher(SearcherWithRandomSeed):
             for k, v in self.config_space.items()
         }
 
-    def _configs_with_results(self) -> List[Dict]:
-        return [
-            config
-            for trial, config in self.trial_configs.items()
-            if not trial in self.pending_trials
-        ]
-
-    def _configs_pending(self) -> List[Dict]:
-        return [
-            config
-            for trial, config in self.trial_configs.items()
-            if trial in self.pending_trials
-        ]
-
     def metric_names(self) -> List[str]:
         return [self.metric_name]
 
@@ -80,33 +80,38 @@ class CostPromotionRungSystem(PromotionRungSystem):
         """
         ret_id = None
         if len(recorded) > 1:
-            sign = 2 * (self._mode == "min") - 1
-            # Sort best-first
-            sorted_record = sorted(
-                ((k,) + v for k, v in recorded.items()), key=lambda x: x[1] * sign
+            # Entries of `recorded` are sorted best-first, so we only need to
+            # scan them until the threshold is reached
+            cost_threshold = (
+                sum(recorded[k][1] for k, _ in recorded.best_first()) * prom_quant
             )
-            cost_threshold = sum(x[2] for x in sorted_record) * prom_quant
-            sum_costs = 0
-            # DEBUG
-            log_msg = (
-                f"q = {prom_quant:.2f}, threshold = {cost_threshold:.2f}\n"
-                + ", ".join(
-                    [
-                        f"{x[0]}:{x[2]:.2f}({x[1]:.3f},{int(x[3])})"
-                        for x in sorted_record
-                    ]
+            sorted_record = ((k,) + recorded[k] for k, _ in recorded.best_first())
+            debug_log = logger.isEnabledFor(logging.DEBUG)
+            if debug_log:
+                sorted_record = list(sorted_record)
+                log_msg = (
+                    f"q = {prom_quant:.2f}, threshold = {cost_threshold:.2f}\n"
+                    + ", ".join(
+                        [
+                            f"{x[0]}:{x[2]:.2f}({x[1]:.3f},{int(x[3])})"
+                            for x in sorted_record
+                        ]
+                    )
                 )
-            )
+            sum_costs = 0
             for id, _, cost, was_promoted in sorted_record:
                 sum_costs += cost
                 if sum_costs > cost_threshold:
-                    log_msg += "\nNothing to promote"
+                    if debug_log:
+                        log_msg += "\nNothing to promote"
                     break
                 if not was_promoted:
-                    log_msg += f"\nPromote {id}: sum_costs = {sum_costs:.2f}"
+                    if debug_log:
+                        log_msg += f"\nPromote {id}: sum_costs = {sum_costs:.2f}"
                     ret_id = id
                     break
-            logger.debug(log_msg)  # DEBUG
+            if debug_log:
+                logger.debug(log_msg)
         return ret_id
 
     def _register_metrics_at_rung_level(self, trial_id, result, recorded):
@@ -14,6 +14,7 @@ from typing import Optional
 
 from syne_tune.optimizer.schedulers.hyperband_stopping import (
     quantile_cutoff,
+    RungData,
     RungSystem,
 )
 
@@ -60,12 +61,11 @@ class PromotionRungSystem(RungSystem):
         # is required for `on_task_report` to properly report `ignore_data`.
         self._running = dict()
 
-    def _cutoff(self, recorded: dict, prom_quant: float):
-        values = [x[0] for x in recorded.values()]
-        return quantile_cutoff(values, prom_quant, self._mode)
+    def _cutoff(self, recorded: RungData, prom_quant: float):
+        return quantile_cutoff(recorded, prom_quant, self._mode)
 
     def _find_promotable_trial(
-        self, recorded: dict, prom_quant: float, resource: int
+        self, recorded: RungData, prom_quant: float, resource: int
     ) -> Optional[str]:
         """
         Check whether any not yet promoted entry in `recorded` is
@@ -85,18 +85,14 @@ class PromotionRungSystem(RungSystem):
         sign = 1 - 2 * (self._mode == "min")
         cutoff = self._cutoff(recorded, prom_quant)
         if cutoff is not None:
-            # Best id among trials paused at this rung (i.e., not yet promoted)
-            trial_id, val = max(
-                (
-                    (k, v[0])
-                    for k, v in recorded.items()
-                    if self._is_promotable_trial(k, v[0], not v[1], resource)
-                ),
-                key=lambda x: sign * x[1],
-                default=(None, 0.0),
-            )
-            if trial_id is not None and sign * (val - cutoff) >= 0:
-                ret_id = trial_id
+            # Best id among trials paused at this rung (i.e., not yet promoted).
+            # Entries are scanned best first, so the first promotable one is
+            # the best
+            for trial_id, val in recorded.not_promoted_best_first():
+                if self._is_promotable_trial(trial_id, val, True, resource):
+                    if sign * (val - cutoff) >= 0:
+                        ret_id = trial_id
+                    break
         return ret_id
 
     def _is_promotable_trial(
@@ -11,14 +11,150 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 import logging
+import math
+from bisect import bisect_left, insort
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Tuple, Iterator
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+class RungData(dict):
+    """
+    Data of all trials which reached a rung level, a dict mapping trial_id to
+    the value recorded there. This is either the metric value, or a tuple
+    whose first entry is the metric value and whose last entry is a flag
+    whether the trial has been promoted from the rung.
+
+    In addition, entries are maintained in sorted order (best metric value
+    first, ties broken by order of insertion), so that quantiles of metric
+    values can be computed in O(1), and the best trial not yet promoted can be
+    found in O(log n), where n is the number of trials at the rung. Insertions
+    cost O(log n) comparisons (plus moving list elements, which is cheap).
+    Entries must be set as `data[trial_id] = value`.
+
+    :param mode: "min" or "max", determines which metric values are best
+    """
+
+    def __init__(self, mode: str):
+        super().__init__()
+        self._mode = mode
+        self._sign = 1 if mode == "min" else -1
+        self._num_insertions = 0
+        self._num_nans = 0
+        # trial_id -> (sort_key, position), where position is the order of
+        # insertion
+        self._sort_keys = dict()
+        # Sorted lists of `(sort_key, position, trial_id)`, for all entries and
+        # for entries not yet promoted
+        self._sorted_all = []
+        self._sorted_not_promoted = []
+
+    @staticmethod
+    def _split_value(value) -> Tuple[float, bool]:
+        if isinstance(value, tuple):
+            return value[0], not value[-1]
+        else:
+            return value, False
+
+    def __setitem__(self, trial_id, value):
+        if trial_id in self:
+            self._remove(trial_id)
+            position = self._sort_keys[trial_id][1]
+        else:
+            position = self._num_insertions
+            self._num_insertions += 1
+        super().__setitem__(trial_id, value)
+        metric_value, not_promoted = self._split_value(value)
+        if math.isnan(metric_value):
+            # NaN values are sorted last
+            self._num_nans += 1
+            sort_key = math.inf
+        else:
+            sort_key = self._sign * metric_value
+        self._sort_keys[trial_id] = (sort_key, position)
+        entry = (sort_key, position, trial_id)
+        insort(self._sorted_all, entry)
+        if not_promoted:
+            insort(self._sorted_not_promoted, entry)
+
+    def __delitem__(self, trial_id):
+        self._remove(trial_id)
+        del self._sort_keys[trial_id]
+        super().__delitem__(trial_id)
+
+    def _remove(self, trial_id):
+        metric_value, not_promoted = self._split_value(self[trial_id])
+        if math.isnan(metric_value):
+            self._num_nans -= 1
+        entry = self._sort_keys[trial_id] + (trial_id,)
+        for sorted_list in (
+            [self._sorted_all, self._sorted_not_promoted]
+            if not_promoted
+            else [self._sorted_all]
+        ):
+            del sorted_list[bisect_left(sorted_list, entry)]
+
+    def __reduce__(self):
+        # Sorted lists are recreated when entries are inserted
+        return self.__class__, (self._mode,), None, None, iter(self.items())
+
+    def _metric_value(self, entry: tuple) -> float:
+        sort_key = entry[0]
+        return math.nan if sort_key == math.inf else self._sign * sort_key
+
+    def quantile(self, q: float) -> float:
+        """
+        Same as `np.quantile(values, q)`, where `values` are all metric values
+        recorded at the rung.
+
+        :param q: Quantile, in [0, 1]
+        :return: Quantile of metric values
+        """
+        num_values = len(self)
+        assert num_values > 0
+        if self._num_nans > 0:
+            return math.nan
+        # Mirrors linear interpolation in `np.quantile`
+        virtual_index = (num_values - 1) * q
+        if virtual_index >= num_values - 1:
+            prev_index = next_index = num_values - 1
+        else:
+            prev_index = int(math.floor(virtual_index))
+            next_index = prev_index + 1
+        gamma = virtual_index - prev_index
+        values = self._sorted_all
+        if self._sign == 1:
+            prev_value = self._metric_value(values[prev_index])
+            next_value = self._metric_value(values[next_index])
+        else:
+            prev_value = self._metric_value(values[num_values - 1 - prev_index])
+            next_value = self._metric_value(values[num_values - 1 - next_index])
+        diff = next_value - prev_value
+        if gamma >= 0.5:
+            return next_value - diff * (1 - gamma)
+        else:
+            return prev_value + diff * gamma
+
+    def best_first(self) -> Iterator[Tuple[str, float]]:
+        """
+        :return: Iterator over `(trial_id, metric_value)` for all entries,
+            best metric value first
+        """
+        return ((entry[2], self._metric_value(entry)) for entry in self._sorted_all)
+
+    def not_promoted_best_first(self) -> Iterator[Tuple[str, float]]:
+        """
+        :return: Iterator over `(trial_id, metric_value)` for entries not yet
+            promoted, best metric value first
+        """
+        return (
+            (entry[2], self._metric_value(entry)) for entry in self._sorted_not_promoted
+        )
+
+
 @dataclass
 class RungEntry:
     level: int  # Rung level r_j
@@ -31,7 +167,10 @@ def quantile_cutoff(values, prom_quant, mode):
         # Cannot determine cutoff from one value
         return None
     q = prom_quant if mode == "min" else (1 - prom_quant)
-    return np.quantile(values, q)
+    if isinstance(values, RungData):
+        return values.quantile(q)
+    else:
+        return np.quantile(values, q)
 
 
 class RungSystem:
@@ -52,9 +191,9 @@ class RungSystem:
         self._resource_attr = resource_attr
         # The data entry in `_rungs` is a dict with key trial_id. The
         # value type depends on the subclass, but it contains the
-        # metric value
+        # metric value. Entries are also kept sorted, see :class:`RungData`
         self._rungs = [
-            RungEntry(level=x, prom_quant=y, data=dict())
+            RungEntry(level=x, prom_quant=y, data=RungData(mode))
             for x, y in reversed(list(zip(rung_levels, promote_quantiles)))
         ]
 
@@ -164,8 +303,7 @@ class StoppingRungSystem(RungSystem):
     """
 
     def _cutoff(self, recorded, prom_quant):
-        values = list(recorded.values())
-        return quantile_cutoff(values, prom_quant, self._mode)
+        return quantile_cutoff(recorded, prom_quant, self._mode)
 
     def _task_continues(
         self,
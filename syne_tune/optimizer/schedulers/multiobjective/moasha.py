@@ -207,7 +207,8 @@ class _Bracket:
         self.rf = reduction_factor
         MAX_RUNGS = int(np.log(max_t / min_t) / np.log(self.rf) - s + 1)
         self._rungs = [
-            (min_t * self.rf ** (k + s), {}) for k in reversed(range(MAX_RUNGS))
+            (min_t * self.rf ** (k + s), mo_priority.rung_data())
+            for k in reversed(range(MAX_RUNGS))
         ]
         self.priority = mo_priority
 
@@ -217,30 +218,16 @@ class _Bracket:
             if cur_iter < milestone or trial_id in recorded:
                 continue
             else:
-                if not recorded:
-                    # if no result was previously recorded, we saw the first result and we continue
-                    action = SchedulerDecision.CONTINUE
-                else:
-                    # get the list of metrics seen for the rung, compute multiobjective priority and decide to continue
-                    # if priority is in the top ones according to a rank induced by the `reduction_factor`.
-                    metric_recorded = np.array(
-                        [list(x.values()) for x in recorded.values()]
-                        + [list(metrics.values())]
-                    )
-                    priorities = self.priority(metric_recorded)
-
-                    # self._plot(milestone, metric_recorded, priorities)
-
-                    # We sort priorities at every call, assuming the cost of sort would be negligible
-                    # in case this becomes slow, we could just maintain a sorted list of priorities in cost
-                    # of memory.
-                    ranks = np.searchsorted(sorted(priorities), priorities) / len(
-                        priorities
-                    )
-                    new_priority_rank = ranks[-1]
-                    if new_priority_rank > 1 / self.rf:
-                        action = SchedulerDecision.STOP
-                recorded[trial_id] = metrics
+                # record the metrics and rank them among all metrics seen for the rung by the multiobjective
+                # priority, we continue if the rank is in the top ones according to the `reduction_factor`.
+                # The rung data maintains what is needed to rank new entries (see `MOPriority.rung_data`).
+                new_priority_rank = recorded.add(trial_id, metrics)
+
+                # self._plot(milestone, recorded.objectives, self.priority(recorded.objectives))
+
+                # if no result was previously recorded, we saw the first result and we continue
+                if len(recorded) > 1 and new_priority_rank > 1 / self.rf:
+                    action = SchedulerDecision.STOP
                 break
         return action
 
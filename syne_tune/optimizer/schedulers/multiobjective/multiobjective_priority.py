@@ -10,11 +10,12 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 import numpy as np
 from syne_tune.optimizer.schedulers.multiobjective.non_dominated_priority import (
     nondominated_sort,
+    IncrementalNonDominatedSort,
 )
 
 
@@ -42,6 +43,13 @@ class MOPriority:
     def priority_unsafe(self, objectives: np.array) -> np.array:
         raise NotImplementedError()
 
+    def rung_data(self) -> "MORungData":
+        """
+        :return: Empty data of a rung level, which ranks its entries by this
+            priority
+        """
+        return MORungData(self)
+
 
 class LinearScalarizationPriority(MOPriority):
     def __init__(
@@ -109,8 +117,91 @@ class NonDominatedPriority(MOPriority):
         self.max_num_samples = max_num_samples
 
     def priority_unsafe(self, objectives: np.array) -> np.array:
-        return np.array(
-            nondominated_sort(
-                X=objectives, dim=self.dim, max_items=self.max_num_samples
-            )
+        order = nondominated_sort(
+            X=objectives, dim=self.dim, max_items=self.max_num_samples
         )
+        # The priority of an item is its position in the order, items which
+        # are not sorted (see `max_num_samples`) come last
+        priorities = np.full(objectives.shape[0], len(order))
+        priorities[order] = np.arange(len(order))
+        return priorities
+
+    def rung_data(self) -> "MORungData":
+        return NonDominatedRungData(self)
+
+
+class MORungData(dict):
+    """
+    Data of all trials which reached a rung level of MOASHA, a dict mapping
+    trial_id to the dict of objectives recorded there. Entries must be added
+    by :meth:`add`, which returns the rank of the new entry.
+
+    Objectives are also maintained as a matrix, so that it does not have to
+    be recreated from the dict for every new entry. Priorities of all entries
+    are recomputed by `priority` whenever an entry is added.
+
+    :param priority: Multiobjective priority used to rank entries
+    """
+
+    def __init__(self, priority: MOPriority):
+        super().__init__()
+        self.priority = priority
+        self._objectives = None
+
+    @property
+    def objectives(self) -> np.ndarray:
+        """
+        :return: Objectives of all entries, in order of insertion, shape
+            (num_entries, num_objectives)
+        """
+        return self._objectives[: len(self)]
+
+    def _append_objectives(self, objectives: np.ndarray):
+        num_entries = len(self) - 1
+        if self._objectives is None:
+            self._objectives = np.empty((16, objectives.size))
+        elif num_entries == self._objectives.shape[0]:
+            self._objectives = np.concatenate(
+                [self._objectives, np.empty_like(self._objectives)], axis=0
+            )
+        self._objectives[num_entries] = objectives
+
+    def add(self, trial_id: int, metrics: Dict[str, float]) -> float:
+        """
+        Adds entry for a trial which is not at the rung level yet.
+
+        :param trial_id: ID of trial
+        :param metrics: Objectives recorded for the trial
+        :return: Rank of the new entry, normalized to [0, 1): the fraction of
+            entries (including the new one) with lower priority value
+        """
+        assert trial_id not in self, f"trial_id {trial_id} is already recorded"
+        super().__setitem__(trial_id, metrics)
+        self._append_objectives(np.array(list(metrics.values()), dtype=np.float64))
+        return self._rank_of_last_entry()
+
+    def _rank_of_last_entry(self) -> float:
+        priorities = self.priority(self.objectives)
+        return np.sum(priorities < priorities[-1]) / len(priorities)
+
+
+class NonDominatedRungData(MORungData):
+    """
+    Rung level data for :class:`NonDominatedPriority`. The Pareto fronts of
+    all entries are maintained incrementally, so that adding an entry does
+    not require a non-dominated sort of all entries, only the epsilon-net of
+    the front the new entry belongs to is computed.
+
+    :param priority: Non-dominated sort priority
+    """
+
+    def __init__(self, priority: NonDominatedPriority):
+        super().__init__(priority)
+        self._nondominated_sort = IncrementalNonDominatedSort(dim=priority.dim)
+
+    def _rank_of_last_entry(self) -> float:
+        index = self._nondominated_sort.insert(self.objectives[-1])
+        position = self._nondominated_sort.position(index)
+        if self.priority.max_num_samples is not None:
+            position = min(position, self.priority.max_num_samples)
+        return position / len(self)
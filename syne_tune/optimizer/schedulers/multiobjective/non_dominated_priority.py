@@ -15,36 +15,71 @@ from typing import Optional, List, Union
 import numpy as np
 
 
-def pareto_efficient(X: np.ndarray) -> np.ndarray:
+def _is_dominated(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    """
+    Evaluates for each allocation in X whether it is dominated by some allocation in Y, where
+    lower costs are better. An allocation does not dominate itself.
+
+    Parameters
+    ----------
+    X: np.ndarray [N, D]
+        The allocations to check.
+    Y: np.ndarray [M, D]
+        The allocations to compare against.
+
+    Returns
+    -------
+    np.ndarray [N]
+        A boolean array, indicating for each allocation in X whether it is dominated.
+    """
+    if Y.shape[0] == 0 or X.shape[0] == 0:
+        return np.zeros(X.shape[0], dtype=bool)
+    # An allocation is dominated by A if all costs are equal or lower and at least one cost is
+    # strictly lower
+    Y = Y[None, :, :]
+    X = X[:, None, :]
+    return np.any(np.all(Y <= X, axis=-1) & np.any(Y < X, axis=-1), axis=1)
+
+
+def pareto_efficient(X: np.ndarray, chunk_size: int = 64) -> np.ndarray:
     """
     Evaluates for each allocation in the provided array whether it is Pareto efficient. The costs
     are assumed to be improved by lowering them (eg lower is better).
 
+    If A dominates B, A comes before B in lexicographic order of (sum of costs, costs). We visit
+    allocations in this order, in chunks of size `chunk_size`. Allocations of a chunk are compared
+    against the Pareto efficient allocations found so far, and those not dominated against each
+    other, both in a vectorized way.
+
     Parameters
     ----------
     X: np.ndarray [N, D]
         The allocations to check where N is the number of allocations and D the number of costs per
         allocation.
+    chunk_size: int, default: 64
+        Number of allocations compared in one vectorized operation.
 
     Returns
     -------
     np.ndarray [N]
         A boolean array, indicating for each allocation whether it is Pareto efficient.
     """
-    # First, we assume that all allocations are Pareto efficient, i.e. not dominated
-    mask = np.ones(X.shape[0], dtype=bool)
-    # Then, we iterate over all allocations A and check which are dominated by then current
-    # allocation A. If it is, we don't need to check it against another allocation.
-    for i, allocation in enumerate(X):
-        # Only consider allocation if it hasn't been dominated yet
-        if mask[i]:
-            # An allocation is dominated by A if all costs are equal or lower and at least one cost
-            # is strictly lower. Using that definition, A cannot be dominated by itself.
-            dominated = np.all(allocation <= X[mask], axis=1) * np.any(
-                allocation < X[mask], axis=1
-            )
-            mask[mask] = ~dominated
-
+    num_items = X.shape[0]
+    mask = np.zeros(num_items, dtype=bool)
+    if num_items == 0:
+        return mask
+    keys = tuple(X[:, d] for d in reversed(range(X.shape[1]))) + (X.sum(axis=1),)
+    order = np.lexsort(keys)
+    front = X[:0]
+    for start in range(0, num_items, chunk_size):
+        chunk = order[start : (start + chunk_size)]
+        # Most allocations are dominated by the front found so far, only the
+        # others need to be compared against each other
+        chunk = chunk[~_is_dominated(X[chunk], front)]
+        X_chunk = X[chunk]
+        efficient = chunk[~_is_dominated(X_chunk, X_chunk)]
+        mask[efficient] = True
+        front = np.concatenate([front, X[efficient]], axis=0)
     return mask
 
 
@@ -55,7 +90,8 @@ def compute_epsilon_net(X: np.ndarray, dim: Optional[int] = None) -> np.ndarray:
     item. The third item is then chosen to maximize the distance to the existing points and so on.
 
     This algorithm is taken from "Nearest-Neighbor Searching and Metric Space Dimensions"
-    (Clarkson, 2005, p.17).
+    (Clarkson, 2005, p.17). The distance of each item to the items chosen so far is maintained,
+    so that every step costs O(N D).
 
     Parameters
     ----------
@@ -69,37 +105,48 @@ def compute_epsilon_net(X: np.ndarray, dim: Optional[int] = None) -> np.ndarray:
     Returns
     -------
     np.ndarray [N]
-        A list of item indices, defining a sparsified order of the items.
+        The rank of each item in the sparsified order of the items.
     """
-    indices = set(range(X.shape[0]))
+    order = _epsilon_net_order(X, dim=dim)
+
+    # convert argsort indices to rank
+    ranks = np.empty(len(order), dtype=int)
+    ranks[order] = np.arange(len(order))
+    return ranks
+
 
+def _epsilon_net_order(
+    X: np.ndarray, dim: Optional[int] = None, until: Optional[int] = None
+) -> List[int]:
+    """
+    Computes the order of `compute_epsilon_net`. If `until` is given, the
+    order is only computed until this item is chosen.
+    """
+    num_items = X.shape[0]
     # Choose the seed item according to dim
     if dim is None:
-        initial_index = np.random.choice(X.shape[0])
+        initial_index = np.random.choice(num_items)
     else:
         initial_index = np.argmin(X, axis=0)[dim]
 
-    # Initialize the order
+    # Distance of each item to the items chosen so far, -1 for items already
+    # chosen. Ties are broken in favour of the smallest index
+    diff = X - X[initial_index]
+    min_distances = np.sqrt(np.sum(diff * diff, axis=-1))
+    min_distances[initial_index] = -1
     order = [initial_index]
-    indices.remove(initial_index)
 
     # Iterate until all models have been chosen
-    while indices:
-        # Get the distance to all items that have already been chosen
-        ordered_indices = list(indices)
-        diff = X[ordered_indices][:, None, :].repeat(len(order), axis=1) - X[order]
-        min_distances = np.linalg.norm(diff, axis=-1).min(-1)
-
-        # Then, choose the one with the maximum distance to all points
-        choice = ordered_indices[min_distances.argmax()]
+    while len(order) < num_items and (until is None or order[-1] != until):
+        # Choose the one with the maximum distance to all points
+        choice = min_distances.argmax()
         order.append(choice)
-        indices.remove(choice)
-
-    # convert argsort indices to rank
-    ranks = np.empty(len(order), dtype=int)
-    for rank, i in enumerate(order):
-        ranks[i] = rank
-    return np.array(ranks)
+        diff = X - X[choice]
+        np.minimum(
+            min_distances, np.sqrt(np.sum(diff * diff, axis=-1)), out=min_distances
+        )
+        min_distances[choice] = -1
+    return order
 
 
 def nondominated_sort(
@@ -140,7 +187,7 @@ def nondominated_sort(
         # Compute the Pareto front and sort the items within
         pareto_mask = pareto_efficient(X[remaining])
         pareto_front = remaining[pareto_mask]
-        pareto_order = compute_epsilon_net(X[pareto_front], dim=dim)
+        pareto_order = np.argsort(compute_epsilon_net(X[pareto_front], dim=dim))
 
         # Add order to the indices
         indices.append(pareto_front[pareto_order].tolist())
@@ -159,3 +206,115 @@ def nondominated_sort(
     if flatten:
         return [i for ix in indices for i in ix]
     return indices
+
+
+class IncrementalNonDominatedSort:
+    """
+    Maintains the Pareto fronts (layers) of a non-dominated sort of a growing set of items, as
+    computed by `nondominated_sort`.
+
+    When an item is inserted, it joins the first layer which contains no item dominating it.
+    Items of this layer which are dominated by the new item move to the next layer, where they
+    may in turn push items to the layer after, and so on. This costs O(N D) comparisons in the
+    worst case, instead of recomputing all layers from scratch.
+
+    The position of an item in the order of `nondominated_sort` is the number of items in layers
+    before its own, plus its rank in the epsilon-net of its layer. Only the latter needs to be
+    computed when the position is queried.
+
+    Parameters
+    ----------
+    dim: Optional[int], default: None
+        The feature (metric) to prefer when ranking items within the Pareto front, see
+        `nondominated_sort`.
+    """
+
+    def __init__(self, dim: Optional[int] = None):
+        self.dim = dim
+        self._X = None
+        self._num_items = 0
+        # Indices of items in each layer, in increasing order
+        self._layers = []
+        # Index of layer for each item
+        self._layer_of_item = []
+
+    def __len__(self) -> int:
+        return self._num_items
+
+    @property
+    def X(self) -> np.ndarray:
+        return self._X[: self._num_items]
+
+    def layers(self) -> List[List[int]]:
+        return [layer.tolist() for layer in self._layers]
+
+    def _append(self, x: np.ndarray) -> int:
+        if self._X is None:
+            self._X = np.empty((16, x.size))
+        elif self._num_items == self._X.shape[0]:
+            self._X = np.concatenate([self._X, np.empty_like(self._X)], axis=0)
+        index = self._num_items
+        self._X[index] = x
+        self._num_items += 1
+        self._layer_of_item.append(None)
+        return index
+
+    def insert(self, x: np.ndarray) -> int:
+        """
+        Parameters
+        ----------
+        x: np.ndarray [D]
+            The item to insert.
+
+        Returns
+        -------
+        int
+            The index of the new item.
+        """
+        x = np.asarray(x, dtype=np.float64).reshape((-1,))
+        index = self._append(x)
+        X = self._X
+        # First layer which does not contain an item dominating the new one
+        level = 0
+        while level < len(self._layers) and _is_dominated(
+            x[None, :], X[self._layers[level]]
+        ):
+            level += 1
+        # Items dominated by moving items are pushed to the next layer
+        moving = np.array([index])
+        while moving.size > 0 and level < len(self._layers):
+            layer = self._layers[level]
+            pushed = _is_dominated(X[layer], X[moving])
+            self._layers[level] = np.sort(np.concatenate([layer[~pushed], moving]))
+            for i in moving:
+                self._layer_of_item[i] = level
+            moving = layer[pushed]
+            level += 1
+        if moving.size > 0:
+            self._layers.append(np.sort(moving))
+            for i in moving:
+                self._layer_of_item[i] = level
+        return index
+
+    def position(self, index: int) -> int:
+        """
+        Parameters
+        ----------
+        index: int
+            Index of an item.
+
+        Returns
+        -------
+        int
+            The position of the item in the order of `nondominated_sort`.
+        """
+        level = self._layer_of_item[index]
+        layer = self._layers[level]
+        num_before = sum(len(other) for other in self._layers[:level])
+        if layer.size == 1:
+            return num_before
+        # The epsilon-net is computed until the item is chosen
+        order = _epsilon_net_order(
+            self._X[layer], dim=self.dim, until=np.searchsorted(layer, index)
+        )
+        return num_before + len(order) - 1
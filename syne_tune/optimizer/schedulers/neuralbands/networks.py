@@ -10,6 +10,9 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import time
+from typing import Optional
+
 import numpy as np
 import torch
 import torch.nn as nn
@@ -37,24 +40,41 @@ class NetworkExploitation(nn.Module):
 
 
 class Exploitation:
-    def __init__(self, dim: int, lr: float = 0.001, hidden: int = 100):
+    def __init__(
+        self,
+        dim: int,
+        lr: float = 0.001,
+        hidden: int = 100,
+        batch_size: int = 32,
+        max_steps: int = 100,
+        max_train_time: Optional[float] = None,
+    ):
 
         """
         the budget-aware network of NeuralBand
 
+        Observations are stored in contiguous tensors, which grow geometrically,
+        so that training can draw mini-batches by indexing.
+
         :param dim: number of dimensions of configuration vector
         :param lr: learning rate of Adam
         :param hidden: width of neural network
+        :param batch_size: mini-batch size used in :meth:`train`
+        :param max_steps: maximum number of Adam steps per call of :meth:`train`
+        :param max_train_time: if given, :meth:`train` returns once this many
+            seconds have passed (checked after every step)
         """
         self.lr = lr
+        self.batch_size = batch_size
+        self.max_steps = max_steps
+        self.max_train_time = max_train_time
         self.func = NetworkExploitation(dim, hidden_size=hidden).to(device)
 
-        # store all configuration vectors
-        self.x1_list = []
-        # store all budgets
-        self.b_list = []
-        # store all evaluated scores
-        self.reward_list = []
+        # configuration vectors, budgets and evaluated scores. Only the first
+        # `data_size` rows are valid
+        self._x1 = torch.zeros((16, dim))
+        self._b = torch.zeros((16, 1))
+        self._reward = torch.zeros((16, 1))
 
         # number of parameters of neural network
         self.total_param = sum(
@@ -70,12 +90,33 @@ class Exploitation:
         # the maximal budget occured so far
         self.max_b = 0.01
 
+    @property
+    def x1_data(self) -> torch.Tensor:
+        return self._x1[: self.data_size]
+
+    @property
+    def b_data(self) -> torch.Tensor:
+        return self._b[: self.data_size]
+
+    @property
+    def reward_data(self) -> torch.Tensor:
+        return self._reward[: self.data_size]
+
+    def _grow(self):
+        capacity = 2 * self._x1.shape[0]
+        for name in ("_x1", "_b", "_reward"):
+            old = getattr(self, name)
+            new = torch.zeros((capacity, old.shape[1]))
+            new[: self.data_size] = old[: self.data_size]
+            setattr(self, name, new)
+
     def add_data(self, x: list, reward: float):
-        x1 = torch.tensor(x[0]).float()
-        b = torch.tensor(x[1]).float()
-        self.x1_list.append(x1)
-        self.b_list.append(b)
-        self.reward_list.append(reward)
+        if self.data_size == self._x1.shape[0]:
+            self._grow()
+        pos = self.data_size
+        self._x1[pos] = torch.as_tensor(np.asarray(x[0]), dtype=torch.float32)
+        self._b[pos, 0] = float(x[1])
+        self._reward[pos, 0] = float(reward)
         self.data_size += 1
         self.sum_b += x[1]
         if self.max_b < x[1]:
@@ -88,27 +129,60 @@ class Exploitation:
         res = self.func(x1, b)
         return res
 
+    def predict_batch(self, x1: np.ndarray, b: float) -> np.ndarray:
+        """
+        Predicts scores for many configurations at the same budget, using a
+        single forward pass without gradients.
+
+        :param x1: encoded configurations, shape `(n, dim)`
+        :param b: budget
+        :return: predicted scores, shape `(n,)`
+        """
+        with torch.no_grad():
+            x1 = torch.as_tensor(np.asarray(x1), dtype=torch.float32).to(device)
+            res = self.func(x1, torch.tensor(float(b), device=device))
+        return res.reshape((-1,)).cpu().numpy()
+
     def train(self) -> float:
+        """
+        Runs epochs of mini-batch Adam over the stored data, until the mean
+        loss of an epoch drops below 1e-4, `max_steps` steps have been done, or
+        `max_train_time` is exceeded.
+
+        :return: mean squared error over the samples processed (in the last
+            epoch, if training converged)
+        """
+        length = self.data_size
+        if length == 0:
+            return 0.0
+        start_time = time.perf_counter()
         optimizer = optim.Adam(self.func.parameters(), lr=self.lr)
-        length = len(self.reward_list)
-        index = np.arange(length)
-        np.random.shuffle(index)
+        x1_data = self.x1_data.to(device)
+        b_data = self.b_data.to(device)
+        reward_data = self.reward_data.to(device)
         cnt = 0
-        tot_loss = 0
+        num_samples = 0
+        tot_loss = 0.0
         while True:
-            batch_loss = 0
-            for idx in index:
-                x1 = self.x1_list[idx].to(device)
-                b = self.b_list[idx].to(device)
-                r = self.reward_list[idx]
+            index = torch.randperm(length, device=device)
+            epoch_loss = 0.0
+            for start in range(0, length, self.batch_size):
+                batch = index[start : start + self.batch_size]
                 optimizer.zero_grad()
-                loss = (self.func(x1, b) - r) ** 2
-                loss.backward()
+                sq_errors = (
+                    self.func(x1_data[batch], b_data[batch]) - reward_data[batch]
+                ) ** 2
+                sq_errors.mean().backward()
                 optimizer.step()
-                batch_loss += loss.item()
-                tot_loss += loss.item()
+                batch_loss = sq_errors.sum().item()
+                epoch_loss += batch_loss
+                tot_loss += batch_loss
+                num_samples += batch.numel()
                 cnt += 1
-                if cnt >= 500:
-                    return tot_loss / cnt
-            if batch_loss / length <= 1e-4:
-                return batch_loss / length
+                if cnt >= self.max_steps or (
+                    self.max_train_time is not None
+                    and time.perf_counter() - start_time >= self.max_train_time
+                ):
+                    return tot_loss / num_samples
+            if epoch_loss / length <= 1e-4:
+                return epoch_loss / length
@@ -14,7 +14,6 @@ import logging
 from typing import Dict, Optional
 import numpy as np
 
-from syne_tune.backend.trial_status import Trial
 from syne_tune.optimizer.scheduler import SchedulerDecision, TrialSuggestion
 from syne_tune.config_space import cast_config_values
 from syne_tune.backend.time_keeper import RealTimeKeeper
@@ -82,45 +81,48 @@ class NeuralbandScheduler(NeuralbandSchedulerBase):
         extra_kwargs["elapsed_time"] = self._elapsed_time()
         trial_id = str(trial_id)
 
-        # active selection criterion
+        # active selection criterion. Configurations are drawn and scored in
+        # batches, and the first one (in order of drawing) which passes the
+        # criterion is selected. If none does after `max_while_loop + 2`
+        # draws, the best one is selected
         initial_budget = self.net.max_b
-        while_loop_count = 0
-        l_t_score = []
-        while 1:
-            config = self.searcher.get_config(**extra_kwargs, trial_id=trial_id)
-            if config is not None:
-                config_encoding = self.hp_ranges.to_ndarray(config)
-                predict_score = self.net.predict(
-                    (config_encoding, initial_budget)
-                ).item()
-                l_t_score.append((config, predict_score))
+        max_num_draws = self.max_while_loop + 2
+        threshold = self.gamma * (1.0 - initial_budget / self.max_t)
+        l_t_configs = []
+        l_t_scores = []
+        config = None
+        while config is None:
+            num = min(self.screening_batch_size, max_num_draws - len(l_t_configs))
+            configs, encodings = self._draw_candidates(num, extra_kwargs, trial_id)
+            if configs:
+                predict_scores = self.net.predict_batch(encodings, initial_budget)
                 if self.mode == "min":
-                    if (
-                        self.currnet_best_score - predict_score
-                        > self.gamma
-                        * self.currnet_best_score
-                        * (1.0 - initial_budget / self.max_t)
-                    ):
-                        break
-                    if while_loop_count > self.max_while_loop:
-                        l_t_score = sorted(l_t_score, key=lambda x: x[1])
-                        config = l_t_score[0][0]
-                        break
+                    passed = (
+                        self.currnet_best_score - predict_scores
+                        > threshold * self.currnet_best_score
+                    )
                 else:
-                    if predict_score * 100.0 - self.currnet_best_score > self.gamma * (
-                        100.0 - self.currnet_best_score
-                    ) * (1.0 - initial_budget / self.max_t):
-                        break
-                    if while_loop_count > self.max_while_loop:
-                        l_t_score = sorted(l_t_score, key=lambda x: x[1], reverse=True)
-                        config = l_t_score[0][0]
-                        break
-                while_loop_count += 1
-            else:
+                    passed = predict_scores * 100.0 - self.currnet_best_score > (
+                        threshold * (100.0 - self.currnet_best_score)
+                    )
+                pos = np.flatnonzero(passed)
+                if pos.size > 0:
+                    config = configs[pos[0]]
+                    break
+                l_t_configs.extend(configs)
+                l_t_scores.append(predict_scores)
+            if len(configs) < num:
                 self._searcher_initialized = False
                 self._initialize_searcher_new()
                 config = self.searcher.get_config(**extra_kwargs, trial_id=trial_id)
                 break
+            if len(l_t_configs) >= max_num_draws:
+                l_t_scores = np.concatenate(l_t_scores)
+                if self.mode == "min":
+                    best_pos = np.argmin(l_t_scores)
+                else:
+                    best_pos = np.argmax(l_t_scores)
+                config = l_t_configs[best_pos]
 
         if config is not None:
             config = cast_config_values(config, self.config_space)
@@ -129,162 +131,27 @@ class NeuralbandScheduler(NeuralbandSchedulerBase):
 
         return config
 
-    def on_trial_result(self, trial: Trial, result: Dict) -> str:
-        self._check_result(result)
-        trial_id = str(trial.trial_id)
-        debug_log = self.searcher.debug_log
-        trial_decision = SchedulerDecision.CONTINUE
-        if len(result) == 0:
-            # An empty dict should just be skipped
-            if debug_log is not None:
-                logger.info(
-                    f"trial_id {trial_id}: Skipping empty dict received "
-                    "from reporter"
-                )
-        else:
-            # Time since start of experiment
-            time_since_start = self._elapsed_time()
-            do_update = False
-            config = self._preprocess_config(trial.config)
-            cost_and_promotion = (
-                self._cost_attr is not None
-                and self._cost_attr in result
-                and self.does_pause_resume()
-            )
-            if cost_and_promotion:
-                # Trial may have paused/resumed before, so need to add cost
-                # offset from these
-                cost_offset = self._cost_offset.get(trial_id, 0)
-                result[self._total_cost_attr()] = result[self._cost_attr] + cost_offset
-            if trial_id not in self._active_trials:
-                # Trial not in self._active_trials anymore, so must have been
-                # stopped
-                trial_decision = SchedulerDecision.STOP
-                logger.warning(
-                    f"trial_id {trial_id}: Was STOPPED, but receives another "
-                    f"report {result}\nThis report is ignored"
-                )
-            elif not self._active_trials[trial_id]["running"]:
-                # Trial must have been paused before
-                trial_decision = SchedulerDecision.PAUSE
-                logger.warning(
-                    f"trial_id {trial_id}: Was PAUSED, but receives another "
-                    f"report {result}\nThis report is ignored"
-                )
-            else:
-                # perturb the feedback and train network
-                config = trial.config
-                config_encoding = self.hp_ranges.to_ndarray(config)
-                if "epoch" in result:
-                    hp_budget = float(result["epoch"] / self.max_t)
-                else:
-                    hp_budget = float(result["hp_epoch"] / self.max_t)
-                test_loss = result[self.metric]
-                # update current best score
-                if self.mode == "min":
-                    if test_loss < self.currnet_best_score:
-                        self.currnet_best_score = test_loss
-                    perturbed_loss = test_loss + np.random.normal(
-                        0, self.nu * self.currnet_best_score * (1 - hp_budget)
-                    )
-                else:
-                    if test_loss > self.currnet_best_score:
-                        self.currnet_best_score = test_loss
-                    perturbed_loss = (
-                        test_loss
-                        + np.random.normal(
-                            0, self.nu * (100.0 - test_loss) * (1 - hp_budget)
-                        )
-                    ) / 100.0
-                self.net.add_data((config_encoding, hp_budget), perturbed_loss)
-
-                # train network
-                if self.net.data_size % self.train_step_size == 0:
-                    predict_score = self.net.predict(
-                        (config_encoding, hp_budget)
-                    ).item()
-                    self.net.train()
-
-                task_info = self.terminator.on_task_report(trial_id, result)
-                task_continues = task_info["task_continues"]
-                milestone_reached = task_info["milestone_reached"]
-                if cost_and_promotion:
-                    if milestone_reached:
-                        # Trial reached milestone and will pause there: Update
-                        # cost offset
-                        if self._cost_attr is not None:
-                            self._cost_offset[trial_id] = result[
-                                self._total_cost_attr()
-                            ]
-                    elif task_info.get("ignore_data", False):
-                        if self._cost_offset[trial_id] > 0:
-                            logger.info(
-                                f"trial_id {trial_id}: Resumed trial seems to have been "
-                                + "started from scratch (no checkpointing?), so we erase "
-                                + "the cost offset."
-                            )
-                        self._cost_offset[trial_id] = 0
-
-                do_update = self._update_searcher(trial_id, config, result, task_info)
-                resource = int(result[self._resource_attr])
-                self._active_trials[trial_id].update(
-                    {
-                        "time_stamp": time_since_start,
-                        "reported_result": {
-                            self.metric: result[self.metric],
-                            self._resource_attr: resource,
-                        },
-                        "keep_case": milestone_reached,
-                    }
-                )
-                if do_update:
-                    largest_update_resource = self._active_trials[trial_id][
-                        "largest_update_resource"
-                    ]
-                    if largest_update_resource is None:
-                        largest_update_resource = resource - 1
-                    assert largest_update_resource <= resource, (
-                        f"Internal error (trial_id {trial_id}): "
-                        + f"on_trial_result called with resource = {resource}, "
-                        + f"but largest_update_resource = {largest_update_resource}"
-                    )
-                    if resource == largest_update_resource:
-                        do_update = False  # Do not update again
-                    else:
-                        self._active_trials[trial_id][
-                            "largest_update_resource"
-                        ] = resource
-                if not task_continues:
-                    if (not self.does_pause_resume()) or resource >= self.max_t:
-                        trial_decision = SchedulerDecision.STOP
-                        act_str = "Terminating"
-                    else:
-                        trial_decision = SchedulerDecision.PAUSE
-                        act_str = "Pausing"
-                    self._cleanup_trial(trial_id)
-                if debug_log is not None:
-                    if not task_continues:
-                        logger.info(
-                            f"trial_id {trial_id}: {act_str} evaluation "
-                            f"at {resource}"
-                        )
-                    elif milestone_reached:
-                        msg = f"trial_id {trial_id}: Reaches {resource}, continues"
-                        next_milestone = task_info.get("next_milestone")
-                        if next_milestone is not None:
-                            msg += f" to {next_milestone}"
-                        logger.info(msg)
-            self.searcher.on_trial_result(
-                trial_id, config, result=result, update=do_update
+    def _update_network(self, config: Dict, result: Dict):
+        # perturb the feedback and train network
+        config_encoding = self.hp_ranges.to_ndarray(config)
+        hp_budget = self._budget_of_result(result)
+        test_loss = result[self.metric]
+        # update current best score
+        if self.mode == "min":
+            if test_loss < self.currnet_best_score:
+                self.currnet_best_score = test_loss
+            perturbed_loss = test_loss + np.random.normal(
+                0, self.nu * self.currnet_best_score * (1 - hp_budget)
             )
-        # Extra info in debug mode
-        log_msg = f"trial_id {trial_id} (metric = {result[self.metric]:.3f}"
-        for k, is_float in ((self._resource_attr, False), ("elapsed_time", True)):
-            if k in result:
-                if is_float:
-                    log_msg += f", {k} = {result[k]:.2f}"
-                else:
-                    log_msg += f", {k} = {result[k]}"
-        log_msg += f"): decision = {trial_decision}"
-        logger.debug(log_msg)
-        return trial_decision
+        else:
+            if test_loss > self.currnet_best_score:
+                self.currnet_best_score = test_loss
+            perturbed_loss = (
+                test_loss
+                + np.random.normal(0, self.nu * (100.0 - test_loss) * (1 - hp_budget))
+            ) / 100.0
+        self.net.add_data((config_encoding, hp_budget), perturbed_loss)
+
+        # train network
+        if self.net.data_size % self.train_step_size == 0:
+            self.net.train()
@@ -11,7 +11,7 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, List, Tuple
 import numpy as np
 import torch
 
@@ -37,7 +37,15 @@ def is_continue_decision(trial_decision: str) -> bool:
 
 class NeuralbandSchedulerBase(HyperbandScheduler):
     def __init__(
-        self, config_space: Dict, step_size: int, max_while_loop: int, **kwargs
+        self,
+        config_space: Dict,
+        step_size: int,
+        max_while_loop: int,
+        train_batch_size: int = 32,
+        train_max_steps: int = 100,
+        max_train_time: Optional[float] = None,
+        screening_batch_size: int = 16,
+        **kwargs,
     ):
         """
         Shared base scheduler for NeuralBand.
@@ -45,6 +53,11 @@ class NeuralbandSchedulerBase(HyperbandScheduler):
         :param config_space:
         :param step_size: How many trials we train the network once
         :param max_while_loop: Maximal number of times we can draw a configuration from configuration space
+        :param train_batch_size: Mini-batch size for training the network
+        :param train_max_steps: Maximal number of Adam steps each time the network is trained
+        :param max_train_time: If given, training the network stops after this many seconds
+        :param screening_batch_size: Number of configurations drawn and scored together when
+            selecting a new configuration
         :param kwargs:
         """
 
@@ -56,10 +69,36 @@ class NeuralbandSchedulerBase(HyperbandScheduler):
         self.input_dim = self.hp_ranges.ndarray_size
 
         # initialize neural network
-        self.net = Exploitation(dim=self.input_dim)
+        self.net = Exploitation(
+            dim=self.input_dim,
+            batch_size=train_batch_size,
+            max_steps=train_max_steps,
+            max_train_time=max_train_time,
+        )
         self.currnet_best_score = 1.0
         self.train_step_size = step_size
         self.max_while_loop = max_while_loop
+        self.screening_batch_size = screening_batch_size
+
+    def _draw_candidates(
+        self, num: int, extra_kwargs: Dict, trial_id: str
+    ) -> Tuple[List[Dict], Optional[np.ndarray]]:
+        """
+        Draws up to `num` configurations from the searcher and encodes them.
+        Fewer are returned if the searcher runs out of configurations.
+
+        :return: `(configs, encodings)`, where `encodings` has shape
+            `(len(configs), input_dim)`, or is None if `configs` is empty
+        """
+        configs = []
+        for _ in range(num):
+            config = self.searcher.get_config(**extra_kwargs, trial_id=trial_id)
+            if config is None:
+                break
+            configs.append(config)
+        if not configs:
+            return configs, None
+        return configs, np.vstack([self.hp_ranges.to_ndarray(c) for c in configs])
 
     def _initialize_searcher_new(self):
         searcher = self.kwargs["searcher"]
@@ -88,155 +127,48 @@ class NeuralbandSchedulerBase(HyperbandScheduler):
         self.searcher: BaseSearcher = searcher_factory(searcher, **search_options)
         self._searcher_initialized = True
 
+    def _budget_of_result(self, result: Dict) -> float:
+        if "epoch" in result:
+            return float(result["epoch"] / self.max_t)
+        else:
+            return float(result["hp_epoch"] / self.max_t)
+
+    def _update_network(self, config: Dict, result: Dict):
+        """
+        Adds the observation in `result` to the data of the network, and
+        trains the network every `step_size` observations.
+
+        :param config: Configuration of the trial reporting `result`
+        :param result: Result reported by the trial
+        """
+        config_encoding = self.hp_ranges.to_ndarray(config)
+        hp_budget = self._budget_of_result(result)
+        test_loss = result[self.metric]
+
+        # update current best score
+        if self.mode == "min":
+            if test_loss < self.currnet_best_score:
+                self.currnet_best_score = test_loss
+        else:
+            if test_loss > self.currnet_best_score:
+                self.currnet_best_score = test_loss
+
+        self.net.add_data((config_encoding, hp_budget), test_loss)
+
+        # train network
+        if self.net.data_size % self.train_step_size == 0:
+            self.net.train()
+
     def on_trial_result(self, trial: Trial, result: Dict) -> str:
         self._check_result(result)
         trial_id = str(trial.trial_id)
-        debug_log = self.searcher.debug_log
-        trial_decision = SchedulerDecision.CONTINUE
-        if len(result) == 0:
-            # An empty dict should just be skipped
-            if debug_log is not None:
-                logger.info(
-                    f"trial_id {trial_id}: Skipping empty dict received "
-                    "from reporter"
-                )
-        else:
-            # Time since start of experiment
-            time_since_start = self._elapsed_time()
-            do_update = False
-            config = self._preprocess_config(trial.config)
-            cost_and_promotion = (
-                self._cost_attr is not None
-                and self._cost_attr in result
-                and self.does_pause_resume()
-            )
-            if cost_and_promotion:
-                # Trial may have paused/resumed before, so need to add cost
-                # offset from these
-                cost_offset = self._cost_offset.get(trial_id, 0)
-                result[self._total_cost_attr()] = result[self._cost_attr] + cost_offset
-            if trial_id not in self._active_trials:
-                # Trial not in self._active_trials anymore, so must have been
-                # stopped
-                trial_decision = SchedulerDecision.STOP
-                logger.warning(
-                    f"trial_id {trial_id}: Was STOPPED, but receives another "
-                    f"report {result}\nThis report is ignored"
-                )
-            elif not self._active_trials[trial_id]["running"]:
-                # Trial must have been paused before
-                trial_decision = SchedulerDecision.PAUSE
-                logger.warning(
-                    f"trial_id {trial_id}: Was PAUSED, but receives another "
-                    f"report {result}\nThis report is ignored"
-                )
-            else:
-                # update neural network
-                config = trial.config
-                config_encoding = self.hp_ranges.to_ndarray(config)
-                if "epoch" in result:
-                    hp_budget = float(result["epoch"] / self.max_t)
-                else:
-                    hp_budget = float(result["hp_epoch"] / self.max_t)
-                test_loss = result[self.metric]
-
-                # update current best score
-                if self.mode == "min":
-                    if test_loss < self.currnet_best_score:
-                        self.currnet_best_score = test_loss
-                else:
-                    if test_loss > self.currnet_best_score:
-                        self.currnet_best_score = test_loss
-
-                self.net.add_data((config_encoding, hp_budget), test_loss)
-
-                # train network
-                if self.net.data_size % self.train_step_size == 0:
-                    self.net.train()
-
-                task_info = self.terminator.on_task_report(trial_id, result)
-                task_continues = task_info["task_continues"]
-                milestone_reached = task_info["milestone_reached"]
-                if cost_and_promotion:
-                    if milestone_reached:
-                        # Trial reached milestone and will pause there: Update
-                        # cost offset
-                        if self._cost_attr is not None:
-                            self._cost_offset[trial_id] = result[
-                                self._total_cost_attr()
-                            ]
-                    elif task_info.get("ignore_data", False):
-                        if self._cost_offset[trial_id] > 0:
-                            logger.info(
-                                f"trial_id {trial_id}: Resumed trial seems to have been "
-                                + "started from scratch (no checkpointing?), so we erase "
-                                + "the cost offset."
-                            )
-                        self._cost_offset[trial_id] = 0
-
-                do_update = self._update_searcher(trial_id, config, result, task_info)
-                resource = int(result[self._resource_attr])
-                self._active_trials[trial_id].update(
-                    {
-                        "time_stamp": time_since_start,
-                        "reported_result": {
-                            self.metric: result[self.metric],
-                            self._resource_attr: resource,
-                        },
-                        "keep_case": milestone_reached,
-                    }
-                )
-                if do_update:
-                    largest_update_resource = self._active_trials[trial_id][
-                        "largest_update_resource"
-                    ]
-                    if largest_update_resource is None:
-                        largest_update_resource = resource - 1
-                    assert largest_update_resource <= resource, (
-                        f"Internal error (trial_id {trial_id}): "
-                        + f"on_trial_result called with resource = {resource}, "
-                        + f"but largest_update_resource = {largest_update_resource}"
-                    )
-                    if resource == largest_update_resource:
-                        do_update = False  # Do not update again
-                    else:
-                        self._active_trials[trial_id][
-                            "largest_update_resource"
-                        ] = resource
-                if not task_continues:
-                    if (not self.does_pause_resume()) or resource >= self.max_t:
-                        trial_decision = SchedulerDecision.STOP
-                        act_str = "Terminating"
-                    else:
-                        trial_decision = SchedulerDecision.PAUSE
-                        act_str = "Pausing"
-                    self._cleanup_trial(trial_id)
-                if debug_log is not None:
-                    if not task_continues:
-                        logger.info(
-                            f"trial_id {trial_id}: {act_str} evaluation "
-                            f"at {resource}"
-                        )
-                    elif milestone_reached:
-                        msg = f"trial_id {trial_id}: Reaches {resource}, continues"
-                        next_milestone = task_info.get("next_milestone")
-                        if next_milestone is not None:
-                            msg += f" to {next_milestone}"
-                        logger.info(msg)
-            self.searcher.on_trial_result(
-                trial_id, config, result=result, update=do_update
-            )
-        # Extra info in debug mode
-        log_msg = f"trial_id {trial_id} (metric = {result[self.metric]:.3f}"
-        for k, is_float in ((self._resource_attr, False), ("elapsed_time", True)):
-            if k in result:
-                if is_float:
-                    log_msg += f", {k} = {result[k]:.2f}"
-                else:
-                    log_msg += f", {k} = {result[k]}"
-        log_msg += f"): decision = {trial_decision}"
-        logger.debug(log_msg)
-        return trial_decision
+        if len(result) > 0:
+            record = self._active_trials.get(trial_id)
+            # Reports from stopped or paused trials are ignored by the
+            # scheduler, so they do not enter the network data either
+            if record is not None and is_continue_decision(record.trial_decision):
+                self._update_network(trial.config, result)
+        return super().on_trial_result(trial, result)
 
 
 class NeuralbandEGreedyScheduler(NeuralbandSchedulerBase):
@@ -282,40 +214,35 @@ class NeuralbandEGreedyScheduler(NeuralbandSchedulerBase):
         extra_kwargs["elapsed_time"] = self._elapsed_time()
         trial_id = str(trial_id)
 
-        # epsilon greedy selection criterion
+        # epsilon greedy selection criterion. In the greedy case,
+        # `max_while_loop + 1` configurations are drawn and scored in batches,
+        # and the best one is selected
         initial_budget = self.net.average_b
-        while_loop_count = 0
-        l_t_score = []
         epsilon = np.random.binomial(1, self.epsilon)
         if epsilon:
             config = self.searcher.get_config(**extra_kwargs, trial_id=trial_id)
         else:
-            while 1:
-                config = self.searcher.get_config(**extra_kwargs, trial_id=trial_id)
-                if config is not None:
-                    config_encoding = self.hp_ranges.to_ndarray(config)
-                    predict_score = self.net.predict(
-                        (config_encoding, initial_budget)
-                    ).item()
-                    l_t_score.append((config, predict_score))
-                    while_loop_count += 1
-                    if self.mode == "min":
-                        if while_loop_count > self.max_while_loop:
-                            l_t_score = sorted(l_t_score, key=lambda x: x[1])
-                            config = l_t_score[0][0]
-                            break
-                    else:
-                        if while_loop_count > self.max_while_loop:
-                            l_t_score = sorted(
-                                l_t_score, key=lambda x: x[1], reverse=True
-                            )
-                            config = l_t_score[0][0]
-                            break
-                else:
+            max_num_draws = self.max_while_loop + 1
+            l_t_configs = []
+            l_t_scores = []
+            config = None
+            while config is None:
+                num = min(self.screening_batch_size, max_num_draws - len(l_t_configs))
+                configs, encodings = self._draw_candidates(num, extra_kwargs, trial_id)
+                if len(configs) < num:
                     self._searcher_initialized = False
                     self._initialize_searcher_new()
                     config = self.searcher.get_config(**extra_kwargs, trial_id=trial_id)
                     break
+                l_t_configs.extend(configs)
+                l_t_scores.append(self.net.predict_batch(encodings, initial_budget))
+                if len(l_t_configs) >= max_num_draws:
+                    l_t_scores = np.concatenate(l_t_scores)
+                    if self.mode == "min":
+                        best_pos = np.argmin(l_t_scores)
+                    else:
+                        best_pos = np.argmax(l_t_scores)
+                    config = l_t_configs[best_pos]
 
         if config is not None:
             config = cast_config_values(config, self.config_space)
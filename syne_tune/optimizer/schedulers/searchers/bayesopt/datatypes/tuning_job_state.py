@@ -10,7 +10,9 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple, Callable, Hashable
+
+import numpy as np
 
 from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
     TrialEvaluations,
@@ -24,6 +26,240 @@ from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges import (
 )
 
 
+class _ListIndex:
+    """
+    Maps keys of the entries of a list to their positions. The index is
+    maintained for changes done via :meth:`append` and :meth:`pop`. Since the
+    list is public, it may also be changed from outside. This is detected if
+    the list object is replaced, or its size or last entry changes, in which
+    case the index is rebuilt (or extended, if entries have been appended).
+    """
+
+    def __init__(self, key_fn: Callable[[object], Hashable]):
+        self._key_fn = key_fn
+        self._list = None
+        self._size = 0
+        self._last_entry = None
+        # If keys are not unique, the first position is stored
+        self._position = dict()
+        # Incremented whenever the index is rebuilt from scratch
+        self.version = 0
+
+    def sync(self, entries: list) -> List[Hashable]:
+        """
+        Makes sure the index is consistent with `entries`.
+
+        :param entries: List to be indexed
+        :return: Keys of entries which have been newly indexed, unless the
+            index was rebuilt from scratch (this is signalled by `version`)
+        """
+        size = self._size
+        unchanged = entries is self._list and (
+            size == 0
+            or (len(entries) >= size and entries[size - 1] is self._last_entry)
+        )
+        if unchanged and len(entries) == size:
+            return []
+        if not unchanged:
+            self._list = entries
+            self._size = 0
+            self._position = dict()
+            self.version += 1
+        new_keys = [self._key_fn(x) for x in entries[self._size :]]
+        for pos, key in enumerate(new_keys, start=self._size):
+            self._position.setdefault(key, pos)
+        self._size = len(entries)
+        if entries:
+            self._last_entry = entries[-1]
+        return new_keys
+
+    def find(self, entries: list, key: Hashable) -> int:
+        self.sync(entries)
+        pos = self._position.get(key, -1)
+        if pos != -1 and self._key_fn(entries[pos]) != key:
+            # List has been modified from outside, undetected by `sync`
+            self._list = None
+            self.sync(entries)
+            pos = self._position.get(key, -1)
+        return pos
+
+    def append(self, entries: list, entry):
+        self.sync(entries)
+        entries.append(entry)
+        self._position.setdefault(self._key_fn(entry), self._size)
+        self._size += 1
+        self._last_entry = entry
+
+    def pop(self, entries: list, pos: int):
+        key = self._key_fn(entries.pop(pos))
+        self._size -= 1
+        self._last_entry = entries[-1] if entries else None
+        if self._position.get(key) == pos:
+            del self._position[key]
+        for pos in range(pos, self._size):
+            key = self._key_fn(entries[pos])
+            old_pos = self._position.get(key)
+            if old_pos is None or old_pos >= pos:
+                self._position[key] = pos
+
+
+def _trial_id_key(entry) -> str:
+    return entry.trial_id
+
+
+def _pending_key(entry) -> Tuple[str, Optional[int]]:
+    return entry.trial_id, entry.resource
+
+
+class _ObservedDataIndex:
+    """
+    Index and caches for `TuningJobState.trials_evaluations`: positions of
+    trials, number of observed cases per metric and encoded features per
+    metric, all maintained incrementally. Trials whose observed data may have
+    changed are marked by :meth:`mark_changed`, and cached entries for them
+    are recomputed on demand.
+
+    This object can be shared between states which have the same
+    `trials_evaluations` list (see :meth:`TuningJobState.copy_with_pending`).
+    """
+
+    def __init__(self):
+        self.trial_index = _ListIndex(key_fn=_trial_id_key)
+        self._version = None
+        # Maps cache key to set of trial_ids whose entries are out of date
+        self._changed_trials = dict()
+        # Maps metric_name to per-trial number of cases and their sum
+        self._num_cases = dict()
+        # Maps (metric_name, resource_attr_name) to per-trial entries
+        # `(keys, features, values)`
+        self._features = dict()
+        self._hp_ranges = None
+
+    def sync(self, trials_evaluations: List[TrialEvaluations]):
+        new_trial_ids = self.trial_index.sync(trials_evaluations)
+        if self.trial_index.version != self._version:
+            self._version = self.trial_index.version
+            self._changed_trials = dict()
+            self._num_cases = dict()
+            self._features = dict()
+        else:
+            for trial_id in new_trial_ids:
+                self.mark_changed(trial_id)
+
+    def mark_changed(self, trial_id: str):
+        for changed_trials in self._changed_trials.values():
+            changed_trials.add(trial_id)
+
+    def _pop_changed_trials(self, cache_key) -> Set[str]:
+        changed_trials = self._changed_trials[cache_key]
+        self._changed_trials[cache_key] = set()
+        return changed_trials
+
+    def num_observed_cases(
+        self, trials_evaluations: List[TrialEvaluations], metric_name: str
+    ) -> int:
+        self.sync(trials_evaluations)
+        cache_key = ("num_cases", metric_name)
+        if metric_name not in self._num_cases:
+            num_cases = {
+                ev.trial_id: ev.num_cases(metric_name) for ev in trials_evaluations
+            }
+            self._num_cases[metric_name] = [num_cases, sum(num_cases.values())]
+            self._changed_trials[cache_key] = set()
+        else:
+            entry = self._num_cases[metric_name]
+            num_cases = entry[0]
+            for trial_id in self._pop_changed_trials(cache_key):
+                pos = self.trial_index.find(trials_evaluations, trial_id)
+                new_num = trials_evaluations[pos].num_cases(metric_name)
+                entry[1] += new_num - num_cases.get(trial_id, 0)
+                num_cases[trial_id] = new_num
+        return self._num_cases[metric_name][1]
+
+    def observed_features_for_metric(
+        self,
+        state: "TuningJobState",
+        metric_name: str,
+        resource_attr_name: Optional[str],
+    ) -> (np.ndarray, np.ndarray):
+        trials_evaluations = state.trials_evaluations
+        self.sync(trials_evaluations)
+        if state.hp_ranges is not self._hp_ranges:
+            self._hp_ranges = state.hp_ranges
+            self._features = dict()
+        cache_key = ("features", metric_name, resource_attr_name)
+        if cache_key not in self._features:
+            per_trial = dict()
+            self._features[cache_key] = per_trial
+            update_trials = [ev.trial_id for ev in trials_evaluations]
+        else:
+            per_trial = self._features[cache_key]
+            update_trials = self._pop_changed_trials(cache_key)
+        self._changed_trials[cache_key] = set()
+        # Configs which need to be encoded are collected for all trials, so
+        # that `to_ndarray_matrix` is called only once
+        updates = []
+        new_configs = []
+        for trial_id in update_trials:
+            pos = self.trial_index.find(trials_evaluations, trial_id)
+            metric_entry = trials_evaluations[pos].metrics.get(metric_name)
+            if metric_entry is None or (
+                isinstance(metric_entry, dict) and not metric_entry
+            ):
+                per_trial.pop(trial_id, None)
+                continue
+            config = state.config_for_trial[trial_id]
+            cached_entry = per_trial.get(trial_id)
+            if isinstance(metric_entry, dict):
+                assert (
+                    resource_attr_name is not None
+                ), f"Need resource_attr_name for dict-valued metric {metric_name}"
+                keys = list(metric_entry.keys())
+                values = np.vstack(list(metric_entry.values()))
+                num_cached = 0
+                if cached_entry is not None and cached_entry[0] is not None:
+                    cached_keys = cached_entry[0]
+                    if cached_keys == keys[: len(cached_keys)]:
+                        # Only configs for new resource levels are encoded
+                        num_cached = len(cached_keys)
+                new_configs.extend(
+                    dict(config, **{resource_attr_name: int(resource)})
+                    for resource in keys[num_cached:]
+                )
+                num_new = len(keys) - num_cached
+            else:
+                keys = None
+                values = np.vstack([metric_entry])
+                num_cached = 0
+                new_configs.append(config)
+                num_new = 1
+            updates.append((trial_id, keys, values, num_cached, num_new))
+        if new_configs:
+            new_features = state.hp_ranges.to_ndarray_matrix(new_configs)
+            start = 0
+            for trial_id, keys, values, num_cached, num_new in updates:
+                features = new_features[start : (start + num_new)]
+                start += num_new
+                if num_cached > 0:
+                    features = np.vstack([per_trial[trial_id][1], features])
+                per_trial[trial_id] = (keys, features, values)
+        else:
+            for trial_id, keys, values, _, _ in updates:
+                per_trial[trial_id] = (keys, per_trial[trial_id][1], values)
+        entries = [
+            per_trial[ev.trial_id]
+            for ev in trials_evaluations
+            if ev.trial_id in per_trial
+        ]
+        if entries:
+            features = np.vstack([entry[1] for entry in entries])
+            values = np.vstack([entry[2] for entry in entries])
+        else:
+            features = np.zeros((0, state.hp_ranges.ndarray_size))
+            values = np.zeros((0, 1))
+        return features, values
+
+
 class TuningJobState:
     """
     Collects all data determining the state of a tuning experiment. Trials
@@ -39,6 +275,14 @@ class TuningJobState:
     `trials_evaluations[i].metrics[k][str(r)]` is the value for metric k
     and trial `trials_evaluations[i].trial_id` observed at resource level
     r.
+
+    Lookups of trials in `trials_evaluations` and of pending evaluations are
+    done via hash indexes, and counts as well as encoded features of observed
+    data are maintained incrementally. These assume that observed data are
+    modified via :meth:`metrics_for_trial` (the `metrics` of a trial are
+    marked as changed whenever they are handed out), or otherwise that
+    :meth:`observed_data_changed` is called. Entries may still be appended
+    to or removed from the lists directly, which is detected.
     """
 
     def __init__(
@@ -61,6 +305,17 @@ class TuningJobState:
         self.trials_evaluations = trials_evaluations
         self.failed_trials = failed_trials
         self.pending_evaluations = pending_evaluations
+        self._observed_index = _ObservedDataIndex()
+        self._pending_index = _ListIndex(key_fn=_pending_key)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # States pickled before indexes were introduced: Empty indexes are
+        # rebuilt from `trials_evaluations`, `pending_evaluations` on first use
+        if "_observed_index" not in state:
+            self._observed_index = _ObservedDataIndex()
+        if "_pending_index" not in state:
+            self._pending_index = _ListIndex(key_fn=_pending_key)
 
     @staticmethod
     def _check_all_string(trial_ids: List[str], name: str):
@@ -93,25 +348,32 @@ class TuningJobState:
             pending_evaluations=[],
         )
 
+    def copy_with_pending(
+        self, pending_evaluations: List[PendingEvaluation]
+    ) -> "TuningJobState":
+        """
+        Returns state which shares all members with this one except for
+        `pending_evaluations`. Indexes and caches for observed data are
+        shared as well.
+
+        :param pending_evaluations: Pending evaluations for new state
+        :return: New state
+        """
+        new_state = TuningJobState(
+            hp_ranges=self.hp_ranges,
+            config_for_trial=self.config_for_trial,
+            trials_evaluations=self.trials_evaluations,
+            failed_trials=self.failed_trials,
+            pending_evaluations=pending_evaluations,
+        )
+        new_state._observed_index = self._observed_index
+        return new_state
+
     def _find_labeled(self, trial_id: str) -> int:
-        try:
-            return next(
-                i
-                for i, x in enumerate(self.trials_evaluations)
-                if x.trial_id == trial_id
-            )
-        except StopIteration:
-            return -1
+        return self._observed_index.trial_index.find(self.trials_evaluations, trial_id)
 
     def _find_pending(self, trial_id: str, resource: Optional[int] = None) -> int:
-        try:
-            return next(
-                i
-                for i, x in enumerate(self.pending_evaluations)
-                if x.trial_id == trial_id and x.resource == resource
-            )
-        except StopIteration:
-            return -1
+        return self._pending_index.find(self.pending_evaluations, (trial_id, resource))
 
     def _register_config_for_trial(
         self, trial_id: str, config: Optional[Configuration] = None
@@ -147,11 +409,25 @@ class TuningJobState:
             # New entry
             metrics = dict()
             new_eval = TrialEvaluations(trial_id=trial_id, metrics=metrics)
-            self.trials_evaluations.append(new_eval)
+            self._observed_index.trial_index.append(self.trials_evaluations, new_eval)
+        # The caller may modify `metrics`
+        self.observed_data_changed(trial_id)
         return metrics
 
+    def observed_data_changed(self, trial_id: str):
+        """
+        Signals that observed data for `trial_id` has been modified. This is
+        done automatically in :meth:`metrics_for_trial`, but needs to be
+        called if `trials_evaluations` entries are modified otherwise.
+
+        :param trial_id: ID of trial whose data has changed
+        """
+        self._observed_index.mark_changed(trial_id)
+
     def num_observed_cases(self, metric_name: str = INTERNAL_METRIC_NAME) -> int:
-        return sum(ev.num_cases(metric_name) for ev in self.trials_evaluations)
+        return self._observed_index.num_observed_cases(
+            self.trials_evaluations, metric_name
+        )
 
     def observed_data_for_metric(
         self, metric_name: str = INTERNAL_METRIC_NAME, resource_attr_name: str = None
@@ -195,6 +471,27 @@ class TuningJobState:
                     metric_values.append(metric_entry)
         return configs, metric_values
 
+    def observed_features_for_metric(
+        self, metric_name: str = INTERNAL_METRIC_NAME, resource_attr_name: str = None
+    ) -> (np.ndarray, np.ndarray):
+        """
+        Same as :meth:`observed_data_for_metric`, but configs are returned
+        encoded by `hp_ranges.to_ndarray`, in the same order, and metric
+        values are stacked by `np.vstack` (shape `(n, 1)` for scalar values).
+        Encoded features are cached per trial and only recomputed for trials
+        whose data has changed. If observations for a trial are appended at
+        new resource levels, only these are encoded.
+
+        :param metric_name:
+        :param resource_attr_name:
+        :return: features, metric_values
+        """
+        if resource_attr_name is None:
+            resource_attr_name = self.hp_ranges.name_last_pos
+        return self._observed_index.observed_features_for_metric(
+            self, metric_name, resource_attr_name
+        )
+
     def is_pending(self, trial_id: str, resource: Optional[int] = None) -> bool:
         return self._find_pending(trial_id, resource) != -1
 
@@ -233,14 +530,15 @@ class TuningJobState:
         """
         self._register_config_for_trial(trial_id, config)
         assert not self.is_pending(trial_id, resource)
-        self.pending_evaluations.append(
-            PendingEvaluation(trial_id=trial_id, resource=resource)
+        self._pending_index.append(
+            self.pending_evaluations,
+            PendingEvaluation(trial_id=trial_id, resource=resource),
         )
 
     def remove_pending(self, trial_id: str, resource: Optional[int] = None) -> bool:
         pos = self._find_pending(trial_id, resource)
         if pos != -1:
-            self.pending_evaluations.pop(pos)
+            self._pending_index.pop(self.pending_evaluations, pos)
             return True
         else:
             return False
@@ -47,10 +47,24 @@ DATA_TYPE = anp.float64
 
 @dataclass
 class OptimizationConfig:
+    """
+    `n_starts` L-BFGS runs are done for each fit, the first one starting from
+    the current parameters, the others from random perturbations of them. If
+    `n_workers > 1`, these restarts are run in parallel, using a thread pool
+    of this size.
+
+    `restart_period` is used only if parameters are not reset before each
+    fit (warm-starting). In this case, random restarts are done only for
+    every `restart_period`-th fit, while otherwise a single L-BFGS run is
+    started from the previous optimum.
+    """
+
     lbfgs_tol: float
     lbfgs_maxiter: int
     verbose: bool
     n_starts: int
+    n_workers: int = 1
+    restart_period: int = 1
 
 
 @dataclass
@@ -10,6 +10,8 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import copy
+
 import numpy as np
 import autograd.numpy as anp
 from autograd.builtins import isinstance
@@ -205,6 +207,8 @@ class GaussianProcessOptimizeModel(GaussianProcessModel):
         self._states = None
         self.fit_reset_params = fit_reset_params
         self.optimization_config = optimization_config
+        # Number of calls of `fit` so far
+        self._num_fits = 0
 
     @property
     def states(self) -> Optional[List[PosteriorState]]:
@@ -229,19 +233,37 @@ class GaussianProcessOptimizeModel(GaussianProcessModel):
         self.likelihood.on_fit_start(data, profiler)
         if self.fit_reset_params:
             self.reset_params()
-        n_starts = self.optimization_config.n_starts
+        n_starts = self._num_starts_for_fit()
+        self._num_fits += 1
+        verbose = self.optimization_config.verbose
+
+        def create_arguments():
+            # Restarts run in parallel need their own copy of the likelihood.
+            # The profiler is not copied, since it is not thread-safe
+            memo = {id(profiler): None} if profiler is not None else dict()
+            return create_lbfgs_arguments(
+                criterion=copy.deepcopy(self.likelihood, memo),
+                crit_args=[data],
+                verbose=verbose,
+            )
+
+        tag = "fit_restarts" if n_starts > 1 else "fit_warmstart"
+        if profiler is not None:
+            profiler.start(tag)
         ret_infos = apply_lbfgs_with_multiple_starts(
             *create_lbfgs_arguments(
-                criterion=self.likelihood,
-                crit_args=[data],
-                verbose=self.optimization_config.verbose,
+                criterion=self.likelihood, crit_args=[data], verbose=verbose
             ),
             bounds=self.likelihood.box_constraints_internal(),
             random_state=self._random_state,
             n_starts=n_starts,
+            n_workers=self.optimization_config.n_workers,
+            create_arguments=create_arguments,
             tol=self.optimization_config.lbfgs_tol,
             maxiter=self.optimization_config.lbfgs_maxiter,
         )
+        if profiler is not None:
+            profiler.stop(tag)
 
         # Logging in response to failures of optimization runs
         n_succeeded = sum(x is None for x in ret_infos)
@@ -277,6 +299,23 @@ class GaussianProcessOptimizeModel(GaussianProcessModel):
         # Recompute posterior state for new hyperparameters
         self._recompute_states(data)
 
+    def _num_starts_for_fit(self) -> int:
+        """
+        If parameters are warm-started (not reset before each fit) and
+        `optimization_config.restart_period > 1`, random restarts are done
+        only every `restart_period`-th fit, and a single L-BFGS run is started
+        from the previous optimum otherwise.
+        """
+        restart_period = self.optimization_config.restart_period
+        if (
+            self.fit_reset_params
+            or restart_period <= 1
+            or self._num_fits % restart_period == 0
+        ):
+            return self.optimization_config.n_starts
+        else:
+            return 1
+
     def _set_likelihood_params(self, params: dict):
         for param in self.likelihood.collect_params().values():
             vec = params.get(param.name)
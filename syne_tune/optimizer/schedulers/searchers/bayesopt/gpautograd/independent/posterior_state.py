@@ -270,14 +270,19 @@ class IndependentGPPerResourcePosteriorState(PosteriorStateWithSampleJoint):
         mean_data: float,
         std_data: float,
     ) -> np.ndarray:
-        inner_input, resource = decode_extended_features(
-            input.reshape((1, -1)), self._resource_attr_range
+        inner_input, resources = decode_extended_features(
+            input.reshape((-1, input.shape[-1])), self._resource_attr_range
         )
-        assert resource.size == 1
-        resource = resource.item()
+        resource = resources[0]
+        assert np.all(
+            resources == resource
+        ), "All inputs in a batch must have the same resource"
         inner_grad = (
             self._states[resource]
             .backward_gradient(inner_input, head_gradients, mean_data, std_data)
-            .reshape((-1,))
+            .reshape((inner_input.shape[0], -1))
+        )
+        return np.reshape(
+            np.concatenate((inner_grad, np.zeros((inner_grad.shape[0], 1))), axis=1),
+            input.shape,
         )
-        return np.reshape(np.concatenate((inner_grad, np.zeros((1,)))), input.shape)
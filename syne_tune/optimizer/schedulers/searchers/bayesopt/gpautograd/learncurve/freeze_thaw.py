@@ -35,6 +35,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.learncurve.iss
     _rowvec,
     _squared_norm,
     _inner_product,
+    _position_major_order,
     predict_posterior_marginals,
 )
 from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_impl import (
@@ -185,26 +186,13 @@ def resource_kernel_likelihood_precomputations(targets: List[np.ndarray]) -> Dic
         `prepare_data`
     :return: See above
     """
-    ydims = [y.shape[0] for y in targets]
-    ydim_max = ydims[0]
-    num_configs = list(
-        np.sum(
-            np.array(ydims).reshape((-1, 1)) > np.arange(ydim_max).reshape((1, -1)),
-            axis=0,
-        ).reshape((-1,))
-    )
-    assert num_configs[0] == len(targets), (num_configs, len(targets))
-    assert num_configs[-1] > 0, num_configs
-    total_size = sum(num_configs)
-    assert total_size == sum(ydims)
+    ydims, num_configs, order, _ = _position_major_order(targets)
+    total_size = order.size
     # Attention: When comparing this to `issm.issm_likelihood_precomputations`,
     # `targets` maps to `yflat` in the same ordering (the index is still r),
     # whereas there the index j of `deltay` runs in the opposite direction of
     # the index r of `targets`
-    yflat_rows = []
-    for pos, num in enumerate(num_configs):
-        yflat_rows.extend([y[pos].reshape((1, -1)) for y in targets[:num]])
-    yflat = np.vstack(yflat_rows)
+    yflat = np.vstack([y.reshape((y.shape[0], -1)) for y in targets])[order]
     assert yflat.shape[0] == total_size
     return {"ydims": ydims, "num_configs": num_configs, "yflat": yflat}
 
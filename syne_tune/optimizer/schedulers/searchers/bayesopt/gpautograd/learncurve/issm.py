@@ -38,6 +38,9 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
     TrialEvaluations,
 )
 from syne_tune.optimizer.schedulers.searchers.utils.common import Configuration
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges import (
+    HyperparameterRanges,
+)
 from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.config_ext import (
     ExtendedConfiguration,
 )
@@ -79,20 +82,19 @@ def _prepare_data_internal(
                 fantasized[trial_id] = [entry]
 
     trial_ids_done = set()
-    for config, observed, trial_id in data_lst:
-        # Observations must be from r_min without any missing
-        obs_res = [x[0] for x in observed]
+    for config, observed, trial_id, values in data_lst:
+        # Observations must be from r_min without any missing. Since resource
+        # levels in `observed` are distinct and sorted, it is sufficient to
+        # check the first and last one
         num_obs = len(observed)
         if num_obs > 0:
-            test = list(range(r_min, r_min + num_obs))
-            assert obs_res == test, (
-                f"trial_id {trial_id} has observations at {obs_res}, but "
-                + f"we need them at {test}"
+            assert observed[0][0] == r_min and observed[-1][0] == r_min + num_obs - 1, (
+                f"trial_id {trial_id} has observations at "
+                + f"{[x[0] for x in observed]}, but we need them at "
+                + f"{list(range(r_min, r_min + num_obs))}"
             )
         # Note: Only observed targets are normalized, not fantasized ones
-        this_targets = (
-            np.array([x[1] for x in observed]).reshape((-1, 1)) - mean
-        ) / std
+        this_targets = (values.reshape((-1, 1)) - mean) / std
         if do_fantasizing:
             if num_fantasy_samples > 1:
                 this_targets = this_targets * np.ones((1, num_fantasy_samples))
@@ -132,15 +134,149 @@ def _prepare_data_internal(
     return configs, targets, trial_ids
 
 
-def _create_tuple(ev: TrialEvaluations, active_metric: str, config_for_trial: Dict):
-    metric_vals = ev.metrics[active_metric]
+def _sorted_observations(metric_vals: Dict) -> List[Tuple[int, float]]:
     assert isinstance(metric_vals, dict)
-    observed = list(
+    return list(
         sorted(((int(k), v) for k, v in metric_vals.items()), key=itemgetter(0))
     )
+
+
+class PreparedDataCache:
+    """
+    Caches parts of the data representation created by :func:`prepare_data`
+    and :func:`prepare_data_with_pending` which depend on a single trial only:
+    the observations sorted by resource level (along with their values as
+    array), and the encoded configuration.
+
+    When new observations for a trial are labeled at the next resource levels,
+    :meth:`append_observations` adds them to the cached entry, all other
+    entries are reused. If observations are changed or removed otherwise,
+    the entry has to be removed by :meth:`invalidate`. Both is done by
+    :class:`ModelStateTransformer`. As a safeguard, cached observations are
+    validated by their number and the value at the largest resource level,
+    and recomputed if this fails.
+
+    :param hp_ranges: Encodes configurations
+    """
+
+    def __init__(self, hp_ranges: HyperparameterRanges):
+        self._hp_ranges = hp_ranges
+        # Maps (trial_id, metric) to (observed, values)
+        self._observed = dict()
+        # Maps trial_id to (config, features)
+        self._features = dict()
+
+    def invalidate(self, trial_id: Optional[str] = None):
+        """
+        :param trial_id: Observations cached for this trial are removed. If
+            not given, the whole cache is cleared
+        """
+        if trial_id is None:
+            self._observed.clear()
+            self._features.clear()
+        else:
+            for key in [k for k in self._observed.keys() if k[0] == trial_id]:
+                del self._observed[key]
+
+    def append_observations(self, trial_id: str, metrics: Dict[str, Dict]):
+        """
+        Appends observations which have been labeled for a trial to cached
+        entries. If they are not at the resource levels following the largest
+        one cached, the entry is removed.
+
+        :param trial_id: ID of trial
+        :param metrics: New observations, maps metric name to dict from
+            resource to value, as in :class:`TrialEvaluations`
+        """
+        for metric_name, metric_vals in metrics.items():
+            key = (trial_id, metric_name)
+            entry = self._observed.get(key)
+            if entry is None or not metric_vals:
+                continue
+            observed, values = entry
+            if isinstance(metric_vals, dict) and observed:
+                new_observed = _sorted_observations(metric_vals)
+                start = observed[-1][0] + 1
+                if all(x[0] == start + i for i, x in enumerate(new_observed)):
+                    self._observed[key] = (
+                        observed + new_observed,
+                        np.concatenate([values, [x[1] for x in new_observed]]),
+                    )
+                    continue
+            del self._observed[key]
+
+    def observations(
+        self, ev: TrialEvaluations, active_metric: str
+    ) -> (List[Tuple[int, float]], np.ndarray):
+        """
+        :param ev: Observed data for a trial
+        :param active_metric: Name of metric
+        :return: `(observed, values)`, where `observed` lists `(resource,
+            value)` sorted by resource, and `values` contains the values
+        """
+        metric_vals = ev.metrics[active_metric]
+        key = (ev.trial_id, active_metric)
+        entry = self._observed.get(key)
+        if entry is not None:
+            observed = entry[0]
+            if (
+                len(metric_vals) != len(observed)
+                or not observed
+                or metric_vals.get(str(observed[-1][0])) != observed[-1][1]
+            ):
+                entry = None
+        if entry is None:
+            observed = _sorted_observations(metric_vals)
+            entry = (observed, np.array([x[1] for x in observed]))
+            self._observed[key] = entry
+        return entry
+
+    def features(self, trial_ids: List[str], configs: List[Configuration]):
+        """
+        :param trial_ids: Trial IDs
+        :param configs: Configurations for `trial_ids`
+        :return: Feature matrix for `configs`
+        """
+        missing = []
+        for pos, (trial_id, config) in enumerate(zip(trial_ids, configs)):
+            entry = self._features.get(trial_id)
+            if entry is None or entry[0] != config:
+                missing.append(pos)
+        if missing:
+            new_features = self._hp_ranges.to_ndarray_matrix(
+                [configs[pos] for pos in missing]
+            )
+            for pos, row in zip(missing, new_features):
+                self._features[trial_ids[pos]] = (configs[pos], row)
+        return np.vstack([self._features[trial_id][1] for trial_id in trial_ids])
+
+
+def _create_tuple(
+    ev: TrialEvaluations,
+    active_metric: str,
+    config_for_trial: Dict,
+    data_cache: Optional[PreparedDataCache] = None,
+):
+    if data_cache is None:
+        observed = _sorted_observations(ev.metrics[active_metric])
+        values = np.array([x[1] for x in observed])
+    else:
+        observed, values = data_cache.observations(ev, active_metric)
     trial_id = ev.trial_id
     config = config_for_trial[trial_id]
-    return config, observed, trial_id
+    return config, observed, trial_id, values
+
+
+def _features_matrix(
+    hp_ranges: HyperparameterRanges,
+    configs: List[Configuration],
+    trial_ids: List[str],
+    data_cache: Optional[PreparedDataCache],
+) -> np.ndarray:
+    if data_cache is None:
+        return hp_ranges.to_ndarray_matrix(configs)
+    else:
+        return data_cache.features(trial_ids, configs)
 
 
 def prepare_data(
@@ -149,6 +285,7 @@ def prepare_data(
     active_metric: str,
     normalize_targets: bool = False,
     do_fantasizing: bool = False,
+    data_cache: Optional[PreparedDataCache] = None,
 ) -> Dict:
     """
     Prepares data in `state` for further processing. The entries
@@ -174,20 +311,20 @@ def prepare_data(
     :param active_metric:
     :param normalize_targets: See above
     :param do_fantasizing: See above
+    :param data_cache: If given, per-trial parts of the result are cached
+        there, and reused in subsequent calls
     :return: See above
     """
     r_min, r_max = config_space_ext.resource_attr_range
     hp_ranges = config_space_ext.hp_ranges
-    data_lst = []
-    targets = []
-    for ev in state.trials_evaluations:
-        tpl = _create_tuple(ev, active_metric, state.config_for_trial)
-        data_lst.append(tpl)
-        observed = tpl[1]
-        targets += [x[1] for x in observed]
+    data_lst = [
+        _create_tuple(ev, active_metric, state.config_for_trial, data_cache)
+        for ev in state.trials_evaluations
+    ]
     mean = 0.0
     std = 1.0
     if normalize_targets:
+        targets = np.concatenate([np.zeros(0)] + [x[3] for x in data_lst])
         std = max(np.std(targets), 1e-9)
         mean = np.mean(targets)
 
@@ -204,7 +341,7 @@ def prepare_data(
     configs, targets, trial_ids = zip(
         *sorted(zip(configs, targets, trial_ids), key=lambda x: -x[1].shape[0])
     )
-    features = hp_ranges.to_ndarray_matrix(configs)
+    features = _features_matrix(hp_ranges, configs, trial_ids, data_cache)
     result = {
         "configs": list(configs),
         "features": features,
@@ -225,6 +362,7 @@ def prepare_data_with_pending(
     config_space_ext: ExtendedConfiguration,
     active_metric: str,
     normalize_targets: bool = False,
+    data_cache: Optional[PreparedDataCache] = None,
 ) -> (Dict, Dict):
     """
     Similar to `prepare_data` with `do_fantasizing=False`, but two dicts are
@@ -240,6 +378,7 @@ def prepare_data_with_pending(
     :param config_space_ext: See `prepare_data`
     :param active_metric: See `prepare_data`
     :param normalize_targets: See `prepare_data`
+    :param data_cache: See `prepare_data`
     :return: See above
 
     """
@@ -252,18 +391,19 @@ def prepare_data_with_pending(
     targets = []
     done_trial_ids = set()
     for ev in state.trials_evaluations:
-        tpl = _create_tuple(ev, active_metric, state.config_for_trial)
-        _, observed, trial_id = tpl
+        tpl = _create_tuple(ev, active_metric, state.config_for_trial, data_cache)
+        trial_id = tpl[2]
         if trial_id not in num_pending_for_trial:
             data1_lst.append(tpl)
         else:
             data2_lst.append(tpl)
             num_pending.append(num_pending_for_trial[trial_id])
         done_trial_ids.add(trial_id)
-        targets += [x[1] for x in observed]
+        targets.append(tpl[3])
     mean = 0.0
     std = 1.0
     if normalize_targets:
+        targets = np.concatenate([np.zeros(0)] + targets)
         std = max(np.std(targets), 1e-9)
         mean = np.mean(targets)
     # There may be trials with pending evaluations, but no observed ones
@@ -271,7 +411,7 @@ def prepare_data_with_pending(
         trial_id = ev.trial_id
         if trial_id not in done_trial_ids:
             config = state.config_for_trial[trial_id]
-            data2_lst.append((config, [], trial_id))
+            data2_lst.append((config, [], trial_id, np.zeros(0)))
             num_pending.append(num_pending_for_trial[trial_id])
 
     results = ()
@@ -301,7 +441,7 @@ def prepare_data_with_pending(
                         key=lambda x: -x[1].shape[0],
                     )
                 )
-            features = hp_ranges.to_ndarray_matrix(configs)
+            features = _features_matrix(hp_ranges, configs, trial_ids, data_cache)
         else:
             # It is possible that `data1_lst` is empty
             features = None
@@ -346,6 +486,49 @@ def issm_likelihood_precomputations(targets: List[np.ndarray], r_min: int) -> Di
     :param r_min: Value of r_min, as returned by `prepare_data`
     :return: See above
     """
+    ydims, num_configs, order, positions = _position_major_order(targets)
+    total_size = order.size
+    # Row k of `deltay_flat` is `y[-(j+1)] - y[-j]`, or `y[-1]` for `j == 0`,
+    # where `j` is the position of the row within its target vector `y`.
+    # Targets are flipped, so that position j maps to `y[-(j+1)]`
+    yflat = np.vstack([y[::-1].reshape((y.shape[0], -1)) for y in targets])
+    deltay_flat = yflat.copy()
+    deltay_flat[1:] -= yflat[:-1]
+    starts = np.cumsum([0] + ydims[:-1])
+    deltay_flat[starts] = yflat[starts]
+    deltay = deltay_flat[order]
+    # `logr` is `log(ydim + r_min - j)` for all rows with `j > 0`
+    ydims_flat = np.repeat(ydims, ydims)[order]
+    positions = positions[order]
+    num_first = num_configs[0]
+    log_r = np.log(ydims_flat[num_first:] + r_min - positions[num_first:])
+    assert deltay.shape[0] == total_size
+    assert log_r.size == total_size - num_configs[0]
+    return {
+        "ydims": ydims,
+        "num_configs": num_configs,
+        "deltay": deltay,
+        "logr": log_r,
+    }
+
+
+def _position_major_order(
+    targets: List[np.ndarray],
+) -> (List[int], List[int], np.ndarray, np.ndarray):
+    """
+    Helper for precomputations on the ragged data representation returned by
+    `prepare_data`, where `targets` are sorted by nonincreasing size. Consider
+    the flat vector obtained by concatenating the entries of `targets`. We
+    return `positions`, where `positions[k]` is the position of entry k
+    within its target vector, as well as the permutation `order` which sorts
+    the flat vector by position, keeping the ordering of `targets` for
+    entries with the same position (part j of this ordering contains the
+    entries at position j of the first `num_configs[j]` targets).
+
+    :param targets: Targets from data representation returned by
+        `prepare_data`
+    :return: `(ydims, num_configs, order, positions)`
+    """
     ydims = [y.shape[0] for y in targets]
     ydim_max = ydims[0]
     num_configs = list(
@@ -358,24 +541,10 @@ def issm_likelihood_precomputations(targets: List[np.ndarray], r_min: int) -> Di
     assert num_configs[-1] > 0, num_configs
     total_size = sum(num_configs)
     assert total_size == sum(ydims)
-    yprev = np.vstack([y[-1].reshape((1, -1)) for y in targets])
-    deltay_parts = [yprev]
-    log_r = []
-    for pos, num in enumerate(num_configs[1:], start=1):
-        ycurr = np.vstack([y[-(pos + 1)].reshape((1, -1)) for y in targets[:num]])
-        deltay_parts.append(ycurr - yprev[:num, :])
-        yprev = ycurr
-        logr_curr = [np.log(ydim + r_min - pos) for ydim in ydims[:num]]
-        log_r.extend(logr_curr)
-    deltay = np.vstack(deltay_parts)
-    assert deltay.shape[0] == total_size
-    assert len(log_r) == total_size - num_configs[0]
-    return {
-        "ydims": ydims,
-        "num_configs": num_configs,
-        "deltay": deltay,
-        "logr": np.array(log_r),
-    }
+    starts = np.cumsum([0] + ydims[:-1])
+    positions = np.arange(total_size) - np.repeat(starts, ydims)
+    order = np.argsort(positions, kind="stable")
+    return ydims, num_configs, order, positions
 
 
 def _squared_norm(a, _np=anp):
@@ -188,13 +188,14 @@ class GaussProcAdditivePosteriorState(PosteriorState):
         This is for a single posterior state. If the SurrogateModel uses
         MCMC, have to call this for every sample.
 
-        :param input: Single input point x, shape (d,)
+        :param input: Single input point x, shape (d,), or batch of input
+            points, shape (n, d)
         :param head_gradients: See SurrogateModel.backward_gradient
         :param mean_data: Mean used to normalize targets
         :param std_data: Stddev used to normalize targets
-        :return:
+        :return: Gradient, same shape as `input`
         """
-        test_feature = np.reshape(input, (1, -1))
+        test_feature = np.reshape(input, (-1, input.shape[-1]))
 
         def diff_test_feature(test_feature_array):
             norm_mean, norm_variance = self.predict(test_feature_array)
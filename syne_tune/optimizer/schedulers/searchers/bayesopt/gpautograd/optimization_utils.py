@@ -10,6 +10,9 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
 import numpy as np
 from scipy import optimize
 from autograd import value_and_grad
@@ -244,7 +247,14 @@ def apply_lbfgs(exec_func, param_dict, bounds, **kwargs):
 
 
 def apply_lbfgs_with_multiple_starts(
-    exec_func, param_dict, bounds, random_state, n_starts=N_STARTS, **kwargs
+    exec_func,
+    param_dict,
+    bounds,
+    random_state,
+    n_starts=N_STARTS,
+    n_workers: int = 1,
+    create_arguments: Optional[Callable[[], Tuple[Callable, dict]]] = None,
+    **kwargs
 ):
     """
     When dealing with non-convex problems (e.g., optimization the marginal
@@ -261,12 +271,21 @@ def apply_lbfgs_with_multiple_starts(
     We catch exceptions and return ret_infos about these. If none of the
     restarts worked, param_dict is not modified.
 
+    If `n_workers > 1`, restarts are run in parallel, in a thread pool with
+    `n_workers` threads. Since restarts cannot share `exec_func` and
+    `param_dict`, this needs `create_arguments`, which returns a new pair
+    `(exec_func, param_dict)` (same parameter names as `param_dict`) for each
+    restart. Starting points are sampled in the same way as for sequential
+    restarts, so that results do not depend on `n_workers`.
+
     :param exec_func: see above
     :param param_dict: see above
     :param bounds: see above
     :param random_state: RandomState for sampling
     :param n_starts: Number of times we start an optimization with L-BFGS
         (must be >= 1)
+    :param n_workers: Number of restarts run in parallel. Defaults to 1
+    :param create_arguments: See above. Needed if `n_workers > 1`
     :return: List ret_infos of length n_starts. Entry is None if optimization
         worked, or otherwise has dict with info about exception caught
     """
@@ -276,24 +295,59 @@ def apply_lbfgs_with_multiple_starts(
     best_objective_over_restarts = None
     best_param_dict_over_restarts = copy_of_initial_param_dict
 
-    # Loop over restarts
-    ret_infos = []
-    for iter in range(n_starts):
-        if iter > 0:
-            _inplace_param_dict_randomization(
-                param_dict, copy_of_initial_param_dict, bounds, random_state
+    if n_workers > 1 and n_starts > 1:
+        assert (
+            create_arguments is not None
+        ), "create_arguments must be given if n_workers > 1"
+        # Sample all starting points upfront, in the same order as below
+        starting_points = []
+        for iter in range(n_starts):
+            if iter > 0:
+                _inplace_param_dict_randomization(
+                    param_dict, copy_of_initial_param_dict, bounds, random_state
+                )
+            starting_points.append(
+                {name: param.data() for name, param in param_dict.items()}
             )
 
-        decorator = ExecutorDecorator(exec_func)
-        ret_info = apply_lbfgs(decorator.exec_func, param_dict, bounds, **kwargs)
-
-        ret_infos.append(ret_info)
-        if ret_info is None and (
-            best_objective_over_restarts is None
-            or decorator.best_objective < best_objective_over_restarts
-        ):
-            best_objective_over_restarts = decorator.best_objective
-            best_param_dict_over_restarts = _deep_copy_param_dict(param_dict)
+        def run_restart(starting_point):
+            _exec_func, _param_dict = create_arguments()
+            for name, value in starting_point.items():
+                _param_dict[name].set_data(value)
+            decorator = ExecutorDecorator(_exec_func)
+            ret_info = apply_lbfgs(decorator.exec_func, _param_dict, bounds, **kwargs)
+            return ret_info, decorator.best_objective, _param_dict
+
+        with ThreadPoolExecutor(max_workers=min(n_workers, n_starts)) as executor:
+            results = list(executor.map(run_restart, starting_points))
+        ret_infos = []
+        for ret_info, best_objective, restart_param_dict in results:
+            ret_infos.append(ret_info)
+            if ret_info is None and (
+                best_objective_over_restarts is None
+                or best_objective < best_objective_over_restarts
+            ):
+                best_objective_over_restarts = best_objective
+                best_param_dict_over_restarts = restart_param_dict
+    else:
+        # Loop over restarts
+        ret_infos = []
+        for iter in range(n_starts):
+            if iter > 0:
+                _inplace_param_dict_randomization(
+                    param_dict, copy_of_initial_param_dict, bounds, random_state
+                )
+
+            decorator = ExecutorDecorator(exec_func)
+            ret_info = apply_lbfgs(decorator.exec_func, param_dict, bounds, **kwargs)
+
+            ret_infos.append(ret_info)
+            if ret_info is None and (
+                best_objective_over_restarts is None
+                or decorator.best_objective < best_objective_over_restarts
+            ):
+                best_objective_over_restarts = decorator.best_objective
+                best_param_dict_over_restarts = _deep_copy_param_dict(param_dict)
 
     # We copy back the values of the best parameters into param_dict (again,
     # inplace, as required by the executor)
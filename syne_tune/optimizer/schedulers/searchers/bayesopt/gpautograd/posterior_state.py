@@ -96,11 +96,12 @@ class PosteriorState:
         This is for a single posterior state. If the SurrogateModel uses
         MCMC, have to call this for every sample.
 
-        :param input: Single input point x, shape (d,)
+        :param input: Single input point x, shape (d,), or batch of input
+            points, shape (n, d)
         :param head_gradients: See SurrogateModel.backward_gradient
         :param mean_data: Mean used to normalize targets
         :param std_data: Stddev used to normalize targets
-        :return:
+        :return: Gradient, same shape as `input`
         """
         raise NotImplementedError
 
@@ -252,11 +253,12 @@ class GaussProcPosteriorState(PosteriorStateWithSampleJoint):
         the acquisition function is based on the de-normalized predictive
         distribution, which is why we need 'mean_data', 'std_data' here.
 
-        :param input: Single input point x, shape (d,)
+        :param input: Single input point x, shape (d,), or batch of input
+            points, shape (n, d)
         :param head_gradients: See SurrogateModel.backward_gradient
         :param mean_data: Mean used to normalize targets
         :param std_data: Stddev used to normalize targets
-        :return:
+        :return: Gradient, same shape as `input`
         """
 
         def predict_func(test_feature_array):
@@ -303,13 +305,14 @@ def backward_gradient_given_predict(
     distribution, which is why we need 'mean_data', 'std_data' here.
 
     :param predict_func: Function mapping input x to mean, variance
-    :param input: Single input point x, shape (d,)
+    :param input: Single input point x, shape (d,), or batch of input
+        points, shape (n, d)
     :param head_gradients: See SurrogateModel.backward_gradient
     :param mean_data: Mean used to normalize targets
     :param std_data: Stddev used to normalize targets
-    :return:
+    :return: Gradient, same shape as `input`
     """
-    test_feature = np.reshape(input, (1, -1))
+    test_feature = np.reshape(input, (-1, input.shape[-1]))
     assert "mean" in head_gradients, "Need head_gradients['mean'] for backward_gradient"
     has_std = "std" in head_gradients
 
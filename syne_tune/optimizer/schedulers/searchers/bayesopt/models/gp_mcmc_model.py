@@ -44,6 +44,9 @@ class GaussProcMCMCModelFactory(GaussProcModelFactory):
         debug_log: Optional[DebugLogPrinter] = None,
         filter_observed_data: Optional[ConfigurationFilter] = None,
         hp_ranges_for_prediction: Optional[HyperparameterRanges] = None,
+        max_size_data_for_model: Optional[int] = None,
+        max_size_top_fraction: float = 0.25,
+        random_seed: int = 0,
     ):
         """
         We support pending evaluations via fantasizing. Note that state does
@@ -67,6 +70,9 @@ class GaussProcMCMCModelFactory(GaussProcModelFactory):
             debug_log=debug_log,
             filter_observed_data=filter_observed_data,
             hp_ranges_for_prediction=hp_ranges_for_prediction,
+            max_size_data_for_model=max_size_data_for_model,
+            max_size_top_fraction=max_size_top_fraction,
+            random_seed=random_seed,
         )
 
     def get_params(self):
@@ -181,28 +181,79 @@ class InternalCandidateEvaluations:
 # Note: If state.pending_evaluations is not empty, it must contain entries
 # of type FantasizedPendingEvaluation, which contain the fantasy samples. This
 # is the case only for internal states.
+def select_subset_of_data(
+    targets: np.ndarray,
+    max_size: int,
+    top_fraction: float,
+    random_state: np.random.RandomState,
+) -> np.ndarray:
+    """
+    Selects a subset of at most `max_size` observations, so that a GP
+    surrogate model can be fit to it in bounded time. Since the criterion is
+    minimized, we first select the `int(top_fraction * max_size)`
+    observations with the smallest targets, which matter most for finding
+    the next candidate. The remaining ones are sampled uniformly at random
+    among the others, so the model still covers the whole space.
+
+    :param targets: Target values, shape (n,) or (n, 1)
+    :param max_size: Maximum size of subset
+    :param top_fraction: Fraction of subset made up by top observations
+    :param random_state: Used to sample the remaining observations
+    :return: Indices of selected observations, in increasing order
+    """
+    targets = targets.reshape((-1,))
+    num_data = targets.size
+    if num_data <= max_size:
+        return np.arange(num_data)
+    num_top = min(int(top_fraction * max_size), max_size)
+    order = np.argsort(targets, kind="stable")
+    top_indices = order[:num_top]
+    other_indices = random_state.choice(
+        order[num_top:], size=max_size - num_top, replace=False
+    )
+    return np.sort(np.concatenate((top_indices, other_indices)))
+
+
 def get_internal_candidate_evaluations(
     state: TuningJobState,
     active_metric: str,
     normalize_targets: bool,
     num_fantasy_samples: int,
+    max_size_data: Optional[int] = None,
+    top_fraction: float = 0.25,
+    random_seed: int = 0,
 ) -> InternalCandidateEvaluations:
-    candidates, evaluation_values = state.observed_data_for_metric(
+    """
+    If `max_size_data` is given and there are more observed data than this,
+    a subset is selected by :func:`select_subset_of_data`. Pending evaluations
+    are always retained. The selection is determined by `random_seed` and
+    the number of observations, so that repeated calls for the same data
+    return the same subset.
+    """
+    features, evaluation_values = state.observed_features_for_metric(
         metric_name=active_metric
     )
     hp_ranges = state.hp_ranges
-    features = hp_ranges.to_ndarray_matrix(candidates)
     # Normalize
     # Note: The fantasy values in state.pending_evaluations are sampled
     # from the model fit to normalized targets, so they are already
     # normalized
-    targets = np.vstack(evaluation_values).reshape((-1, 1))
+    targets = evaluation_values.reshape((-1, 1))
     mean = 0.0
     std = 1.0
     if normalize_targets:
         std = max(np.std(targets).item(), 1e-9)
         mean = np.mean(targets).item()
         targets = (targets - mean) / std
+    if max_size_data is not None and targets.shape[0] > max_size_data:
+        subset = select_subset_of_data(
+            targets,
+            max_size=max_size_data,
+            top_fraction=top_fraction,
+            random_state=np.random.RandomState([random_seed, targets.shape[0]]),
+        )
+        targets = targets[subset]
+        features = features[subset]
     if state.pending_evaluations:
         # In this case, y becomes a matrix, where the observed values are
         # broadcast
@@ -237,12 +288,20 @@ class GaussProcModelFactory(TransformerModelFactory):
         filter_observed_data: Optional[ConfigurationFilter] = None,
         no_fantasizing: bool = False,
         hp_ranges_for_prediction: Optional[HyperparameterRanges] = None,
+        max_size_data_for_model: Optional[int] = None,
+        max_size_top_fraction: float = 0.25,
+        random_seed: int = 0,
     ):
         """
         We support pending evaluations via fantasizing. Note that state does
         not contain the fantasy values, but just the pending configs. Fantasy
         values are sampled here.
 
+        If `max_size_data_for_model` is given, the GP model is fit to a subset
+        of at most this many observations (subset of data), so that fitting
+        and prediction costs are bounded independent of the number of
+        observations. See :func:`select_subset_of_data`.
+
         :param gpmodel: GPModel model
         :param active_metric: Name of the metric to optimize.
         :param normalize_targets: Normalize observed target values?
@@ -253,6 +312,11 @@ class GaussProcModelFactory(TransformerModelFactory):
             simply ignored, fantasizing is not done (not recommended)
         :param hp_ranges_for_prediction: If given, `GaussProcSurrogateModel`
             should use this instead of `state.hp_ranges`
+        :param max_size_data_for_model: If given, the model is fit to at
+            most this many observations
+        :param max_size_top_fraction: Fraction of subset of observations made
+            up by those with the smallest targets
+        :param random_seed: Seed for sampling subset of observations
 
         """
         self._gpmodel = gpmodel
@@ -263,6 +327,9 @@ class GaussProcModelFactory(TransformerModelFactory):
         self._filter_observed_data = filter_observed_data
         self._no_fantasizing = no_fantasizing
         self._hp_ranges_for_prediction = hp_ranges_for_prediction
+        self._max_size_data_for_model = max_size_data_for_model
+        self._max_size_top_fraction = max_size_top_fraction
+        self._random_seed = random_seed
         self._mean = None
         self._std = None
 
@@ -294,12 +361,7 @@ class GaussProcModelFactory(TransformerModelFactory):
         # Compute posterior for state without pending evals
         no_pending_state = state
         if state.pending_evaluations:
-            no_pending_state = TuningJobState(
-                hp_ranges=state.hp_ranges,
-                config_for_trial=state.config_for_trial,
-                trials_evaluations=state.trials_evaluations,
-                failed_trials=state.failed_trials,
-            )
+            no_pending_state = state.copy_with_pending([])
         self._posterior_for_state(
             no_pending_state, fit_params=fit_params, profiler=self._profiler
         )
@@ -352,6 +414,9 @@ class GaussProcModelFactory(TransformerModelFactory):
             self.active_metric,
             self.normalize_targets,
             self._get_num_fantasy_samples(),
+            max_size_data=self._max_size_data_for_model,
+            top_fraction=self._max_size_top_fraction,
+            random_seed=self._random_seed,
         )
         features = internal_candidate_evaluations.features
         targets = internal_candidate_evaluations.targets
@@ -422,13 +487,7 @@ class GaussProcModelFactory(TransformerModelFactory):
             ]
         else:
             new_pending = []
-        return TuningJobState(
-            hp_ranges=state.hp_ranges,
-            config_for_trial=state.config_for_trial,
-            trials_evaluations=state.trials_evaluations,
-            failed_trials=state.failed_trials,
-            pending_evaluations=new_pending,
-        )
+        return state.copy_with_pending(new_pending)
 
     def configure_scheduler(self, scheduler):
         from syne_tune.optimizer.schedulers.hyperband import HyperbandScheduler
@@ -462,6 +521,9 @@ class GaussProcEmpiricalBayesModelFactory(GaussProcModelFactory):
         filter_observed_data: Optional[ConfigurationFilter] = None,
         no_fantasizing: bool = False,
         hp_ranges_for_prediction: Optional[HyperparameterRanges] = None,
+        max_size_data_for_model: Optional[int] = None,
+        max_size_top_fraction: float = 0.25,
+        random_seed: int = 0,
     ):
         """
         We support pending evaluations via fantasizing. Note that state does
@@ -485,6 +547,9 @@ class GaussProcEmpiricalBayesModelFactory(GaussProcModelFactory):
             filter_observed_data=filter_observed_data,
             no_fantasizing=no_fantasizing,
             hp_ranges_for_prediction=hp_ranges_for_prediction,
+            max_size_data_for_model=max_size_data_for_model,
+            max_size_top_fraction=max_size_top_fraction,
+            random_seed=random_seed,
         )
         self.num_fantasy_samples = num_fantasy_samples
 
@@ -32,6 +32,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.learncurve.gpi
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.learncurve.issm import (
     prepare_data,
     prepare_data_with_pending,
+    PreparedDataCache,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.learncurve.posterior_state import (
     GaussProcAdditivePosteriorState,
@@ -41,6 +42,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.base_cl
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
     FantasizedPendingEvaluation,
+    MetricValues,
 )
 from syne_tune.optimizer.schedulers.searchers.utils.common import ConfigurationFilter
 from syne_tune.optimizer.schedulers.searchers.bayesopt.utils.debug_log import (
@@ -181,6 +183,9 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
         self._profiler = profiler
         self._filter_observed_data = filter_observed_data
         self.normalize_targets = normalize_targets
+        # Per-trial parts of the data passed to the model are cached, so they
+        # need not be recomputed from scratch for every update
+        self._data_cache = PreparedDataCache(config_space_ext.hp_ranges)
 
     @property
     def debug_log(self) -> Optional[DebugLogPrinter]:
@@ -196,6 +201,14 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
     def set_params(self, param_dict):
         self._gpmodel.set_params(param_dict)
 
+    def on_observed_data_changed(
+        self, trial_id: str, new_labels: Optional[Dict[str, MetricValues]] = None
+    ):
+        if new_labels is None:
+            self._data_cache.invalidate(trial_id)
+        else:
+            self._data_cache.append_observations(trial_id, new_labels)
+
     def model(self, state: TuningJobState, fit_params: bool) -> SurrogateModel:
         assert state.num_observed_cases(self.active_metric) > 0, (
             "Cannot compute posterior: state has no labeled datapoints "
@@ -212,6 +225,7 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
             self.active_metric,
             normalize_targets=self.normalize_targets,
             do_fantasizing=False,
+            data_cache=self._data_cache,
         )
         if fit_params:
             logger.info(f"Fitting surrogate model for {self.active_metric}")
@@ -244,6 +258,7 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
                 active_metric=self.active_metric,
                 normalize_targets=self.normalize_targets,
                 do_fantasizing=True,
+                data_cache=self._data_cache,
             )
             self._gpmodel.recompute_states(data)
         else:
@@ -277,13 +292,7 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
         assert state.pending_evaluations and self.num_fantasy_samples > 0
 
         # Recompute posterior state with fantasy samples
-        state_with_fantasies = TuningJobState(
-            hp_ranges=state.hp_ranges,
-            config_for_trial=state.config_for_trial,
-            trials_evaluations=state.trials_evaluations,
-            failed_trials=state.failed_trials,
-            pending_evaluations=fantasy_samples,
-        )
+        state_with_fantasies = state.copy_with_pending(fantasy_samples)
         # Recompute posterior state with fantasy samples
         data = prepare_data(
             state=state_with_fantasies,
@@ -291,6 +300,7 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
             active_metric=self.active_metric,
             normalize_targets=self.normalize_targets,
             do_fantasizing=True,
+            data_cache=self._data_cache,
         )
         self._gpmodel.recompute_states(data)
         if self.normalize_targets:
@@ -329,6 +339,7 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
             config_space_ext=self._config_space_ext,
             active_metric=self.active_metric,
             normalize_targets=self.normalize_targets,
+            data_cache=self._data_cache,
         )
         if not data_nopending["configs"]:
             # It can happen that all trials with observed data also have
@@ -398,10 +409,4 @@ class GaussProcAdditiveModelFactory(TransformerModelFactory):
                     )
                 )
         # Return new state, with `pending_evaluations` replaced
-        return TuningJobState(
-            hp_ranges=state.hp_ranges,
-            config_for_trial=state.config_for_trial,
-            trials_evaluations=state.trials_evaluations,
-            failed_trials=state.failed_trials,
-            pending_evaluations=pending_evaluations_with_fantasies,
-        )
+        return state.copy_with_pending(pending_evaluations_with_fantasies)
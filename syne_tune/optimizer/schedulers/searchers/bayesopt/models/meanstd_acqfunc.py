@@ -241,34 +241,42 @@ class MeanStdAcquisitionFunction(AcquisitionFunction):
     def compute_acq_with_gradient(
         self, input: np.ndarray, model: Optional[SurrogateOutputModel] = None
     ) -> (float, np.ndarray):
+        fvals, gradients = self.compute_acq_with_gradient_batch(
+            input.reshape(1, -1), model=model
+        )
+        return fvals[0], gradients.reshape(input.shape)
+
+    def compute_acq_with_gradient_batch(
+        self, inputs: np.ndarray, model: Optional[SurrogateOutputModel] = None
+    ) -> (np.ndarray, np.ndarray):
         if model is None:
             model = self.model
         if isinstance(model, SurrogateModel):
             model = dictionarize_objective(model)
-        output_to_predictions = self._map_outputs_to_predictions(
-            model, input.reshape(1, -1)
-        )
+        # Predictions for all inputs are computed with a single call per model
+        output_to_predictions = self._map_outputs_to_predictions(model, inputs)
         current_bests = self._get_current_bests(model)
 
-        # Reshaping of predictions to accomodate _compute_head_and_gradient. We
-        # also store the original shapes, which are needed below
-        shapes = dict()
-        for output_name, preds_for_samples in output_to_predictions.items():
-            shapes[output_name] = {k: v.shape for k, v in preds_for_samples[0].items()}
-            for prediction in preds_for_samples:
-                for k in prediction.keys():
-                    prediction[k] = prediction[k].reshape((-1,))
-
         # MCMC average is product over lists coming from each model. We need to
         # accumulate head gradients w.r.t. each model, each of which being a
-        # list over MCMC samples from that model (size 1 if no MCMC)
-        fvals_list = []
-        # For accumulation of head gradients, we also need to have the
-        # position in each list
+        # list over MCMC samples from that model (size 1 if no MCMC). Head
+        # values and gradients are computed for all inputs at once, using the
+        # same reshaping of predictions as in `compute_acq`
         list_values = [
-            list(enumerate(output_to_predictions[name]))
+            list(
+                enumerate(
+                    {
+                        k: v.reshape((-1, 1))
+                        if (k == "mean" and v.ndim == 1) or k == "std"
+                        else v
+                        for k, v in prediction.items()
+                    }
+                    for prediction in output_to_predictions[name]
+                )
+            )
             for name in self.model_output_names
         ]
+        fvals_list = []
         head_gradient = {
             name: [None] * len(predictions)
             for name, predictions in output_to_predictions.items()
@@ -278,30 +286,31 @@ class MeanStdAcquisitionFunction(AcquisitionFunction):
             output_to_preds = dict(zip(self.model_output_names, predictions))
             current_best = current_bests(positions)
             head_result = self._compute_head_and_gradient(output_to_preds, current_best)
-            fvals_list.append(head_result.hval)
+            fvals_list.append(head_result.hval.reshape((-1,)))
             for output_name, pos in zip(self.model_output_names, positions):
                 head_gradient[output_name][pos] = self._add_head_gradients(
-                    head_result.gradient[output_name], head_gradient[output_name][pos]
+                    head_result.gradient[output_name],
+                    head_gradient[output_name][pos],
                 )
+        num_total = len(fvals_list)
+        fvals = np.mean(fvals_list, axis=0)
 
         # Sum up the gradients coming from each output model
-        fval = np.mean(fvals_list)
-        num_total = len(fvals_list)
         gradient = 0.0
         for output_name, output_model in model.items():
             # Reshape head gradients so they have the same shape as corresponding
             # predictions. This is required for `backward_gradient` to work.
-            shp = shapes[output_name]
+            predictions = output_to_predictions[output_name]
             head_grad = [
-                {k: v.reshape(shp[k]) for k, v in orig_grad.items()}
-                for orig_grad in head_gradient[output_name]
+                {k: v.reshape(predictions[pos][k].shape) for k, v in grads.items()}
+                for pos, grads in enumerate(head_gradient[output_name])
             ]
-            # Gradients are computed by the model
-            gradient_list = output_model.backward_gradient(input, head_grad)
+            # Gradients are computed by the model, for all inputs at once
+            gradient_list = output_model.backward_gradient(inputs, head_grad)
             # Average over MCMC samples
             output_gradient = np.sum(gradient_list, axis=0) / num_total
             gradient += output_gradient
-        return fval, gradient
+        return fvals, gradient
 
     def _map_outputs_to_predictions(
         self, model: SurrogateOutputModel, inputs: np.ndarray
@@ -350,16 +359,20 @@ class MeanStdAcquisitionFunction(AcquisitionFunction):
         current_best: Optional[np.ndarray],
     ) -> HeadWithGradient:
         """
-        Computes both head value and head gradients, for a single input.
+        Computes both head values and head gradients, for a batch of inputs.
+        As in `_compute_head`, if mean has nf > 1 columns, both std and
+        current_best are broadcasted, and head values are averaged over this
+        dimension.
 
         :param: output_to_predictions: Dictionary mapping each output to a
             dict containing predictive moments, keys as in
-            `_output_to_keys_predict`. 'mean' has shape (nf,), 'std' has shape
-            (1,)
-        :param current_best: Incumbent, shape (nf,)
-        :return: HeadWithGradient containing hval and head gradients for
-            each output model. All HeadWithGradient values have the same
-            shape as the corresponding predictions
+            `_output_to_keys_predict`. 'mean' has shape (n, nf), 'std' has
+            shape (n, 1)
+        :param current_best: Incumbent, shape (1, nf)
+        :return: HeadWithGradient containing hval, shape (n,), and head
+            gradients for each output model. Head gradients have shape
+            (n, nf) for 'mean' (or (n, 1) if the predictions of this model
+            have no fantasies), and (n, 1) for 'std'
 
         """
         raise NotImplementedError
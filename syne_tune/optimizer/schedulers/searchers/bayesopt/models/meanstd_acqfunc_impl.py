@@ -70,10 +70,10 @@ def _extract_active_and_secondary_metric(model_output_names, active_metric):
 
 def _postprocess_gradient(grad: np.ndarray, nf: int) -> np.ndarray:
     if nf > 1:
-        assert grad.size == nf  # Sanity check
+        assert grad.shape[1] == nf  # Sanity check
         return grad / nf
     else:
-        return np.mean(grad, keepdims=True)
+        return np.mean(grad, axis=1, keepdims=True)
 
 
 class EIAcquisitionFunction(MeanStdAcquisitionFunction):
@@ -115,7 +115,7 @@ class EIAcquisitionFunction(MeanStdAcquisitionFunction):
     ) -> HeadWithGradient:
         assert current_best is not None
         mean, std = self._extract_mean_and_std(output_to_predictions)
-        nf_mean = mean.size
+        nf_mean = mean.shape[1]
         assert current_best.size == nf_mean
 
         # phi, Phi is PDF and CDF of Gaussian
@@ -124,7 +124,7 @@ class EIAcquisitionFunction(MeanStdAcquisitionFunction):
         dh_dmean = _postprocess_gradient(Phi, nf=nf_mean)
         dh_dstd = _postprocess_gradient(-phi, nf=1)
         return HeadWithGradient(
-            hval=-np.mean(f_acqu),
+            hval=-np.mean(f_acqu, axis=1),
             gradient={self.active_metric: dict(mean=dh_dmean, std=dh_dstd)},
         )
 
@@ -162,12 +162,12 @@ class LCBAcquisitionFunction(MeanStdAcquisitionFunction):
         current_best: Optional[np.ndarray],
     ) -> HeadWithGradient:
         mean, std = self._extract_mean_and_std(output_to_predictions)
-        nf_mean = mean.size
+        nf_mean = mean.shape[1]
 
         dh_dmean = np.ones_like(mean) / nf_mean
         dh_dstd = (-self.kappa) * np.ones_like(std)
         return HeadWithGradient(
-            hval=np.mean(mean - std * self.kappa),
+            hval=np.mean(mean - std * self.kappa, axis=1),
             gradient={self.active_metric: dict(mean=dh_dmean, std=dh_dstd)},
         )
 
@@ -255,8 +255,8 @@ class EIpuAcquisitionFunction(MeanStdAcquisitionFunction):
         assert current_best is not None
         mean, std = self._extract_mean_and_std(output_to_predictions)
         pred_cost = self._extract_positive_cost(output_to_predictions)
-        nf_active = mean.size
-        nf_cost = pred_cost.size
+        nf_active = mean.shape[1]
+        nf_cost = pred_cost.shape[1]
 
         # phi, Phi is PDF and CDF of Gaussian
         phi, Phi, u = get_quantiles(self.jitter, current_best, mean, std)
@@ -275,7 +275,7 @@ class EIpuAcquisitionFunction(MeanStdAcquisitionFunction):
             self.active_metric: dict(mean=dh_dmean_active, std=dh_dstd_active),
             self.cost_metric: dict(mean=dh_dmean_cost),
         }
-        return HeadWithGradient(hval=-np.mean(f_acqu), gradient=gradient)
+        return HeadWithGradient(hval=-np.mean(f_acqu, axis=1), gradient=gradient)
 
     def _extract_positive_cost(self, output_to_predictions):
         pred_cost = output_to_predictions[self.cost_metric]["mean"]
@@ -390,8 +390,8 @@ class CEIAcquisitionFunction(MeanStdAcquisitionFunction):
         mean_constr, std_constr = self._extract_mean_and_std(
             output_to_predictions, metric=self.constraint_metric
         )
-        nf_mean = mean.size
-        nf_constr = mean_constr.size
+        nf_mean = mean.shape[1]
+        nf_constr = mean_constr.shape[1]
 
         # Compute the probability of satisfying the constraint P(c(x) <= 0)
         std_constr = std_constr + MIN_STD_CONSTRAINT
@@ -440,7 +440,7 @@ class CEIAcquisitionFunction(MeanStdAcquisitionFunction):
                 mean=dh_dmean_constraint, std=dh_dstd_constraint
             ),
         }
-        return HeadWithGradient(hval=-np.mean(f_acqu), gradient=gradient)
+        return HeadWithGradient(hval=-np.mean(f_acqu, axis=1), gradient=gradient)
 
     def _get_current_bests_internal(
         self, model: SurrogateOutputModel
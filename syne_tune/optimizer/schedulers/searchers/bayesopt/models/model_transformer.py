@@ -33,6 +33,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
     TrialEvaluations,
     dictionarize_objective,
     INTERNAL_METRIC_NAME,
+    MetricValues,
 )
 from syne_tune.optimizer.schedulers.searchers.utils.common import Configuration
 from syne_tune.optimizer.schedulers.utils.simple_profiler import SimpleProfiler
@@ -99,6 +100,21 @@ class TransformerModelFactory:
         """
         pass
 
+    def on_observed_data_changed(
+        self, trial_id: str, new_labels: Optional[Dict[str, MetricValues]] = None
+    ):
+        """
+        Called by :class:`ModelStateTransformer` whenever observed data for a
+        trial is added or removed. Factories which cache data derived from the
+        state can use this to update or invalidate entries for this trial.
+
+        :param trial_id: ID of trial whose observed data changed
+        :param new_labels: If observed data has been labeled, these are the
+            new labels, as in `TrialEvaluations.metrics`. None if observed data
+            has been removed
+        """
+        pass
+
 
 # Convenience types allowing for multi-output HPO. These are used for methods that work both in the standard case
 # of a single output model and in the multi-output case
@@ -303,6 +319,7 @@ class ModelStateTransformer:
                 + f"key {key}"
             )
             del metric_vals[key]
+        self._observed_data_changed(trial_id)
 
     def label_trial(
         self, data: TrialEvaluations, config: Optional[Configuration] = None
@@ -338,8 +355,16 @@ class ModelStateTransformer:
                 metrics[name] = new_labels
             else:
                 metrics[name].update(new_labels)
+        self._observed_data_changed(trial_id, new_labels=data.metrics)
         self._model = None  # Invalidate
 
+    def _observed_data_changed(
+        self, trial_id: str, new_labels: Optional[Dict[str, MetricValues]] = None
+    ):
+        self._state.observed_data_changed(trial_id)
+        for model_factory in self._model_factory.values():
+            model_factory.on_observed_data_changed(trial_id, new_labels)
+
     def filter_pending_evaluations(
         self, filter_pred: Callable[[PendingEvaluation], bool]
     ):
@@ -84,6 +84,20 @@ class CandidateGenerator:
         """
         raise NotImplementedError()
 
+    def generate_candidates_matrix(self, num_cands: int) -> np.ndarray:
+        """
+        Variant of :meth:`generate_candidates_en_bulk`, which returns
+        candidates in encoded form, w.r.t. `hp_ranges` of the generator. This
+        is optional: generators which support it can be combined with
+        :meth:`ScoringFunction.score_matrix`, so that only candidates which
+        are actually chosen need to be decoded.
+
+        :param num_cands: Number of candidates to generate
+        :return: Encoded candidates, shape `(num_cands, d)`. May contain
+            duplicates or entries of the exclusion list
+        """
+        raise NotImplementedError()
+
 
 class SurrogateModel:
     def __init__(self, state: TuningJobState, active_metric: str = None):
@@ -169,11 +183,19 @@ class SurrogateModel:
         'head_gradients' contains the head gradients nabla_p f. Its shape is
         that of p (where n=1).
 
+        `input` can also be a batch of n input points, shape (n, d). In this
+        case, the shape of 'head_gradients' is that of p for n points. Since
+        predictions are marginals, the gradient for each point only depends
+        on its own head gradients, and the gradients for all points are
+        returned as (n, d) matrix.
+
         Lists have >1 entry if MCMC is used, otherwise they are all size 1.
 
-        :param input: Single input point x, shape (d,)
+        :param input: Single input point x, shape (d,), or batch of points,
+            shape (n, d)
         :param head_gradients: See above
-        :return: Gradient nabla_x f (several if MCMC is used)
+        :return: Gradient nabla_x f (several if MCMC is used), same shape as
+            `input`
         """
         raise NotImplementedError
 
@@ -205,6 +227,23 @@ class ScoringFunction:
         """
         raise NotImplementedError
 
+    def score_matrix(
+        self,
+        inputs: np.ndarray,
+        model: Optional[SurrogateOutputModel] = None,
+    ) -> np.ndarray:
+        """
+        Variant of :meth:`score`, where candidates are given in encoded form,
+        w.r.t. `hp_ranges_for_prediction` of the model. This is optional.
+
+        lower is better
+
+        :param inputs: Encoded candidates, shape `(n, d)`
+        :param model: If given, overrides the default model
+        :return: Scores, shape `(n,)`
+        """
+        raise NotImplementedError
+
 
 class AcquisitionFunction(ScoringFunction):
     def __init__(self, model: SurrogateOutputModel, active_metric: str = None):
@@ -238,6 +277,23 @@ class AcquisitionFunction(ScoringFunction):
         """
         raise NotImplementedError
 
+    def compute_acq_with_gradient_batch(
+        self, inputs: np.ndarray, model: Optional[SurrogateOutputModel] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Variant of :meth:`compute_acq_with_gradient` for a batch of input
+        points. Implementations should compute values and gradients for all
+        points with a single call of the model. The default implementation
+        loops over points.
+
+        :param inputs: Input points, shape (n, d)
+        :param model: If given, overrides self.model
+        :return: Values f(x_i), shape (n,), gradients nabla_x f(x_i), shape (n, d)
+        """
+        results = [self.compute_acq_with_gradient(x, model=model) for x in inputs]
+        fvals, gradients = zip(*results)
+        return np.array(fvals), np.vstack(gradients)
+
     def score(
         self,
         candidates: Iterable[Configuration],
@@ -251,7 +307,14 @@ class AcquisitionFunction(ScoringFunction):
             active_model = model
         hp_ranges = active_model.hp_ranges_for_prediction()
         inputs = hp_ranges.to_ndarray_matrix(candidates)
-        return list(self.compute_acq(inputs, model=model))
+        return list(self.score_matrix(inputs, model=model))
+
+    def score_matrix(
+        self,
+        inputs: np.ndarray,
+        model: Optional[SurrogateOutputModel] = None,
+    ) -> np.ndarray:
+        return self.compute_acq(inputs, model=model)
 
 
 AcquisitionClassAndArgs = Union[
@@ -310,3 +373,21 @@ class LocalOptimizer:
         :return: Configuration found by local optimization
         """
         raise NotImplementedError
+
+    def optimize_batch(
+        self,
+        candidates: List[Configuration],
+        model: Optional[SurrogateOutputModel] = None,
+    ) -> List[Tuple[Configuration, Configuration]]:
+        """
+        Run local optimization from several starting points. Implementations
+        can advance all starting points jointly. The default implementation
+        calls :meth:`optimize` for each of them.
+
+        :param candidates: Starting points
+        :param model: If given, overrides self.model
+        :return: List of (start, optimized) pairs, best optimized configs
+            first. Pairs whose optimized config equals one coming before may
+            be dropped
+        """
+        return [(cand, self.optimize(cand, model=model)) for cand in candidates]
@@ -10,7 +10,7 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import List, Tuple, Iterator, Optional
+from typing import List, Tuple, Iterator, Optional, Iterable
 import logging
 from dataclasses import dataclass
 import numpy as np
@@ -99,6 +99,11 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
         See below.
     :param debug_log: If a DebugLogPrinter is passed here, it is used to write
         log messages
+    :param num_local_starts: Number of top-ranked distinct initial candidates
+        from which local optimization is started jointly, using
+        :meth:`LocalOptimizer.optimize_batch`. If this is 1 (default), only
+        the top-ranked candidate is optimized, unless its result is a
+        duplicate. Further candidates are optimized one at a time, if needed
 
     """
 
@@ -115,6 +120,7 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
     profiler: SimpleProfiler = None
     sample_unique_candidates: bool = False
     debug_log: Optional[DebugLogPrinter] = None
+    num_local_starts: int = 1
 
     # Note: For greedy batch selection (num_outer_iterations > 1), the
     # underlying SurrrogateModel changes with each new pending candidate. The
@@ -227,6 +233,9 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
             self.profiler.push_prefix("nextcand")
             self.profiler.start("all")
             self.profiler.start("genrandom")
+        score_as_matrix = (
+            not self.sample_unique_candidates and self._score_candidates_as_matrix()
+        )
         if self.sample_unique_candidates:
             # This can be expensive, depending on what type Candidate is
             initial_candidates = generate_unique_candidates(
@@ -234,6 +243,15 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
                 num_initial_candidates,
                 self.exclusion_candidates,
             )
+        elif score_as_matrix:
+            # Candidates are sampled and scored in encoded form. They are
+            # decoded lazily in the order of their scores, so that only those
+            # needed below are converted to configs
+            initial_inputs = (
+                self.initial_candidates_generator.generate_candidates_matrix(
+                    num_initial_candidates
+                )
+            )
         else:
             # Will not return candidates in `exclusion_candidates`, but there
             # can be duplicates
@@ -246,7 +264,24 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
             self.profiler.stop("genrandom")
             self.profiler.start("scoring")
         logger.info("BayesOpt Algorithm: Scoring (and reordering) candidates.")
-        if self.debug_log is not None:
+        if score_as_matrix:
+            scores = self.initial_candidates_scorer.score_matrix(
+                initial_inputs, model=model
+            )
+            order = np.argsort(scores, kind="stable")
+            initial_candidates = _lazily_decode_candidates(
+                initial_inputs[order],
+                hp_ranges=self.initial_candidates_generator.hp_ranges,
+                exclusion_candidates=self.exclusion_candidates,
+            )
+            if self.debug_log is not None:
+                # Peek at the first entry of the iterator
+                config = next(initial_candidates, None)
+                if config is not None:
+                    top_scores = np.asarray(scores)[order[:5]]
+                    self.debug_log.set_init_config(config, top_scores)
+                    initial_candidates = itertools.chain([config], initial_candidates)
+        elif self.debug_log is not None:
             candidates_and_scores = _order_candidates(
                 initial_candidates,
                 self.initial_candidates_scorer,
@@ -269,6 +304,7 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
             self.local_optimizer,
             hp_ranges=self.exclusion_candidates.hp_ranges,
             model=model,
+            num_local_starts=self.num_local_starts,
         )
         logger.info("BayesOpt Algorithm: Selecting final set of candidates.")
         if self.debug_log is not None and isinstance(
@@ -294,6 +330,35 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
             self.profiler.pop_prefix()  # nextcand
         return candidates
 
+    def _score_candidates_as_matrix(self) -> bool:
+        """
+        :return: Can initial candidates be generated and scored in encoded
+            form? This needs both the candidate generator and the scoring
+            function to support it
+        """
+        generator_type = type(self.initial_candidates_generator)
+        scorer_type = type(self.initial_candidates_scorer)
+        return (
+            generator_type.generate_candidates_matrix
+            is not CandidateGenerator.generate_candidates_matrix
+            and scorer_type.score_matrix is not ScoringFunction.score_matrix
+        )
+
+
+def _lazily_decode_candidates(
+    inputs: np.ndarray,
+    hp_ranges: HyperparameterRanges,
+    exclusion_candidates: ExclusionList,
+) -> Iterator[Configuration]:
+    """
+    Decodes rows of `inputs` one at a time, skipping configs in
+    `exclusion_candidates`.
+    """
+    for row in inputs:
+        config = hp_ranges.from_ndarray(row)
+        if not exclusion_candidates.contains(config):
+            yield config
+
 
 def _order_candidates(
     candidates: List[Configuration],
@@ -313,18 +378,33 @@ def _order_candidates(
 
 
 def _lazily_locally_optimize(
-    candidates: List[Configuration],
+    candidates: Iterable[Configuration],
     local_optimizer: LocalOptimizer,
     hp_ranges: HyperparameterRanges,
     model: Optional[SurrogateModel],
+    num_local_starts: int = 1,
 ) -> Iterator[Tuple[Configuration, Configuration]]:
     """
     Due to local deduplication we do not know in advance how many candidates
     we have to locally optimize, hence this helper to create a lazy generator
     of locally optimized candidates.
     Note that `candidates` may contain duplicates, but such are skipped here.
+
+    If `num_local_starts > 1`, the first `num_local_starts` distinct candidates
+    are optimized jointly by `local_optimizer.optimize_batch`. Remaining
+    candidates are optimized one at a time, as long as more are needed.
     """
     considered_already = ExclusionList.empty_list(hp_ranges)
+    candidates = iter(candidates)
+    if num_local_starts > 1:
+        starts = []
+        for cand in candidates:
+            if not considered_already.contains(cand):
+                considered_already.add(cand)
+                starts.append(cand)
+                if len(starts) == num_local_starts:
+                    break
+        yield from local_optimizer.optimize_batch(starts, model=model)
     for cand in candidates:
         if not considered_already.contains(cand):
             considered_already.add(cand)
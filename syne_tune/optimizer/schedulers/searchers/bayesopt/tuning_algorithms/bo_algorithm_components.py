@@ -10,7 +10,7 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 import numpy as np
 from scipy.optimize import fmin_l_bfgs_b
 import logging
@@ -21,6 +21,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.base_cl
     ScoringFunction,
     LocalOptimizer,
     SurrogateOutputModel,
+    AcquisitionFunction,
     AcquisitionClassAndArgs,
     unwrap_acquisition_class_and_kwargs,
 )
@@ -32,6 +33,26 @@ from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges import (
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of L-BFGS iterations for a local optimization
+LBFGS_MAXITER = 1000
+
+# In :meth:`LBFGSOptimizeAcquisition.optimize_batch`, starts are optimized
+# jointly for rounds of this many iterations. After each round, starts which
+# have converged are dropped
+LBFGS_MULTISTART_ITERATIONS_PER_ROUND = 50
+
+# A start has converged once the maximum norm of its projected gradient is
+# below this value (the default of `fmin_l_bfgs_b`), or if the relative
+# reduction of its value in a round is below `LBFGS_FTOL` (the default
+# `factr` of `fmin_l_bfgs_b` times machine precision, relative to the scale
+# of the start)
+LBFGS_PGTOL = 1e-5
+
+LBFGS_FACTR = 1e7
+
+LBFGS_FTOL = LBFGS_FACTR * np.finfo(float).eps
+
+
 class IndependentThompsonSampling(ScoringFunction):
     """
     Note: This is not Thompson sampling, but rather a variant called
@@ -56,7 +77,17 @@ class IndependentThompsonSampling(ScoringFunction):
     ) -> List[float]:
         if model is None:
             model = self.model
-        predictions_list = model.predict_candidates(candidates)
+        inputs = model.hp_ranges_for_prediction().to_ndarray_matrix(candidates)
+        return list(self.score_matrix(inputs, model=model))
+
+    def score_matrix(
+        self,
+        inputs: np.ndarray,
+        model: Optional[SurrogateModel] = None,
+    ) -> np.ndarray:
+        if model is None:
+            model = self.model
+        predictions_list = model.predict(inputs)
         scores = []
         # If the model supports fantasizing, posterior_means is a matrix. In
         # that case, samples are drawn for every column, then averaged (why
@@ -64,12 +95,13 @@ class IndependentThompsonSampling(ScoringFunction):
         for predictions in predictions_list:
             posterior_means = predictions["mean"]
             posterior_stds = predictions["std"]
-            new_score = [
-                np.mean(self.random_state.normal(m, s))
-                for m, s in zip(posterior_means, posterior_stds)
-            ]
-            scores.append(new_score)
-        return list(np.mean(np.array(scores), axis=0))
+            if posterior_means.ndim == 2:
+                posterior_stds = posterior_stds.reshape((-1, 1))
+            samples = self.random_state.normal(posterior_means, posterior_stds)
+            if samples.ndim == 2:
+                samples = np.mean(samples, axis=1)
+            scores.append(samples)
+        return np.mean(np.array(scores), axis=0)
 
 
 class LBFGSOptimizeAcquisition(LocalOptimizer):
@@ -84,18 +116,21 @@ class LBFGSOptimizeAcquisition(LocalOptimizer):
         # Number criterion evaluations in last recent optimize call
         self.num_evaluations = None
 
-    def optimize(
-        self, candidate: Configuration, model: Optional[SurrogateOutputModel] = None
-    ) -> Configuration:
+    def _acquisition_function(
+        self, model: Optional[SurrogateOutputModel]
+    ) -> AcquisitionFunction:
         # Before local minimization, the model for this state_id should have been fitted.
         if model is None:
             model = self.model
         acquisition_class, acquisition_kwargs = unwrap_acquisition_class_and_kwargs(
             self.acquisition_class
         )
-        acquisition_function = acquisition_class(
-            model, self.active_metric, **acquisition_kwargs
-        )
+        return acquisition_class(model, self.active_metric, **acquisition_kwargs)
+
+    def optimize(
+        self, candidate: Configuration, model: Optional[SurrogateOutputModel] = None
+    ) -> Configuration:
+        acquisition_function = self._acquisition_function(model)
 
         x0 = self.hp_ranges.to_ndarray(candidate)
         bounds = self.hp_ranges.get_ndarray_bounds()
@@ -106,7 +141,7 @@ class LBFGSOptimizeAcquisition(LocalOptimizer):
             n_evaluations[0] += 1
             return acquisition_function.compute_acq_with_gradient(x)
 
-        res = fmin_l_bfgs_b(f_df, x0=x0, bounds=bounds, maxiter=1000)
+        res = fmin_l_bfgs_b(f_df, x0=x0, bounds=bounds, maxiter=LBFGS_MAXITER)
         self.num_evaluations = n_evaluations[0]
         if res[2]["task"] == b"ABNORMAL_TERMINATION_IN_LNSRCH":
             # this condition was copied from the old GPyOpt code
@@ -129,6 +164,158 @@ class LBFGSOptimizeAcquisition(LocalOptimizer):
             result = self.hp_ranges.from_ndarray(optimized_x.flatten())
             return result
 
+    def optimize_batch(
+        self,
+        candidates: List[Configuration],
+        model: Optional[SurrogateOutputModel] = None,
+    ) -> List[Tuple[Configuration, Configuration]]:
+        """
+        All starting points are advanced simultaneously, by running L-BFGS-B
+        on the sum of acquisition function values. Since this objective is
+        separable, its minimizers are the local minimizers of all starts.
+        Values and gradients for all starts are computed by a single call of
+        :meth:`AcquisitionFunction.compute_acq_with_gradient_batch`.
+
+        Optimization is done in rounds of at most
+        `LBFGS_MULTISTART_ITERATIONS_PER_ROUND` iterations. After each round,
+        starts which have converged are dropped, so that later rounds only work
+        on those still moving. Convergence is decided for each start
+        separately, relative to the scale of its own acquisition value. The
+        `factr` tolerance of L-BFGS-B refers to the sum, it is chosen so that
+        a round does not stop before the start with the smallest scale has
+        converged. If the line search of a round fails, the remaining starts
+        are optimized one by one.
+
+        If the optimized point of a start is not better than the start itself,
+        the start is returned instead. Pairs are sorted w.r.t. the acquisition
+        values of optimized configs, and pairs whose optimized config equals a
+        better one are dropped.
+        """
+        if len(candidates) < 2:
+            return super().optimize_batch(candidates, model=model)
+        acquisition_function = self._acquisition_function(model)
+        initial_x = self.hp_ranges.to_ndarray_matrix(candidates)
+        num_starts, dimension = initial_x.shape
+        bounds = self.hp_ranges.get_ndarray_bounds()
+        a_min, a_max = (np.array(x) for x in zip(*bounds))
+        n_evaluations = [0]  # wrapped in list to allow access from function
+
+        def f_df(x):
+            n_evaluations[0] += 1
+            fvals, gradients = acquisition_function.compute_acq_with_gradient_batch(
+                x.reshape((-1, dimension))
+            )
+            return np.sum(fvals), gradients.reshape((-1,))
+
+        def acq_values(x):
+            return acquisition_function.compute_acq(x).reshape((-1,))
+
+        current_x = initial_x.copy()
+        initial_fvals = acq_values(initial_x)
+        current_fvals = initial_fvals.copy()
+        active = np.arange(num_starts)
+        num_iterations = 0
+        while active.size > 0 and num_iterations < LBFGS_MAXITER:
+            maxiter = min(
+                LBFGS_MULTISTART_ITERATIONS_PER_ROUND, LBFGS_MAXITER - num_iterations
+            )
+            # L-BFGS-B stops once the reduction of the sum is below `factr`
+            # times machine precision, relative to the scale of the sum. We
+            # rescale this to the smallest scale of any active start
+            active_fvals = current_fvals[active]
+            factr = (
+                LBFGS_FACTR
+                * np.min(np.maximum(np.abs(active_fvals), 1.0))
+                / max(abs(np.sum(active_fvals)), 1.0)
+            )
+            res = fmin_l_bfgs_b(
+                f_df,
+                x0=current_x[active].reshape((-1,)),
+                bounds=bounds * active.size,
+                maxiter=maxiter,
+                factr=factr,
+                pgtol=LBFGS_PGTOL,
+            )
+            num_iterations += res[2]["nit"]
+            # Clip to avoid situation where result is small epsilon out of bounds
+            new_x = np.clip(res[0].reshape((-1, dimension)), a_min, a_max)
+            assert np.linalg.norm(res[0] - new_x.reshape((-1,))) < 1e-6, (
+                res[0],
+                new_x,
+                bounds,
+            )
+            current_x[active] = new_x
+            new_fvals = acq_values(new_x)
+            previous_fvals = current_fvals[active]
+            current_fvals[active] = new_fvals
+            # Drop starts which have converged. This is done even if L-BFGS
+            # stopped before the iteration limit of the round, since its
+            # stopping rule refers to the sum over all starts. The projected
+            # gradient is zero for components at a bound, where the gradient
+            # points outwards. As in L-BFGS, a start has also converged if the
+            # relative reduction of its value is tiny
+            gradients = res[2]["grad"].reshape((-1, dimension))
+            at_bound = ((new_x <= a_min) & (gradients > 0)) | (
+                (new_x >= a_max) & (gradients < 0)
+            )
+            projected_gradients = np.where(at_bound, 0, gradients)
+            small_gradient = np.max(np.abs(projected_gradients), axis=1) <= LBFGS_PGTOL
+            scale = np.maximum(
+                np.maximum(np.abs(previous_fvals), np.abs(new_fvals)), 1.0
+            )
+            small_reduction = previous_fvals - new_fvals <= LBFGS_FTOL * scale
+            if res[2]["task"] != b"ABNORMAL_TERMINATION_IN_LNSRCH":
+                active = active[~(small_gradient | small_reduction)]
+                continue
+            # The joint line search failed. This can be caused by a single
+            # start, so all starts which have not converged are optimized one
+            # by one. A small reduction does not count as converged here,
+            # since the failed line search may have stopped them
+            active = active[~small_gradient]
+            if active.size > 0:
+                logger.warning(
+                    f"ABNORMAL_TERMINATION_IN_LNSRCH in lbfgs after {n_evaluations[0]} "
+                    f"evaluations, optimizing {active.size} remaining starts "
+                    "separately"
+                )
+                maxiter = max(LBFGS_MAXITER - num_iterations, 1)
+                for pos in active:
+                    res = fmin_l_bfgs_b(
+                        f_df,
+                        x0=current_x[pos],
+                        bounds=bounds,
+                        maxiter=maxiter,
+                        pgtol=LBFGS_PGTOL,
+                    )
+                    if res[2]["task"] == b"ABNORMAL_TERMINATION_IN_LNSRCH":
+                        # As in :meth:`optimize`, we keep the current point
+                        continue
+                    new_x = np.clip(res[0], a_min, a_max)
+                    new_fval = acq_values(new_x.reshape((1, -1)))[0]
+                    if new_fval < current_fvals[pos]:
+                        current_x[pos] = new_x
+                        current_fvals[pos] = new_fval
+            break
+        self.num_evaluations = n_evaluations[0]
+
+        # Compare optimized with initial points
+        optimized_fvals = current_fvals
+        result = []
+        optimized_already = set()
+        for pos in np.argsort(
+            np.minimum(initial_fvals, optimized_fvals), kind="stable"
+        ):
+            candidate = candidates[pos]
+            if optimized_fvals[pos] < initial_fvals[pos]:
+                optimized = self.hp_ranges.from_ndarray(current_x[pos])
+            else:
+                optimized = candidate
+            match_str = self.hp_ranges.config_to_match_string(optimized)
+            if match_str not in optimized_already:
+                optimized_already.add(match_str)
+                result.append((candidate, optimized))
+        return result
+
 
 class NoOptimization(LocalOptimizer):
     def optimize(
@@ -52,6 +52,9 @@ class RandomStatefulCandidateGenerator(CandidateGenerator):
         while True:
             yield self.hp_ranges.random_config(self.random_state)
 
+    def generate_candidates_matrix(self, num_cands: int) -> np.ndarray:
+        return self.hp_ranges.random_ndarray_matrix(self.random_state, num_cands)
+
     def generate_candidates_en_bulk(
         self, num_cands: int, exclusion_list=None
     ) -> List[Configuration]:
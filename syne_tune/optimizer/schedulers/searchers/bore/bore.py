@@ -19,7 +19,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.calibration import CalibratedClassifierCV
 
-from typing import Dict
+from typing import Dict, List
 
 from syne_tune.optimizer.schedulers.searchers.searcher import SearcherWithRandomSeed
 from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
@@ -47,6 +47,7 @@ class Bore(SearcherWithRandomSeed):
         random_prob: float = 0.0,
         init_random: int = 6,
         classifier_kwargs: dict = None,
+        refit_every: int = 1,
         **kwargs,
     ):
 
@@ -74,6 +75,11 @@ class Bore(SearcherWithRandomSeed):
         :param random_prob: probability for returning a random configurations (epsilon greedy)
         :param init_random: Number of initial random configurations before we start with the optimization.
         :param classifier_kwargs: Dict that contains all hyperparameters for the classifier
+        :param refit_every: The classifier is refit only once at least this many
+            new observations have arrived since the last fit. Otherwise, the
+            current classifier is used to score candidates. Larger values keep
+            the latency of `get_config` low as the history grows. Defaults to 1
+            (refit whenever there is new data)
         """
 
         super().__init__(
@@ -92,6 +98,10 @@ class Bore(SearcherWithRandomSeed):
         self.init_random = init_random
         self.random_prob = random_prob
         self.mode = mode
+        assert refit_every >= 1, f"refit_every = {refit_every} must be positive"
+        self.refit_every = refit_every
+        # Number of observations the classifier has last been fit on
+        self._num_data_last_fit = None
 
         self._hp_ranges = make_hyperparameter_ranges(config_space)
 
@@ -159,8 +169,14 @@ class Bore(SearcherWithRandomSeed):
             config = self._hp_ranges.random_config(self.random_state)
 
         else:
-            # train model
-            self.train_model(self.inputs, self.targets)
+            # train model, unless it has been fit recently enough
+            num_data = len(self.inputs)
+            if (
+                self._num_data_last_fit is None
+                or num_data - self._num_data_last_fit >= self.refit_every
+            ):
+                self.train_model(self.inputs, self.targets)
+                self._num_data_last_fit = num_data
 
             if self.model is None:
                 config = self._hp_ranges.random_config(self.random_state)
@@ -183,39 +199,22 @@ class Bore(SearcherWithRandomSeed):
                     best, traj = de.run()
                     config = self._hp_ranges.from_ndarray(best)
 
-                elif self.acq_optimizer == "rs_with_replacement":
-                    values = []
-                    X = []
-                    for i in range(self.feval_acq):
-                        xi = self._hp_ranges.random_config(self.random_state)
-                        X.append(xi)
-                        values.append(self.loss(self._hp_ranges.to_ndarray(xi))[0])
-
-                    ind = np.array(values).argmin()
-                    config = X[ind]
                 else:
-
-                    # sample random configurations without replacement
-                    values = []
-                    X = []
-                    counter = 0
-                    while len(values) < self.feval_acq and counter < 10:
-                        xi = self._hp_ranges.random_config(self.random_state)
-                        if xi not in X:
-                            X.append(xi)
-                            values.append(self.loss(self._hp_ranges.to_ndarray(xi))[0])
-                            counter = 0
-                        else:
+                    if self.acq_optimizer == "rs_with_replacement":
+                        X = self._hp_ranges.random_configs(
+                            self.random_state, self.feval_acq
+                        )
+                    else:
+                        # sample random configurations without replacement
+                        X = self._sample_configs_without_replacement()
+                        if len(X) < self.feval_acq:
                             logging.warning(
-                                "Re-sampled the same configuration. Retry..."
+                                f"Only {len(X)} instead of {self.feval_acq} configurations "
+                                f"sampled to optimize the acquisition function"
                             )
-                            counter += 1  # we stop sampling if after 10 retires we are not able to find a new config
-                    if len(values) < self.feval_acq:
-                        logging.warning(
-                            f"Only {len(values)} instead of {self.feval_acq} configurations "
-                            f"sampled to optimize the acquisition function"
-                        )
-                    ind = np.array(values).argmin()
+                    # score all candidates with a single call of the classifier
+                    values = self.loss(self._hp_ranges.to_ndarray_matrix(X))
+                    ind = np.argmin(values)
                     config = X[ind]
 
         opt_time = time.time() - start_time
@@ -227,6 +226,36 @@ class Bore(SearcherWithRandomSeed):
 
         return config
 
+    def _sample_configs_without_replacement(self) -> List[Dict]:
+        """
+        Samples up to `feval_acq` distinct random configurations. Duplicates
+        are detected by hashing match strings. Configurations are drawn in
+        batches, and sampling stops once 10 draws in a row have been duplicates.
+
+        :return: List of distinct configurations
+        """
+        configs = []
+        match_strings = set()
+        counter = 0
+        while len(configs) < self.feval_acq and counter < 10:
+            batch = self._hp_ranges.random_configs(
+                self.random_state, self.feval_acq - len(configs)
+            )
+            for config in batch:
+                match_str = self._hp_ranges.config_to_match_string(config)
+                if match_str not in match_strings:
+                    match_strings.add(match_str)
+                    configs.append(config)
+                    counter = 0
+                else:
+                    logging.warning("Re-sampled the same configuration. Retry...")
+                    # we stop sampling if after 10 retries we are not able to find
+                    # a new config
+                    counter += 1
+                    if counter >= 10:
+                        break
+        return configs
+
     def train_model(self, train_data, train_targets):
 
         start_time = time.time()
@@ -245,9 +274,9 @@ class Bore(SearcherWithRandomSeed):
             self.model = CalibratedClassifierCV(
                 self.model, cv=2, method=self.calibration
             )
-            self.model.fit(X, np.array(z, dtype=np.int))
+            self.model.fit(X, np.array(z, dtype=int))
         else:
-            self.model.fit(X, np.array(z, dtype=np.int))
+            self.model.fit(X, np.array(z, dtype=int))
 
         z_hat = self.model.predict(X)
         accuracy = np.mean(z_hat == z)
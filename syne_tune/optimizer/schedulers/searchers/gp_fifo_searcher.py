@@ -142,6 +142,7 @@ class ModelBasedSearcher(SearcherWithRandomSeed):
         num_initial_random_choices: int = DEFAULT_NUM_INITIAL_RANDOM_EVALUATIONS,
         initial_scoring: Optional[str] = None,
         skip_local_optimization: bool = False,
+        num_local_starts: int = 1,
         cost_attr: Optional[str] = None,
         resource_attr: Optional[str] = None,
         filter_observed_data: Optional[ConfigurationFilter] = None,
@@ -160,6 +161,7 @@ class ModelBasedSearcher(SearcherWithRandomSeed):
         self._debug_log = model_factory.debug_log
         self.initial_scoring = check_initial_candidates_scorer(initial_scoring)
         self.skip_local_optimization = skip_local_optimization
+        self.num_local_starts = num_local_starts
         # Create state transformer
         # Initial state is empty (note that the state is mutable)
         if init_state is None:
@@ -524,16 +526,42 @@ class GPFIFOSearcher(ModelBasedSearcher):
         function is skipped, and the top-tanked initial candidate is returned
         instead. In this case, `initial_scoring='acq_func'` makes most sense,
         otherwise the acquisition function will not be used.
+    num_local_starts : int
+        Number of top-ranked distinct initial candidates from which local
+        optimization of the acquisition function is started. If larger than
+        1, all of them are optimized jointly (in batch mode), and the best
+        result is returned. Defaults to 1
     opt_nstarts : int
         Parameter for hyperparameter fitting. Number of random restarts
+    opt_nworkers : int
+        Parameter for hyperparameter fitting. If >1, random restarts are run
+        in parallel, using a thread pool of this size. Defaults to 1
     opt_maxiter : int
         Parameter for hyperparameter fitting. Maximum number of iterations
         per restart
     opt_warmstart : bool
         Parameter for hyperparameter fitting. If True, each fitting is started
         from the previous optimum. Not recommended in general
+    opt_restart_period : int
+        Parameter for hyperparameter fitting. Only used if
+        `opt_warmstart == True`. If >1, random restarts are done only every
+        K-th fitting, while otherwise a single optimization is started from
+        the previous optimum. This reduces fitting time as data grows.
+        Defaults to 1
     opt_verbose : bool
         Parameter for hyperparameter fitting. If True, lots of output
+    max_size_data_for_model : int
+        If given, the surrogate model is fit to a subset of at most this many
+        observations, so that the cost of `get_config` is bounded even for
+        very many observations (this is relevant for multi-fidelity searchers,
+        where each report is an observation). The subset consists of the
+        best observations, see `max_size_top_fraction`, and others sampled at
+        random. By default, all observations are used.
+        Not supported for `model` in `['gp_issm', 'gp_expdecay']`
+    max_size_top_fraction : float
+        Only if `max_size_data_for_model` is given. Fraction of the subset
+        made up by the observations with the best metric values. Defaults
+        to 0.25
     opt_skip_init_length : int
         Parameter for hyperparameter fitting, skip predicate. Fitting is never
         skipped as long as number of observations below this threshold
@@ -700,6 +728,7 @@ class GPFIFOSearcher(ModelBasedSearcher):
             profiler=self.profiler,
             sample_unique_candidates=False,
             debug_log=self.debug_log,
+            num_local_starts=self.num_local_starts,
         )
         # Next candidate decision
         _config = bo_algorithm.next_candidates()
@@ -810,6 +839,7 @@ class GPFIFOSearcher(ModelBasedSearcher):
                     duplicate_detector=DuplicateDetectorIdentical(),
                     sample_unique_candidates=False,
                     debug_log=self.debug_log,
+                    num_local_starts=self.num_local_starts,
                 )
                 # Next candidate decision
                 _configs = bo_algorithm.next_candidates()
@@ -843,6 +873,7 @@ class GPFIFOSearcher(ModelBasedSearcher):
             num_initial_random_choices=self.num_initial_random_choices,
             initial_scoring=self.initial_scoring,
             skip_local_optimization=self.skip_local_optimization,
+            num_local_starts=self.num_local_starts,
             cost_attr=self._cost_attr,
             resource_attr=self._resource_attr,
             filter_observed_data=self._filter_observed_data,
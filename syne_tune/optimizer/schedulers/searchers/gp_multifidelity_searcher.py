@@ -116,14 +116,24 @@ class GPMultiFidelitySearcher(GPFIFOSearcher):
         See :class:`GPFIFOSearcher`
     skip_local_optimization : str
         See :class:`GPFIFOSearcher`
+    num_local_starts : int
+        See :class:`GPFIFOSearcher`
     opt_nstarts : int
         See :class:`GPFIFOSearcher`
+    opt_nworkers : int
+        See :class:`GPFIFOSearcher`
     opt_maxiter : int
         See :class:`GPFIFOSearcher`
     opt_warmstart : bool
         See :class:`GPFIFOSearcher`
+    opt_restart_period : int
+        See :class:`GPFIFOSearcher`
     opt_verbose : bool
         See :class:`GPFIFOSearcher`
+    max_size_data_for_model : int
+        See :class:`GPFIFOSearcher`
+    max_size_top_fraction : float
+        See :class:`GPFIFOSearcher`
     opt_skip_init_length : int
         See :class:`GPFIFOSearcher`
     opt_skip_period : int
@@ -157,6 +157,8 @@ def _create_gp_common(hp_ranges: HyperparameterRanges, **kwargs):
         lbfgs_maxiter=kwargs["opt_maxiter"],
         verbose=kwargs["opt_verbose"],
         n_starts=kwargs["opt_nstarts"],
+        n_workers=kwargs["opt_nworkers"],
+        restart_period=kwargs["opt_restart_period"],
     )
     if kwargs.get("profiler", False):
         profiler = SimpleProfiler()
@@ -183,6 +185,7 @@ def _create_gp_model_factory(
     result: dict,
     hp_ranges_for_prediction: Optional[HyperparameterRanges],
     active_metric: Optional[str],
+    random_seed: int,
     **kwargs,
 ):
     filter_observed_data = result["filter_observed_data"]
@@ -196,6 +199,9 @@ def _create_gp_model_factory(
         filter_observed_data=filter_observed_data,
         no_fantasizing=kwargs.get("no_fantasizing", False),
         hp_ranges_for_prediction=hp_ranges_for_prediction,
+        max_size_data_for_model=kwargs.get("max_size_data_for_model"),
+        max_size_top_fraction=kwargs["max_size_top_fraction"],
+        random_seed=random_seed,
     )
     return {
         "model_factory": model_factory,
@@ -248,6 +254,7 @@ def _create_gp_standard_model(
         result=result,
         hp_ranges_for_prediction=hp_ranges_for_prediction,
         active_metric=active_metric,
+        random_seed=random_seed,
         **kwargs,
     )
 
@@ -292,6 +299,7 @@ def _create_gp_independent_model(
         result=result,
         hp_ranges_for_prediction=hp_ranges_for_prediction,
         active_metric=active_metric,
+        random_seed=random_seed,
         **kwargs,
     )
 
@@ -304,6 +312,13 @@ def _create_gp_additive_model(
     config_space_ext,
     **kwargs,
 ):
+    max_size_data_for_model = kwargs.get("max_size_data_for_model")
+    if max_size_data_for_model is not None:
+        logger.warning(
+            f"max_size_data_for_model = {max_size_data_for_model} is not "
+            f"supported for model = '{model}' and is ignored. The model is fit "
+            "to all observations"
+        )
     result = _create_gp_common(hp_ranges, **kwargs)
     if model == "gp_issm":
         res_model = IndependentISSModelParameters(
@@ -455,7 +470,12 @@ def _create_common_objects(model=None, is_hypertune=False, **kwargs):
         )
     result["num_initial_candidates"] = kwargs["num_init_candidates"]
     result["num_initial_random_choices"] = kwargs["num_init_random"]
-    for k in ("initial_scoring", "cost_attr", "skip_local_optimization"):
+    for k in (
+        "initial_scoring",
+        "cost_attr",
+        "skip_local_optimization",
+        "num_local_starts",
+    ):
         result[k] = kwargs[k]
 
     return result
@@ -779,7 +799,9 @@ def _common_defaults(
         "profiler": False,
         "opt_maxiter": 50,
         "opt_nstarts": 2,
+        "opt_nworkers": 1,
         "opt_warmstart": False,
+        "opt_restart_period": 1,
         "opt_verbose": False,
         "opt_debug_writer": False,
         "num_fantasy_samples": 20,
@@ -788,6 +810,8 @@ def _common_defaults(
         "num_init_candidates": DEFAULT_NUM_INITIAL_CANDIDATES,
         "initial_scoring": DEFAULT_INITIAL_SCORING,
         "skip_local_optimization": False,
+        "num_local_starts": 1,
+        "max_size_top_fraction": 0.25,
         "debug_log": True,
         "cost_attr": "elapsed_time",
         "normalize_targets": True,
@@ -819,7 +843,9 @@ def _common_defaults(
         "profiler": Boolean(),
         "opt_maxiter": Integer(1, None),
         "opt_nstarts": Integer(1, None),
+        "opt_nworkers": Integer(1, None),
         "opt_warmstart": Boolean(),
+        "opt_restart_period": Integer(1, None),
         "opt_verbose": Boolean(),
         "opt_debug_writer": Boolean(),
         "num_fantasy_samples": Integer(1, None),
@@ -827,6 +853,9 @@ def _common_defaults(
         "num_init_candidates": Integer(5, None),
         "initial_scoring": Categorical(choices=tuple(SUPPORTED_INITIAL_SCORING)),
         "skip_local_optimization": Boolean(),
+        "num_local_starts": Integer(1, None),
+        "max_size_data_for_model": Integer(2, None),
+        "max_size_top_fraction": Float(0.0, 1.0),
         "debug_log": Boolean(),
         "normalize_targets": Boolean(),
     }
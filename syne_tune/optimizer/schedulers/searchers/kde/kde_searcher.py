@@ -22,11 +22,48 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.utils.debug_log import (
     DebugLogPrinter,
 )
 
-__all__ = ["KernelDensityEstimator"]
+__all__ = ["KernelDensityEstimator", "kde_pdf"]
 
 logger = logging.getLogger(__name__)
 
 
+def kde_pdf(kde: sm.nonparametric.KDEMultivariate, data_predict: np.ndarray):
+    """
+    Evaluates the density of a fitted `KDEMultivariate` at all rows of
+    `data_predict` at once. This computes the same values as `kde.pdf`, for
+    the default kernels (Gaussian for continuous, Wang-Ryzin for ordered,
+    Aitchison-Aitken for unordered variables), but avoids the loop over
+    evaluation points.
+
+    :param kde: Fitted KDE
+    :param data_predict: Evaluation points, shape `(n, d)`
+    :return: Density values, shape `(n,)`
+    """
+    data = kde.data
+    data_predict = np.asarray(data_predict, dtype=np.float64).reshape(-1, data.shape[1])
+    # Product kernel values, shape `(n, nobs)`
+    kernel_values = np.ones((data_predict.shape[0], data.shape[0]))
+    cont_bw_prod = 1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for pos, (vartype, bw) in enumerate(zip(kde.var_type, kde.bw)):
+            data_col = data[:, pos]
+            diff = data_predict[:, pos].reshape(-1, 1) - data_col.reshape(1, -1)
+            is_equal = diff == 0
+            if vartype == "c":
+                kernel_values *= np.exp(-(diff**2) / (bw**2 * 2.0)) / np.sqrt(
+                    2 * np.pi
+                )
+                cont_bw_prod *= bw
+            elif vartype == "o":
+                kernel_values *= np.where(
+                    is_equal, 1 - bw, 0.5 * (1 - bw) * (bw ** np.abs(diff))
+                )
+            else:
+                num_levels = np.unique(data_col).size
+                kernel_values *= np.where(is_equal, 1 - bw, bw / (num_levels - 1))
+    return kernel_values.sum(axis=1) / cont_bw_prod / kde.nobs
+
+
 class KernelDensityEstimator(SearcherWithRandomSeed):
     """
     Fits two kernel density estimators (KDE) to model the density of the top N
@@ -131,6 +168,9 @@ class KernelDensityEstimator(SearcherWithRandomSeed):
 
         self.good_kde = None
         self.bad_kde = None
+        # Cache for the fitted KDEs, see :meth:`_fitted_kdes`
+        self._kde_models = None
+        self._kde_num_data = None
 
         self.vartypes = []
 
@@ -264,7 +304,7 @@ class KernelDensityEstimator(SearcherWithRandomSeed):
         suggestion = self._next_initial_config()
 
         if suggestion is None:
-            models = self.train_kde(np.array(self.X), np.array(self.y))
+            models = self._fitted_kdes()
 
             if models is None or self.random_state.rand() < self.random_fraction:
                 # return random candidate because a) we don't have enough data points or
@@ -276,68 +316,82 @@ class KernelDensityEstimator(SearcherWithRandomSeed):
             else:
                 self.bad_kde = models[0]
                 self.good_kde = models[1]
-                l = self.good_kde.pdf
-                g = self.bad_kde.pdf
-
-                acquisition_function = lambda x: max(1e-32, g(x)) / max(l(x), 1e-32)
-
-                current_best = None
-                val_current_best = None
-                for i in range(self.num_candidates):
-                    idx = self.random_state.randint(0, len(self.good_kde.data))
-                    mean = self.good_kde.data[idx]
-                    candidate = []
-
-                    for m, bw, t in zip(mean, self.good_kde.bw, self.vartypes):
-                        bw = max(bw, self.min_bandwidth)
-                        vartype = t[0]
-                        domain = t[1]
-                        if vartype == "c":
-                            # continuous parameter
-                            bw = self.bandwidth_factor * bw
-                            candidate.append(
-                                sps.truncnorm.rvs(
-                                    -m / bw,
-                                    (1 - m) / bw,
-                                    loc=m,
-                                    scale=bw,
-                                    random_state=self.random_state,
-                                )
-                            )
-                        else:
-                            # categorical or integer parameter
-                            if self.random_state.rand() < (1 - bw):
-                                candidate.append(m)
-                            else:
-                                if vartype == "o":
-                                    # integer
-                                    sample = self.random_state.randint(
-                                        domain[0], domain[1]
-                                    )
-                                    sample = (sample - domain[0]) / (
-                                        domain[1] - domain[0]
-                                    )
-                                    candidate.append(sample)
-                                elif vartype == "u":
-                                    # categorical
-                                    candidate.append(
-                                        self.random_state.randint(domain) / domain
-                                    )
-                    val = acquisition_function(candidate)
-
-                    if not np.isfinite(val):
-                        logging.warning(
-                            "candidate has non finite acquisition function value"
-                        )
-
-                    if val_current_best is None or val_current_best > val:
-                        current_best = candidate
-                        val_current_best = val
-
+                candidates = self._sample_candidates()
+                # Acquisition function is the ratio g(x) / l(x), evaluated for
+                # all candidates at once
+                l_values = kde_pdf(self.good_kde, candidates)
+                g_values = kde_pdf(self.bad_kde, candidates)
+                values = np.maximum(g_values, 1e-32) / np.maximum(l_values, 1e-32)
+                is_finite = np.isfinite(values)
+                if not np.all(is_finite):
+                    logging.warning(
+                        "candidate has non finite acquisition function value"
+                    )
+                    values = np.where(is_finite, values, np.inf)
+                current_best = candidates[np.argmin(values)]
                 suggestion = self.from_feature(feature_vector=current_best)
 
         return suggestion
 
+    def _fitted_kdes(self):
+        """
+        The KDEs are refit only if new data has arrived since the last call.
+        Data is only ever appended to `X`, `y`, so the number of observations
+        identifies the data the cached models have been fit on.
+
+        :return: Result of :meth:`train_kde` for the current data
+        """
+        num_data = len(self.X)
+        if self._kde_num_data != num_data:
+            self._kde_models = self.train_kde(np.array(self.X), np.array(self.y))
+            self._kde_num_data = num_data
+        return self._kde_models
+
+    def _sample_candidates(self) -> np.ndarray:
+        """
+        Samples `num_candidates` candidates around data points of the good KDE.
+        Continuous parameters are drawn from truncated Normals, categorical or
+        integer parameters are kept with probability `1 - bw`, otherwise drawn
+        uniformly at random.
+
+        :return: Candidates, shape `(num_candidates, d)`
+        """
+        data = self.good_kde.data
+        bw = np.maximum(self.good_kde.bw, self.min_bandwidth)
+        num_candidates = self.num_candidates
+        idx = self.random_state.randint(0, data.shape[0], size=num_candidates)
+        candidates = data[idx].copy()
+        is_continuous = np.array([t[0] == "c" for t in self.vartypes])
+        if np.any(is_continuous):
+            means = candidates[:, is_continuous]
+            scales = self.bandwidth_factor * bw[is_continuous]
+            candidates[:, is_continuous] = sps.truncnorm.rvs(
+                -means / scales,
+                (1 - means) / scales,
+                loc=means,
+                scale=scales,
+                size=means.shape,
+                random_state=self.random_state,
+            )
+        for pos, (vartype, domain) in enumerate(self.vartypes):
+            if vartype == "c":
+                continue
+            resample = self.random_state.rand(num_candidates) >= 1 - bw[pos]
+            num_resample = np.sum(resample)
+            if num_resample == 0:
+                continue
+            if vartype == "o":
+                # integer
+                samples = self.random_state.randint(
+                    domain[0], domain[1], size=num_resample
+                )
+                samples = (samples - domain[0]) / (domain[1] - domain[0])
+            else:
+                # categorical
+                samples = self.random_state.randint(domain, size=num_resample) / domain
+            candidates[resample, pos] = samples
+        return candidates
+
     def train_kde(self, train_data, train_targets):
 
         if train_data.shape[0] < self.num_min_data_points:
@@ -144,6 +144,10 @@ class HyperparameterRanges:
         raise NotImplementedError()
 
     def to_ndarray_matrix(self, configs: Iterable[Configuration]) -> np.ndarray:
+        """
+        :param configs: Configs to encode
+        :return: Matrix of encoded HP vectors, shape `(n, ndarray_size)`
+        """
         return np.vstack([self.to_ndarray(config) for config in configs])
 
     @property
@@ -201,6 +205,22 @@ class HyperparameterRanges:
             for config in self._random_configs(random_state, num_configs)
         ]
 
+    def random_ndarray_matrix(
+        self, random_state: RandomState, num_configs: int
+    ) -> np.ndarray:
+        """
+        Samples `num_configs` random configs, in the same way as
+        :meth:`random_configs`, but returns them in encoded form. Use
+        :meth:`from_ndarray` to decode rows of the matrix. Implementations
+        may sample directly into the encoded representation, which is much
+        faster than sampling and then encoding configs.
+
+        :param random_state: PRN generator
+        :param num_configs: Number of configs to sample
+        :return: Matrix of encoded HP vectors, shape `(num_configs, ndarray_size)`
+        """
+        return self.to_ndarray_matrix(self.random_configs(random_state, num_configs))
+
     def get_ndarray_bounds(self) -> List[Tuple[float, float]]:
         """
         Returns (lower, upper) bounds for each dimension in ndarray vector
@@ -10,9 +10,10 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Tuple, Dict, List, Any, Optional, Union
+from typing import Tuple, Dict, List, Any, Optional, Union, Sequence, Iterable
 import numpy as np
 from autograd import numpy as anp
+from numpy.random import RandomState
 
 from syne_tune.config_space import (
     Domain,
@@ -50,6 +51,15 @@ class HyperparameterRange:
     def to_ndarray(self, hp: Hyperparameter) -> np.ndarray:
         raise NotImplementedError
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        """
+        Encodes several values at once.
+
+        :param hps: Values to encode
+        :return: Encoded values, shape `(len(hps), ndarray_size())`
+        """
+        return np.vstack([self.to_ndarray(hp) for hp in hps])
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         raise NotImplementedError
 
@@ -139,6 +149,19 @@ class HyperparameterRangeContinuous(HyperparameterRange):
             result = np.clip((hp_internal - lower) / (upper - lower), 0.0, 1.0)
         return np.array([result])
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        hps = np.asarray(hps, dtype=np.float64)
+        assert np.all(
+            (self.lower_bound - EPS <= hps) & (hps <= self.upper_bound + EPS)
+        ), self
+        lower, upper = self.lower_internal, self.upper_internal
+        if upper == lower:
+            result = np.zeros_like(hps)
+        else:
+            hps_internal = self.scaling.to_internal(hps)
+            result = np.clip((hps_internal - lower) / (upper - lower), 0.0, 1.0)
+        return result.reshape((-1, 1))
+
     def from_ndarray(self, ndarray: np.ndarray) -> Hyperparameter:
         return scale_from_zero_one(
             ndarray.item(),
@@ -213,6 +236,9 @@ class HyperparameterRangeInteger(HyperparameterRange):
     def to_ndarray(self, hp: Hyperparameter) -> np.ndarray:
         return self._continuous_range.to_ndarray(float(hp))
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        return self._continuous_range.to_ndarray_matrix(hps)
+
     def _round_to_int(self, value: float) -> int:
         return int(np.clip(round(value), self.lower_bound, self.upper_bound))
 
@@ -305,6 +331,19 @@ class HyperparameterRangeFiniteRange(HyperparameterRange):
     def to_ndarray(self, hp: Hyperparameter) -> np.ndarray:
         return self._range_int.to_ndarray(self._map_to_int(hp))
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        hps = np.asarray(hps, dtype=np.float64)
+        if self._step_internal == 0:
+            hps_int = np.zeros_like(hps)
+        else:
+            y_int = np.clip(
+                self._scaling.to_internal(hps),
+                self._lower_internal,
+                self._upper_internal,
+            )
+            hps_int = np.round((y_int - self._lower_internal) / self._step_internal)
+        return self._range_int.to_ndarray_matrix(hps_int)
+
     def from_ndarray(self, ndarray: np.ndarray) -> Hyperparameter:
         int_val = self._range_int.from_ndarray(ndarray)
         return self._map_from_int(int_val)
@@ -342,6 +381,16 @@ class HyperparameterRangeCategorical(HyperparameterRange):
         self.choices = list(choices)
         self.num_choices = len(self.choices)
         assert self.num_choices > 0
+        # Maps values to positions in `choices` (first one, if there are
+        # duplicates), for encoding many values at once
+        self._choice_to_index = dict()
+        for pos, choice in enumerate(self.choices):
+            self._choice_to_index.setdefault(choice, pos)
+
+    def _indices_of_choices(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        indices = [self._choice_to_index.get(hp) for hp in hps]
+        assert None not in indices, "{} not all in {}".format(hps, self)
+        return np.array(indices, dtype=np.int64)
 
     @staticmethod
     def _assert_value_type(value):
@@ -418,6 +467,12 @@ class HyperparameterRangeCategoricalNonBinary(HyperparameterRangeCategorical):
         result[idx] = 1.0
         return result
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        indices = self._indices_of_choices(hps)
+        result = np.zeros(shape=(indices.size, self.num_choices))
+        result[np.arange(indices.size), indices] = 1.0
+        return result
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == self.num_choices, (cand_ndarray, self)
         return self.choices[int(np.argmax(cand_ndarray))]
@@ -477,6 +532,9 @@ class HyperparameterRangeCategoricalBinary(HyperparameterRangeCategorical):
         idx = self.choices.index(hp)
         return self._range_int.to_ndarray(idx)
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        return self._range_int.to_ndarray_matrix(self._indices_of_choices(hps))
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == 1
         return self.choices[self._range_int.from_ndarray(cand_ndarray)]
@@ -501,6 +559,9 @@ class HyperparameterRangeOrdinalEqual(HyperparameterRangeCategorical):
         idx = self.choices.index(hp)
         return self._range_int.to_ndarray(idx)
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        return self._range_int.to_ndarray_matrix(self._indices_of_choices(hps))
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == 1
         return self.choices[self._range_int.from_ndarray(cand_ndarray)]
@@ -537,6 +598,11 @@ class HyperparameterRangeOrdinalNearestNeighbor(HyperparameterRangeCategorical):
             np.log(float(hp)) if self.log_scale else float(hp)
         )
 
+    def to_ndarray_matrix(self, hps: Sequence[Hyperparameter]) -> np.ndarray:
+        self._indices_of_choices(hps)  # Checks that values are valid
+        hps = np.asarray(hps, dtype=np.float64)
+        return self._range_int.to_ndarray_matrix(np.log(hps) if self.log_scale else hps)
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == 1
         return self._domain_int.cast_int(self._range_int.from_ndarray(cand_ndarray))
@@ -659,6 +725,45 @@ class HyperparameterRangesImpl(HyperparameterRanges):
         ]
         return np.hstack(pieces)
 
+    def to_ndarray_matrix(self, configs: Iterable[Configuration]) -> np.ndarray:
+        """
+        Encodes column by column, each hyperparameter for all configs at once.
+
+        :param configs: Configs to encode
+        :return: Matrix of encoded HP vectors, shape `(n, ndarray_size)`
+        """
+        configs = list(configs)
+        return np.hstack(
+            [
+                hp_range.to_ndarray_matrix(
+                    [config[hp_range.name] for config in configs]
+                )
+                for hp_range in self._hp_ranges
+            ]
+        )
+
+    def random_ndarray_matrix(
+        self, random_state: RandomState, num_configs: int
+    ) -> np.ndarray:
+        """
+        Samples each hyperparameter for all configs at once, using the
+        vectorized sampler of its domain, and encodes the values column by
+        column. No config dictionaries are created.
+        """
+        columns = []
+        for hp_range in self._hp_ranges:
+            name = hp_range.name
+            if self._fix_attribute_value(name):
+                values = [self.value_for_last_pos] * num_configs
+            else:
+                values = self.config_space_for_sampling[name].sample(
+                    size=num_configs, random_state=random_state
+                )
+                if num_configs == 1:
+                    values = [values]
+            columns.append(hp_range.to_ndarray_matrix(values))
+        return np.hstack(columns)
+
     def from_ndarray(self, enc_config: np.ndarray) -> Configuration:
         """
         Converts a config from internal ndarray representation (fed to the GP)
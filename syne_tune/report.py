@@ -12,12 +12,14 @@
 # permissions and limitations under the License.
 import os
 import re
+import struct
 import sys
 import numpy as np
 import json
 import logging
 from ast import literal_eval
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Union
 from time import time, perf_counter
 from dataclasses import dataclass
 
@@ -28,6 +30,7 @@ from syne_tune.constants import (
     ST_WORKER_COST,
     ST_WORKER_TIMESTAMP,
     ST_WORKER_ITER,
+    ST_METRICS_CHANNEL_ENV,
 )
 
 # this is required so that metrics are written
@@ -49,6 +52,13 @@ class Reporter:
     add_cost: bool = True
 
     def __post_init__(self):
+        # If the back-end provides a metrics channel, reports are written there
+        # instead of stdout
+        channel_path = os.getenv(ST_METRICS_CHANNEL_ENV)
+        if channel_path:
+            self._metrics_channel = MetricsChannelWriter(channel_path)
+        else:
+            self._metrics_channel = None
         if self.add_time:
             self.start = perf_counter()
             self.iter = 0
@@ -102,7 +112,10 @@ class Reporter:
                 kw[ST_WORKER_COST] = seconds_spent * self.dollar_cost
         kw[ST_WORKER_ITER] = self.iter
         self.iter += 1
-        _report_logger(**kw)
+        if self._metrics_channel is not None:
+            self._metrics_channel(kw)
+        else:
+            _report_logger(**kw)
 
 
 def _report_logger(**kwargs):
@@ -110,6 +123,11 @@ def _report_logger(**kwargs):
     sys.stdout.flush()
 
 
+def _np_encoder(object):
+    if isinstance(object, np.generic):
+        return object.item()
+
+
 def _serialize_report_dict(report_dict: dict) -> str:
     """
     :param report_dict: a dictionary of metrics to be serialized
@@ -117,12 +135,7 @@ def _serialize_report_dict(report_dict: dict) -> str:
     if the dictionary values are not JSON-serializable
     """
     try:
-
-        def np_encoder(object):
-            if isinstance(object, np.generic):
-                return object.item()
-
-        report_str = json.dumps(report_dict, default=np_encoder)
+        report_str = json.dumps(report_dict, default=_np_encoder)
         assert sys.getsizeof(report_str) < 50_000
         return report_str
     except TypeError as e:
@@ -146,3 +159,164 @@ def retrieve(log_lines: List[str]) -> List[Dict[str, float]]:
     for metric_values in re.findall(regex, "\n".join(log_lines)):
         metrics.append(json.loads(metric_values))
     return metrics
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+class IncrementalMetricsRetriever:
+    """
+    Retrieves metrics reported with `_report_logger` from a log file which is
+    growing over time (e.g., `std.out` of a running trial). In contrast to
+    `retrieve`, which parses the whole log at every call, this class remembers
+    the byte offset of the file up to which results have been parsed already,
+    as well as a partial trailing line (if any). Each call of `read_new` only
+    reads and decodes bytes appended since the previous call, so the cost per
+    call does not grow with the size of the log.
+
+    All metrics retrieved so far are maintained in `metrics`, this list is
+    extended in place.
+
+    :param path: Path of log file. It is OK for the file not to exist (yet)
+    """
+
+    MARKER = b"[tune-metric]"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.metrics = []
+        self._offset = 0
+        self._partial_line = b""
+
+    def has_new_data(self) -> bool:
+        """
+        :return: Has the log grown since the last call of `read_new`?
+        """
+        return _file_size(self.path) > self._offset
+
+    def read_new(self, flush: bool = False) -> List[Dict[str, float]]:
+        """
+        :param flush: If True, a trailing line not terminated by a newline is
+            parsed as well. Use this once the process writing the log has
+            finished
+        :return: List of metrics appended to the log since the last call
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        self._offset += len(data)
+        if not data and not (flush and self._partial_line):
+            return []
+        lines = (self._partial_line + data).split(b"\n")
+        if flush:
+            self._partial_line = b""
+        else:
+            self._partial_line = lines.pop()
+        # Only lines containing the marker are decoded
+        new_metrics = retrieve(
+            log_lines=[
+                line.decode("utf-8", errors="replace")
+                for line in lines
+                if self.MARKER in line
+            ]
+        )
+        self.metrics.extend(new_metrics)
+        return new_metrics
+
+
+# Each record of the metrics channel is prefixed by its length in bytes
+_CHANNEL_HEADER = struct.Struct("<I")
+
+
+class MetricsChannelWriter:
+    """
+    Writes reports to an append-only file of length-prefixed records, which is
+    read by the back-end with :class:`MetricsChannelReader`. Each record
+    consists of a 4-byte little-endian length, followed by the JSON encoding
+    of the report. Compared to printing to stdout, records do not have to be
+    searched for in the training log, and there is no limit on their size.
+
+    The file is opened once and kept open without buffering, so that each
+    report is written with a single system call and is visible to the
+    back-end right away.
+
+    :param path: Path of channel file
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab", buffering=0)
+
+    def __call__(self, report_dict: dict):
+        try:
+            payload = json.dumps(report_dict, default=_np_encoder).encode("utf-8")
+        except TypeError as e:
+            print("The dictionary set to be reported does not seem to be serializable.")
+            raise e
+        self._file.write(_CHANNEL_HEADER.pack(len(payload)) + payload)
+
+    def close(self):
+        self._file.close()
+
+
+class MetricsChannelReader:
+    """
+    Reads reports written by :class:`MetricsChannelWriter`. Same as
+    :class:`IncrementalMetricsRetriever`, only bytes appended since the last
+    call of `read_new` are read, and an incomplete trailing record is kept
+    until the remainder has been written.
+
+    All metrics retrieved so far are maintained in `metrics`, this list is
+    extended in place.
+
+    :param path: Path of channel file. It is OK for the file not to exist (yet)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.metrics = []
+        self._offset = 0
+        self._partial_record = b""
+
+    def has_new_data(self) -> bool:
+        """
+        :return: Has the channel grown since the last call of `read_new`?
+        """
+        return _file_size(self.path) > self._offset
+
+    def read_new(self, flush: bool = False) -> List[Dict[str, float]]:
+        """
+        :param flush: Ignored, since incomplete records cannot be parsed
+        :return: List of metrics appended to the channel since the last call
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        if not data:
+            return []
+        self._offset += len(data)
+        buffer = self._partial_record + data
+        header_size = _CHANNEL_HEADER.size
+        new_metrics = []
+        pos = 0
+        while pos + header_size <= len(buffer):
+            (length,) = _CHANNEL_HEADER.unpack_from(buffer, pos)
+            end = pos + header_size + length
+            if end > len(buffer):
+                break
+            new_metrics.append(json.loads(buffer[pos + header_size : end]))
+            pos = end
+        self._partial_record = buffer[pos:]
+        self.metrics.extend(new_metrics)
+        return new_metrics
@@ -14,7 +14,7 @@ import logging
 import numpy as np
 
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
 from syne_tune.tuning_status import TuningStatus
 
@@ -171,6 +171,13 @@ class PlateauStopper(object):
             self.multiplier = 1
         else:
             self.multiplier = -1
+        # The trajectory is maintained incrementally, see
+        # `_update_trajectory`
+        self._status = None
+        self._rows_version = None
+        self._row_positions = dict()
+        self._row_values = []
+        self._running_best = []
 
     def __call__(self, status: TuningStatus) -> bool:
 
@@ -179,18 +186,8 @@ class PlateauStopper(object):
         if status.num_trials_finished == 0:
             return False
 
-        trials = status.trial_rows
-        trajectory = []
-        curr_best = None
-
-        for ti in trials.values():
-            if self._metric in ti:
-                y = self.multiplier * ti[self._metric]
-                if curr_best is None or y < curr_best:
-                    curr_best = y
-                trajectory.append(curr_best)
-
-        top_values = trajectory[-self._num_trials :]
+        self._update_trajectory(status)
+        top_values = self._top_values()
         # If the current iteration has to stop
         has_plateaued = (
             len(top_values) == self._num_trials and np.std(top_values) <= self._std
@@ -205,3 +202,55 @@ class PlateauStopper(object):
         # and then call the method that re-executes
         # the checks, including the iterations.
         return has_plateaued and self._iterations >= self._patience
+
+    def _update_trajectory(self, status: TuningStatus):
+        """
+        The trajectory is the running best of the metric over the rows of
+        `status.trial_rows` which contain the metric. We maintain the metric
+        value and the running best for every row, and only recompute the
+        running best from the first row which changed since the last call.
+        Rows of running trials are the most recent ones, so this is much
+        cheaper than recomputing the whole trajectory.
+        """
+        trial_ids = None
+        if self._status is status and self._rows_version is not None:
+            trial_ids = status.trial_ids_of_rows_updated_since(self._rows_version)
+        trials = status.trial_rows
+        if trial_ids is None:
+            # Recompute from scratch
+            self._row_positions = dict()
+            self._row_values = []
+            self._running_best = []
+            trial_ids = list(trials.keys())
+        first_changed = len(self._row_values)
+        for trial_id in trial_ids:
+            row = trials[trial_id]
+            value = self.multiplier * row[self._metric] if self._metric in row else None
+            pos = self._row_positions.get(trial_id)
+            if pos is None:
+                pos = len(self._row_values)
+                self._row_positions[trial_id] = pos
+                self._row_values.append(value)
+                self._running_best.append(None)
+            else:
+                self._row_values[pos] = value
+            first_changed = min(first_changed, pos)
+        curr_best = self._running_best[first_changed - 1] if first_changed > 0 else None
+        for pos in range(first_changed, len(self._row_values)):
+            y = self._row_values[pos]
+            if y is not None and (curr_best is None or y < curr_best):
+                curr_best = y
+            self._running_best[pos] = curr_best
+        # We keep a reference, since `id(status)` may be reused by a different
+        # object once `status` has been deleted
+        self._status = status
+        self._rows_version = status.rows_version
+
+    def _top_values(self) -> List[float]:
+        top_values = []
+        pos = len(self._row_values) - 1
+        while pos >= 0 and len(top_values) < self._num_trials:
+            if self._row_values[pos] is not None:
+                top_values.append(self._running_best[pos])
+            pos -= 1
+        return top_values[::-1]
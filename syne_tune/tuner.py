@@ -12,10 +12,13 @@
 # permissions and limitations under the License.
 import json
 import logging
+import os
+import threading
 import time
 from collections import OrderedDict
 from pathlib import Path
 from typing import List, Callable, Tuple, Optional, Dict, Set
+from contextlib import nullcontext
 import dill as dill
 
 from syne_tune.backend.trial_backend import TrialBackend
@@ -23,7 +26,12 @@ from syne_tune.backend.trial_status import Status, Trial
 from syne_tune.config_space import to_dict, Domain
 from syne_tune.constants import ST_TUNER_CREATION_TIMESTAMP, ST_TUNER_START_TIMESTAMP
 from syne_tune.optimizer.scheduler import SchedulerDecision, TrialScheduler
-from syne_tune.tuner_callback import TunerCallback, StoreResultsCallback
+from syne_tune.tuner_callback import (
+    TunerCallback,
+    StoreResultsCallback,
+    TunerProfilingCallback,
+)
+from syne_tune.tuner_journal import TunerJournal
 from syne_tune.tuning_status import TuningStatus, print_best_metric_found
 from syne_tune.util import (
     RegularCallback,
@@ -55,6 +63,9 @@ class Tuner:
         metadata: Optional[dict] = None,
         suffix_tuner_name: bool = True,
         save_tuner: bool = True,
+        event_driven: bool = False,
+        snapshot_interval: Optional[float] = None,
+        background_snapshots: bool = False,
     ):
         """
         Allows to run an tuning job, call `run` after initializing.
@@ -87,6 +98,24 @@ class Tuner:
         :param save_tuner: If True, the `Tuner` object is serialized at the end
             of tuning, including its dependencies (e.g., scheduler). This allows
             all details of the experiment to be recovered
+        :param event_driven: If True, when all workers are busy, the tuner
+            blocks in `trial_backend.wait_for_events` until a new result
+            arrives or a trial finishes, but at most `sleep_time` seconds.
+            Otherwise, it always sleeps for `sleep_time` seconds. For back-ends
+            which do not support waiting for events, both are the same
+        :param snapshot_interval: Only if `save_tuner` is True. If given, the
+            tuner is not serialized as a whole every `results_update_interval`
+            seconds. Instead, events of the tuning loop (trials started,
+            results observed) are appended to a journal, and a full snapshot
+            `tuner.dill` is written only every `snapshot_interval` seconds.
+            `Tuner.load` restores the state by loading the snapshot and
+            replaying the journal. Replaying calls the scheduler in the same
+            way as the tuning loop did, so it assumes that the scheduler is
+            deterministic given its state (random seeds are part of the state)
+        :param background_snapshots: If True, snapshots are written to file
+            in a background thread. The tuner is still serialized in the
+            tuning loop, so that the snapshot is consistent. If the previous
+            snapshot is still being written, the next one is skipped
         """
         self.trial_backend = trial_backend
         self.scheduler = scheduler
@@ -98,6 +127,9 @@ class Tuner:
         self.wait_trial_completion_when_stopping = wait_trial_completion_when_stopping
         self.metadata = self._enrich_metadata(metadata)
         self.save_tuner = save_tuner
+        self.event_driven = event_driven
+        self.snapshot_interval = snapshot_interval
+        self.background_snapshots = background_snapshots
 
         self.max_failures = max_failures
         self.print_update_interval = print_update_interval
@@ -127,6 +159,9 @@ class Tuner:
 
         self.tuning_status = None
         self.tuner_saver = None
+        self._journal = None
+        self._snapshot_thread = None
+        self._profiler = None
 
     def run(self):
         """
@@ -147,21 +182,42 @@ class Tuner:
                     "tuning status (last metric is reported)\n" + str(tuning_status)
                 ),
             )
-            # saves the tuner every results_update_interval seconds
+            # saves the tuner every results_update_interval seconds, or every
+            # snapshot_interval seconds if events are written to a journal
             if self.save_tuner:
+                if self.snapshot_interval is not None:
+                    if self._journal is None:
+                        self._journal = TunerJournal(self.tuner_path)
+                    save_interval = self.snapshot_interval
+                else:
+                    save_interval = self.results_update_interval
                 self.tuner_saver = RegularCallback(
-                    callback=lambda tuner: tuner.save(),
-                    call_seconds_frequency=self.results_update_interval,
+                    callback=lambda tuner: tuner.save(
+                        background=tuner.background_snapshots
+                    ),
+                    call_seconds_frequency=save_interval,
                 )
 
             self.metadata[ST_TUNER_START_TIMESTAMP] = time.time()
 
             for callback in self.callbacks:
                 callback.on_tuning_start(self)
+            # Phases of the tuner loop are timed if a profiling callback is used
+            self._profiler = next(
+                (
+                    callback
+                    for callback in self.callbacks
+                    if isinstance(callback, TunerProfilingCallback)
+                ),
+                None,
+            )
 
             self.tuner_path.mkdir(exist_ok=True, parents=True)
 
             self._save_metadata()
+            if self._journal is not None:
+                # The journal can only be replayed on top of a snapshot
+                self.save()
 
             done_trials_statuses = OrderedDict()
             # `running_trial_ids` contains the ids of all trials currently running,
@@ -188,7 +244,8 @@ class Tuner:
 
                 if new_results and self.save_tuner:
                     # Save tuner state only if there have been new results
-                    self.tuner_saver(tuner=self)
+                    with self._profile("save_tuner"):
+                        self.tuner_saver(tuner=self)
 
                 # update the list of done trials and remove those from `running_trials_ids`
                 # Note: It is important to update `running_trials_ids` before
@@ -221,7 +278,7 @@ class Tuner:
                                 f"Stopping criterion reached, waiting for completion of running trials "
                                 f"{running_trials_ids}"
                             )
-                        self._sleep()
+                        self._sleep(running_trials_ids)
                     else:
                         break
                 else:
@@ -236,12 +293,14 @@ class Tuner:
                             "Tuning is finishing as the whole configuration space got exhausted."
                         )
 
-                self.status_printer(self.tuning_status)
+                with self._profile("status_printer"):
+                    self.status_printer(self.tuning_status)
 
                 for callback in self.callbacks:
                     callback.on_loop_end()
 
-                stop_condition_reached = self._stop_condition()
+                with self._profile("stop_condition"):
+                    stop_condition_reached = self._stop_condition()
         except Exception as e:
             logger.error(
                 "An error happened during the tuning, cleaning up resources and logging final resources "
@@ -281,10 +340,28 @@ class Tuner:
                 f"Tuning finished, results of trials can be found on {self.tuner_path}"
             )
 
-    def _sleep(self):
-        time.sleep(self.sleep_time)
-        for callback in self.callbacks:
-            callback.on_tuning_sleep(self.sleep_time)
+    def _profile(self, phase: str):
+        """
+        :param phase: Phase of the tuner loop, see `TunerProfilingCallback`
+        :return: Context manager which records the time spent in its block for
+            `phase`, if a `TunerProfilingCallback` is used
+        """
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.phase_timer(phase)
+
+    def _sleep(self, running_trials_ids: Set[int]):
+        with self._profile("sleep"):
+            if self.event_driven:
+                sleep_time = self.trial_backend.wait_for_events(
+                    trial_ids=list(running_trials_ids), timeout=self.sleep_time
+                )
+            else:
+                time.sleep(self.sleep_time)
+                sleep_time = self.sleep_time
+        with self._profile("callbacks"):
+            for callback in self.callbacks:
+                callback.on_tuning_sleep(sleep_time)
 
     @staticmethod
     def _set_metadata(metadata: dict, name: str, value):
@@ -336,15 +413,21 @@ class Tuner:
         """
 
         # fetch new results
-        trial_status_dict, new_results = self.trial_backend.fetch_status_results(
-            trial_ids=list(running_trials_ids)
-        )
-
-        for callback in self.callbacks:
-            callback.on_fetch_status_results(
-                trial_status_dict=trial_status_dict, new_results=new_results
+        with self._profile("fetch_status_results"):
+            trial_status_dict, new_results = self.trial_backend.fetch_status_results(
+                trial_ids=list(running_trials_ids)
             )
 
+        if self._journal is not None:
+            with self._profile("save_tuner"):
+                self._journal_new_results(trial_status_dict, new_results)
+
+        with self._profile("callbacks"):
+            for callback in self.callbacks:
+                callback.on_fetch_status_results(
+                    trial_status_dict=trial_status_dict, new_results=new_results
+                )
+
         assert len(running_trials_ids) <= self.n_workers
 
         # Gets list of trials that are done with the new results.
@@ -359,9 +442,10 @@ class Tuner:
         trial_status_dict.update(done_trials_statuses)
 
         # update status with new results and all done trials
-        self.tuning_status.update(
-            trial_status_dict=trial_status_dict, new_results=new_results
-        )
+        with self._profile("tuning_status"):
+            self.tuning_status.update(
+                trial_status_dict=trial_status_dict, new_results=new_results
+            )
 
         return done_trials_statuses, new_results
 
@@ -379,7 +463,7 @@ class Tuner:
                 f"{num_running_trials} of {self.n_workers} workers are "
                 f"busy, wait for {self.sleep_time} seconds"
             )
-            self._sleep()
+            self._sleep(running_trials_ids)
 
         else:
             # Schedule as many trials as we have free workers
@@ -393,17 +477,29 @@ class Tuner:
         :return: the trial-id of the task suggested, None if the scheduler was done.
         """
         trial_id = self.trial_backend.new_trial_id()
-        suggestion = self.scheduler.suggest(trial_id=trial_id)
+        with self._profile("scheduler_suggest"):
+            suggestion = self.scheduler.suggest(trial_id=trial_id)
         if suggestion is None:
             logger.info("Searcher ran out of candidates, tuning job is stopping.")
             raise StopIteration
         elif suggestion.spawn_new_trial_id:
             # we schedule a new trial, possibly using the checkpoint of `checkpoint_trial_id`
             # if given.
-            trial = self.trial_backend.start_trial(
-                config=suggestion.config.copy(),
-                checkpoint_trial_id=suggestion.checkpoint_trial_id,
-            )
+            with self._profile("start_trial"):
+                trial = self.trial_backend.start_trial(
+                    config=suggestion.config.copy(),
+                    checkpoint_trial_id=suggestion.checkpoint_trial_id,
+                )
+            if self._journal is not None:
+                with self._profile("save_tuner"):
+                    self._journal.append(
+                        dict(
+                            kind="suggest",
+                            trial_id=trial_id,
+                            suggestion=suggestion,
+                            trial=self._trial_for_journal(trial),
+                        )
+                    )
             self.scheduler.on_trial_add(trial=trial)
             logger.info(f"(trial {trial_id}) - scheduled {suggestion}")
             return trial_id
@@ -413,9 +509,21 @@ class Tuner:
             if suggestion.config is not None:
                 log_msg += f" with new_config = {suggestion.config}"
             logger.info(log_msg)
-            self.trial_backend.resume_trial(
-                trial_id=suggestion.checkpoint_trial_id, new_config=suggestion.config
-            )
+            if self._journal is not None:
+                with self._profile("save_tuner"):
+                    self._journal.append(
+                        dict(
+                            kind="suggest",
+                            trial_id=trial_id,
+                            suggestion=suggestion,
+                            trial=None,
+                        )
+                    )
+            with self._profile("start_trial"):
+                self.trial_backend.resume_trial(
+                    trial_id=suggestion.checkpoint_trial_id,
+                    new_config=suggestion.config,
+                )
             return suggestion.checkpoint_trial_id
 
     def _handle_failure(self, done_trials_statuses: Dict[int, Tuple[Trial, str]]):
@@ -429,31 +537,175 @@ class Tuner:
                 logger.error(stderr)
                 raise ValueError(f"Trial - {trial_id} failed")
 
-    def save(self, folder: Optional[str] = None):
+    def save(self, folder: Optional[str] = None, background: bool = False):
+        """
+        Serializes the tuner to `tuner.dill`. If events are written to a
+        journal (see `snapshot_interval`), this snapshot replaces the journal
+        written so far.
+
+        :param folder: Directory to write to. Defaults to `tuner_path`
+        :param background: If True, the serialized tuner is written to file in
+            a background thread. If the previous snapshot is still being
+            written, this one is skipped
+        """
         if folder is None:
             tuner_serialized_path = self.tuner_path / "tuner.dill"
         else:
             tuner_serialized_path = Path(folder) / "tuner.dill"
-        with open(tuner_serialized_path, "wb") as f:
-            logger.debug(f"saving tuner in {tuner_serialized_path}")
-            dill.dump(self, f)
-            self.trial_backend.on_tuner_save()  # callback
+        if self._snapshot_thread is not None:
+            if background and self._snapshot_thread.is_alive():
+                logger.debug("Skipping snapshot, previous one is still written")
+                return
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+        first_segment = None
+        if self._journal is not None and folder is None:
+            # Events from now on are appended to a new segment, earlier ones
+            # are part of the snapshot
+            first_segment = self._journal.start_new_segment()
+        logger.debug(f"saving tuner in {tuner_serialized_path}")
+        data = dill.dumps(self)
+        self.trial_backend.on_tuner_save()  # callback
+        if background:
+            self._snapshot_thread = threading.Thread(
+                target=self._write_snapshot,
+                args=(data, tuner_serialized_path, first_segment),
+            )
+            self._snapshot_thread.start()
+        else:
+            self._write_snapshot(data, tuner_serialized_path, first_segment)
+
+    def _write_snapshot(
+        self, data: bytes, tuner_serialized_path: Path, first_segment: Optional[int]
+    ):
+        # Write to a temporary file first, so that a valid snapshot is
+        # available at any time
+        tmp_path = tuner_serialized_path.parent / (tuner_serialized_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, tuner_serialized_path)
+        if first_segment is not None:
+            self._journal.remove_segments_before(first_segment)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_snapshot_thread"] = None
+        return state
+
+    def __setstate__(self, state):
+        # Tuners serialized by earlier versions lack some attributes
+        defaults = dict(
+            event_driven=False,
+            snapshot_interval=None,
+            background_snapshots=False,
+            _journal=None,
+            _snapshot_thread=None,
+            _profiler=None,
+        )
+        self.__dict__.update(defaults)
+        self.__dict__.update(state)
 
     @staticmethod
     def load(tuner_path: Optional[str]):
         with open(Path(tuner_path) / "tuner.dill", "rb") as f:
             tuner = dill.load(f)
             tuner.tuner_path = Path(experiment_path(tuner_name=tuner.name))
-            return tuner
+        if tuner._journal is not None:
+            tuner._journal.path = Path(tuner_path)
+            tuner._replay_journal()
+            tuner._journal.path = tuner.tuner_path
+        for callback in tuner.callbacks:
+            callback.on_tuner_loaded(tuner)
+        return tuner
+
+    @staticmethod
+    def _trial_for_journal(trial: Trial) -> Trial:
+        # `TrialResult` objects contain all metrics reported so far
+        return Trial(
+            trial_id=trial.trial_id,
+            config=trial.config,
+            creation_time=trial.creation_time,
+        )
+
+    def _journal_new_results(
+        self,
+        trial_status_dict: Dict[int, Tuple[Trial, str]],
+        new_results: List[Tuple[int, dict]],
+    ):
+        last_status = self.tuning_status.last_trial_status_seen
+        if new_results or any(
+            status != last_status.get(trial_id)
+            for trial_id, (_, status) in trial_status_dict.items()
+        ):
+            self._journal.append(
+                dict(
+                    kind="results",
+                    trial_status_dict={
+                        trial_id: (self._trial_for_journal(trial), status)
+                        for trial_id, (trial, status) in trial_status_dict.items()
+                    },
+                    new_results=new_results,
+                )
+            )
+
+    def _replay_journal(self):
+        """
+        Replays the events in the journal, which were recorded after the
+        snapshot was taken. Scheduler, tuning status and the bookkeeping of
+        the back-end are updated as in the tuning loop, but no trials are
+        started, stopped or paused, and callbacks are not called.
+        """
+        num_events = 0
+        for event in self._journal.events(self._journal.segment):
+            if event["kind"] == "suggest":
+                trial_id = event["trial_id"]
+                suggestion = event["suggestion"]
+                replayed_suggestion = self.scheduler.suggest(trial_id=trial_id)
+                if replayed_suggestion != suggestion:
+                    logger.warning(
+                        f"Replaying journal: scheduler suggests {replayed_suggestion} "
+                        f"for trial_id {trial_id}, but {suggestion} was recorded. "
+                        "The state of the scheduler may not be restored exactly"
+                    )
+                if suggestion.spawn_new_trial_id:
+                    trial = event["trial"]
+                    self.trial_backend.on_tuner_replay_start_trial(trial)
+                    self.scheduler.on_trial_add(trial=trial)
+                else:
+                    self.trial_backend.on_tuner_replay_resume_trial(
+                        trial_id=suggestion.checkpoint_trial_id,
+                        new_config=suggestion.config,
+                    )
+            else:
+                trial_status_dict = event["trial_status_dict"]
+                new_results = event["new_results"]
+                done_trials_statuses = self._update_running_trials(
+                    trial_status_dict, new_results, callbacks=[], replay=True
+                )
+                trial_status_dict.update(done_trials_statuses)
+                self.tuning_status.update(
+                    trial_status_dict=trial_status_dict, new_results=new_results
+                )
+                self.trial_backend.on_tuner_replay_new_results(new_results)
+            num_events += 1
+        # Events of the resumed tuning loop must not be appended to segments
+        # which have been replayed already
+        last_segment = self._journal.last_segment()
+        if last_segment is not None:
+            self._journal.segment = max(self._journal.segment, last_segment)
+        logger.info(f"Replayed {num_events} events from the tuner journal")
 
     def _update_running_trials(
         self,
         trial_status_dict: Dict[int, Tuple[Trial, str]],
         new_results: List[Tuple[int, dict]],
         callbacks: List[TunerCallback],
+        replay: bool = False,
     ) -> Dict[int, Tuple[Trial, str]]:
         """
         Updates schedulers with new results and sends decision to stop/pause trials to the backend.
+        If `replay` is True, this is called when replaying the journal, and
+        the backend is not called.
         :return: dictionary mapping trial-ids that are finished to status.
         Trials can be finished because:
          1) the scheduler decided to stop or pause.
@@ -470,29 +722,41 @@ class Tuner:
 
                 # communicate new result to the searcher and the scheduler
                 self.last_seen_result_per_trial[trial_id] = result
-                decision = self.scheduler.on_trial_result(trial=trial, result=result)
-
-                for callback in callbacks:
-                    callback.on_trial_result(
-                        trial=trial,
-                        status=status,
-                        result=result,
-                        decision=decision,
+                with self._profile("scheduler_on_trial_result"):
+                    decision = self.scheduler.on_trial_result(
+                        trial=trial, result=result
                     )
 
+                with self._profile("callbacks"):
+                    for callback in callbacks:
+                        callback.on_trial_result(
+                            trial=trial,
+                            status=status,
+                            result=result,
+                            decision=decision,
+                        )
+
                 if decision == SchedulerDecision.STOP:
                     if status != Status.completed:
                         # we override the status immediately, this avoids calling the backend status another time to
                         # update after the change which may be expensive
                         status = Status.stopped
-                        self.trial_backend.stop_trial(trial_id=trial_id, result=result)
+                        if not replay:
+                            with self._profile("backend_stop_pause"):
+                                self.trial_backend.stop_trial(
+                                    trial_id=trial_id, result=result
+                                )
                     self.scheduler.on_trial_remove(trial=trial)
                     done_trials[trial_id] = (trial, status)
                     self.trials_scheduler_stopped.add(trial_id)
 
                 elif decision == SchedulerDecision.PAUSE:
                     status = Status.paused
-                    self.trial_backend.pause_trial(trial_id=trial_id, result=result)
+                    if not replay:
+                        with self._profile("backend_stop_pause"):
+                            self.trial_backend.pause_trial(
+                                trial_id=trial_id, result=result
+                            )
                     self.scheduler.on_trial_remove(trial=trial)
                     done_trials[trial_id] = (trial, status)
 
@@ -514,14 +778,17 @@ class Tuner:
                 ), f"trial {trial_id} completed and no metrics got observed"
                 last_result = self.last_seen_result_per_trial[trial_id]
                 if not trial_id in done_trials:
-                    self.scheduler.on_trial_complete(trial, last_result)
-                for callback in callbacks:
-                    callback.on_trial_complete(trial, last_result)
+                    with self._profile("scheduler_on_trial_result"):
+                        self.scheduler.on_trial_complete(trial, last_result)
+                with self._profile("callbacks"):
+                    for callback in callbacks:
+                        callback.on_trial_complete(trial, last_result)
                 done_trials[trial_id] = (trial, status)
 
             if status == Status.failed:
                 logger.info(f"Trial trial_id {trial_id} failed.")
-                self.scheduler.on_trial_error(trial)
+                with self._profile("scheduler_on_trial_result"):
+                    self.scheduler.on_trial_error(trial)
                 done_trials[trial_id] = (trial, status)
 
             # For the case when the trial is stopped independently of the scheduler, we choose to use
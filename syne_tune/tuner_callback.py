@@ -10,22 +10,48 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import json
 import numbers
 import os
+from array import array
+from collections import defaultdict
+from functools import partial
 from time import perf_counter
 from typing import Dict, List, Tuple, Optional
 import copy
 import logging
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 
 from syne_tune.backend.trial_status import Trial
-from syne_tune.constants import ST_DECISION, ST_TRIAL_ID, ST_STATUS, ST_TUNER_TIME
+from syne_tune.constants import (
+    ST_DECISION,
+    ST_TRIAL_ID,
+    ST_STATUS,
+    ST_TUNER_TIME,
+    ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_JOURNAL_FILENAME,
+    ST_TUNER_PROFILE_FILENAME,
+    ST_TUNER_PROFILE_SUMMARY_FILENAME,
+)
 from syne_tune.util import RegularCallback
 
 logger = logging.getLogger(__name__)
 
 
 class TunerCallback:
+    def on_tuner_loaded(self, tuner):
+        """
+        Called by `Tuner.load` once a tuner has been restored from its
+        snapshot (and journal). If tuning is resumed, `on_tuning_start` is
+        called afterwards.
+
+        :param tuner: Tuner which has been loaded
+        """
+        pass
+
     def on_tuning_start(self, tuner):
         pass
 
@@ -78,6 +104,43 @@ class TunerCallback:
         pass
 
 
+def _json_default(value):
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return str(value)
+
+
+def append_results_to_journal(results: List[dict], journal_file: Path):
+    """
+    Appends results to a journal file, one JSON record per line.
+
+    :param results: results to be appended
+    :param journal_file: path of journal file, is created if it does not exist
+    """
+    lines = [json.dumps(result, default=_json_default) + "\n" for result in results]
+    with open(journal_file, "a") as f:
+        f.writelines(lines)
+
+
+def read_results_journal(journal_file: Path) -> List[dict]:
+    """
+    Reads results written by :func:`append_results_to_journal`. A truncated
+    last line (for example, if the process writing the journal was killed)
+    is ignored.
+
+    :param journal_file: path of journal file
+    :return: list of results, in the order they were appended
+    """
+    results = []
+    with open(journal_file, "r") as f:
+        for line in f:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt line in {journal_file}: {line}")
+    return results
+
+
 class StoreResultsCallback(TunerCallback):
     def __init__(
         self,
@@ -87,11 +150,27 @@ class StoreResultsCallback(TunerCallback):
         Minimal callback that enables plotting results over time,
         additional callback functionalities will be added as well as example to plot results over time.
 
+        Results are appended to a journal file `results.jsonl` every
+        `tuner.results_update_interval` seconds, so that only new results are
+        written, and only these are kept in memory. At the end of tuning, all
+        results are also written to `results.csv.zip`. This file is not
+        refreshed during tuning, use :func:`syne_tune.experiments.load_experiment`
+        or `results`, which read the journal.
+
+        If the tuner is resumed after `Tuner.load`, results are appended to
+        the journal. Otherwise, a journal left at the same path by an old
+        experiment is removed.
+
         :param add_wallclock_time: whether to add wallclock time to results.
         """
-        self.results = []
+        self._new_results = []
+        self._journal_started = False
+        # Number of results written to the journal
+        self._num_stored_results = 0
+        self._tuner_loaded = False
 
         self.csv_file = None
+        self.journal_file = None
         self.save_results_at_frequency = None
         self.add_wallclock_time = add_wallclock_time
         self._start_time_stamp = None
@@ -118,22 +197,83 @@ class StoreResultsCallback(TunerCallback):
 
         self._set_time_fields(result)
 
-        self.results.append(result)
+        self._new_results.append(result)
 
-        if self.csv_file is not None:
+        if self.journal_file is not None:
             self.save_results_at_frequency()
 
     def store_results(self):
-        if self.csv_file is not None:
-            self.dataframe().to_csv(self.csv_file, index=False)
+        """
+        Appends results received since the last call to the journal file.
+        """
+        if self.journal_file is not None and self._new_results:
+            self.journal_file.parent.mkdir(exist_ok=True, parents=True)
+            append_results_to_journal(self._new_results, self.journal_file)
+            self._journal_started = True
+            self._num_stored_results += len(self._new_results)
+            self._new_results = []
+
+    @property
+    def results(self) -> List[dict]:
+        """
+        :return: all results received so far. Results already stored are
+            read back from the journal file every time, they are not kept in
+            memory
+        """
+        if self._journal_started and self.journal_file.exists():
+            return read_results_journal(self.journal_file) + self._new_results
+        else:
+            return list(self._new_results)
+
+    def __setstate__(self, state):
+        # Callbacks serialized before these members existed
+        state.setdefault("_num_stored_results", 0)
+        state.setdefault("_tuner_loaded", False)
+        self.__dict__.update(state)
+
+    def on_tuner_loaded(self, tuner):
+        self._tuner_loaded = True
+
+    def _prepare_journal_for_resume(self):
+        """
+        A partial last line (the process was killed while writing) is cut
+        off, so that appended results are not merged with it. Results in
+        `_new_results` which have been written to the journal after the
+        snapshot was taken are dropped.
+        """
+        data = self.journal_file.read_bytes()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            logger.warning(
+                f"Removing partial last line from {self.journal_file}: " f"{data[end:]}"
+            )
+            with open(self.journal_file, "rb+") as f:
+                f.truncate(end)
+        # One result per line
+        num_results = data.count(b"\n", 0, end)
+        num_already_stored = min(
+            max(num_results - self._num_stored_results, 0), len(self._new_results)
+        )
+        self._new_results = self._new_results[num_already_stored:]
+        self._num_stored_results = num_results
+        self._journal_started = True
 
     def dataframe(self) -> pd.DataFrame:
         return pd.DataFrame(self.results)
 
     def on_tuning_start(self, tuner):
-        # we set the path of the csv file once the tuner is created since the path may change when the tuner is stop
-        # and resumed again on a different machine.
-        self.csv_file = str(tuner.tuner_path / "results.csv.zip")
+        # we set the path of the result files once the tuner is created since the path may change when the tuner is
+        # stop and resumed again on a different machine.
+        self.csv_file = str(tuner.tuner_path / ST_RESULTS_DATAFRAME_FILENAME)
+        self.journal_file = tuner.tuner_path / ST_RESULTS_JOURNAL_FILENAME
+        if self.journal_file.exists():
+            if self._tuner_loaded or self._journal_started:
+                # Tuning is resumed: Results are appended
+                self._prepare_journal_for_resume()
+            else:
+                # A new experiment is using the path of an old one, whose
+                # results are overwritten
+                self.journal_file.unlink()
 
         # we only save results every `results_update_frequency` seconds as this operation
         # may be expensive on remote storage.
@@ -148,6 +288,205 @@ class StoreResultsCallback(TunerCallback):
         # store the results in case some results were not committed yet (since they are saved every
         # `results_update_interval` seconds)
         self.store_results()
+        if self.csv_file is not None:
+            self.dataframe().to_csv(self.csv_file, index=False)
+
+
+class _PhaseTimer:
+    def __init__(self, profiler: "TunerProfilingCallback", phase: str):
+        self._profiler = profiler
+        self._phase = phase
+        self._start = None
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler.record(self._phase, perf_counter() - self._start)
+
+
+class TunerProfilingCallback(TunerCallback):
+    # Phases of an iteration of the tuner loop, which are timed by the tuner
+    PHASES = (
+        "fetch_status_results",
+        "scheduler_on_trial_result",
+        "backend_stop_pause",
+        "scheduler_suggest",
+        "start_trial",
+        "callbacks",
+        "tuning_status",
+        "save_tuner",
+        "status_printer",
+        "stop_condition",
+        "sleep",
+    )
+
+    def __init__(self, flush_interval: int = 100, log_summary: bool = True):
+        """
+        Records how the time of every iteration of the tuner loop is split
+        between its phases:
+
+        * `fetch_status_results`: Fetching statuses and new results from the
+          back-end
+        * `scheduler_on_trial_result`: Passing new results, completed and
+          failed trials to the scheduler (`on_trial_result`,
+          `on_trial_complete`, ...)
+        * `backend_stop_pause`: Stopping or pausing trials in the back-end
+        * `scheduler_suggest`: Suggestions of the scheduler (`suggest`),
+          which includes the searcher
+        * `start_trial`: Starting or resuming trials in the back-end
+        * `callbacks`: Callbacks for new results and completed trials
+        * `tuning_status`: Updating the tuning status
+        * `save_tuner`: Saving the tuner (`tuner_saver`), including writing
+          the tuner journal
+        * `status_printer`: Printing the tuning status
+        * `stop_condition`: Evaluating the stopping criterion
+        * `sleep`: Waiting for workers to become free
+
+        The remaining time of an iteration is reported as `other`. For every
+        iteration, a record with total duration and number of calls of each
+        phase is appended to `tuner_profile.jsonl` in the tuner directory,
+        every `flush_interval` iterations. At the end of tuning, a summary
+        (total time, fraction of loop time, and percentiles of the duration
+        per iteration for every phase) is written to
+        `tuner_profile_summary.csv`, and logged if `log_summary` is True.
+
+        :param flush_interval: Records are appended to the file every this
+            many iterations
+        :param log_summary: Whether the summary is logged at the end of tuning
+        """
+        assert flush_interval >= 1
+        self.flush_interval = flush_interval
+        self.log_summary = log_summary
+        self.profile_file = None
+        self.summary_file = None
+        self._reset()
+
+    def _reset(self):
+        self._records = []
+        self._num_iterations = 0
+        self._start_time = None
+        self._iteration_start = None
+        self._current = dict()
+        # Duration of phases per iteration, for iterations the phase occurs in
+        self._durations = defaultdict(partial(array, "d"))
+        self._num_calls = defaultdict(int)
+
+    def phase_timer(self, phase: str) -> _PhaseTimer:
+        """
+        :param phase: Name of phase
+        :return: Context manager which records the time spent in its block
+            for `phase`
+        """
+        return _PhaseTimer(self, phase)
+
+    def record(self, phase: str, duration: float):
+        """
+        Records a call of `phase` in the current iteration of the tuner loop.
+
+        :param phase: Name of phase
+        :param duration: Time spent in the call
+        """
+        current = self._current.get(phase)
+        if current is None:
+            self._current[phase] = [duration, 1]
+        else:
+            current[0] += duration
+            current[1] += 1
+
+    def on_tuning_start(self, tuner):
+        self.profile_file = tuner.tuner_path / ST_TUNER_PROFILE_FILENAME
+        self.summary_file = tuner.tuner_path / ST_TUNER_PROFILE_SUMMARY_FILENAME
+        if self.profile_file.exists():
+            self.profile_file.unlink()
+        self._reset()
+        self._start_time = perf_counter()
+
+    def on_loop_start(self):
+        if self._iteration_start is None:
+            self._iteration_start = perf_counter()
+
+    def on_loop_end(self):
+        # An iteration spans from the end of the previous one, so that the
+        # evaluation of the stopping criterion at the end of the loop is
+        # accounted for
+        now = perf_counter()
+        iteration_time = now - self._iteration_start
+        self._iteration_start = now
+        record = {
+            "iteration": self._num_iterations,
+            "time": now - self._start_time,
+            "iteration_time": iteration_time,
+        }
+        other_time = iteration_time
+        for phase, (duration, num_calls) in self._current.items():
+            record[phase + "_time"] = duration
+            record[phase + "_num"] = num_calls
+            self._durations[phase].append(duration)
+            self._num_calls[phase] += num_calls
+            other_time -= duration
+        record["other_time"] = max(other_time, 0.0)
+        self._durations["iteration"].append(iteration_time)
+        self._durations["other"].append(record["other_time"])
+        self._current = dict()
+        self._num_iterations += 1
+        self._records.append(record)
+        if len(self._records) >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Appends records of iterations since the last call to the profile file.
+        """
+        if self.profile_file is not None and self._records:
+            self.profile_file.parent.mkdir(exist_ok=True, parents=True)
+            append_results_to_journal(self._records, self.profile_file)
+            self._records = []
+
+    def summary(self) -> pd.DataFrame:
+        """
+        :return: For every phase (and `iteration`, `other`), number of
+            iterations it occurred in, number of calls, total time, fraction
+            of time of all iterations, mean and percentiles of its duration
+            per iteration
+        """
+        total_time = sum(self._durations["iteration"])
+        rows = []
+        for phase in self.PHASES + ("other", "iteration"):
+            durations = self._durations.get(phase)
+            if not durations:
+                continue
+            durations = np.frombuffer(durations, dtype=np.float64)
+            p50, p90, p99 = np.percentile(durations, [50, 90, 99])
+            rows.append(
+                {
+                    "phase": phase,
+                    "num_iterations": durations.size,
+                    "num_calls": self._num_calls.get(phase, durations.size),
+                    "total_time": durations.sum(),
+                    "fraction": durations.sum() / total_time if total_time > 0 else 0,
+                    "mean": durations.mean(),
+                    "p50": p50,
+                    "p90": p90,
+                    "p99": p99,
+                    "max": durations.max(),
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def on_tuning_end(self):
+        self.flush()
+        if self._num_iterations == 0:
+            return
+        df = self.summary()
+        if self.summary_file is not None:
+            df.to_csv(self.summary_file, index=False)
+        if self.log_summary:
+            logger.info(
+                f"Time spent in phases of {self._num_iterations} iterations of the "
+                f"tuner loop (in seconds):\n" + df.to_string(index=False)
+            )
 
 
 class TensorboardCallback(TunerCallback):
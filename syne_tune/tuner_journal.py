@@ -0,0 +1,103 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+from pathlib import Path
+from typing import Iterator, List, Optional
+import logging
+
+import dill
+
+logger = logging.getLogger(__name__)
+
+
+class TunerJournal:
+    """
+    Append-only journal of events of the tuning loop, which complements
+    snapshots of the :class:`Tuner`. The journal is split into segments. When
+    a snapshot is taken, a new segment is started, and the snapshot records
+    its number. Once the snapshot is written, earlier segments are no longer
+    needed. A tuner is restored by loading the latest snapshot and replaying
+    the events in its segment and all later ones.
+
+    Events are dictionaries, each of which is pickled separately and appended
+    to the file of the current segment.
+
+    :param path: directory to write journal segments to
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.segment = 0
+
+    def segment_file(self, segment: int) -> Path:
+        return self.path / f"tuner-journal-{segment}.dill"
+
+    def append(self, event: dict):
+        with open(self.segment_file(self.segment), "ab") as f:
+            dill.dump(event, f)
+
+    def start_new_segment(self) -> int:
+        """
+        The new segment comes after all segments written so far, so that
+        no events are appended to an existing segment file (for example, one
+        left behind by a snapshot which was interrupted).
+
+        :return: number of the new segment, which receives all subsequent events
+        """
+        last_segment = self.last_segment()
+        if last_segment is not None:
+            self.segment = max(self.segment, last_segment)
+        self.segment += 1
+        return self.segment
+
+    def last_segment(self) -> Optional[int]:
+        """
+        :return: largest number of a segment file in `path`, or None if there
+            are none
+        """
+        segments = [self._segment_number(file) for file in self._segment_files()]
+        return max(segments) if segments else None
+
+    def _segment_files(self) -> List[Path]:
+        return list(self.path.glob("tuner-journal-*.dill"))
+
+    @staticmethod
+    def _segment_number(file: Path) -> int:
+        return int(file.stem.split("-")[-1])
+
+    def events(self, first_segment: int) -> Iterator[dict]:
+        """
+        Iterates over events of segments `first_segment`, `first_segment + 1`,
+        ..., as long as segment files exist. A truncated last event (for
+        example, if the process writing the journal was killed) is ignored.
+
+        :param first_segment: number of first segment
+        """
+        segment = first_segment
+        while self.segment_file(segment).exists():
+            with open(self.segment_file(segment), "rb") as f:
+                while True:
+                    try:
+                        yield dill.load(f)
+                    except EOFError:
+                        break
+                    except Exception:
+                        logger.warning(
+                            f"Skipping corrupt end of {self.segment_file(segment)}"
+                        )
+                        break
+            segment += 1
+
+    def remove_segments_before(self, segment: int):
+        for file in self._segment_files():
+            if self._segment_number(file) < segment:
+                file.unlink(missing_ok=True)
@@ -13,8 +13,9 @@
 import numbers
 import logging
 import time
-from collections import defaultdict, OrderedDict
-from typing import List, Dict, Tuple
+from collections import defaultdict, OrderedDict, Counter
+from itertools import islice
+from typing import List, Dict, Tuple, Optional
 import pandas as pd
 from numpy import inf as np_inf
 
@@ -67,10 +68,24 @@ class MetricsStatistics:
 class TuningStatus:
     """
     Information of a tuning job to display as progress or to use to decide whether to stop the tuning job.
+
+    Aggregates (number of trials per status, total user time and cost) are
+    maintained incrementally in :meth:`update`, so that querying them does not
+    depend on the number of trials. Rows of trials are only recomputed if the
+    trial has new results or changed its status, and a DataFrame is only
+    created in :meth:`get_dataframe`.
+
+    :param metric_names: Names of metrics reported by the trials
+    :param max_rows_to_print: If given, :meth:`__str__` only shows the rows of
+        the most recently started trials, up to this number. If None, all
+        rows are shown
     """
 
-    def __init__(self, metric_names: List[str]):
+    def __init__(
+        self, metric_names: List[str], max_rows_to_print: Optional[int] = None
+    ):
         self.metric_names = metric_names
+        self.max_rows_to_print = max_rows_to_print
         self.start_time = time.perf_counter()
 
         self.overall_metric_statistics = MetricsStatistics()
@@ -78,6 +93,100 @@ class TuningStatus:
 
         self.last_trial_status_seen = OrderedDict()
         self.trial_rows = OrderedDict({})
+        # Running aggregates
+        self._num_trials_per_status = Counter()
+        self._total_worker_metrics = {ST_WORKER_TIME: 0, ST_WORKER_COST: 0.0}
+        # Trials with new results whose rows have not been recomputed yet
+        self._stale_row_trial_ids = set()
+        # Incremented whenever a row of `trial_rows` is added or changed. The
+        # trial ids of these rows are logged, starting from version
+        # `_row_updates_offset`
+        self.rows_version = 0
+        self._row_updates = []
+        self._row_updates_offset = 0
+
+    # Maximum number of entries kept in the log of row updates
+    _MAX_ROW_UPDATES = 10000
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Objects pickled before running aggregates were introduced: these
+        # are recomputed from the statistics of all trials
+        if "_num_trials_per_status" not in state:
+            self.max_rows_to_print = None
+            self._num_trials_per_status = Counter(self.last_trial_status_seen.values())
+            self._total_worker_metrics = {ST_WORKER_TIME: 0, ST_WORKER_COST: 0.0}
+            for trial_statistics in self.trial_metric_statistics.values():
+                for name in self._total_worker_metrics.keys():
+                    self._total_worker_metrics[
+                        name
+                    ] += trial_statistics.max_metrics.get(name, 0)
+            self._stale_row_trial_ids = set()
+            self.rows_version = 0
+            self._row_updates = []
+            self._row_updates_offset = 0
+
+    def _row_updated(self, trial_id: int):
+        self._row_updates.append(trial_id)
+        self.rows_version += 1
+        if len(self._row_updates) > self._MAX_ROW_UPDATES:
+            num_dropped = len(self._row_updates) // 2
+            del self._row_updates[:num_dropped]
+            self._row_updates_offset += num_dropped
+
+    def trial_ids_of_rows_updated_since(self, rows_version: int) -> Optional[List[int]]:
+        """
+        Allows consumers of `trial_rows` to maintain derived information
+        incrementally.
+
+        :param rows_version: Value of `rows_version` at an earlier time
+        :return: Trial ids of rows added or changed since then, in order. Rows
+            are added to `trial_rows` in this order. If this information is
+            not available anymore, None is returned
+        """
+        start = rows_version - self._row_updates_offset
+        if start < 0 or rows_version > self.rows_version:
+            return None
+        return self._row_updates[start:]
+
+    def _set_trial_status(self, trial_id: int, status: str):
+        old_status = self.last_trial_status_seen.get(trial_id)
+        if old_status != status:
+            if old_status is not None:
+                self._num_trials_per_status[old_status] -= 1
+            self._num_trials_per_status[status] += 1
+            self.last_trial_status_seen[trial_id] = status
+
+    def _add_result(self, trial_id: int, result: Dict):
+        self.overall_metric_statistics.add(result)
+        trial_statistics = self.trial_metric_statistics[trial_id]
+        previous_max = {
+            name: trial_statistics.max_metrics.get(name)
+            for name in self._total_worker_metrics.keys()
+        }
+        trial_statistics.add(result)
+        for name, previous_value in previous_max.items():
+            new_value = trial_statistics.max_metrics.get(name)
+            if new_value is not None and new_value != previous_value:
+                if previous_value is None:
+                    previous_value = 0
+                self._total_worker_metrics[name] += new_value - previous_value
+
+    def _trial_row(self, trial_id: int, trial: Trial, status: str) -> Dict:
+        trial_statistics = self.trial_metric_statistics[trial_id]
+        row = {
+            "trial_id": trial_id,
+            "status": status,
+            "iter": trial_statistics.count,
+        }
+        row.update(trial.config)
+        row.update(trial_statistics.last_metrics)
+
+        if ST_WORKER_TIME in trial_statistics.max_metrics:
+            row["worker-time"] = trial_statistics.max_metrics[ST_WORKER_TIME]
+        if ST_WORKER_COST in trial_statistics.max_metrics:
+            row["worker-cost"] = trial_statistics.max_metrics[ST_WORKER_COST]
+        return row
 
     def update(
         self,
@@ -87,57 +196,45 @@ class TuningStatus:
         """
         Updates the tuning status given new statuses and results.
         """
-
-        self.last_trial_status_seen.update(
-            {k: v[1] for k, v in trial_status_dict.items()}
-        )
-
         for trial_id, new_result in new_results:
-            self.overall_metric_statistics.add(new_result)
-            self.trial_metric_statistics[trial_id].add(new_result)
+            self._add_result(trial_id, new_result)
+            self._stale_row_trial_ids.add(trial_id)
 
         for trial_id, (trial, status) in trial_status_dict.items():
-            num_metrics = self.trial_metric_statistics[trial_id].count
-            row = {
-                "trial_id": trial_id,
-                "status": status,
-                "iter": num_metrics,
-            }
-            row.update(trial.config)
-            row.update(self.trial_metric_statistics[trial_id].last_metrics)
-
-            if ST_WORKER_TIME in self.trial_metric_statistics[trial_id].max_metrics:
-                row["worker-time"] = self.trial_metric_statistics[trial_id].max_metrics[
-                    ST_WORKER_TIME
-                ]
-            if ST_WORKER_COST in self.trial_metric_statistics[trial_id].max_metrics:
-                row["worker-cost"] = self.trial_metric_statistics[trial_id].max_metrics[
-                    ST_WORKER_COST
-                ]
-
-            self.trial_rows[trial_id] = row
+            status_changed = self.last_trial_status_seen.get(trial_id) != status
+            if status_changed:
+                self._set_trial_status(trial_id, status)
+            if (
+                status_changed
+                or trial_id in self._stale_row_trial_ids
+                or trial_id not in self.trial_rows
+            ):
+                self.trial_rows[trial_id] = self._trial_row(trial_id, trial, status)
+                self._stale_row_trial_ids.discard(trial_id)
+                self._row_updated(trial_id)
 
     def mark_running_job_as_stopped(self):
         """
         Update the status of all trials still running to be marked as stop.
         """
-        self.last_trial_status_seen = {
-            k: v if v != Status.in_progress else Status.stopped
-            for k, v in self.last_trial_status_seen.items()
-        }
-        for trial_id, row in self.trial_rows.items():
-            if row["status"] == Status.in_progress:
+        running_trial_ids = [
+            trial_id
+            for trial_id, status in self.last_trial_status_seen.items()
+            if status == Status.in_progress
+        ]
+        for trial_id in running_trial_ids:
+            self._set_trial_status(trial_id, Status.stopped)
+            row = self.trial_rows.get(trial_id)
+            if row is not None:
                 row["status"] = Status.stopped
+                self._row_updated(trial_id)
 
     @property
     def num_trials_started(self):
         return len(self.last_trial_status_seen)
 
     def _num_trials(self, status: str):
-        return sum(
-            trial_status == status
-            for trial_status in self.last_trial_status_seen.values()
-        )
+        return self._num_trials_per_status[status]
 
     @property
     def num_trials_completed(self):
@@ -152,8 +249,6 @@ class TuningStatus:
         """
         :return: number of trials that finished, e.g. that completed, were stopped or are stopping, or failed
         """
-        # note it may be inefficient to query several times the dataframe in case a very large number of jobs are
-        #  present, we could query the dataframe only once
         return (
             self._num_trials(status=Status.completed)
             + self._num_trials(status=Status.stopped)
@@ -177,28 +272,14 @@ class TuningStatus:
         """
         :return: the total user time spent in the workers
         """
-        if ST_WORKER_TIME in self.overall_metric_statistics.metric_names:
-            usertime_per_trial = [
-                metric.max_metrics.get(ST_WORKER_TIME, 0)
-                for trial, metric in self.trial_metric_statistics.items()
-            ]
-            return sum(usertime_per_trial)
-        else:
-            return 0
+        return self._total_worker_metrics[ST_WORKER_TIME]
 
     @property
     def cost(self):
         """
         :return: the estimated dollar-cost spent while tuning
         """
-        if ST_WORKER_COST in self.overall_metric_statistics.metric_names:
-            cost_per_trial = [
-                metric.max_metrics.get(ST_WORKER_COST, 0)
-                for trial, metric in self.trial_metric_statistics.items()
-            ]
-            return sum(cost_per_trial)
-        else:
-            return 0.0
+        return self._total_worker_metrics[ST_WORKER_COST]
 
     def get_dataframe(self) -> pd.DataFrame:
         return pd.DataFrame(self.trial_rows.values())
@@ -207,10 +288,19 @@ class TuningStatus:
         num_running = self.num_trials_running
         num_finished = self.num_trials_started - num_running
 
-        if len(self.trial_rows) > 0:
-            df = self.get_dataframe()
+        num_rows = len(self.trial_rows)
+        if num_rows > 0:
+            if self.max_rows_to_print is None or num_rows <= self.max_rows_to_print:
+                rows = list(self.trial_rows.values())
+            else:
+                rows = list(
+                    islice(reversed(self.trial_rows.values()), self.max_rows_to_print)
+                )[::-1]
+            df = pd.DataFrame(rows)
             cols = [col for col in df.columns if not col.startswith("st_")]
             res_str = df.loc[:, cols].to_string(index=False, na_rep="-") + "\n"
+            if len(rows) < num_rows:
+                res_str += f"({num_rows - len(rows)} earlier trials not shown)\n"
         else:
             res_str = ""
         res_str += (
@@ -14,6 +14,7 @@ import tempfile
 
 import numpy as np
 import pandas as pd
+import pytest
 
 import syne_tune.config_space as sp
 
@@ -32,6 +33,7 @@ from syne_tune.blackbox_repository.blackbox_offline import (
 from syne_tune.blackbox_repository.blackbox_tabular import (
     serialize as serialize_tabular,
 )
+from syne_tune.blackbox_repository.utils import LazyBlackboxDict
 
 
 n = 10
@@ -233,6 +235,29 @@ def test_blackbox_tabular_serialization():
                 bb2.objectives_evaluations.reshape(-1),
             )
 
+        bb_dict3 = deserialize_tabular(tmpdirname, mmap_mode="r")
+        assert isinstance(bb_dict3, LazyBlackboxDict)
+        assert set(bb_dict3.keys()) == set(bb_dict.keys())
+        # Tasks are only materialized when accessed
+        assert not bb_dict3._blackboxes
+        bb3 = bb_dict3["slice"]
+        assert list(bb_dict3._blackboxes.keys()) == ["slice"]
+        assert bb_dict3["slice"] is bb3
+        assert isinstance(bb3.objectives_evaluations, np.memmap)
+        np.testing.assert_allclose(
+            bb_dict["slice"].objectives_evaluations.reshape(-1),
+            bb3.objectives_evaluations.reshape(-1),
+            rtol=1e-6,
+        )
+        res = bb3.objective_function(
+            {"hp_x1": x1[0], "hp_x2": x2[0]}, fidelity={"hp_epoch": 2}, seed=0
+        )
+        np.testing.assert_allclose(
+            list(res.values()),
+            bb_dict["slice"].objectives_evaluations[0, 0, 1],
+            rtol=1e-6,
+        )
+
         # blackbox.serialize(tmpdirname)
         # blackbox_deserialized = deserialize(tmpdirname)
         # for u, v in zip(x1, x2):
@@ -269,3 +294,50 @@ def test_blackbox_tabular():
             list(res.values()),
             objectives_evaluations[i, num_seeds - 1, num_fidelities - 1, :],
         )
+
+
+def test_blackbox_tabular_batch():
+    data = np.stack([x1, x2]).T
+    hyperparameters = pd.DataFrame(data=data, columns=["hp_x1", "hp_x2"])
+    num_seeds = 3
+    num_fidelities = 5
+    num_objectives = 2
+
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(
+        len(hyperparameters), num_seeds, num_fidelities, num_objectives
+    )
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space=cs_fidelity,
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["a", "b"],
+    )
+
+    rows = np.array([3, 0, 9, 3])
+    seeds = np.array([0, 2, 1, 1])
+    configs = hyperparameters.iloc[rows]
+    expected = objectives_evaluations[rows, seeds]
+    for configurations in [
+        configs,
+        configs.values,
+        configs.to_dict(orient="records"),
+    ]:
+        res = blackbox.objective_function_batch(configurations, seeds=seeds)
+        assert res.shape == (len(rows), num_fidelities, num_objectives)
+        assert np.allclose(res, expected)
+
+    fidelities = np.array([1, 5, 2, 2])
+    res = blackbox.objective_function_batch(configs, fidelities=fidelities, seeds=seeds)
+    assert np.allclose(res, expected[np.arange(len(rows)), fidelities - 1])
+    for i, row in enumerate(rows):
+        res_single = blackbox.objective_function(
+            configuration={"hp_x1": x1[row], "hp_x2": x2[row]},
+            fidelity={"hp_epoch": fidelities[i]},
+            seed=seeds[i],
+        )
+        assert np.allclose(list(res_single.values()), res[i])
+
+    with pytest.raises(ValueError):
+        blackbox.objective_function_batch([{"hp_x1": 0, "hp_x2": 0}])
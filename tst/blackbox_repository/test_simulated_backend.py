@@ -71,6 +71,14 @@ def test_pause_and_resume():
     pause_resources = [1, 2]
     step = max(elapsed_times[0][-1], elapsed_times[1][-1])
     print(f"elapsed_times = {elapsed_times}, step = {step}")
+    # Waiting returns the time until the next event, which is the start of
+    # the trials
+    backend.time_keeper.mark_exit()
+    np.testing.assert_almost_equal(
+        backend.wait_for_events(trial_ids=[0, 1], timeout=0),
+        backend.simulator_config.delay_start,
+        decimal=2,
+    )
     backend.time_keeper.advance(step)
     _, results = backend.fetch_status_results(trial_ids=[0, 1])
     num_found = [0, 0]
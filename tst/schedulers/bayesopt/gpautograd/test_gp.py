@@ -26,11 +26,13 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
     NOISE_VARIANCE_LOWER_BOUND,
     INVERSE_BANDWIDTHS_LOWER_BOUND,
+    OptimizationConfig,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gluon_blocks_helpers import (
     LogarithmScalarEncoding,
     PositiveScalarEncoding,
 )
+from syne_tune.optimizer.schedulers.utils.simple_profiler import SimpleProfiler
 
 
 def test_likelihood_encoding():
@@ -181,3 +183,63 @@ def test_gp_regression_2d_with_ard():
     numpy.testing.assert_almost_equal(mu_train, y_train, decimal=2)
     # Fewer decimals imposed for the test points
     numpy.testing.assert_almost_equal(mu_test, y_test, decimal=1)
+
+
+def _data_for_restarts_tests(random_state, num_data):
+    x_train = random_state.uniform(-5, 5, size=(num_data, 2))
+    y_train = anp.sin(x_train[:, 0]) + 0.1 * random_state.normal(size=num_data)
+    return {"features": x_train, "targets": y_train.reshape((-1, 1))}
+
+
+def test_parallel_restarts_same_as_sequential():
+    random_state = numpy.random.RandomState(31415927)
+    data = _data_for_restarts_tests(random_state, 30)
+    params = []
+    for n_workers in (1, 3):
+        model = GaussianProcessRegression(
+            kernel=Matern52(dimension=2, ARD=True),
+            optimization_config=OptimizationConfig(
+                lbfgs_tol=1e-6,
+                lbfgs_maxiter=100,
+                verbose=False,
+                n_starts=4,
+                n_workers=n_workers,
+            ),
+            random_seed=0,
+        )
+        model.fit(data)
+        params.append(model.get_params())
+    assert params[0].keys() == params[1].keys()
+    for name, value in params[0].items():
+        numpy.testing.assert_almost_equal(value, params[1][name])
+
+
+def test_warmstart_restart_period():
+    random_state = numpy.random.RandomState(27182818)
+    model = GaussianProcessRegression(
+        kernel=Matern52(dimension=2, ARD=True),
+        optimization_config=OptimizationConfig(
+            lbfgs_tol=1e-6,
+            lbfgs_maxiter=100,
+            verbose=False,
+            n_starts=3,
+            restart_period=3,
+        ),
+        random_seed=0,
+        fit_reset_params=False,
+    )
+    profiler = SimpleProfiler()
+    tags = []
+    for num_data in range(10, 70, 10):
+        profiler.begin_block({"num_data": num_data})
+        model.fit(_data_for_restarts_tests(random_state, num_data), profiler=profiler)
+        tags.append(list(profiler.records[-1].durations.keys()))
+    # Random restarts only for every third fit, otherwise warm-start
+    assert tags == [
+        ["fit_restarts"],
+        ["fit_warmstart"],
+        ["fit_warmstart"],
+        ["fit_restarts"],
+        ["fit_warmstart"],
+        ["fit_warmstart"],
+    ]
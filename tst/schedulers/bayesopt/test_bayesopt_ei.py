@@ -38,6 +38,9 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.models.gp_model import (
 from syne_tune.optimizer.schedulers.searchers.bayesopt.models.gp_mcmc_model import (
     GaussProcMCMCModelFactory,
 )
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms import (
+    bo_algorithm_components,
+)
 from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components import (
     LBFGSOptimizeAcquisition,
 )
@@ -291,6 +294,85 @@ def test_value_same_as_with_gradient():
         np.testing.assert_almost_equal(vec1, vec2)
 
 
+def test_gradient_batch_same_as_single():
+    # test that batch values and gradients are the same as those computed for
+    # each point separately
+    random = np.random.RandomState(31415927)
+    for model in default_models():
+        ei = EIAcquisitionFunction(model)
+        X = np.vstack(
+            (
+                random.uniform(low=0.0, high=1.0, size=(5, 2)),
+                random.uniform(low=0.0, high=0.02, size=(5, 2)),
+            )
+        )
+        fvals, gradients = ei.compute_acq_with_gradient_batch(X)
+        assert fvals.shape == (10,) and gradients.shape == (10, 2)
+        np.testing.assert_almost_equal(fvals, ei.compute_acq(X).flatten())
+        for x, fval, gradient in zip(X, fvals, gradients):
+            fval_single, gradient_single = ei.compute_acq_with_gradient(x)
+            np.testing.assert_almost_equal(fval, fval_single)
+            np.testing.assert_almost_equal(gradient, gradient_single)
+
+
+def test_optimize_batch():
+    # Starts are optimized jointly. Each result must be at least as good as
+    # its start, results must be distinct and sorted best first
+    random = np.random.RandomState(42)
+    for model in default_models():
+        ei = EIAcquisitionFunction(model)
+        hp_ranges = model.hp_ranges_for_prediction()
+        opt = LBFGSOptimizeAcquisition(hp_ranges, model, EIAcquisitionFunction)
+        initial_points = random.uniform(low=0.0, high=0.1, size=(6, 2))
+        candidates = [hp_ranges.from_ndarray(x) for x in initial_points]
+        result = opt.optimize_batch(candidates)
+        assert 1 <= len(result) <= len(candidates)
+        optimized_strs = [hp_ranges.config_to_match_string(y) for _, y in result]
+        assert len(set(optimized_strs)) == len(optimized_strs)
+        acq_starts = ei.compute_acq(
+            hp_ranges.to_ndarray_matrix([x for x, _ in result])
+        ).flatten()
+        acq_optimized = ei.compute_acq(
+            hp_ranges.to_ndarray_matrix([y for _, y in result])
+        ).flatten()
+        assert all(acq_optimized <= acq_starts + 1e-10)
+        assert all(np.diff(acq_optimized) >= -1e-10)
+        # Best result must improve on all starts
+        acq_all_starts = ei.compute_acq(initial_points).flatten()
+        assert acq_optimized[0] < np.min(acq_all_starts)
+
+
+def test_optimize_batch_abnormal_termination(monkeypatch):
+    # If the joint line search fails, the remaining starts are optimized
+    # separately
+    fmin_l_bfgs_b = bo_algorithm_components.fmin_l_bfgs_b
+    num_single_runs = [0]
+
+    def joint_fails(func, x0, **kwargs):
+        if x0.size > 2:
+            fval, grad = func(x0)
+            task = b"ABNORMAL_TERMINATION_IN_LNSRCH"
+            return x0, fval, dict(task=task, nit=1, grad=grad)
+        num_single_runs[0] += 1
+        return fmin_l_bfgs_b(func, x0=x0, **kwargs)
+
+    monkeypatch.setattr(bo_algorithm_components, "fmin_l_bfgs_b", joint_fails)
+    random = np.random.RandomState(42)
+    model = default_models(do_mcmc=False)[0]
+    ei = EIAcquisitionFunction(model)
+    hp_ranges = model.hp_ranges_for_prediction()
+    opt = LBFGSOptimizeAcquisition(hp_ranges, model, EIAcquisitionFunction)
+    initial_points = random.uniform(low=0.0, high=0.1, size=(6, 2))
+    candidates = [hp_ranges.from_ndarray(x) for x in initial_points]
+    result = opt.optimize_batch(candidates)
+    assert num_single_runs[0] == len(candidates)
+    acq_optimized = ei.compute_acq(
+        hp_ranges.to_ndarray_matrix([y for _, y in result])
+    ).flatten()
+    acq_all_starts = ei.compute_acq(initial_points).flatten()
+    assert acq_optimized[0] < np.min(acq_all_starts)
+
+
 if __name__ == "__main__":
     test_optimization_improves()
     test_numerical_gradient()
@@ -10,11 +10,16 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import logging
 import numpy as np
+import pytest
 
 from syne_tune.optimizer.schedulers.searchers.bayesopt.models.gp_model import (
     get_internal_candidate_evaluations,
 )
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
+    FantasizedPendingEvaluation,
+)
 from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
     dictionarize_objective,
     INTERNAL_METRIC_NAME,
@@ -24,6 +29,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.utils.test_objects import
     create_tuning_job_state,
 )
 from syne_tune.config_space import uniform, randint, choice, loguniform
+from syne_tune.optimizer.schedulers import HyperbandScheduler
 from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
     make_hyperparameter_ranges,
 )
@@ -66,6 +72,61 @@ def test_get_internal_candidate_evaluations():
     np.testing.assert_almost_equal(result.std, 3.283629428273267)
 
 
+def test_get_internal_candidate_evaluations_subset():
+    random_state = np.random.RandomState(31415927)
+    hp_ranges = make_hyperparameter_ranges({"a": uniform(0.0, 1.0)})
+    num_data, max_size, num_fantasy_samples = 200, 40, 5
+    values = random_state.normal(size=num_data)
+    cand_tuples = [(x,) for x in random_state.uniform(size=num_data)]
+    state = create_tuning_job_state(
+        hp_ranges=hp_ranges,
+        cand_tuples=cand_tuples,
+        metrics=[dictionarize_objective(y) for y in values],
+    )
+    kwargs = dict(
+        active_metric=INTERNAL_METRIC_NAME,
+        normalize_targets=True,
+        num_fantasy_samples=num_fantasy_samples,
+        max_size_data=max_size,
+        top_fraction=0.25,
+    )
+    result = get_internal_candidate_evaluations(state, **kwargs)
+    assert result.features.shape == (max_size, 1)
+    # Normalization is done w.r.t. all observations
+    np.testing.assert_almost_equal(result.mean, np.mean(values))
+    np.testing.assert_almost_equal(result.std, np.std(values))
+    # The best observations are part of the subset
+    targets = result.targets.reshape((-1,)) * result.std + result.mean
+    for y in np.sort(values)[:10]:
+        assert np.min(np.abs(targets - y)) < 1e-10
+    # Features and targets are selected consistently
+    value_for_x = dict((x[0], y) for x, y in zip(cand_tuples, values))
+    for x, y in zip(result.features.reshape((-1,)), targets):
+        np.testing.assert_almost_equal(value_for_x[x], y)
+    # Same subset for repeated calls
+    result2 = get_internal_candidate_evaluations(state, **kwargs)
+    np.testing.assert_equal(result.features, result2.features)
+    # Pending evaluations are always retained
+    pending_configs = [hp_ranges.tuple_to_config((x,)) for x in (0.1, 0.2)]
+    for trial_id, config in enumerate(pending_configs, start=num_data):
+        trial_id = str(trial_id)
+        state.config_for_trial[trial_id] = config
+        state.pending_evaluations.append(
+            FantasizedPendingEvaluation(
+                trial_id=trial_id,
+                fantasies={
+                    INTERNAL_METRIC_NAME: random_state.normal(
+                        size=(1, num_fantasy_samples)
+                    )
+                },
+            )
+        )
+    result = get_internal_candidate_evaluations(state, **kwargs)
+    assert result.features.shape == (max_size + 2, 1)
+    assert result.targets.shape == (max_size + 2, num_fantasy_samples)
+    np.testing.assert_almost_equal(result.features[-2:, 0], [0.1, 0.2])
+
+
 def test_dimensionality_and_warping_ranges():
     # Note: `choice` with binary value range is encoded as 1, not 2 dims
     hp_ranges = make_hyperparameter_ranges(
@@ -81,3 +142,19 @@ def test_dimensionality_and_warping_ranges():
     dim, warping_ranges = dimensionality_and_warping_ranges(hp_ranges)
     assert dim == 7
     assert warping_ranges == {1: (0.0, 1.0), 5: (0.0, 1.0)}
+
+
+@pytest.mark.parametrize("model", ["gp_issm", "gp_expdecay"])
+def test_max_size_data_for_model_not_supported(model, caplog):
+    config_space = {"x": uniform(0.0, 1.0), "epochs": 10}
+    with caplog.at_level(logging.WARNING):
+        HyperbandScheduler(
+            config_space,
+            searcher="bayesopt",
+            search_options={"model": model, "max_size_data_for_model": 10},
+            max_resource_attr="epochs",
+            resource_attr="epoch",
+            metric="loss",
+            mode="min",
+        )
+    assert "max_size_data_for_model = 10 is not supported" in caplog.text
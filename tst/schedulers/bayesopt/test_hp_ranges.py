@@ -460,3 +460,48 @@ def test_encoded_ranges():
     assert encoded_ranges["7"] == (14, 15)
     assert encoded_ranges["8"] == (15, 16)
     assert encoded_ranges["9"] == (16, 17)
+
+
+def test_columnar_encoding_and_sampling():
+    config_space = {
+        "0": uniform(1.0, 1000.0),
+        "1": loguniform(1.0, 1000.0),
+        "2": reverseloguniform(0.9, 0.9999),
+        "3": randint(1, 1000),
+        "4": lograndint(1, 1000),
+        "5": choice(["a", "b", "c"]),
+        "6": choice(["a", "b"]),
+        "7": ordinal(["a", "b", "c"]),
+        "8": logordinal([1, 10, 100]),
+        "9": finrange(0.1, 1.0, 10),
+        "10": logfinrange(1, 64, 7, cast_int=True),
+        "11": uniform(2.0, 2.0),
+    }
+    for name_last_pos, value_for_last_pos in [(None, None), ("3", 17)]:
+        hp_ranges = make_hyperparameter_ranges(
+            config_space,
+            name_last_pos=name_last_pos,
+            value_for_last_pos=value_for_last_pos,
+        )
+        random_state = np.random.RandomState(0)
+        configs = hp_ranges.random_configs(random_state, num_configs=50)
+        features = hp_ranges.to_ndarray_matrix(configs)
+        assert_allclose(
+            features, np.vstack([hp_ranges.to_ndarray(config) for config in configs])
+        )
+        random_state = np.random.RandomState(1)
+        features = hp_ranges.random_ndarray_matrix(random_state, num_configs=200)
+        assert features.shape == (200, hp_ranges.ndarray_size)
+        bounds = np.array(hp_ranges.get_ndarray_bounds())
+        assert np.all(features >= bounds[:, 0]) and np.all(features <= bounds[:, 1])
+        # Decoding and encoding again does not change features
+        decoded = [hp_ranges.from_ndarray(row) for row in features]
+        assert_allclose(hp_ranges.to_ndarray_matrix(decoded), features)
+        if value_for_last_pos is not None:
+            assert all(config["3"] == value_for_last_pos for config in decoded)
+        # Same distribution as `random_configs`
+        values = [config["1"] for config in decoded]
+        assert 3 < np.percentile(values, 25) < 10
+        assert 20 < np.percentile(values, 50) < 50
+        counts = Counter(config["5"] for config in decoded)
+        assert all(count > 40 for count in counts.values())
@@ -0,0 +1,135 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import numpy as np
+
+from syne_tune.config_space import randint, uniform
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
+    FantasizedPendingEvaluation,
+    TrialEvaluations,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.config_ext import (
+    ExtendedConfiguration,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.tuning_job_state import (
+    TuningJobState,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.learncurve.issm import (
+    PreparedDataCache,
+    prepare_data,
+    prepare_data_with_pending,
+)
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
+    make_hyperparameter_ranges,
+)
+
+
+METRIC = "metric"
+
+
+def _assert_same_data(data1, data2):
+    assert data1.keys() == data2.keys()
+    for k, v1 in data1.items():
+        v2 = data2[k]
+        if k == "features":
+            np.testing.assert_allclose(v1, v2)
+        elif k == "targets":
+            assert len(v1) == len(v2)
+            for t1, t2 in zip(v1, v2):
+                np.testing.assert_allclose(t1, t2)
+        else:
+            assert v1 == v2, (k, v1, v2)
+
+
+def test_prepare_data_with_cache():
+    config_space = {"x": uniform(0.0, 1.0), "y": randint(1, 10)}
+    hp_ranges = make_hyperparameter_ranges(config_space)
+    config_space_ext = ExtendedConfiguration(
+        hp_ranges, resource_attr_key="epoch", resource_attr_range=(1, 20)
+    )
+    random_state = np.random.RandomState(0)
+    state = TuningJobState(
+        hp_ranges=hp_ranges, config_for_trial=dict(), trials_evaluations=[]
+    )
+    data_cache = PreparedDataCache(hp_ranges)
+    num_trials = 15
+    for trial_id in range(num_trials):
+        metrics = state.metrics_for_trial(
+            str(trial_id), config=hp_ranges.random_config(random_state)
+        )
+        metrics[METRIC] = {"1": random_state.randn()}
+    for it in range(40):
+        # Append observations at the next resource levels of some trials. As
+        # done by :class:`ModelStateTransformer`, these are appended to the
+        # cache as well
+        for trial_id in random_state.choice(num_trials, size=4, replace=False):
+            trial_id = str(trial_id)
+            metric_vals = state.metrics_for_trial(trial_id).setdefault(METRIC, dict())
+            new_labels = dict()
+            for _ in range(random_state.randint(1, 3)):
+                resource = len(metric_vals) + len(new_labels) + 1
+                if resource <= 20:
+                    new_labels[str(resource)] = random_state.randn()
+            metric_vals.update(new_labels)
+            data_cache.append_observations(trial_id, {METRIC: new_labels})
+            if it > 0:
+                observed, values = data_cache._observed[(trial_id, METRIC)]
+                assert len(observed) == len(metric_vals) == values.size
+        if it == 20:
+            # Value changed without appending: Has to be invalidated
+            metric_vals = state.trials_evaluations[0].metrics[METRIC]
+            metric_vals["1"] += 1.0
+            data_cache.invalidate(state.trials_evaluations[0].trial_id)
+        for normalize_targets in (False, True):
+            kwargs = dict(
+                state=state,
+                config_space_ext=config_space_ext,
+                active_metric=METRIC,
+                normalize_targets=normalize_targets,
+            )
+            _assert_same_data(
+                prepare_data(**kwargs), prepare_data(**kwargs, data_cache=data_cache)
+            )
+    # Pending evaluations and fantasizing
+    trials_with_pending = [str(x) for x in (0, 3, 7)]
+    pending_evaluations = []
+    for trial_id in trials_with_pending:
+        metric_vals = state.metrics_for_trial(trial_id)[METRIC]
+        resource = len(metric_vals) + 1
+        pending_evaluations.append(
+            FantasizedPendingEvaluation(
+                trial_id=trial_id,
+                resource=resource,
+                fantasies={METRIC: random_state.randn(3)},
+            )
+        )
+    state = TuningJobState(
+        hp_ranges=hp_ranges,
+        config_for_trial=state.config_for_trial,
+        trials_evaluations=state.trials_evaluations,
+        pending_evaluations=pending_evaluations,
+    )
+    kwargs = dict(
+        state=state,
+        config_space_ext=config_space_ext,
+        active_metric=METRIC,
+        normalize_targets=True,
+    )
+    _assert_same_data(
+        prepare_data(**kwargs, do_fantasizing=True),
+        prepare_data(**kwargs, do_fantasizing=True, data_cache=data_cache),
+    )
+    for data1, data2 in zip(
+        prepare_data_with_pending(**kwargs),
+        prepare_data_with_pending(**kwargs, data_cache=data_cache),
+    ):
+        _assert_same_data(data1, data2)
@@ -0,0 +1,158 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import numpy as np
+
+from syne_tune.config_space import choice, randint, uniform
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
+    INTERNAL_METRIC_NAME,
+    TrialEvaluations,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.config_ext import (
+    ExtendedConfiguration,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.tuning_job_state import (
+    TuningJobState,
+)
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
+    make_hyperparameter_ranges,
+)
+
+
+def _num_observed_cases_slow(state: TuningJobState) -> int:
+    return sum(ev.num_cases() for ev in state.trials_evaluations)
+
+
+def _is_pending_slow(state: TuningJobState, trial_id: str, resource: int) -> bool:
+    return any(
+        x.trial_id == trial_id and x.resource == resource
+        for x in state.pending_evaluations
+    )
+
+
+def _assert_consistent(state: TuningJobState, num_trials: int, max_resource: int):
+    assert state.num_observed_cases() == _num_observed_cases_slow(state)
+    configs, values = state.observed_data_for_metric()
+    features, values2 = state.observed_features_for_metric()
+    if configs:
+        np.testing.assert_array_equal(
+            features, state.hp_ranges.to_ndarray_matrix(configs)
+        )
+        np.testing.assert_array_equal(values2, np.vstack(values))
+    else:
+        assert features.shape == (0, state.hp_ranges.ndarray_size)
+        assert values2.size == 0
+    for trial_id in range(num_trials):
+        trial_id = str(trial_id)
+        for resource in range(1, max_resource + 1):
+            assert state.is_pending(trial_id, resource) == _is_pending_slow(
+                state, trial_id, resource
+            )
+
+
+def test_indexed_state_matches_list_based():
+    config_space = {
+        "x": uniform(0.0, 1.0),
+        "y": randint(1, 10),
+        "z": choice(["a", "b", "c"]),
+    }
+    max_resource = 9
+    config_space_ext = ExtendedConfiguration(
+        make_hyperparameter_ranges(config_space),
+        resource_attr_key="epoch",
+        resource_attr_range=(1, max_resource),
+    )
+    hp_ranges = config_space_ext.hp_ranges_ext
+    random_state = np.random.RandomState(0)
+    state = TuningJobState.empty_state(hp_ranges)
+    num_trials = 20
+    configs = [
+        config_space_ext.hp_ranges.random_config(random_state)
+        for _ in range(num_trials)
+    ]
+    for it in range(200):
+        trial_id = random_state.randint(num_trials)
+        config = configs[trial_id]
+        trial_id = str(trial_id)
+        pos = state._find_labeled(trial_id)
+        metric_vals = (
+            dict()
+            if pos == -1
+            else state.trials_evaluations[pos].metrics.get(INTERNAL_METRIC_NAME, dict())
+        )
+        resource = len(metric_vals) + 1
+        action = random_state.randint(4)
+        if action == 0 and resource <= max_resource:
+            if not state.is_pending(trial_id, resource):
+                state.append_pending(trial_id, config=config, resource=resource)
+        elif action == 1 and resource <= max_resource:
+            # Observation at next resource level, replacing pending evaluation
+            state.remove_pending(trial_id, resource)
+            metrics = state.metrics_for_trial(trial_id, config=config)
+            metrics.setdefault(INTERNAL_METRIC_NAME, dict())[
+                str(resource)
+            ] = random_state.randn()
+        elif action == 2 and resource > 1:
+            # Remove last observation, signalling the change
+            del metric_vals[str(resource - 1)]
+            state.observed_data_changed(trial_id)
+        elif action == 3:
+            # Lists are modified from outside
+            if random_state.rand() < 0.5:
+                new_pending = [
+                    x for x in state.pending_evaluations if random_state.rand() < 0.8
+                ]
+                del state.pending_evaluations[:]
+                state.pending_evaluations.extend(new_pending)
+            elif pos != -1:
+                state.trials_evaluations.pop(pos)
+                state.trials_evaluations.append(
+                    TrialEvaluations(trial_id=trial_id, metrics=dict())
+                )
+        _assert_consistent(state, num_trials, max_resource)
+    # Shares indexes for observed data
+    new_state = state.copy_with_pending([])
+    assert new_state.num_observed_cases() == _num_observed_cases_slow(state)
+    np.testing.assert_array_equal(
+        new_state.observed_features_for_metric()[0],
+        state.observed_features_for_metric()[0],
+    )
+
+
+def test_state_pickled_without_indexes():
+    # States pickled before indexes were introduced
+    config_space = {"x": uniform(0.0, 1.0), "y": randint(1, 10)}
+    hp_ranges = make_hyperparameter_ranges(config_space)
+    random_state = np.random.RandomState(0)
+    state = TuningJobState.empty_state(hp_ranges)
+    for trial_id in range(5):
+        config = hp_ranges.random_config(random_state)
+        if trial_id < 3:
+            state.metrics_for_trial(str(trial_id), config=config)[
+                INTERNAL_METRIC_NAME
+            ] = random_state.randn()
+        else:
+            state.append_pending(str(trial_id), config=config)
+    old_state = TuningJobState.__new__(TuningJobState)
+    old_state.__setstate__(
+        {
+            k: v
+            for k, v in state.__dict__.items()
+            if k not in ("_observed_index", "_pending_index")
+        }
+    )
+    assert old_state._find_labeled("1") == 1
+    assert old_state._find_pending("4") == 1
+    assert old_state.num_observed_cases() == 3
+    old_state.remove_pending("3")
+    old_state.observed_data_changed("0")
+    assert not old_state.is_pending("3")
@@ -0,0 +1,82 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import numpy as np
+import torch
+
+from syne_tune.config_space import choice, randint, uniform
+from syne_tune.optimizer.schedulers.botorch.botorch_searcher import BotorchSearcher
+
+
+config_space = {
+    "x": uniform(0.0, 1.0),
+    "y": randint(1, 5),
+    "z": choice(["a", "b", "c"]),
+    "epochs": 10,
+}
+
+
+def _objective(config):
+    return (config["x"] - 0.3) ** 2 + 0.1 * config["y"] + 0.05 * len(config["z"])
+
+
+def test_botorch_searcher_incremental_features():
+    searcher = BotorchSearcher(
+        config_space, metric="metric", mode="min", random_seed=3141
+    )
+    configs = dict()
+    for trial_id in range(8):
+        configs[trial_id] = searcher.get_config(trial_id=str(trial_id))
+        assert configs[trial_id] is not None
+        # Results arrive out of order, some trials stay pending
+        if trial_id % 2 == 1:
+            for other_id in (trial_id, trial_id - 1):
+                searcher.on_trial_result(
+                    str(other_id),
+                    configs[other_id],
+                    {"metric": _objective(configs[other_id])},
+                    update=True,
+                )
+    assert searcher._num_features == len(configs)
+    for trial_id, config in configs.items():
+        row = searcher._trial_row[trial_id]
+        torch.testing.assert_close(
+            searcher._features[row],
+            searcher._config_to_feature_matrix([config])[0],
+        )
+    # Features of observed trials are aligned with their objective values
+    X = searcher._features[searcher._observed_rows]
+    X_expected = searcher._config_to_feature_matrix(
+        [configs[trial_id] for trial_id in searcher.trial_observations.keys()]
+    )
+    torch.testing.assert_close(X, X_expected)
+    # GP hyperparameters are kept to warm-start the next fit
+    assert searcher._gp_hyperparameters is not None
+
+
+def test_botorch_searcher_pick_acq_best_skips_seen_configs():
+    small_space = {"y": randint(1, 3), "z": choice(["a", "b"])}
+    searcher = BotorchSearcher(
+        small_space, metric="metric", mode="min", random_seed=3141
+    )
+    seen = [{"y": 1, "z": "a"}, {"y": 2, "z": "b"}, {"y": 3, "z": "a"}]
+    for trial_id, config in enumerate(seen):
+        searcher.get_config(trial_id=str(trial_id))
+        searcher.config_seen.add(searcher._config_key(config))
+
+    def acq(X):
+        # Prefers large `y`
+        return X[:, 0, 0]
+
+    for _ in range(5):
+        config = searcher._sample_and_pick_acq_best(acq)
+        assert config not in seen
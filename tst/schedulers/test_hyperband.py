@@ -12,6 +12,9 @@
 # permissions and limitations under the License.
 from datetime import datetime
 from typing import Optional, Dict, Tuple
+import pickle
+
+import numpy as np
 import pytest
 
 from syne_tune.optimizer.schedulers.hyperband import HyperbandScheduler
@@ -19,7 +22,10 @@ from syne_tune.config_space import randint, uniform
 from syne_tune.backend.trial_status import Trial
 from syne_tune.optimizer.scheduler import SchedulerDecision
 from syne_tune.optimizer.schedulers.searchers import RandomSearcher
-from syne_tune.optimizer.schedulers.hyperband_stopping import StoppingRungSystem
+from syne_tune.optimizer.schedulers.hyperband_stopping import (
+    RungData,
+    StoppingRungSystem,
+)
 from syne_tune.optimizer.schedulers.hyperband_promotion import PromotionRungSystem
 from syne_tune.optimizer.schedulers.hyperband_pasha import PASHARungSystem
 from syne_tune.optimizer.schedulers.hyperband_rush import (
@@ -226,3 +232,31 @@ def test_hyperband_scheduler_type(scheduler_type, terminator_cls, does_pause_res
     )
     assert isinstance(myscheduler.terminator._rung_systems[0], terminator_cls)
     assert myscheduler.does_pause_resume() == does_pause_resume
+
+
+@pytest.mark.parametrize("mode", ["min", "max"])
+def test_rung_data(mode):
+    random_state = np.random.RandomState(0)
+    for values in [random_state.randn(25), np.array([0.3, 0.1, 0.3, 0.2, 0.1, 0.3])]:
+        recorded = RungData(mode)
+        for trial_id, value in enumerate(values):
+            recorded[str(trial_id)] = (value, False)
+        for trial_id in ["1", "4"]:
+            recorded[trial_id] = (recorded[trial_id][0], True)
+        for q in [0.0, 0.1, 1 / 3, 0.5, 0.8, 1.0]:
+            assert recorded.quantile(q) == np.quantile(values, q)
+        # Best first, ties broken by order of insertion
+        sign = 1 if mode == "min" else -1
+        order = sorted(range(len(values)), key=lambda i: (sign * values[i], i))
+        assert [k for k, _ in recorded.best_first()] == [str(i) for i in order]
+        assert [k for k, _ in recorded.not_promoted_best_first()] == [
+            str(i) for i in order if i not in (1, 4)
+        ]
+        # Snapshots pass the data on as dict
+        assert recorded == {
+            str(i): (value, i in (1, 4)) for i, value in enumerate(values)
+        }
+        recorded_copy = pickle.loads(pickle.dumps(recorded))
+        assert list(recorded_copy.best_first()) == list(recorded.best_first())
+        del recorded["0"]
+        assert recorded.quantile(0.5) == np.quantile(values[1:], 0.5)
@@ -0,0 +1,82 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import numpy as np
+import statsmodels.api as sm
+
+from syne_tune.config_space import uniform, randint, choice
+from syne_tune.optimizer.schedulers.searchers.kde.kde_searcher import (
+    KernelDensityEstimator,
+    kde_pdf,
+)
+
+
+def test_kde_pdf_matches_statsmodels():
+    random_state = np.random.RandomState(0)
+    num_data, num_predict = 30, 20
+    data = np.column_stack(
+        [
+            random_state.rand(num_data),
+            random_state.randint(0, 5, size=num_data) / 4,
+            random_state.randint(0, 3, size=num_data) / 3,
+            random_state.rand(num_data),
+        ]
+    )
+    data_predict = np.column_stack(
+        [
+            random_state.rand(num_predict),
+            random_state.randint(0, 5, size=num_predict) / 4,
+            random_state.randint(0, 3, size=num_predict) / 3,
+            random_state.rand(num_predict),
+        ]
+    )
+    # Some evaluation points coincide with data points
+    data_predict[:5] = data[:5]
+    kde = sm.nonparametric.KDEMultivariate(
+        data=data, var_type=["c", "o", "u", "c"], bw="normal_reference"
+    )
+    kde.bw = np.clip(kde.bw, 1e-3, None)
+    np.testing.assert_allclose(
+        kde_pdf(kde, data_predict), kde.pdf(data_predict), rtol=1e-10
+    )
+
+
+def test_kde_searcher_refits_only_with_new_data():
+    config_space = {
+        "x": uniform(0.0, 1.0),
+        "n": randint(1, 10),
+        "c": choice(["a", "b", "c"]),
+    }
+    searcher = KernelDensityEstimator(
+        config_space,
+        metric="loss",
+        points_to_evaluate=[],
+        random_fraction=0.0,
+        random_seed=3,
+        debug_log=False,
+    )
+    random_state = np.random.RandomState(1)
+    for trial_id in range(40):
+        config = {
+            k: v.sample(random_state=random_state) for k, v in config_space.items()
+        }
+        searcher._update(str(trial_id), config, {"loss": random_state.rand()})
+    config = searcher.get_config()
+    models = searcher._kde_models
+    assert models is not None
+    assert set(config.keys()) == set(config_space.keys())
+    assert 0 <= config["x"] <= 1 and 1 <= config["n"] <= 10
+    searcher.get_config()
+    assert searcher._kde_models is models
+    searcher._update("40", config, {"loss": 0.0})
+    searcher.get_config()
+    assert searcher._kde_models is not models
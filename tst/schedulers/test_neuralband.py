@@ -0,0 +1,112 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+from datetime import datetime
+
+import numpy as np
+import pytest
+import torch
+
+from syne_tune.backend.trial_status import Trial
+from syne_tune.config_space import randint, uniform
+from syne_tune.optimizer.schedulers.neuralbands.networks import Exploitation
+from syne_tune.optimizer.schedulers.neuralbands.neuralband import (
+    NeuralbandScheduler,
+)
+from syne_tune.optimizer.schedulers.neuralbands.neuralband_supplement import (
+    NeuralbandEGreedyScheduler,
+)
+
+
+def test_exploitation_buffer_and_batch_prediction():
+    torch.manual_seed(0)
+    random_state = np.random.RandomState(0)
+    dim = 3
+    net = Exploitation(dim=dim, batch_size=8, max_steps=200)
+    num_data = 50
+    x1 = random_state.uniform(size=(num_data, dim))
+    budgets = random_state.uniform(size=num_data)
+    rewards = x1.sum(axis=1) * budgets / dim
+    for x, b, r in zip(x1, budgets, rewards):
+        net.add_data((x, b), r)
+    assert net.data_size == num_data
+    np.testing.assert_allclose(net.x1_data.numpy(), x1, rtol=1e-6)
+    np.testing.assert_allclose(net.b_data.numpy().ravel(), budgets, rtol=1e-6)
+    np.testing.assert_allclose(net.reward_data.numpy().ravel(), rewards, rtol=1e-6)
+    assert net.max_b == budgets.max()
+
+    def mse():
+        return np.mean(
+            [
+                (net.predict((x, b)).item() - r) ** 2
+                for x, b, r in zip(x1, budgets, rewards)
+            ]
+        )
+
+    mse_before = mse()
+    net.train()
+    assert mse() < mse_before
+    # Batch prediction agrees with one-by-one prediction
+    budget = 0.7
+    scores = net.predict_batch(x1, budget)
+    assert scores.shape == (num_data,)
+    expected = [net.predict((x, budget)).item() for x in x1]
+    np.testing.assert_allclose(scores, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_exploitation_max_train_time():
+    net = Exploitation(dim=2, batch_size=1, max_steps=100000, max_train_time=0.0)
+    for i in range(10):
+        net.add_data(([0.1 * i, 0.5], 1.0), 5.0)
+    num_calls = []
+    net.func.register_forward_hook(lambda *args: num_calls.append(1))
+    # Returns after a single step
+    net.train()
+    assert len(num_calls) == 1
+
+
+@pytest.mark.parametrize(
+    "scheduler_cls, mode",
+    [
+        (NeuralbandScheduler, "min"),
+        (NeuralbandScheduler, "max"),
+        (NeuralbandEGreedyScheduler, "min"),
+    ],
+)
+def test_neuralband_suggest_and_train(scheduler_cls, mode):
+    config_space = {"x": uniform(0.0, 1.0), "y": randint(1, 10), "epochs": 9}
+    scheduler = scheduler_cls(
+        config_space,
+        step_size=3,
+        max_while_loop=20,
+        screening_batch_size=4,
+        searcher="random",
+        metric="metric",
+        mode=mode,
+        resource_attr="epoch",
+        max_t=9,
+        random_seed=31415927,
+    )
+    random_state = np.random.RandomState(0)
+    for trial_id in range(6):
+        suggestion = scheduler.suggest(trial_id)
+        assert suggestion is not None
+        config = suggestion.config
+        assert set(config_space.keys()).issubset(config.keys())
+        trial = Trial(trial_id=trial_id, config=config, creation_time=datetime.now())
+        scheduler.on_trial_add(trial)
+        for epoch in range(1, 4):
+            metric = random_state.uniform()
+            if mode == "max":
+                metric *= 100
+            scheduler.on_trial_result(trial, dict(epoch=epoch, metric=metric))
+    assert scheduler.net.data_size > 0
@@ -87,3 +87,53 @@ def test_bore_rf():
 
     config = searcher.get_config(trial_id=10)
 """
+
+
+def test_bore_batched_random_search():
+    import numpy as np
+    import pytest
+
+    pytest.importorskip("xgboost")
+    from syne_tune.optimizer.schedulers.searchers.bore.bore import Bore
+    from syne_tune.config_space import randint, uniform
+
+    config_space = {
+        "steps": 10,
+        "width": randint(0, 20),
+        "lr": uniform(0.0, 1.0),
+    }
+    random_state = np.random.RandomState(0)
+    for acq_optimizer in ["rs", "rs_with_replacement"]:
+        searcher = Bore(
+            config_space,
+            metric="accuracy",
+            points_to_evaluate=[],
+            acq_optimizer=acq_optimizer,
+            feval_acq=50,
+            refit_every=3,
+            random_seed=1,
+        )
+        num_fits = 0
+        train_model = searcher.train_model
+
+        def counting_train_model(*args):
+            nonlocal num_fits
+            num_fits += 1
+            train_model(*args)
+
+        searcher.train_model = counting_train_model
+        if acq_optimizer == "rs":
+            configs = searcher._sample_configs_without_replacement()
+            assert len(configs) == 50
+            match_strings = {
+                searcher._hp_ranges.config_to_match_string(config) for config in configs
+            }
+            assert len(match_strings) == 50
+        for i in range(12):
+            config = searcher.get_config(trial_id=str(i))
+            assert set(config.keys()) == {"width", "lr"}
+            searcher.on_trial_result(
+                str(i), config, {"accuracy": random_state.rand()}, update=True
+            )
+        # The model is first fit with 6 observations, then refit with 9
+        assert num_fits == 2
@@ -0,0 +1,113 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import json
+import shutil
+import time
+
+import pandas as pd
+
+from syne_tune.constants import (
+    ST_TUNER_CREATION_TIMESTAMP,
+    ST_RESULTS_DATAFRAME_FILENAME,
+)
+from syne_tune.experiments import load_experiments_df, list_experiments, _read_index
+
+
+def _write_experiment(root, tuner_name: str, num_results: int):
+    path = root / "my-experiment" / tuner_name
+    path.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        ST_TUNER_CREATION_TIMESTAMP: time.time(),
+        "metric_names": ["loss"],
+        "metric_mode": "min",
+    }
+    with open(path / "metadata.json", "w") as f:
+        json.dump(metadata, f)
+    pd.DataFrame(
+        {
+            "trial_id": list(range(num_results)),
+            "loss": [0.1 * i for i in range(num_results)],
+            "epoch": [1] * num_results,
+        }
+    ).to_csv(path / ST_RESULTS_DATAFRAME_FILENAME, index=False)
+
+
+def test_load_experiments_df(tmp_path):
+    root = tmp_path / "root"
+    for i in range(4):
+        _write_experiment(root, f"tuner-{i}", num_results=i + 1)
+    tuner_names = ["tuner-1", "tuner-3"]
+    df = load_experiments_df(
+        tuner_names=tuner_names, columns=["trial_id", "loss", "metric_mode"], root=root
+    )
+    assert set(df.columns) == {"trial_id", "loss", "metric_mode", "tuner_name"}
+    assert sorted(df.tuner_name.unique()) == tuner_names
+    assert len(df) == 2 + 4
+
+    df_full = load_experiments_df(root=root)
+    df_parallel = load_experiments_df(root=root, num_workers=2)
+    pd.testing.assert_frame_equal(df_full, df_parallel)
+    assert "metric_names" in df_full.columns and "epoch" in df_full.columns
+
+    # Index is created, and refreshed for experiments which change
+    index_file = tmp_path / "index.pkl"
+    df_index = load_experiments_df(root=root, index_file=str(index_file))
+    pd.testing.assert_frame_equal(df_full, df_index)
+    _write_experiment(root, "tuner-0", num_results=10)
+    _write_experiment(root, "tuner-4", num_results=2)
+    experiments = list_experiments(
+        root=root, index_file=str(index_file), columns=["loss"]
+    )
+    sizes = {exp.name: len(exp.results) for exp in experiments}
+    assert sizes == {
+        "tuner-0": 10,
+        "tuner-1": 2,
+        "tuner-2": 3,
+        "tuner-3": 4,
+        "tuner-4": 2,
+    }
+    assert all(list(exp.results.columns) == ["loss"] for exp in experiments)
+    index, num_records, _ = _read_index(index_file)
+    assert len(index) == 5 and num_records == 6
+
+    # A record truncated by a crash is dropped, and the index stays usable
+    with open(index_file, "ab") as f:
+        f.write(b"\x80\x04\x95")
+    _write_experiment(root, "tuner-1", num_results=5)
+    experiments = list_experiments(root=root, index_file=str(index_file))
+    assert {exp.name: len(exp.results) for exp in experiments}["tuner-1"] == 5
+    index, num_records, size = _read_index(index_file)
+    assert len(index) == 5 and num_records == 7
+    assert size == index_file.stat().st_size
+
+    # Once most records are outdated, the index is compacted
+    for i in range(3):
+        shutil.rmtree(root / "my-experiment" / f"tuner-{i}")
+    experiments = list_experiments(root=root, index_file=str(index_file))
+    assert sorted(exp.name for exp in experiments) == ["tuner-3", "tuner-4"]
+    index, num_records, _ = _read_index(index_file)
+    assert len(index) == 2 and num_records == 2
+
+
+def test_list_experiments_by_tuner_name(tmp_path):
+    root = tmp_path / "root"
+    for i in range(3):
+        _write_experiment(root, f"tuner-{i}", num_results=i + 1)
+    # Experiments directly below the root are resolved without walking it
+    experiments = list_experiments(
+        root=root / "my-experiment", tuner_names=["tuner-2", "tuner-5"]
+    )
+    assert [exp.name for exp in experiments] == ["tuner-2"]
+    # Nested experiments are still found
+    experiments = list_experiments(root=root, tuner_names=["tuner-0", "tuner-2"])
+    assert sorted(exp.name for exp in experiments) == ["tuner-0", "tuner-2"]
@@ -23,6 +23,12 @@ from syne_tune.optimizer.schedulers.multiobjective.multiobjective_priority impor
     FixedObjectivePriority,
     LinearScalarizationPriority,
     NonDominatedPriority,
+    MORungData,
+)
+from syne_tune.optimizer.schedulers.multiobjective.non_dominated_priority import (
+    pareto_efficient,
+    nondominated_sort,
+    IncrementalNonDominatedSort,
 )
 from syne_tune.config_space import randint
 
@@ -157,3 +163,50 @@ def test_multiobjective_priorities(mo_priority, expected_priority):
     priorities = mo_priority.__call__(objectives=objectives)
     assert np.allclose(priorities, expected_priority)
     assert priorities.shape == (num_samples,)
+
+
+@pytest.mark.parametrize("num_objectives", [1, 2, 3])
+def test_pareto_efficient(num_objectives):
+    random_state = np.random.RandomState(0)
+    for num_samples, num_values in [(50, 3), (300, 10), (500, None)]:
+        if num_values is None:
+            X = random_state.rand(num_samples, num_objectives)
+        else:
+            # many ties
+            X = random_state.randint(0, num_values, size=(num_samples, num_objectives))
+        # brute force: dominated by any other allocation
+        dominated = np.any(
+            np.all(X[None, :, :] <= X[:, None, :], axis=-1)
+            & np.any(X[None, :, :] < X[:, None, :], axis=-1),
+            axis=1,
+        )
+        assert np.array_equal(pareto_efficient(X, chunk_size=32), ~dominated)
+
+
+@pytest.mark.parametrize("num_objectives", [2, 3])
+def test_incremental_nondominated_sort(num_objectives):
+    random_state = np.random.RandomState(0)
+    X = random_state.rand(200, num_objectives)
+    incremental_sort = IncrementalNonDominatedSort(dim=0)
+    for num_samples in range(1, X.shape[0] + 1):
+        incremental_sort.insert(X[num_samples - 1])
+        if num_samples % 20 == 0:
+            layers = nondominated_sort(X[:num_samples], dim=0, flatten=False)
+            assert incremental_sort.layers() == [sorted(layer) for layer in layers]
+            order = [i for layer in layers for i in layer]
+            assert [incremental_sort.position(i) for i in order] == list(
+                range(num_samples)
+            )
+
+
+def test_nondominated_rung_data():
+    random_state = np.random.RandomState(0)
+    priority = NonDominatedPriority(dim=0)
+    rung_data = priority.rung_data()
+    # Recomputes priorities of all entries for every new one
+    full_rung_data = MORungData(priority)
+    for trial_id in range(100):
+        metrics = {metric1: random_state.rand(), metric2: random_state.rand()}
+        rank = rung_data.add(trial_id, metrics)
+        assert rank == full_rung_data.add(trial_id, metrics)
+    assert list(rung_data.keys()) == list(range(100))
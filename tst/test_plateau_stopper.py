@@ -10,6 +10,8 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import numpy as np
+
 from syne_tune.optimizer.baselines import RandomSearch
 from syne_tune import Tuner
 from syne_tune.stopping_criterion import PlateauStopper
@@ -124,3 +126,58 @@ def test_plateau_stopper():
     )
 
     assert not stop_criterion(status)
+
+
+def test_plateau_stopper_incremental_trajectory():
+    metric = "loss"
+    random_state = np.random.RandomState(0)
+    stop_criterion = PlateauStopper(metric=metric, num_trials=3)
+    status = TuningStatus(metric_names=[metric])
+    trials = dict()
+    for iteration in range(50):
+        # New trials are started, and results are reported for running trials
+        # as well as earlier ones (e.g., resumed trials)
+        trial_ids = random_state.randint(0, 2 + iteration // 2, size=3)
+        for trial_id in trial_ids:
+            if trial_id not in trials:
+                trials[trial_id] = Trial(
+                    trial_id=trial_id, config={"x": trial_id}, creation_time=None
+                )
+        status.update(
+            trial_status_dict={
+                trial_id: (trials[trial_id], Status.completed) for trial_id in trial_ids
+            },
+            new_results=[
+                (trial_id, {metric: random_state.rand()}) for trial_id in trial_ids
+            ],
+        )
+        stop_criterion(status)
+        # Trajectory recomputed from scratch
+        fresh_stop_criterion = PlateauStopper(metric=metric, num_trials=3)
+        fresh_stop_criterion(status)
+        assert stop_criterion._top_values() == fresh_stop_criterion._top_values()
+
+
+def test_plateau_stopper_new_status():
+    # If the stopper is called with a different status object, its trajectory
+    # must be recomputed, even if `rows_version` is the same
+    metric = "loss"
+    stop_criterion = PlateauStopper(metric=metric, num_trials=2)
+    for values in [[3.0, 2.0, 1.0], [5.0, 6.0, 7.0]]:
+        status = TuningStatus(metric_names=[metric])
+        status.update(
+            trial_status_dict={
+                trial_id: (
+                    Trial(trial_id=trial_id, config={"x": value}, creation_time=None),
+                    Status.completed,
+                )
+                for trial_id, value in enumerate(values)
+            },
+            new_results=[
+                (trial_id, {metric: value}) for trial_id, value in enumerate(values)
+            ],
+        )
+        stop_criterion(status)
+        fresh_stop_criterion = PlateauStopper(metric=metric, num_trials=2)
+        fresh_stop_criterion(status)
+        assert stop_criterion._top_values() == fresh_stop_criterion._top_values()
@@ -11,9 +11,16 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 import logging
+import tempfile
+from pathlib import Path
 
 from syne_tune import Reporter
-from syne_tune.report import retrieve
+from syne_tune.report import (
+    retrieve,
+    IncrementalMetricsRetriever,
+    MetricsChannelWriter,
+    MetricsChannelReader,
+)
 
 
 def test_report_logger():
@@ -34,3 +41,48 @@ def test_report_logger():
         {"train_nll": 1.45, "time": 1.0, "step": 2},
         {"train_nll": 1.2, "time": 2.0, "step": 3},
     ]
+
+
+def test_incremental_metrics_retriever():
+    with tempfile.TemporaryDirectory() as local_path:
+        path = Path(local_path) / "std.out"
+        retriever = IncrementalMetricsRetriever(path)
+        # File does not exist yet
+        assert retriever.read_new() == []
+        with open(path, "w") as f:
+            f.write("some log output\n")
+            f.write('[tune-metric]: {"step": 0}\n')
+            f.write('[tune-metric]: {"st')
+        assert retriever.read_new() == [{"step": 0}]
+        assert retriever.read_new() == []
+        with open(path, "a") as f:
+            f.write('ep": 1}\nmore log output\n')
+            f.write('[tune-metric]: {"step": 2}')
+        assert retriever.read_new() == [{"step": 1}]
+        assert retriever.read_new(flush=True) == [{"step": 2}]
+        assert retriever.metrics == [{"step": 0}, {"step": 1}, {"step": 2}]
+
+
+def test_metrics_channel():
+    with tempfile.TemporaryDirectory() as local_path:
+        path = Path(local_path) / "metrics.bin"
+        reader = MetricsChannelReader(path)
+        assert reader.read_new() == []
+        writer = MetricsChannelWriter(path)
+        writer({"step": 0, "loss": 0.5})
+        writer({"step": 1, "loss": 0.25, "name": "x" * 100000})
+        assert reader.read_new() == [
+            {"step": 0, "loss": 0.5},
+            {"step": 1, "loss": 0.25, "name": "x" * 100000},
+        ]
+        assert reader.read_new() == []
+        # Incomplete record is only returned once fully written
+        with open(path, "ab") as f:
+            f.write(b"\x0b\x00\x00\x00")
+            f.write(b'{"step"')
+        assert reader.read_new() == []
+        with open(path, "ab") as f:
+            f.write(b": 2}")
+        assert reader.read_new() == [{"step": 2}]
+        assert len(reader.metrics) == 3
+        writer.close()
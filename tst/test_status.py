@@ -11,6 +11,7 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 from syne_tune.backend.trial_status import Trial, Status
+from syne_tune.constants import ST_WORKER_TIME, ST_WORKER_COST
 from syne_tune.tuning_status import TuningStatus, print_best_metric_found
 
 
@@ -110,3 +111,113 @@ def test_stats_are_not_tracked_for_non_numeric_metrics():
         metric_names[0]: "str",
         metric_names[1]: 20,
     }
+
+
+def test_status_aggregates_are_maintained_incrementally():
+    status = TuningStatus(metric_names=["loss"], max_rows_to_print=2)
+    trials = {
+        trial_id: Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        for trial_id in range(4)
+    }
+    status.update(
+        trial_status_dict={
+            trial_id: (trial, Status.in_progress) for trial_id, trial in trials.items()
+        },
+        new_results=[
+            (0, {"loss": 1.0, ST_WORKER_TIME: 2.0, ST_WORKER_COST: 0.5}),
+            (1, {"loss": 2.0, ST_WORKER_TIME: 3.0}),
+        ],
+    )
+    assert status.num_trials_started == 4
+    assert status.num_trials_running == 4
+    assert status.num_trials_finished == 0
+    assert status.user_time == 5.0
+    assert status.cost == 0.5
+
+    rows_version = status.rows_version
+    # Only trial 0 changes, the rows of the other trials are not recomputed
+    status.update(
+        trial_status_dict={
+            0: (trials[0], Status.completed),
+            1: (trials[1], Status.in_progress),
+        },
+        new_results=[
+            (0, {"loss": 0.5, ST_WORKER_TIME: 4.0, ST_WORKER_COST: 1.5}),
+        ],
+    )
+    assert status.rows_version == rows_version + 1
+    assert status.trial_rows[0]["status"] == Status.completed
+    assert status.trial_rows[0]["loss"] == 0.5
+    assert status.num_trials_completed == 1
+    assert status.num_trials_running == 3
+    assert status.num_trials_finished == 1
+    assert status.user_time == 7.0
+    assert status.cost == 1.5
+
+    status.update(
+        trial_status_dict={2: (trials[2], Status.failed)},
+        new_results=[],
+    )
+    status.mark_running_job_as_stopped()
+    assert status.num_trials_failed == 1
+    assert status.num_trials_running == 0
+    assert status.num_trials_finished == 4
+    assert status.trial_rows[3]["status"] == Status.stopped
+    df = status.get_dataframe()
+    assert list(df["status"]) == [
+        Status.completed,
+        Status.stopped,
+        Status.failed,
+        Status.stopped,
+    ]
+
+    # Only the rows of the most recently started trials are printed
+    status_str = str(status)
+    assert "(2 earlier trials not shown)" in status_str
+    assert "0 trials running, 4 finished (1 until the end)" in status_str
+
+
+def test_status_pickled_without_aggregates():
+    # Objects pickled before running aggregates were introduced
+    status = TuningStatus(metric_names=["loss"])
+    trials = {
+        trial_id: Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        for trial_id in range(3)
+    }
+    status.update(
+        trial_status_dict={
+            0: (trials[0], Status.completed),
+            1: (trials[1], Status.in_progress),
+            2: (trials[2], Status.in_progress),
+        },
+        new_results=[
+            (0, {"loss": 1.0, ST_WORKER_TIME: 2.0, ST_WORKER_COST: 0.5}),
+            (1, {"loss": 2.0, ST_WORKER_TIME: 3.0}),
+        ],
+    )
+    state = status.__dict__.copy()
+    for name in [
+        "max_rows_to_print",
+        "_num_trials_per_status",
+        "_total_worker_metrics",
+        "_stale_row_trial_ids",
+        "rows_version",
+        "_row_updates",
+        "_row_updates_offset",
+    ]:
+        del state[name]
+    old_status = TuningStatus.__new__(TuningStatus)
+    old_status.__setstate__(state)
+    assert old_status.max_rows_to_print is None
+    assert old_status.num_trials_completed == 1
+    assert old_status.num_trials_running == 2
+    assert old_status.user_time == 5.0
+    assert old_status.cost == 0.5
+    old_status.update(
+        trial_status_dict={1: (trials[1], Status.completed)},
+        new_results=[(1, {"loss": 1.5, ST_WORKER_TIME: 4.0})],
+    )
+    assert old_status.num_trials_completed == 2
+    assert old_status.user_time == 6.0
+    assert old_status.trial_ids_of_rows_updated_since(0) == [1]
+    assert "1 trials running, 2 finished (2 until the end)" in str(old_status)
@@ -0,0 +1,107 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+from types import SimpleNamespace
+
+import dill
+import numpy as np
+
+from syne_tune.backend.trial_status import Trial
+from syne_tune.constants import (
+    ST_DECISION,
+    ST_TRIAL_ID,
+    ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_JOURNAL_FILENAME,
+)
+from syne_tune.experiments import load_experiment
+from syne_tune.tuner_callback import StoreResultsCallback, read_results_journal
+
+
+def _report_results(callback, trial_ids, num_epochs):
+    for trial_id in trial_ids:
+        trial = Trial(trial_id=trial_id, config={"x": 0.1 * trial_id}, creation_time=0)
+        for epoch in range(1, num_epochs + 1):
+            callback.on_trial_result(
+                trial,
+                status="InProgress",
+                result={"epoch": np.int64(epoch), "loss": 1.0 / epoch},
+                decision="continue",
+            )
+
+
+def test_store_results_callback_appends_to_journal(tmp_path):
+    tuner_path = tmp_path / "my-tuner"
+    # Results of an old experiment at the same path are overwritten
+    tuner_path.mkdir()
+    (tuner_path / ST_RESULTS_JOURNAL_FILENAME).write_text('{"epoch": 100}\n')
+    tuner = SimpleNamespace(tuner_path=tuner_path, results_update_interval=-1)
+    callback = StoreResultsCallback(add_wallclock_time=False)
+    callback.on_tuning_start(tuner)
+    _report_results(callback, trial_ids=[0, 1], num_epochs=3)
+    # Results are written as they come in, and not kept in memory
+    assert callback._new_results == []
+    num_lines = len((tuner_path / ST_RESULTS_JOURNAL_FILENAME).read_text().splitlines())
+    assert num_lines == 6
+    results = callback.results
+    assert [(r[ST_TRIAL_ID], r["epoch"]) for r in results] == [
+        (trial_id, epoch) for trial_id in [0, 1] for epoch in [1, 2, 3]
+    ]
+    assert all(r[ST_DECISION] == "continue" for r in results)
+    callback.on_tuning_end()
+    assert (tuner_path / ST_RESULTS_DATAFRAME_FILENAME).exists()
+
+    # Resuming appends to the journal
+    callback.on_tuning_start(tuner)
+    _report_results(callback, trial_ids=[2], num_epochs=2)
+    # Truncated last line, as if the process was killed while writing
+    with open(tuner_path / ST_RESULTS_JOURNAL_FILENAME, "a") as f:
+        f.write('{"epoch": 3, "lo')
+    df = callback.dataframe()
+    assert len(df) == 8
+    assert list(df["config_x"].unique()) == [0.0, 0.1, 0.2]
+    experiment = load_experiment(
+        "my-tuner", download_if_not_found=False, local_path=str(tmp_path)
+    )
+    assert experiment.results.equals(df)
+
+
+def test_store_results_callback_resume(tmp_path):
+    tuner_path = tmp_path / "my-tuner"
+    journal_file = tuner_path / ST_RESULTS_JOURNAL_FILENAME
+    tuner = SimpleNamespace(tuner_path=tuner_path, results_update_interval=1000)
+    callback = StoreResultsCallback(add_wallclock_time=False)
+    callback.on_tuning_start(tuner)
+    _report_results(callback, trial_ids=[0], num_epochs=2)
+    # Snapshot taken before results are first written to the journal
+    snapshot = dill.dumps(callback)
+    callback.store_results()
+    _report_results(callback, trial_ids=[1], num_epochs=1)
+    callback.store_results()
+    # Process is killed while writing
+    with open(journal_file, "a") as f:
+        f.write('{"epoch": 3, "lo')
+
+    # Resume from the snapshot: Results in the journal are kept, those in the
+    # snapshot which have been written already are not written again, and
+    # the partial last line is removed
+    callback = dill.loads(snapshot)
+    callback.on_tuner_loaded(tuner)
+    callback.on_tuning_start(tuner)
+    assert len(read_results_journal(journal_file)) == 3
+    _report_results(callback, trial_ids=[2], num_epochs=2)
+    callback.store_results()
+    results = read_results_journal(journal_file)
+    expected = [(0, 1), (0, 2), (1, 1), (2, 1), (2, 2)]
+    assert [(r[ST_TRIAL_ID], r["epoch"]) for r in results] == expected
+    assert [(r[ST_TRIAL_ID], r["epoch"]) for r in callback.results] == expected
+    # Stored results are not kept in memory
+    assert not callback._new_results
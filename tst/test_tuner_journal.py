@@ -0,0 +1,201 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import shutil
+import tempfile
+from pathlib import Path
+
+import dill
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.config_space import randint
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.optimizer.schedulers.hyperband import HyperbandScheduler
+from syne_tune.tuner_callback import TunerCallback
+from syne_tune.tuner_journal import TunerJournal
+from syne_tune.util import script_height_example_path
+from tst.util_test import temporary_local_backend
+
+
+class CopyTunerFilesCallback(TunerCallback):
+    """
+    Copies snapshot and journal at the end of tuning, before the final
+    snapshot is written.
+    """
+
+    def __init__(self, target_path: str):
+        self._target_path = Path(target_path)
+        self._tuner_path = None
+
+    def on_tuning_start(self, tuner):
+        self._tuner_path = tuner.tuner_path
+
+    def on_tuning_end(self):
+        for file in self._target_path.glob("tuner*.dill"):
+            file.unlink()
+        for file in self._tuner_path.glob("tuner*.dill"):
+            shutil.copy(file, self._target_path / file.name)
+
+
+def test_tuner_journal_replay():
+    max_steps = 5
+    config_space = {
+        "steps": max_steps,
+        "width": randint(0, 20),
+        "height": randint(-100, 100),
+        "sleep_time": 0.01,
+    }
+    scheduler = HyperbandScheduler(
+        config_space,
+        searcher="random",
+        metric="mean_loss",
+        mode="min",
+        max_t=max_steps,
+        resource_attr="epoch",
+        random_seed=31415927,
+    )
+    with tempfile.TemporaryDirectory() as copy_path:
+        tuner = Tuner(
+            trial_backend=temporary_local_backend(
+                entry_point=script_height_example_path()
+            ),
+            scheduler=scheduler,
+            stop_criterion=StoppingCriterion(max_num_trials_started=4),
+            n_workers=2,
+            sleep_time=0.05,
+            callbacks=[CopyTunerFilesCallback(copy_path)],
+            snapshot_interval=1000,
+        )
+        tuner.run()
+        # Only the initial snapshot was written, the rest is in the journal
+        assert len(list(Path(copy_path).glob("tuner-journal-*.dill"))) == 1
+        replayed_tuner = Tuner.load(copy_path)
+    # The final snapshot replaces the journal
+    assert not list(tuner.tuner_path.glob("tuner-journal-*.dill"))
+    final_tuner = Tuner.load(tuner.tuner_path)
+    for other_tuner in (replayed_tuner, final_tuner):
+        assert other_tuner.trial_backend.trial_ids == tuner.trial_backend.trial_ids
+        assert (
+            other_tuner.last_seen_result_per_trial == tuner.last_seen_result_per_trial
+        )
+        assert other_tuner.tuning_status.trial_rows.keys() == (
+            tuner.tuning_status.trial_rows.keys()
+        )
+    # Replaying the journal restores the state of the scheduler
+    trial_id = len(tuner.trial_backend.trial_ids)
+    next_suggestion = final_tuner.scheduler.suggest(trial_id)
+    assert replayed_tuner.scheduler.suggest(trial_id) == next_suggestion
+
+
+def test_load_tuner_serialized_without_new_attributes(monkeypatch):
+    # Tuners serialized by earlier versions lack some attributes
+    config_space = {"steps": 5, "width": randint(0, 20), "height": 1}
+    tuner = Tuner(
+        trial_backend=temporary_local_backend(entry_point=script_height_example_path()),
+        scheduler=RandomSearch(config_space, metric="mean_loss", mode="min"),
+        stop_criterion=StoppingCriterion(max_num_trials_started=2),
+        n_workers=1,
+    )
+    state = tuner.__dict__.copy()
+    for name in [
+        "_journal",
+        "_snapshot_thread",
+        "_profiler",
+        "snapshot_interval",
+        "background_snapshots",
+        "event_driven",
+    ]:
+        del state[name]
+    old_tuner = Tuner.__new__(Tuner)
+    old_tuner.__dict__.update(state)
+    with tempfile.TemporaryDirectory() as path:
+        with monkeypatch.context() as m:
+            # `Tuner.__getstate__` would add `_snapshot_thread`
+            m.setattr(Tuner, "__getstate__", lambda self: self.__dict__)
+            with open(Path(path) / "tuner.dill", "wb") as f:
+                dill.dump(old_tuner, f)
+        loaded_tuner = Tuner.load(path)
+        assert loaded_tuner._journal is None
+        assert loaded_tuner.snapshot_interval is None
+        assert not loaded_tuner.event_driven
+        loaded_tuner.save(folder=path)
+
+
+def _restore_tuner_files(source_path: Path, tuner_path: Path, split_journal: bool):
+    """
+    Restores snapshot and journal copied by :class:`CopyTunerFilesCallback`,
+    which simulates a tuner killed before writing its final snapshot. If
+    `split_journal` is True, the events of the journal are split into two
+    segments, as left behind by a background snapshot which was interrupted.
+    """
+    for file in tuner_path.glob("tuner*.dill"):
+        file.unlink()
+    for file in source_path.glob("tuner*.dill"):
+        shutil.copy(file, tuner_path / file.name)
+    if split_journal:
+        journal = TunerJournal(tuner_path)
+        (segment_file,) = tuner_path.glob("tuner-journal-*.dill")
+        segment = int(segment_file.stem.split("-")[-1])
+        events = list(journal.events(segment))
+        num_first = len(events) // 2
+        for offset, part in enumerate([events[:num_first], events[num_first:]]):
+            with open(journal.segment_file(segment + offset), "wb") as f:
+                for event in part:
+                    dill.dump(event, f)
+
+
+def test_tuner_journal_resume_twice():
+    max_steps = 5
+    config_space = {
+        "steps": max_steps,
+        "width": randint(0, 20),
+        "height": randint(-100, 100),
+        "sleep_time": 0.01,
+    }
+    scheduler = HyperbandScheduler(
+        config_space,
+        searcher="random",
+        metric="mean_loss",
+        mode="min",
+        max_t=max_steps,
+        resource_attr="epoch",
+        random_seed=31415927,
+    )
+    with tempfile.TemporaryDirectory() as copy_path:
+        copy_path = Path(copy_path)
+        callback = CopyTunerFilesCallback(copy_path)
+        tuner = Tuner(
+            trial_backend=temporary_local_backend(
+                entry_point=script_height_example_path()
+            ),
+            scheduler=scheduler,
+            stop_criterion=StoppingCriterion(max_num_trials_started=3),
+            n_workers=2,
+            sleep_time=0.05,
+            callbacks=[callback],
+            snapshot_interval=1000,
+        )
+        tuner.run()
+        for max_num_trials_started in (6, 9):
+            # Tuner is killed before its final snapshot, and then resumed.
+            # Events replayed before must not be replayed again
+            _restore_tuner_files(copy_path, tuner.tuner_path, split_journal=True)
+            trial_ids = tuner.trial_backend.trial_ids
+            tuner = Tuner.load(tuner.tuner_path)
+            assert tuner.trial_backend.trial_ids == trial_ids
+            tuner.stop_criterion = StoppingCriterion(
+                max_num_trials_started=max_num_trials_started
+            )
+            tuner.run()
+            assert len(tuner.trial_backend.trial_ids) >= max_num_trials_started
+    final_tuner = Tuner.load(tuner.tuner_path)
+    assert final_tuner.trial_backend.trial_ids == tuner.trial_backend.trial_ids
@@ -0,0 +1,76 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.config_space import randint
+from syne_tune.constants import (
+    ST_TUNER_PROFILE_FILENAME,
+    ST_TUNER_PROFILE_SUMMARY_FILENAME,
+)
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.tuner_callback import (
+    TunerProfilingCallback,
+    StoreResultsCallback,
+    read_results_journal,
+)
+from syne_tune.util import script_height_example_path
+from tst.util_test import temporary_local_backend
+
+
+def test_tuner_profiling_callback():
+    max_steps = 5
+    config_space = {
+        "steps": max_steps,
+        "width": randint(0, 20),
+        "height": randint(-100, 100),
+        "sleep_time": 0.01,
+    }
+    profiler = TunerProfilingCallback(flush_interval=3)
+    tuner = Tuner(
+        trial_backend=temporary_local_backend(entry_point=script_height_example_path()),
+        scheduler=RandomSearch(config_space, metric="mean_loss", mode="min"),
+        stop_criterion=StoppingCriterion(max_num_trials_started=3),
+        n_workers=2,
+        sleep_time=0.05,
+        callbacks=[StoreResultsCallback(), profiler],
+    )
+    tuner.run()
+
+    records = read_results_journal(tuner.tuner_path / ST_TUNER_PROFILE_FILENAME)
+    assert [record["iteration"] for record in records] == list(range(len(records)))
+    for record in records:
+        phase_time = sum(
+            v
+            for k, v in record.items()
+            if k.endswith("_time") and k != "iteration_time"
+        )
+        assert abs(phase_time - record["iteration_time"]) < 1e-6 or (
+            record["other_time"] == 0
+        )
+    assert sum(record.get("scheduler_suggest_num", 0) for record in records) >= 3
+    assert any("fetch_status_results_time" in record for record in records)
+
+    summary = profiler.summary()
+    phases = set(summary["phase"])
+    for phase in (
+        "fetch_status_results",
+        "scheduler_suggest",
+        "start_trial",
+        "tuning_status",
+        "iteration",
+        "other",
+    ):
+        assert phase in phases
+    row = summary.set_index("phase").loc["iteration"]
+    assert row["num_iterations"] == len(records)
+    assert row["fraction"] == 1
+    assert (tuner.tuner_path / ST_TUNER_PROFILE_SUMMARY_FILENAME).exists()
@@ -11,8 +11,10 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 import logging
+import tempfile
 from pathlib import Path
 
+from syne_tune.backend import LocalBackend
 from syne_tune.backend.trial_status import Status
 from syne_tune.util import script_checkpoint_example_path
 from tst.util_test import temporary_local_backend, wait_until_all_trials_completed
@@ -172,3 +174,41 @@ def test_gpu_allocation(caplog):
     gpu = backend.trial_gpu[6]
     assert gpu in {1, 3}
     assert backend.gpu_times_assigned[gpu] == 2
+
+
+def test_local_backend_metrics_channel():
+    path_script = script_checkpoint_example_path()
+    with tempfile.TemporaryDirectory() as local_path:
+        backend = LocalBackend(entry_point=path_script, use_metrics_channel=True)
+        backend.set_path(results_root=local_path)
+        trial_id = backend.start_trial(config={"num-epochs": 3}).trial_id
+        wait_until_all_trials_completed(backend)
+
+        trial_statuses, new_metrics = get_status_metrics(backend, trial_id)
+        assert trial_statuses == {trial_id: Status.completed}
+        check_metrics(
+            new_metrics,
+            [
+                (trial_id, {"step": 0, "train_acc": 1}),
+                (trial_id, {"step": 1, "train_acc": 2}),
+                (trial_id, {"step": 2, "train_acc": 3}),
+            ],
+        )
+        # Metrics are not written to the training log
+        assert not any("[tune-metric]" in line for line in backend.stdout(trial_id))
+        trial_statuses, new_metrics = get_status_metrics(backend, trial_id)
+        assert new_metrics == []
+
+
+def test_local_backend_wait_for_events():
+    path_script = script_checkpoint_example_path()
+    backend = temporary_local_backend(entry_point=path_script)
+    trial_id = backend.start_trial(config={"num-epochs": 2, "sleep-time": 1}).trial_id
+    # No retriever for the trial yet, so there are news right away
+    assert backend.wait_for_events([trial_id], timeout=30) < 1
+    statuses, _ = get_status_metrics(backend, trial_id)
+    while statuses[trial_id] == Status.in_progress:
+        # Each call returns with the next report or when the trial completes
+        assert backend.wait_for_events([trial_id], timeout=30) < 10
+        statuses, _ = get_status_metrics(backend, trial_id)
+    assert statuses == {trial_id: Status.completed}
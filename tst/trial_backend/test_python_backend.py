@@ -11,6 +11,8 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 import tempfile
+import time
+
 from syne_tune.backend import PythonBackend
 from syne_tune.backend.trial_status import Status
 from syne_tune.config_space import randint
@@ -52,3 +54,81 @@ def test_python_backend():
         metrics_second_trial = [metric["y"] for x, metric in metrics if x == 1]
         assert metrics_first_trial == [2, 3, 4, 5, 6]
         assert metrics_second_trial == [3, 4, 5, 6, 7]
+
+
+def g(x):
+    import os
+    import signal
+    import time
+    from syne_tune import Reporter
+
+    reporter = Reporter()
+    if x < 0:
+        os._exit(3)  # Crashes the worker process
+    # For this value, the worker does not react to interrupts
+    ignore_interrupt = x == 20
+    if ignore_interrupt:
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGUSR1})
+    for i in range(x):
+        reporter(step=i + 1, y=x + i)
+        time.sleep(0.5)
+    if ignore_interrupt:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGUSR1})
+
+
+def wait_until_trials_done(backend, trial_ids):
+    for _ in range(300):
+        trials, _ = backend.fetch_status_results(trial_ids)
+        if all(status != Status.in_progress for _, status in trials.values()):
+            return {trial_id: status for trial_id, (_, status) in trials.items()}
+        time.sleep(0.1)
+    assert False, "backend trials did not finish after 30s"
+
+
+def test_python_backend_worker_pool():
+    with tempfile.TemporaryDirectory() as local_path:
+        backend = PythonBackend(
+            g, config_space={"x": randint(-1, 10)}, use_worker_pool=True
+        )
+        backend.set_path(str(local_path))
+        backend.start_trial({"x": 2})
+        backend.start_trial({"x": 3})
+        statuses = wait_until_trials_done(backend, [0, 1])
+        assert statuses == {0: Status.completed, 1: Status.completed}
+        pids = {worker.process.pid for worker in backend._worker_pool.workers}
+        assert len(pids) == 2
+
+        # Workers are reused for new trials. Stopping a trial interrupts the
+        # function, but not the worker
+        backend.start_trial({"x": 100})
+        backend.start_trial({"x": 1})
+        time.sleep(1)
+        backend.stop_trial(trial_id=2)
+        statuses = wait_until_trials_done(backend, [2, 3])
+        assert statuses == {2: Status.stopped, 3: Status.completed}
+        assert {worker.process.pid for worker in backend._worker_pool.workers} == pids
+
+        # A crashing trial fails, and its worker is replaced
+        backend.start_trial({"x": -1})
+        statuses = wait_until_trials_done(backend, [4])
+        assert statuses == {4: Status.failed}
+        backend.start_trial({"x": 1})
+        backend.start_trial({"x": 1})
+        statuses = wait_until_trials_done(backend, [5, 6])
+        assert statuses == {5: Status.completed, 6: Status.completed}
+        assert len(backend._worker_pool.workers) == 2
+
+        # A paused trial is resumed on another worker, while the old one does
+        # not react to the interrupt. Killing the old worker must not change
+        # the status of the resumed run
+        backend.start_trial({"x": 20})
+        time.sleep(1)
+        backend.pause_trial(trial_id=7)
+        backend.resume_trial(trial_id=7)
+        time.sleep(6)
+        backend.start_trial({"x": 1})  # Old worker is killed here
+        trials, _ = backend.fetch_status_results([7])
+        assert trials[7][1] == Status.in_progress
+        statuses = wait_until_trials_done(backend, [7, 8])
+        assert statuses == {7: Status.completed, 8: Status.completed}
+        backend.stop_all()
@@ -369,3 +369,70 @@ def test_simulator_backend_with_table_class():
         actual[k] = np.array([x[1][k] for x in results])
         required[k] = np.array([x[k] for x in required_results])
         np.testing.assert_almost_equal(actual[k], required[k])
+
+
+def test_simulator_state_lazy_deletion():
+    state = SimulatorState()
+    for trial_id in range(4):
+        state.push(StartEvent(trial_id=trial_id), event_time=trial_id)
+        for epoch in range(1, 4):
+            state.push(
+                OnTrialResultEvent(trial_id=trial_id, result=dict(epoch=epoch)),
+                event_time=trial_id + epoch,
+            )
+    state.remove_events(trial_id=0)
+    assert state.num_pending_events(0) == 0
+    assert state.next_event_time() == 1
+    # Events pushed after removal are kept
+    state.push(CompleteEvent(trial_id=0, status="stopped"), event_time=1.5)
+    state.remove_events(trial_id=2)
+    state.remove_events(trial_id=3)  # compacts the heap
+    assert len(state.event_heap) == 5
+    obtained_results = []
+    while True:
+        entry = state.next_until(10)
+        if entry is None:
+            break
+        obtained_results.append((entry[0], type(entry[1]), entry[1].trial_id))
+    assert obtained_results == [
+        (1, StartEvent, 1),
+        (1.5, CompleteEvent, 0),
+        (2, OnTrialResultEvent, 1),
+        (3, OnTrialResultEvent, 1),
+        (4, OnTrialResultEvent, 1),
+    ]
+    assert state.next_event_time() is None
+    assert state.num_pending_events(1) == 0
+
+
+def test_simulator_state_push_events():
+    # Events pushed with `push_events` are returned in the same order as if
+    # pushed one by one, also if events are removed in between
+    random_state = np.random.RandomState(0)
+    states = [SimulatorState(), SimulatorState()]
+    obtained_results = [[], []]
+    for time_now in range(1, 40):
+        new_events = []
+        trial_id = time_now
+        num_events = random_state.randint(1, 6)
+        event_times = time_now + random_state.randint(0, 5, size=num_events)
+        for epoch, event_time in enumerate(event_times):
+            event = OnTrialResultEvent(trial_id=trial_id, result=dict(epoch=epoch))
+            new_events.append((event, float(event_time)))
+        trial_to_remove = random_state.randint(1, time_now + 1)
+        for state, results in zip(states, obtained_results):
+            if state is states[0]:
+                for event, event_time in new_events:
+                    state.push(event, event_time)
+            else:
+                state.push_events(new_events)
+            if time_now % 3 == 0:
+                state.remove_events(trial_id=trial_to_remove)
+            while True:
+                entry = state.next_until(time_now)
+                if entry is None:
+                    break
+                results.append((entry[0], entry[1].trial_id, entry[1].result["epoch"]))
+    assert len(obtained_results[0]) > 0
+    assert obtained_results[0] == obtained_results[1]
+    assert states[0].next_event_time() == states[1].next_event_time()